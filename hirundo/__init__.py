@@ -1,3 +1,14 @@
+from ._http import HedgingPolicy
+from .bulk import BulkReport, BulkResult
+from .cleanup import Cleanup, CleanupPlan, CleanupReport
+from .client import (
+    HirundoClient,
+    configure_hedging,
+    configure_name_cache,
+    get_default_client,
+    set_default_client,
+)
+from .compact import CompactDataset, CompactRun
 from .dataset_enum import (
     DatasetMetadataType,
     LabelingType,
@@ -10,8 +21,11 @@ from .dataset_qa import (
     ObjectDetectionRunArgs,
     QADataset,
     RunArgs,
+    RunEvent,
+    RunTimeoutError,
 )
 from .dataset_qa_results import DatasetQAResults
+from .fingerprints import FingerprintStore
 from .git import GitPlainAuth, GitRepo, GitSSHAuth
 from .labeling import (
     COCO,
@@ -23,6 +37,22 @@ from .labeling import (
     KeylabsObjSegImages,
     KeylabsObjSegVideo,
 )
+from .launch_scheduler import LaunchPriority, LaunchScheduler
+from .manifest import ChangeAction, Manifest, ManifestPlan, ResourceChange
+from .name_cache import NameCache, NameCacheStats
+from .pipeline import PipelineItem, PipelineStage, QAPipeline
+from .progress import (
+    DebouncedProgressSink,
+    LoggingProgressSink,
+    NullProgressSink,
+    ProgressSink,
+    RichProgressSink,
+    TqdmProgressSink,
+)
+from .run_checkpoints import RunCheckpoint, RunCheckpointStore
+from .run_history import HistorySyncReport, RunHistory
+from .run_watcher import RunStateChange, RunWatcher, WatchMode
+from .sharding import ShardedQA, ShardedRun
 from .storage import (
     StorageConfig,
     StorageGCP,
@@ -45,6 +75,8 @@ __all__ = [
     "QADataset",
     "Domain",
     "RunArgs",
+    "RunEvent",
+    "RunTimeoutError",
     "ClassificationRunArgs",
     "ObjectDetectionRunArgs",
     "DatasetMetadataType",
@@ -59,6 +91,46 @@ __all__ = [
     "StorageGit",
     "StorageConfig",
     "DatasetQAResults",
+    "BulkReport",
+    "BulkResult",
+    "Cleanup",
+    "CleanupPlan",
+    "CleanupReport",
+    "FingerprintStore",
+    "CompactDataset",
+    "CompactRun",
+    "Manifest",
+    "ManifestPlan",
+    "ResourceChange",
+    "ChangeAction",
+    "HedgingPolicy",
+    "HirundoClient",
+    "configure_hedging",
+    "configure_name_cache",
+    "NameCache",
+    "NameCacheStats",
+    "get_default_client",
+    "set_default_client",
+    "ProgressSink",
+    "DebouncedProgressSink",
+    "LoggingProgressSink",
+    "NullProgressSink",
+    "RichProgressSink",
+    "TqdmProgressSink",
+    "RunCheckpoint",
+    "RunCheckpointStore",
+    "RunHistory",
+    "HistorySyncReport",
+    "RunStateChange",
+    "RunWatcher",
+    "WatchMode",
+    "LaunchPriority",
+    "LaunchScheduler",
+    "PipelineItem",
+    "PipelineStage",
+    "QAPipeline",
+    "ShardedQA",
+    "ShardedRun",
     "load_df",
     "load_from_zip",
 ]
@@ -0,0 +1,78 @@
+import asyncio
+import time
+import typing
+from collections.abc import AsyncGenerator
+
+T = typing.TypeVar("T")
+
+
+class Deadline:
+    """
+    A point in (monotonic) time by which an operation must finish.
+    A deadline without a timeout never expires.
+    """
+
+    def __init__(self, timeout: typing.Optional[float] = None):
+        """
+        Args:
+            timeout: The number of seconds from now until the deadline, or `None` for no deadline
+        """
+        self.timeout = timeout
+        self.expires_at = time.monotonic() + timeout if timeout is not None else None
+
+    def remaining(self) -> typing.Optional[float]:
+        """
+        The number of seconds until the deadline (at least 0), or `None` if there is no deadline
+        """
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    def check(self) -> None:
+        """
+        Raises:
+            TimeoutError: If the deadline passed
+        """
+        if self.expired:
+            raise TimeoutError(f"Deadline of {self.timeout} seconds exceeded")
+
+    def clamp(self, seconds: typing.Optional[float]) -> typing.Optional[float]:
+        """
+        Limit a timeout so it does not extend past the deadline
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return seconds
+        if seconds is None:
+            return remaining
+        return min(seconds, remaining)
+
+
+NO_DEADLINE = Deadline()
+
+
+async def abefore_deadline(
+    items: AsyncGenerator[T, None], deadline: Deadline
+) -> AsyncGenerator[T, None]:
+    """
+    The items of an async generator until the deadline passes. The generator is closed either way.
+
+    Raises:
+        TimeoutError: If the deadline passed before the generator ended
+    """
+    try:
+        while True:
+            try:
+                item = await asyncio.wait_for(items.__anext__(), deadline.remaining())
+            except StopAsyncIteration:
+                return
+            except asyncio.TimeoutError:
+                deadline.check()
+                raise
+            yield item
+    finally:
+        await items.aclose()
@@ -0,0 +1,22 @@
+import hashlib
+import json
+import typing
+
+from pydantic import BaseModel
+
+Exclude = typing.Union[set[str], dict[str, typing.Any], None]
+
+
+def content_hash(
+    model: BaseModel, exclude: Exclude = None, extra: typing.Optional[str] = None
+) -> str:
+    """
+    A stable hash of the content of a model, i.e. of its JSON dump with sorted keys.
+    Exclude the fields set by the server (e.g. IDs), so that the hash only depends on the definition.
+    `extra` is hashed along with the dump, e.g. the hash of a nested model hashed separately.
+    """
+    dump = model.model_dump(mode="json", exclude=exclude)
+    canonical = json.dumps(dump, sort_keys=True, separators=(",", ":"))
+    if extra is not None:
+        canonical = f"{canonical}\n{extra}"
+    return hashlib.sha256(canonical.encode()).hexdigest()
@@ -0,0 +1,41 @@
+import os
+import typing
+import weakref
+
+from hirundo.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class _ForkSafe(typing.Protocol):
+    def _after_fork(self) -> None:
+        """
+        Replace the state a forked child must not share with its parent,
+        e.g. pooled sockets, locks, thread pools & database connections
+        """
+        ...
+
+
+_FORK_SAFE_OBJECTS: "weakref.WeakSet[_ForkSafe]" = weakref.WeakSet()
+
+
+def reset_after_fork(obj: _ForkSafe) -> None:
+    """
+    Call `obj._after_fork()` in the child process whenever the process forks,
+    e.g. when `multiprocessing` or `gunicorn` start workers after `hirundo` was used.
+    Only a weak reference to `obj` is kept.
+    """
+    _FORK_SAFE_OBJECTS.add(obj)
+
+
+def _reset_all_after_fork() -> None:
+    for obj in list(_FORK_SAFE_OBJECTS):
+        try:
+            obj._after_fork()
+        except Exception as e:
+            logger.error("Failed to reset %r after fork", obj, exc_info=e)
+
+
+if hasattr(os, "register_at_fork"):
+    # ⬆️ Not available on Windows, where processes are spawned instead of forked
+    os.register_at_fork(after_in_child=_reset_all_after_fork)
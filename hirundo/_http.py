@@ -1,6 +1,16 @@
+import functools
+import math
+import re
+import threading
+import time
+import typing
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
 import requests as _requests
+from pydantic import BaseModel, TypeAdapter
 from requests import Response
-from requests.adapters import HTTPAdapter
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 from urllib3.util.retry import Retry
 
 import hirundo.logger
@@ -9,11 +19,18 @@ logger = hirundo.logger.get_logger(__name__)
 
 MINIMUM_CLIENT_SERVER_ERROR_CODE = 400
 
+HEDGE_MAX_WORKERS = 16
+LATENCY_WINDOW_SIZE = 256
+
+T = typing.TypeVar("T")
+
+_ID_SEGMENT = re.compile(r"^(\d+|[0-9a-fA-F-]{16,})$")
+
 
-def _build_retrying_session() -> _requests.Session:
+def _default_retry() -> Retry:
     # No more than 10 tries total (including the initial attempt)
     # urllib3 Retry.total counts retries, not total attempts, so use 9 retries
-    retries = Retry(
+    return Retry(
         total=9,
         backoff_factor=1.0,
         status_forcelist=(429,),
@@ -21,43 +38,221 @@ def _build_retrying_session() -> _requests.Session:
         respect_retry_after_header=True,
         raise_on_status=False,
     )
-    adapter = HTTPAdapter(max_retries=retries)
+
+
+def _build_retrying_session(
+    retries: typing.Optional[Retry] = None,
+    pool_maxsize: int = DEFAULT_POOLSIZE,
+) -> _requests.Session:
+    if retries is None:
+        retries = _default_retry()
+    adapter = HTTPAdapter(max_retries=retries, pool_maxsize=pool_maxsize)
     session = _requests.Session()
     session.mount("http://", adapter)
     session.mount("https://", adapter)
     return session
 
 
-_SESSION = _build_retrying_session()
+class HedgingPolicy(BaseModel):
+    """
+    Configuration for hedged idempotent reads.
+
+    When a `GET` request has not returned within the hedge delay, a second identical request is sent
+    and whichever response arrives first is used.
+    The hedge delay is derived from the recent latencies of the same endpoint.
+    """
+
+    percentile: float = 95.0
+    """
+    The latency percentile (of the same endpoint) after which a hedged request is sent.
+    """
+    min_delay: float = 0.05
+    """
+    The minimum hedge delay in seconds.
+    """
+    max_delay: float = 5.0
+    """
+    The maximum hedge delay in seconds.
+    """
+    initial_delay: float = 1.0
+    """
+    The hedge delay in seconds used until enough latency samples were collected for an endpoint.
+    """
+    min_samples: int = 20
+    """
+    The number of latency samples required before the percentile-derived delay is used.
+    """
+    budget_ratio: float = 0.1
+    """
+    The fraction of extra load hedging is allowed to add, i.e. `0.1` allows at most one
+    hedged request for every 10 primary requests.
+    """
+    budget_burst: float = 10.0
+    """
+    The maximum number of hedged requests that can be saved up in the retry budget.
+    """
+
+
+def _endpoint_key(method: str, url: str) -> str:
+    """
+    Group URLs by endpoint by replacing ID path segments with a placeholder,
+    e.g. `GET https://api.hirundo.io/dataset-qa/dataset/12` becomes `GET /dataset-qa/dataset/{id}`
+    """
+    path = _requests.utils.urlparse(url).path
+    segments = ["{id}" if _ID_SEGMENT.match(s) else s for s in path.split("/")]
+    return f"{method.upper()} {'/'.join(segments)}"
+
+
+class _LatencyTracker:
+    """
+    Keeps a rolling window of response latencies per endpoint.
+    """
+
+    def __init__(self, window_size: int = LATENCY_WINDOW_SIZE):
+        self._window_size = window_size
+        self._samples: defaultdict[str, deque[float]] = defaultdict(
+            lambda: deque(maxlen=self._window_size)
+        )
+        self._lock = threading.Lock()
+
+    def record(self, key: str, seconds: float) -> None:
+        with self._lock:
+            self._samples[key].append(seconds)
 
+    def percentile(
+        self, key: str, percentile: float, min_samples: int = 1
+    ) -> typing.Optional[float]:
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+        if not samples or len(samples) < min_samples:
+            return None
+        index = max(0, math.ceil(percentile / 100 * len(samples)) - 1)
+        return samples[min(index, len(samples) - 1)]
 
-class _RequestsShim:
-    """Shim exposing a subset of the requests API but backed by a retrying Session."""
 
-    HTTPError = _requests.HTTPError
-    Response = _requests.Response
+class _RetryBudget:
+    """
+    Token bucket capping the extra load added by hedged requests.
+    Every primary request deposits `ratio` tokens and every hedged request spends one token.
+    """
 
-    def request(self, method: str, url: str, **kwargs) -> Response:
-        return _SESSION.request(method=method, url=url, **kwargs)
+    def __init__(self, ratio: float, burst: float):
+        self._ratio = ratio
+        self._burst = burst
+        self._tokens = burst
+        self._lock = threading.Lock()
 
-    def get(self, url: str, **kwargs) -> Response:
-        return _SESSION.get(url, **kwargs)
+    def deposit(self) -> None:
+        with self._lock:
+            self._tokens = min(self._burst, self._tokens + self._ratio)
 
-    def post(self, url: str, **kwargs) -> Response:
-        return _SESSION.post(url, **kwargs)
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            return True
 
-    def delete(self, url: str, **kwargs) -> Response:
-        return _SESSION.delete(url, **kwargs)
 
-    def patch(self, url: str, **kwargs) -> Response:
-        return _SESSION.patch(url, **kwargs)
+class _RateLimiter:
+    """
+    Token bucket limiting the rate of requests sent by all threads of a client.
+    Requests over the limit wait for their turn, in the order they arrived.
+    """
 
-    def put(self, url: str, **kwargs) -> Response:
-        return _SESSION.put(url, **kwargs)
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
 
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+            self._tokens -= 1.0
+            # ⬇️ A negative balance reserves a future token, so waiting requests keep their order
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if delay > 0:
+            time.sleep(delay)
 
-# Public shim to be imported by modules instead of the raw requests package
-requests = _RequestsShim()
+
+class _Hedger:
+    def __init__(self, policy: HedgingPolicy):
+        self.policy = policy
+        self.latencies = _LatencyTracker()
+        self.budget = _RetryBudget(policy.budget_ratio, policy.budget_burst)
+        self._executor = ThreadPoolExecutor(
+            max_workers=HEDGE_MAX_WORKERS, thread_name_prefix="hirundo-hedge"
+        )
+
+    def hedge_delay(self, key: str) -> float:
+        delay = self.latencies.percentile(
+            key, self.policy.percentile, self.policy.min_samples
+        )
+        if delay is None:
+            delay = self.policy.initial_delay
+        return min(self.policy.max_delay, max(self.policy.min_delay, delay))
+
+    def _timed_request(
+        self, session: _requests.Session, key: str, method: str, url: str, **kwargs
+    ) -> Response:
+        start = time.monotonic()
+        response = session.request(method=method, url=url, **kwargs)
+        self.latencies.record(key, time.monotonic() - start)
+        return response
+
+    def request(
+        self,
+        session: _requests.Session,
+        method: str,
+        url: str,
+        before_hedge: typing.Optional[typing.Callable[[], None]] = None,
+        **kwargs,
+    ) -> Response:
+        """
+        Send the request, and a hedged copy of it if it is slower than the hedge delay.
+        `before_hedge` is called before the copy is sent, e.g. to wait for the client's rate limiter.
+        """
+        key = _endpoint_key(method, url)
+        self.budget.deposit()
+        primary = self._executor.submit(
+            self._timed_request, session, key, method, url, **kwargs
+        )
+        done, _ = wait([primary], timeout=self.hedge_delay(key))
+        if done or not self.budget.try_spend():
+            return primary.result()
+        if before_hedge is not None:
+            before_hedge()
+            if primary.done():
+                # ⬆️ The primary request finished while waiting, so there is nothing to hedge
+                return primary.result()
+        logger.debug("Hedging slow request to %s", key)
+        hedged = self._executor.submit(
+            self._timed_request, session, key, method, url, **kwargs
+        )
+        pending: set[Future[Response]] = {primary, hedged}
+        while True:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for loser in pending:
+                        loser.add_done_callback(_close_response)
+                    return future.result()
+            if not pending:
+                return done.pop().result()  # Both requests failed, re-raise the error
+
+
+def _close_response(future: "Future[Response]") -> None:
+    if future.exception() is None:
+        future.result().close()
+
+
+HTTPError = _requests.HTTPError
 
 
 def raise_for_status_with_reason(response: Response):
@@ -70,3 +265,20 @@ def raise_for_status_with_reason(response: Response):
         logger.debug("Could not parse response as JSON: %s", e)
 
     response.raise_for_status()
+
+
+@functools.cache
+def _get_type_adapter(type_: typing.Any) -> TypeAdapter:
+    return TypeAdapter(type_)
+
+
+def parse_response(response: Response, type_: type[T]) -> T:
+    """
+    Validate the JSON body of a response into `type_` straight from the response bytes,
+    without first building intermediate Python dicts.
+
+    Args:
+        response: The response to parse
+        type_: The type to validate the response body into, e.g. `list[GitRepoOut]`
+    """
+    return _get_type_adapter(type_).validate_json(response.content)
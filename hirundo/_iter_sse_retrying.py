@@ -1,20 +1,234 @@
 import asyncio
+import random
+import socket
+import threading
 import time
 import typing
 import uuid
+from collections import deque
 from collections.abc import AsyncGenerator, Generator
 
 import httpx
 import urllib3
 from httpx_sse import ServerSentEvent, SSEError, aconnect_sse, connect_sse
-from stamina import retry
 
-from hirundo._http import requests
+from hirundo._deadline import NO_DEADLINE, Deadline
 from hirundo._timeouts import READ_TIMEOUT
 from hirundo.logger import get_logger
 
 logger = get_logger(__name__)
 
+DEFAULT_PING_INTERVAL = 15.0
+DEFAULT_STALL_MULTIPLIER = 3.0
+MAX_RECONNECTS = 100
+# ⬆️ Consecutive failed connections before giving up
+RECONNECT_WAIT_INITIAL = 0.1
+RECONNECT_WAIT_MAX = 5.0
+RECONNECT_WAIT_JITTER = 1.0
+PING_INTERVAL_WINDOW_SIZE = 10
+
+# httpx.ReadError is thrown when there is a network error.
+#   Some network errors may be temporary, hence the retries.
+# httpx.RemoteProtocolError is thrown when the server closes the connection.
+#  This may happen when the server is overloaded and closes the connection or
+#  when Kubernetes restarts / replaces a pod.
+#  Likewise, this will likely be temporary, hence the retries.
+# httpx.ReadTimeout is thrown when no data arrived within the stall timeout,
+#  e.g. because the connection is half-open. Reconnecting resumes the stream.
+RECONNECT_ON = (
+    httpx.ReadError,
+    httpx.ReadTimeout,
+    httpx.RemoteProtocolError,
+    urllib3.exceptions.ReadTimeoutError,
+)
+
+
+class SSEHeartbeat:
+    """
+    Tracks the `ping` events of an SSE stream to detect stalled connections.
+
+    A stream is considered stalled when nothing arrived for `stall_multiplier` times the ping interval.
+    The ping interval is assumed to be `ping_interval` until longer intervals are observed.
+    """
+
+    def __init__(
+        self,
+        ping_interval: float = DEFAULT_PING_INTERVAL,
+        stall_multiplier: float = DEFAULT_STALL_MULTIPLIER,
+        on_ping_latency: typing.Optional[typing.Callable[[float], None]] = None,
+    ):
+        """
+        Args:
+            ping_interval: The expected interval in seconds between `ping` events
+            stall_multiplier: How many ping intervals without any data mean the stream is stalled
+            on_ping_latency: Called with the time in seconds between each pair of consecutive `ping` events
+        """
+        self.ping_interval = ping_interval
+        self.stall_multiplier = stall_multiplier
+        self.on_ping_latency = on_ping_latency
+        self.stalls = 0
+        """
+        The number of times the stream was reconnected because it stalled
+        """
+        self._ping_intervals: deque[float] = deque(maxlen=PING_INTERVAL_WINDOW_SIZE)
+        self._last_ping_at: typing.Optional[float] = None
+
+    @property
+    def stall_timeout(self) -> float:
+        return self.stall_multiplier * max(
+            self.ping_interval, max(self._ping_intervals, default=0.0)
+        )
+
+    def connected(self) -> None:
+        # ⬇️ The time between pings on different connections is not a ping-to-ping latency
+        self._last_ping_at = None
+
+    def observe(self, sse: ServerSentEvent) -> None:
+        if sse.event != "ping":
+            return
+        now = time.monotonic()
+        if self._last_ping_at is not None:
+            latency = now - self._last_ping_at
+            self._ping_intervals.append(latency)
+            if self.on_ping_latency is not None:
+                self.on_ping_latency(latency)
+        self._last_ping_at = now
+
+    def timeout(
+        self,
+        client: typing.Union[httpx.Client, httpx.AsyncClient],
+        deadline: Deadline = NO_DEADLINE,
+    ):
+        """
+        The timeout for a (re)connection: the client's timeouts with the read timeout set to the stall timeout,
+        all limited by the deadline
+        """
+        return httpx.Timeout(
+            connect=deadline.clamp(client.timeout.connect),
+            read=deadline.clamp(self.stall_timeout),
+            write=deadline.clamp(client.timeout.write),
+            pool=deadline.clamp(client.timeout.pool),
+        )
+
+
+class SSECancellation:
+    """
+    Lets another thread stop a blocking SSE stream, e.g. once nobody is listening to it anymore.
+    Cancelling shuts down the open connection (which wakes the thread reading from it)
+    and keeps the stream from reconnecting.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._response: typing.Optional[httpx.Response] = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self) -> None:
+        with self._lock:
+            self._cancelled = True
+            response = self._response
+        if response is not None:
+            _shutdown(response)
+
+    def attach(self, response: httpx.Response) -> None:
+        with self._lock:
+            self._response = response
+            cancelled = self._cancelled
+        if cancelled:
+            _shutdown(response)
+
+    def detach(self) -> None:
+        with self._lock:
+            self._response = None
+
+
+def _shutdown(response: httpx.Response) -> None:
+    # ⬇️ Closing a socket does not wake a thread blocked reading from it, shutting it down does
+    stream = response.extensions.get("network_stream")
+    sock = stream.get_extra_info("socket") if stream is not None else None
+    if sock is None:
+        response.close()
+        return
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass  # Already closed
+
+
+class _ResumePosition:
+    """
+    The position to resume an SSE stream from after reconnecting
+    """
+
+    def __init__(self, last_event_id: str = ""):
+        self.last_event_id = last_event_id
+        self.reconnection_delay = 0.0
+
+    def update(self, sse: ServerSentEvent) -> None:
+        if sse.id:
+            self.last_event_id = sse.id
+        if sse.retry is not None:
+            self.reconnection_delay = sse.retry / 1000
+
+    def headers(self, headers: dict[str, str]) -> dict[str, str]:
+        if self.last_event_id:
+            return {**headers, "Last-Event-ID": self.last_event_id}
+        return headers
+
+
+class _ReconnectBackoff:
+    """
+    Exponential backoff with jitter between reconnections, on top of the `retry` delay sent by the server.
+    Only consecutive failures count, so a long stream whose idle connections get dropped now & then
+    (e.g. by a proxy) never runs out of attempts.
+    """
+
+    def __init__(self, deadline: Deadline):
+        self.deadline = deadline
+        self.failures = 0
+
+    def received(self) -> None:
+        self.failures = 0
+
+    def failed(self, error: Exception) -> None:
+        """
+        Count a failed connection
+
+        Raises:
+            The error of the connection, once `MAX_RECONNECTS` connections failed in a row
+        """
+        self.failures += 1
+        if self.failures >= MAX_RECONNECTS:
+            raise error
+
+    def wait(self) -> float:
+        """
+        The number of seconds to wait before reconnecting, limited by the deadline
+        """
+        wait = min(
+            RECONNECT_WAIT_MAX,
+            RECONNECT_WAIT_INITIAL * 2 ** (self.failures - 1)
+            + random.uniform(0, RECONNECT_WAIT_JITTER),  # noqa: S311
+        )
+        remaining = self.deadline.remaining()
+        return wait if remaining is None else min(wait, remaining)
+
+
+def _log_reconnect(url: str, error: Exception, heartbeat: SSEHeartbeat) -> None:
+    if isinstance(error, httpx.ReadTimeout):
+        heartbeat.stalls += 1
+        logger.warning(
+            "SSE stream from %s stalled for %.1f seconds. Reconnecting",
+            url,
+            heartbeat.stall_timeout,
+        )
+    else:
+        logger.warning("SSE stream from %s failed with %r. Reconnecting", url, error)
+
 
 # Credit: https://github.com/florimondmanca/httpx-sse/blob/master/README.md#handling-reconnections
 def iter_sse_retrying(
@@ -22,56 +236,55 @@ def iter_sse_retrying(
     method: str,
     url: str,
     headers: typing.Optional[dict[str, str]] = None,
+    heartbeat: typing.Optional[SSEHeartbeat] = None,
+    last_event_id: str = "",
+    deadline: Deadline = NO_DEADLINE,
+    cancellation: typing.Optional[SSECancellation] = None,
 ) -> Generator[ServerSentEvent, None, None]:
-    if headers is None:
-        headers = {}
-    last_event_id = ""
-    reconnection_delay = 0.0
-
-    # `stamina` will apply jitter and exponential backoff on top of
-    # the `retry` reconnection delay sent by the server.
-    # httpx.ReadError is thrown when there is a network error.
-    #   Some network errors may be temporary, hence the retries.
-    # httpx.RemoteProtocolError is thrown when the server closes the connection.
-    #  This may happen when the server is overloaded and closes the connection or
-    #  when Kubernetes restarts / replaces a pod.
-    #  Likewise, this will likely be temporary, hence the retries.
-    @retry(
-        on=(
-            httpx.ReadError,
-            httpx.RemoteProtocolError,
-            urllib3.exceptions.ReadTimeoutError,
-        )
-    )
-    def _iter_sse():
-        nonlocal last_event_id, reconnection_delay
-
-        time.sleep(reconnection_delay)
+    headers = headers or {}
+    if heartbeat is None:
+        heartbeat = SSEHeartbeat()
+    if cancellation is None:
+        cancellation = SSECancellation()
+    position = _ResumePosition(last_event_id)
+    backoff = _ReconnectBackoff(deadline)
 
-        connect_headers = {
-            **headers,
-            "Accept": "text/event-stream",
-            "X-Accel-Buffering": "no",
-        }
+    def _connect() -> Generator[ServerSentEvent, None, None]:
+        time.sleep(deadline.clamp(position.reconnection_delay))
+        deadline.check()
+        if cancellation.cancelled:
+            return
 
-        if last_event_id:
-            connect_headers["Last-Event-ID"] = last_event_id
+        connect_headers = position.headers(
+            {
+                **headers,
+                "Accept": "text/event-stream",
+                "X-Accel-Buffering": "no",
+            }
+        )
 
-        with connect_sse(client, method, url, headers=connect_headers) as event_source:
+        heartbeat.connected()
+        with connect_sse(
+            client,
+            method,
+            url,
+            headers=connect_headers,
+            timeout=heartbeat.timeout(client, deadline),
+        ) as event_source:
+            cancellation.attach(event_source.response)
             try:
                 for sse in event_source.iter_sse():
-                    last_event_id = sse.id
-
-                    if sse.retry is not None:
-                        reconnection_delay = sse.retry / 1000
-
+                    deadline.check()
+                    backoff.received()
+                    position.update(sse)
+                    heartbeat.observe(sse)
                     yield sse
             except SSEError:
                 logger.error("SSE error occurred. Trying regular request")
-                response = requests.get(
+                response = client.get(
                     url,
                     headers=connect_headers,
-                    timeout=READ_TIMEOUT,
+                    timeout=deadline.clamp(READ_TIMEOUT),
                 )
                 yield ServerSentEvent(
                     event="",
@@ -79,8 +292,20 @@ def iter_sse_retrying(
                     id=uuid.uuid4().hex,
                     retry=None,
                 )
+            finally:
+                cancellation.detach()
 
-    return _iter_sse()
+    while True:
+        try:
+            yield from _connect()
+            return
+        except RECONNECT_ON as error:
+            if cancellation.cancelled:
+                return
+            deadline.check()
+            backoff.failed(error)
+            _log_reconnect(url, error, heartbeat)
+        time.sleep(backoff.wait())
 
 
 async def aiter_sse_retrying(
@@ -88,49 +313,43 @@ async def aiter_sse_retrying(
     method: str,
     url: str,
     headers: dict[str, str],
+    heartbeat: typing.Optional[SSEHeartbeat] = None,
+    last_event_id: str = "",
+    deadline: Deadline = NO_DEADLINE,
 ) -> AsyncGenerator[ServerSentEvent, None]:
-    last_event_id = ""
-    reconnection_delay = 0.0
-
-    # `stamina` will apply jitter and exponential backoff on top of
-    # the `retry` reconnection delay sent by the server.
-    # httpx.ReadError is thrown when there is a network error.
-    #   Some network errors may be temporary, hence the retries.
-    # httpx.RemoteProtocolError is thrown when the server closes the connection.
-    #  This may happen when the server is overloaded and closes the connection or
-    #  when Kubernetes restarts / replaces a pod.
-    #  Likewise, this will likely be temporary, hence the retries.
-    @retry(
-        on=(
-            httpx.ReadError,
-            httpx.RemoteProtocolError,
-            urllib3.exceptions.ReadTimeoutError,
-        )
-    )
-    async def _iter_sse() -> AsyncGenerator[ServerSentEvent, None]:
-        nonlocal last_event_id, reconnection_delay
+    if heartbeat is None:
+        heartbeat = SSEHeartbeat()
+    position = _ResumePosition(last_event_id)
+    backoff = _ReconnectBackoff(deadline)
 
-        await asyncio.sleep(reconnection_delay)
+    async def _connect() -> AsyncGenerator[ServerSentEvent, None]:
+        await asyncio.sleep(deadline.clamp(position.reconnection_delay))
+        deadline.check()
 
-        connect_headers = {**headers, "Accept": "text/event-stream"}
-
-        if last_event_id:
-            connect_headers["Last-Event-ID"] = last_event_id
+        connect_headers = position.headers({**headers, "Accept": "text/event-stream"})
 
+        heartbeat.connected()
         async with aconnect_sse(
-            client, method, url, headers=connect_headers
+            client,
+            method,
+            url,
+            headers=connect_headers,
+            timeout=heartbeat.timeout(client, deadline),
         ) as event_source:
             try:
                 async for sse in event_source.aiter_sse():
-                    last_event_id = sse.id
-
-                    if sse.retry is not None:
-                        reconnection_delay = sse.retry / 1000
-
+                    deadline.check()
+                    backoff.received()
+                    position.update(sse)
+                    heartbeat.observe(sse)
                     yield sse
             except SSEError:
                 logger.error("SSE error occurred. Trying regular request")
-                response = await client.get(url, headers=connect_headers)
+                response = await client.get(
+                    url,
+                    headers=connect_headers,
+                    timeout=deadline.clamp(READ_TIMEOUT),
+                )
                 yield ServerSentEvent(
                     event="",
                     data=response.text,
@@ -138,4 +357,16 @@ async def aiter_sse_retrying(
                     retry=None,
                 )
 
+    async def _iter_sse() -> AsyncGenerator[ServerSentEvent, None]:
+        while True:
+            try:
+                async for sse in _connect():
+                    yield sse
+                return
+            except RECONNECT_ON as error:
+                deadline.check()
+                backoff.failed(error)
+                _log_reconnect(url, error, heartbeat)
+            await asyncio.sleep(backoff.wait())
+
     return _iter_sse()
@@ -0,0 +1,86 @@
+import datetime
+import typing
+from collections.abc import Generator
+
+from hirundo._http import parse_response, raise_for_status_with_reason
+
+if typing.TYPE_CHECKING:
+    from hirundo.client import HirundoClient
+
+T = typing.TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 500
+
+
+def iter_pages(
+    client: "HirundoClient",
+    path: str,
+    item_type: type[T],
+    params: typing.Optional[dict[str, typing.Any]] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> Generator[T, None, None]:
+    """
+    Lazily page through a list endpoint using `limit` & `offset` query parameters.
+    Only one page is held in memory at a time.
+
+    Note: If the server does not support pagination and returns the full list,
+    the full list is yielded once.
+
+    Args:
+        client: The client to send the requests with
+        path: The API path of the list endpoint
+        item_type: The type of each item in the list
+        params: Additional query parameters to send with each request
+        page_size: The maximum number of items to request per page
+    """
+    if page_size < 1:
+        raise ValueError("`page_size` must be a positive integer")
+    offset = 0
+    first_item: typing.Optional[T] = None
+    while True:
+        response = client.get(
+            path,
+            params={**(params or {}), "limit": page_size, "offset": offset},
+            timeout=client.read_timeout,
+        )
+        raise_for_status_with_reason(response)
+        page = parse_response(response, list[item_type])
+        if not page or (offset and page[0] == first_item):
+            # ⬆️ An identical first item means the server ignored `offset`
+            return
+        first_item = page[0]
+        yield from page
+        if len(page) != page_size:
+            return
+        offset += page_size
+
+
+def to_utc(value: datetime.datetime) -> datetime.datetime:
+    """
+    Convert a datetime to UTC, treating naive datetimes as UTC (like the API server does)
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return value.astimezone(datetime.timezone.utc)
+
+
+def matches_filters(
+    item: typing.Any,
+    name_prefix: typing.Optional[str] = None,
+    created_after: typing.Optional[datetime.datetime] = None,
+    created_before: typing.Optional[datetime.datetime] = None,
+) -> bool:
+    """
+    Check whether a listed item matches the name prefix and creation date filters.
+    Naive datetimes are treated as UTC.
+    """
+    if name_prefix is not None and not item.name.startswith(name_prefix):
+        return False
+    if created_after is None and created_before is None:
+        return True
+    created_at = to_utc(item.created_at)
+    if created_after is not None and created_at < to_utc(created_after):
+        return False
+    if created_before is not None and created_at >= to_utc(created_before):
+        return False
+    return True
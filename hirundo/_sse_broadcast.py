@@ -0,0 +1,161 @@
+import asyncio
+import threading
+import typing
+import weakref
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterator, Hashable
+
+from httpx_sse import ServerSentEvent
+
+from hirundo._fork import reset_after_fork
+from hirundo.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_REPLAY_SIZE = 100
+
+_END = object()
+
+
+class _Broadcast:
+    """
+    A single upstream SSE stream shared by any number of subscriber queues.
+    The most recent `replay_size` events are kept, so that late subscribers can catch up.
+    """
+
+    def __init__(
+        self,
+        open_stream: typing.Callable[[], AsyncIterator[ServerSentEvent]],
+        replay_size: int,
+    ):
+        self._open_stream = open_stream
+        self._history: deque[ServerSentEvent] = deque(maxlen=replay_size)
+        self._subscribers: set[asyncio.Queue] = set()
+        self.finished = False
+        self._error: typing.Optional[BaseException] = None
+        self._task: typing.Optional[asyncio.Task] = None
+
+    def subscribe(self) -> asyncio.Queue:
+        subscriber: asyncio.Queue = asyncio.Queue()
+        for sse in self._history:
+            subscriber.put_nowait(sse)
+        self._subscribers.add(subscriber)
+        if self._task is None:
+            self._task = asyncio.create_task(self._pump())
+        return subscriber
+
+    def unsubscribe(self, subscriber: asyncio.Queue) -> bool:
+        """
+        Remove a subscriber and close the upstream stream if it was the last one.
+
+        Returns:
+            Whether the broadcast has no subscribers left
+        """
+        self._subscribers.discard(subscriber)
+        if self._subscribers:
+            return False
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        return True
+
+    def _publish(self, item: typing.Any) -> None:
+        for subscriber in self._subscribers:
+            subscriber.put_nowait(item)
+
+    async def _pump(self) -> None:
+        stream = self._open_stream()
+        try:
+            async for sse in stream:
+                self._history.append(sse)
+                self._publish(sse)
+        except Exception as error:
+            self._error = error
+        finally:
+            self.finished = True
+            self._publish(self._error if self._error is not None else _END)
+            aclose = getattr(stream, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+
+class SSEBroadcastRegistry:
+    """
+    A process-level registry of shared SSE streams.
+
+    The first subscriber to a key opens the upstream stream, later subscribers attach to the
+    same stream and first receive a replay of its most recent events.
+    The upstream stream is closed when its last subscriber leaves.
+    Subscribing after the upstream stream ended opens a new stream.
+
+    Since `asyncio` objects are bound to an event loop, streams are only shared
+    between subscribers on the same event loop. Streams left behind by closed event loops are dropped.
+    """
+
+    def __init__(self, replay_size: int = DEFAULT_REPLAY_SIZE):
+        self.replay_size = replay_size
+        self._broadcasts: dict[
+            tuple[weakref.ref[asyncio.AbstractEventLoop], Hashable], _Broadcast
+        ] = {}
+        self._lock = threading.Lock()
+        reset_after_fork(self)
+
+    def _after_fork(self) -> None:
+        # ⬇️ The event loops & streams of the parent do not exist in the child
+        self._broadcasts = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._broadcasts)
+
+    def _drop_closed_loops(self) -> None:
+        # ⬇️ A loop closed without unsubscribing (e.g. stopped mid-stream) leaves its streams behind
+        for registry_key in [
+            registry_key
+            for registry_key in self._broadcasts
+            if (loop := registry_key[0]()) is None or loop.is_closed()
+        ]:
+            del self._broadcasts[registry_key]
+
+    async def subscribe(
+        self,
+        key: Hashable,
+        open_stream: typing.Callable[[], AsyncIterator[ServerSentEvent]],
+    ) -> AsyncGenerator[ServerSentEvent, None]:
+        """
+        Subscribe to the stream for `key`, opening it with `open_stream` if it is not open yet.
+
+        Args:
+            key: Identifies the stream, e.g. the client & run ID
+            open_stream: Opens the upstream stream. Only called by the first subscriber.
+
+        Yields:
+            The events of the shared stream, starting with a replay of its most recent events
+        """
+        registry_key = (weakref.ref(asyncio.get_running_loop()), key)
+        # ⬆️ Unlike the loop's `id`, a weak reference never matches a later loop at the same address
+        with self._lock:
+            self._drop_closed_loops()
+            broadcast = self._broadcasts.get(registry_key)
+            if broadcast is None or broadcast.finished:
+                # ⬆️ Streams that already ended are not shared with new subscribers
+                logger.debug("Opening shared SSE stream for %s", key)
+                broadcast = self._broadcasts[registry_key] = _Broadcast(
+                    open_stream, self.replay_size
+                )
+            subscriber = broadcast.subscribe()
+        try:
+            while True:
+                item = await subscriber.get()
+                if item is _END:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            with self._lock:
+                if (
+                    broadcast.unsubscribe(subscriber)
+                    and self._broadcasts.get(registry_key) is broadcast
+                ):
+                    logger.debug("Closing shared SSE stream for %s", key)
+                    del self._broadcasts[registry_key]
@@ -0,0 +1,169 @@
+import typing
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+from pydantic import BaseModel
+from requests import HTTPError
+
+from hirundo.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_BULK_CONCURRENCY = 8
+
+ID = typing.TypeVar("ID", int, str)
+M = typing.TypeVar("M")
+
+
+class BulkResult(BaseModel):
+    """
+    The outcome of a bulk operation for a single ID
+    """
+
+    id: typing.Union[int, str]
+    error: typing.Optional[str] = None
+    """
+    The error the operation failed with, or `None` if it succeeded
+    """
+    status_code: typing.Optional[int] = None
+    """
+    The HTTP status code of the failed request, if the server rejected it
+    """
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class BulkReport(BaseModel):
+    """
+    The outcome of a bulk operation (e.g. :func:`QADataset.delete_many`) for each ID, in the given order
+    """
+
+    operation: str
+    results: list[BulkResult]
+
+    @property
+    def succeeded(self) -> list[typing.Union[int, str]]:
+        """
+        The IDs the operation succeeded for
+        """
+        return [result.id for result in self.results if result.ok]
+
+    @property
+    def failed(self) -> list[BulkResult]:
+        """
+        The results of the IDs the operation failed for
+        """
+        return [result for result in self.results if not result.ok]
+
+
+def _run_one(operation: typing.Callable[[ID], None], id_: ID) -> BulkResult:
+    try:
+        operation(id_)
+    except HTTPError as error:
+        return BulkResult(
+            id=id_,
+            error=str(error),
+            status_code=error.response.status_code
+            if error.response is not None
+            else None,
+        )
+    except Exception as error:
+        return BulkResult(id=id_, error=str(error))
+    return BulkResult(id=id_)
+
+
+def run_bulk(
+    name: str,
+    operation: typing.Callable[[ID], None],
+    ids: Iterable[ID],
+    max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+) -> BulkReport:
+    """
+    Run an operation for each ID, at most `max_concurrency` at once.
+    A failure for one ID does not stop the operation for the other IDs.
+
+    Args:
+        name: The name of the operation, used in logs & the report
+        operation: The operation to run for a single ID
+        ids: The IDs to run the operation for. Duplicate IDs are only processed once.
+        max_concurrency: The maximum number of operations running at once
+
+    Returns:
+        A report with the outcome for each ID
+    """
+    unique_ids = list(dict.fromkeys(ids))
+    if not unique_ids:
+        return BulkReport(operation=name, results=[])
+    with ThreadPoolExecutor(
+        max_workers=min(max_concurrency, len(unique_ids)),
+        thread_name_prefix=f"hirundo-{name}",
+    ) as executor:
+        results = list(executor.map(lambda id_: _run_one(operation, id_), unique_ids))
+    report = BulkReport(operation=name, results=results)
+    logger.info(
+        "Bulk %s: %s succeeded, %s failed",
+        name,
+        len(report.succeeded),
+        len(report.failed),
+    )
+    return report
+
+
+def create_deduplicated(
+    name: str,
+    create: typing.Callable[[M], int],
+    models: Sequence[M],
+    key: typing.Callable[[M], str],
+    max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+) -> list[typing.Optional[int]]:
+    """
+    Create models on the server, at most `max_concurrency` at once.
+    Models with the same `key` (e.g. the same content hash) are only created once and share the ID.
+    A failure for one model does not stop the others.
+
+    Args:
+        name: The name of the operation, used in logs
+        create: Creates a single model & returns its ID
+        models: The models to create
+        key: The key of a model. Models with the same key are created once.
+        max_concurrency: The maximum number of models being created at once
+
+    Returns:
+        The ID of each model in the given order, or `None` if it could not be created
+    """
+    keys = [key(model) for model in models]
+    unique: dict[str, M] = {}
+    for model_key, model in zip(keys, models):
+        unique.setdefault(model_key, model)
+    if not unique:
+        return []
+    with ThreadPoolExecutor(
+        max_workers=min(max_concurrency, len(unique)),
+        thread_name_prefix=f"hirundo-{name}",
+    ) as executor:
+        futures = {
+            model_key: executor.submit(create, model)
+            for model_key, model in unique.items()
+        }
+    ids: dict[str, typing.Optional[int]] = {}
+    for model_key, future in futures.items():
+        try:
+            ids[model_key] = future.result()
+        except Exception as e:
+            logger.error(
+                "Bulk %s failed for %s",
+                name,
+                getattr(unique[model_key], "name", model_key),
+                exc_info=e,
+            )
+            ids[model_key] = None
+    logger.info(
+        "Bulk %s: %s distinct of %s created, %s failed",
+        name,
+        sum(id_ is not None for id_ in ids.values()),
+        len(models),
+        sum(id_ is None for id_ in ids.values()),
+    )
+    return [ids[model_key] for model_key in keys]
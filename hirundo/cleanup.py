@@ -0,0 +1,374 @@
+import datetime
+import typing
+from collections import defaultdict
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+
+from pydantic import BaseModel
+
+from hirundo.bulk import DEFAULT_BULK_CONCURRENCY, BulkReport, BulkResult
+from hirundo.client import HirundoClient, resolve_client
+from hirundo.dataset_qa import DataQARunOut, QADataset, QADatasetOut, RunStatus
+from hirundo.git import GitRepo, GitRepoOut
+from hirundo.logger import get_logger
+from hirundo.storage import ResponseStorageConfig, StorageConfig
+
+logger = get_logger(__name__)
+
+
+class CleanupPlan(BaseModel):
+    """
+    The resources a :class:`Cleanup` deletes, per level in deletion order
+    """
+
+    run_ids: list[str] = []
+    """
+    The runs to archive
+    """
+    dataset_ids: list[int] = []
+    """
+    The datasets to delete, once their runs are archived
+    """
+    storage_config_ids: list[int] = []
+    """
+    The storage configs to delete, once the datasets using them are deleted
+    """
+    git_repo_ids: list[int] = []
+    """
+    The Git repositories to delete, once the storage configs using them are deleted
+    """
+    dependents: dict[str, list[str]] = {}
+    """
+    The resources that must be gone before each resource can be deleted,
+    keyed by `"<resource>:<id>"`, e.g. `{"dataset:12": ["run:abc"]}`
+    """
+
+    @property
+    def empty(self) -> bool:
+        return not (
+            self.run_ids
+            or self.dataset_ids
+            or self.storage_config_ids
+            or self.git_repo_ids
+        )
+
+
+class CleanupReport(BaseModel):
+    """
+    The outcome of a :class:`Cleanup`
+    """
+
+    plan: CleanupPlan
+    dry_run: bool
+    reports: list[BulkReport] = []
+    """
+    A report for each level that was cleaned up, in deletion order. Empty for a dry run.
+    """
+
+    @property
+    def failed(self) -> list[BulkResult]:
+        """
+        The results of the resources that could not be deleted, including the resources
+        skipped because a resource depending on them could not be deleted
+        """
+        return [result for report in self.reports for result in report.failed]
+
+
+def _resource_key(resource: str, id_: typing.Union[int, str]) -> str:
+    return f"{resource}:{id_}"
+
+
+def _matches_name(
+    name: str, name_prefix: typing.Optional[str], name_contains: typing.Optional[str]
+) -> bool:
+    return (name_prefix is None or name.startswith(name_prefix)) and (
+        name_contains is None or name_contains in name
+    )
+
+
+class Cleanup:
+    """
+    Delete runs, datasets, storage configs & Git repositories that match the given filters,
+    respecting the dependencies between them.
+
+    Resources are deleted level by level: the runs are archived, then the datasets are deleted,
+    then the storage configs and finally the Git repositories.
+    Each level is deleted in parallel, and a level only starts once the level before it finished.
+    A resource is skipped (and reported as failed) if a resource depending on it could not be deleted,
+    e.g. a dataset is kept if one of its runs could not be archived.
+    Storage configs & Git repositories still used by resources that are kept are never deleted.
+    """
+
+    def __init__(
+        self,
+        name_prefix: typing.Optional[str] = None,
+        name_contains: typing.Optional[str] = None,
+        older_than: typing.Optional[datetime.timedelta] = None,
+        include_succeeded: bool = False,
+        include_without_runs: bool = False,
+        include_orphans: bool = False,
+        organization_id: typing.Optional[int] = None,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        client: typing.Optional[HirundoClient] = None,
+    ):
+        """
+        Args:
+            name_prefix: If provided, only resources whose name starts with this prefix are deleted
+            name_contains: If provided, only resources whose name contains this string are deleted
+            older_than: If provided, only datasets (with their runs) and Git repositories without activity
+                for this long are deleted. The activity of a dataset includes the creation of its runs.
+                Storage configs are only deleted along with the expired datasets using them.
+            include_succeeded: If True, datasets whose runs all succeeded are deleted regardless of `older_than`
+            include_without_runs: If True, datasets without runs are deleted too (subject to `older_than`).
+                By default they are kept, since they may have just been created for a run.
+            include_orphans: If True, storage configs & Git repositories matching the name filters are deleted
+                even if no deleted dataset (or storage config) uses them, as long as nothing kept uses them.
+                Without `older_than` this includes every unused storage config, since their age is unknown.
+                By default only the storage configs & Git repositories of the deleted datasets are deleted.
+            organization_id: The ID of the organization to clean up. Defaults to the user's default organization.
+            max_concurrency: The maximum number of requests sent at once for each level
+            client: The client to use. Defaults to the default client.
+        """
+        self.name_prefix = name_prefix
+        self.name_contains = name_contains
+        self.older_than = older_than
+        self.include_succeeded = include_succeeded
+        self.include_without_runs = include_without_runs
+        self.include_orphans = include_orphans
+        self.organization_id = organization_id
+        self.max_concurrency = max_concurrency
+        self.client = resolve_client(client)
+
+    def _matches(self, name: str) -> bool:
+        return _matches_name(name, self.name_prefix, self.name_contains)
+
+    def _cutoff(self) -> typing.Optional[datetime.datetime]:
+        if self.older_than is None:
+            return None
+        return datetime.datetime.now(datetime.timezone.utc) - self.older_than
+
+    def _expired(
+        self,
+        dataset: QADatasetOut,
+        runs: list[DataQARunOut],
+        cutoff: typing.Optional[datetime.datetime],
+    ) -> bool:
+        if not runs and not self.include_without_runs:
+            return False
+        if (
+            self.include_succeeded
+            and runs
+            and all(run.status == RunStatus.SUCCESS for run in runs)
+        ):
+            return True
+        if cutoff is None:
+            return True
+        last_activity = max(
+            [dataset.updated_at, *(run.created_at for run in runs)],
+        )
+        return last_activity <= cutoff
+
+    def _list(
+        self,
+    ) -> tuple[
+        list[DataQARunOut],
+        list[QADatasetOut],
+        list[ResponseStorageConfig],
+        list[GitRepoOut],
+    ]:
+        with ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="hirundo-cleanup"
+        ) as executor:
+            runs = executor.submit(
+                QADataset.list_runs, self.organization_id, client=self.client
+            )
+            datasets = executor.submit(
+                QADataset.list_datasets, self.organization_id, client=self.client
+            )
+            storage_configs = executor.submit(
+                StorageConfig.list, self.organization_id, client=self.client
+            )
+            git_repos = executor.submit(GitRepo.list, client=self.client)
+        return (
+            runs.result(),
+            datasets.result(),
+            storage_configs.result(),
+            git_repos.result(),
+        )
+
+    def _plan_datasets(
+        self,
+        plan: CleanupPlan,
+        runs: list[DataQARunOut],
+        datasets: list[QADatasetOut],
+    ) -> set[int]:
+        """
+        Add the expired datasets & their runs to the plan
+
+        Returns:
+            The IDs of the storage configs used by the datasets that are kept
+        """
+        cutoff = self._cutoff()
+        runs_by_dataset: defaultdict[int, list[DataQARunOut]] = defaultdict(list)
+        for run in runs:
+            runs_by_dataset[run.dataset_id].append(run)
+        kept_storage_config_ids: set[int] = set()
+        for dataset in datasets:
+            dataset_runs = runs_by_dataset[dataset.id]
+            if not (
+                self._matches(dataset.name)
+                and self._expired(dataset, dataset_runs, cutoff)
+            ):
+                kept_storage_config_ids.add(dataset.storage_config.id)
+                continue
+            plan.dataset_ids.append(dataset.id)
+            dataset_key = _resource_key("dataset", dataset.id)
+            for run in dataset_runs:
+                plan.run_ids.append(run.run_id)
+                plan.dependents.setdefault(dataset_key, []).append(
+                    _resource_key("run", run.run_id)
+                )
+            plan.dependents.setdefault(
+                _resource_key("storage-config", dataset.storage_config.id), []
+            ).append(dataset_key)
+        return kept_storage_config_ids
+
+    def _plan_storage_configs(
+        self,
+        plan: CleanupPlan,
+        storage_configs: list[ResponseStorageConfig],
+        kept_storage_config_ids: set[int],
+    ) -> set[int]:
+        """
+        Add the storage configs of the deleted datasets to the plan.
+        With `include_orphans` and without an expiry, unused storage configs matching the name filters are added too.
+        With an expiry they are not, since their age is unknown & they may belong to a dataset being created.
+
+        Returns:
+            The IDs of the Git repositories used by the storage configs that are kept
+        """
+        kept_git_repo_ids: set[int] = set()
+        for storage_config in storage_configs:
+            storage_config_key = _resource_key("storage-config", storage_config.id)
+            selected = storage_config_key in plan.dependents or (
+                self.include_orphans
+                and self.older_than is None
+                and self._matches(storage_config.name)
+            )
+            if not selected or storage_config.id in kept_storage_config_ids:
+                if storage_config.git is not None:
+                    kept_git_repo_ids.add(storage_config.git.repo.id)
+                continue
+            plan.storage_config_ids.append(storage_config.id)
+            if storage_config.git is not None:
+                plan.dependents.setdefault(
+                    _resource_key("git-repo", storage_config.git.repo.id), []
+                ).append(storage_config_key)
+        return kept_git_repo_ids
+
+    def _plan_git_repos(
+        self,
+        plan: CleanupPlan,
+        git_repos: list[GitRepoOut],
+        kept_git_repo_ids: set[int],
+    ) -> None:
+        """
+        Add the Git repositories of the deleted storage configs to the plan, and with `include_orphans`
+        the unused expired Git repositories matching the name filters
+        """
+        cutoff = self._cutoff()
+        for git_repo in git_repos:
+            if git_repo.id in kept_git_repo_ids:
+                continue
+            if _resource_key("git-repo", git_repo.id) in plan.dependents or (
+                self.include_orphans
+                and self._matches(git_repo.name)
+                and (cutoff is None or git_repo.updated_at <= cutoff)
+            ):
+                plan.git_repo_ids.append(git_repo.id)
+
+    def plan(self) -> CleanupPlan:
+        """
+        List the resources on the server and work out which of them to delete, without deleting anything
+        """
+        runs, datasets, storage_configs, git_repos = self._list()
+        plan = CleanupPlan()
+        kept_storage_config_ids = self._plan_datasets(plan, runs, datasets)
+        kept_git_repo_ids = self._plan_storage_configs(
+            plan, storage_configs, kept_storage_config_ids
+        )
+        self._plan_git_repos(plan, git_repos, kept_git_repo_ids)
+        return plan
+
+    def _delete_level(
+        self,
+        resource: str,
+        operation: typing.Callable[..., BulkReport],
+        ids: Iterable[typing.Union[int, str]],
+        plan: CleanupPlan,
+        failed: set[str],
+    ) -> BulkReport:
+        """
+        Delete a level of resources, skipping the resources with dependents that could not be deleted.
+        The keys of the resources that are not deleted are added to `failed`.
+        """
+        ids = list(ids)
+        skipped: dict[typing.Union[int, str], BulkResult] = {}
+        for id_ in ids:
+            key = _resource_key(resource, id_)
+            blocking = [
+                dependent
+                for dependent in plan.dependents.get(key, [])
+                if dependent in failed
+            ]
+            if blocking:
+                failed.add(key)
+                skipped[id_] = BulkResult(
+                    id=id_,
+                    error=f"Skipped because {', '.join(blocking)} could not be deleted",
+                )
+        report = operation(
+            [id_ for id_ in ids if id_ not in skipped],
+            self.max_concurrency,
+            client=self.client,
+        )
+        failed.update(_resource_key(resource, result.id) for result in report.failed)
+        results = {result.id: result for result in report.results}
+        results.update(skipped)
+        return BulkReport(
+            operation=report.operation, results=[results[id_] for id_ in ids]
+        )
+
+    def run(self, dry_run: bool = False) -> CleanupReport:
+        """
+        Delete the resources selected by :func:`Cleanup.plan`
+
+        Args:
+            dry_run: If True, only plan the cleanup & log what would be deleted
+
+        Returns:
+            A report with the plan & the outcome of each level
+        """
+        plan = self.plan()
+        logger.info(
+            "%s %s runs, %s datasets, %s storage configs and %s Git repositories",
+            "Would clean up" if dry_run else "Cleaning up",
+            len(plan.run_ids),
+            len(plan.dataset_ids),
+            len(plan.storage_config_ids),
+            len(plan.git_repo_ids),
+        )
+        if dry_run:
+            return CleanupReport(plan=plan, dry_run=True)
+        failed: set[str] = set()
+        levels: list[tuple[str, typing.Callable[..., BulkReport], list[typing.Any]]] = [
+            ("run", QADataset.archive_runs, plan.run_ids),
+            ("dataset", QADataset.delete_many, plan.dataset_ids),
+            ("storage-config", StorageConfig.delete_many, plan.storage_config_ids),
+            ("git-repo", GitRepo.delete_many, plan.git_repo_ids),
+        ]
+        reports = [
+            self._delete_level(resource, operation, ids, plan, failed)
+            for resource, operation, ids in levels
+        ]
+        return CleanupReport(plan=plan, dry_run=False, reports=reports)
@@ -1,3 +1,5 @@
+import datetime
+import itertools
 import os
 import re
 import sys
@@ -12,6 +14,9 @@ from rich.table import Table
 
 from hirundo._env import API_HOST, EnvLocation
 
+if typing.TYPE_CHECKING:
+    from hirundo.manifest import ManifestPlan
+
 docs = "sphinx" in sys.modules
 hirundo_epilog = (
     None
@@ -205,13 +210,48 @@ def check_run(
 
 
 @app.command("list-runs", epilog=hirundo_epilog)
-def list_runs():
+def list_runs(
+    status: Annotated[
+        typing.Optional[list[str]],
+        typer.Option(
+            help="Only list runs with this status. Can be passed multiple times."
+        ),
+    ] = None,
+    name_prefix: Annotated[
+        typing.Optional[str],
+        typer.Option(help="Only list runs whose dataset name starts with this prefix."),
+    ] = None,
+    created_after: Annotated[
+        typing.Optional[datetime.datetime],
+        typer.Option(help="Only list runs created at or after this time (UTC)."),
+    ] = None,
+    limit: Annotated[
+        typing.Optional[int],
+        typer.Option(help="The maximum number of runs to list."),
+    ] = None,
+):
     """
     List all runs available.
     """
-    from hirundo.dataset_qa import QADataset
+    from hirundo.dataset_qa import QADataset, RunStatus
 
-    runs = QADataset.list_runs()
+    statuses = None
+    if status:
+        try:
+            statuses = [RunStatus(s.upper().replace("_", " ")) for s in status]
+        except ValueError:
+            raise typer.BadParameter(
+                f"Must be one of: {', '.join(s.name for s in RunStatus)}",
+                param_hint="--status",
+            ) from None
+    runs = itertools.islice(
+        QADataset.iter_runs(
+            status=statuses,
+            name_prefix=name_prefix,
+            created_after=created_after,
+        ),
+        limit,
+    )
 
     console = Console()
     table = Table(
@@ -241,6 +281,227 @@ def list_runs():
     console.print(table)
 
 
+@app.command("cleanup", epilog=hirundo_epilog)
+def cleanup(
+    name_prefix: Annotated[
+        typing.Optional[str],
+        typer.Option(help="Only delete resources whose name starts with this prefix."),
+    ] = None,
+    name_contains: Annotated[
+        typing.Optional[str],
+        typer.Option(help="Only delete resources whose name contains this string."),
+    ] = None,
+    older_than_days: Annotated[
+        typing.Optional[float],
+        typer.Option(
+            help="Only delete datasets & Git repositories without activity for this many days."
+        ),
+    ] = None,
+    include_succeeded: Annotated[
+        bool,
+        typer.Option(
+            help="Also delete datasets whose runs all succeeded, regardless of their age."
+        ),
+    ] = False,
+    include_without_runs: Annotated[
+        bool,
+        typer.Option(help="Also delete datasets without runs."),
+    ] = False,
+    include_orphans: Annotated[
+        bool,
+        typer.Option(
+            help="Also delete unused storage configs & Git repositories matching the name filters, not only those of deleted datasets."
+        ),
+    ] = False,
+    max_concurrency: Annotated[
+        int,
+        typer.Option(help="The maximum number of requests sent at once."),
+    ] = 8,
+    dry_run: Annotated[
+        bool,
+        typer.Option(help="Only list what would be deleted."),
+    ] = False,
+):
+    """
+    Archive runs and delete datasets, storage configs and Git repositories, in dependency order.
+    """
+    from hirundo.cleanup import Cleanup
+
+    if name_prefix is None and name_contains is None and older_than_days is None:
+        print(
+            "Refusing to clean up everything. Pass --name-prefix, --name-contains or --older-than-days."
+        )
+        raise typer.Exit(code=1)
+    report = Cleanup(
+        name_prefix=name_prefix,
+        name_contains=name_contains,
+        older_than=datetime.timedelta(days=older_than_days)
+        if older_than_days is not None
+        else None,
+        include_succeeded=include_succeeded,
+        include_without_runs=include_without_runs,
+        include_orphans=include_orphans,
+        max_concurrency=max_concurrency,
+    ).run(dry_run=dry_run)
+
+    console = Console()
+    table = Table(
+        title="Would delete:" if dry_run else "Deleted:",
+        expand=True,
+    )
+    for col in ("Resource", "IDs"):
+        table.add_column(col, overflow="fold")
+    plan = report.plan
+    for resource, ids in (
+        ("Runs (archived)", plan.run_ids),
+        ("Datasets", plan.dataset_ids),
+        ("Storage configs", plan.storage_config_ids),
+        ("Git repositories", plan.git_repo_ids),
+    ):
+        table.add_row(resource, ", ".join(str(id_) for id_ in ids))
+    console.print(table)
+    for result in report.failed:
+        print(f"Failed to delete {result.id}: {result.error}")
+    if report.failed:
+        raise typer.Exit(code=1)
+
+
+@app.command("register", epilog=hirundo_epilog)
+def register(
+    manifest_file: Annotated[
+        Path,
+        typer.Option(
+            "--file",
+            "-f",
+            exists=True,
+            dir_okay=False,
+            help="The YAML manifest of the datasets to register.",
+        ),
+    ],
+    replace_if_exists: Annotated[
+        bool,
+        typer.Option(
+            help="Replace existing datasets, storage configs and Git repositories with the same names."
+        ),
+    ] = False,
+    max_concurrency: Annotated[
+        int,
+        typer.Option(help="The maximum number of requests sent at once."),
+    ] = 8,
+    skip_unchanged: Annotated[
+        bool,
+        typer.Option(
+            help="With --replace-if-exists, skip replacing resources that did not change since they were last registered from this machine."
+        ),
+    ] = True,
+):
+    """
+    Create the datasets of a YAML manifest, with their storage configs and Git repositories.
+    """
+    from hirundo.fingerprints import FingerprintStore
+    from hirundo.manifest import Manifest
+
+    manifest = Manifest.from_yaml(manifest_file)
+    dataset_ids = manifest.register(
+        replace_if_exists=replace_if_exists,
+        max_concurrency=max_concurrency,
+        fingerprints=FingerprintStore() if skip_unchanged else None,
+    )
+
+    console = Console()
+    table = Table(title="Registered datasets:", expand=True)
+    for col in ("Dataset name", "Dataset ID"):
+        table.add_column(col, overflow="fold")
+    for name, dataset_id in dataset_ids.items():
+        table.add_row(name, str(dataset_id))
+    console.print(table)
+    failed = [
+        dataset.name for dataset in manifest.datasets if dataset.name not in dataset_ids
+    ]
+    if failed:
+        print(f"Failed to register: {', '.join(failed)}")
+        raise typer.Exit(code=1)
+
+
+def _print_plan(plan: "ManifestPlan", title: str):
+    from hirundo.manifest import ChangeAction
+
+    symbols = {
+        ChangeAction.CREATE: "+",
+        ChangeAction.UPDATE: "~",
+        ChangeAction.UNCHANGED: "=",
+    }
+    console = Console()
+    table = Table(title=title, expand=True)
+    for col in ("", "Resource", "Name", "Changed fields", "ID", "Error"):
+        table.add_column(col, overflow="fold")
+    for change in plan.changes:
+        table.add_row(
+            symbols[change.action],
+            change.resource,
+            change.name,
+            ", ".join(change.changed_fields),
+            str(change.id) if change.id is not None else None,
+            change.error,
+        )
+    console.print(table)
+
+
+@app.command("plan", epilog=hirundo_epilog)
+def plan(
+    manifest_file: Annotated[
+        Path,
+        typer.Option(
+            "--file",
+            "-f",
+            exists=True,
+            dir_okay=False,
+            help="The YAML manifest of the datasets to compare to the server.",
+        ),
+    ],
+):
+    """
+    Show the changes `hirundo apply` would make to bring the server in line with a YAML manifest.
+    """
+    from hirundo.manifest import Manifest
+
+    manifest_plan = Manifest.from_yaml(manifest_file).plan()
+    _print_plan(manifest_plan, "Planned changes:")
+    print(f"{len(manifest_plan.pending)} to create or replace")
+
+
+@app.command("apply", epilog=hirundo_epilog)
+def apply(
+    manifest_file: Annotated[
+        Path,
+        typer.Option(
+            "--file",
+            "-f",
+            exists=True,
+            dir_okay=False,
+            help="The YAML manifest of the datasets to apply.",
+        ),
+    ],
+    max_concurrency: Annotated[
+        int,
+        typer.Option(help="The maximum number of requests sent at once."),
+    ] = 8,
+):
+    """
+    Create the datasets, storage configs and Git repositories of a YAML manifest that do not exist
+    on the server and replace those that changed, in dependency order.
+    """
+    from hirundo.manifest import Manifest
+
+    manifest_plan = Manifest.from_yaml(manifest_file).apply(
+        max_concurrency=max_concurrency
+    )
+    _print_plan(manifest_plan, "Applied changes:")
+    if manifest_plan.failed:
+        print(f"Failed to apply: {', '.join(c.key for c in manifest_plan.failed)}")
+        raise typer.Exit(code=1)
+
+
 typer_click_object = typer.main.get_command(app)
 
 if __name__ == "__main__":
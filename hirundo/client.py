@@ -0,0 +1,407 @@
+import gzip
+import json
+import math
+import os
+import threading
+import typing
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+from requests import Response, Session
+from requests.adapters import DEFAULT_POOLSIZE
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+
+from hirundo import _env
+from hirundo._fork import reset_after_fork
+from hirundo._headers import get_headers
+from hirundo._http import (
+    HedgingPolicy,
+    _build_retrying_session,
+    _endpoint_key,
+    _Hedger,
+    _LatencyTracker,
+    _RateLimiter,
+)
+from hirundo._iter_sse_retrying import (
+    DEFAULT_PING_INTERVAL,
+    DEFAULT_STALL_MULTIPLIER,
+    SSEHeartbeat,
+)
+from hirundo._timeouts import DOWNLOAD_READ_TIMEOUT, MODIFY_TIMEOUT, READ_TIMEOUT
+
+if typing.TYPE_CHECKING:
+    from hirundo.name_cache import NameCache
+
+SSE_CONNECT_TIMEOUT = 5.0
+GZIP_COMPRESS_LEVEL = 6
+DEFAULT_MAX_WORKERS = 8
+
+ACCEPT_ENCODING = make_headers(accept_encoding=True)["accept-encoding"]
+"""
+The response encodings the HTTP transport can decode.
+Always includes `gzip` & `deflate`, and includes `br` & `zstd` when the optional
+`brotli` & `zstandard` packages are installed.
+"""
+
+
+class HirundoClient:
+    """
+    A client for a single Hirundo deployment and API key.
+
+    The client owns the API server address, the credentials, the pooled HTTP transport, the timeouts
+    and the retry policy used for every request made with it.
+    All resource classes (e.g. `QADataset`, `StorageConfig` & `GitRepo`) accept a `client` argument,
+    so a single process can work with several deployments or API keys at once.
+    When no client is passed, the default client (see :func:`get_default_client`) is used,
+    which is configured from the `API_HOST` & `API_KEY` environment variables.
+
+    Clients can be used before forking worker processes (e.g. with `multiprocessing` or `gunicorn`):
+    each child process gets its own connection pools, thread pool & locks.
+    """
+
+    def __init__(
+        self,
+        api_host: typing.Optional[str] = None,
+        api_key: typing.Optional[str] = None,
+        read_timeout: float = READ_TIMEOUT,
+        modify_timeout: float = MODIFY_TIMEOUT,
+        download_read_timeout: float = DOWNLOAD_READ_TIMEOUT,
+        retry: typing.Optional[Retry] = None,
+        hedging: typing.Optional[HedgingPolicy] = None,
+        compress_requests_above: typing.Optional[int] = None,
+        sse_ping_interval: float = DEFAULT_PING_INTERVAL,
+        sse_stall_multiplier: float = DEFAULT_STALL_MULTIPLIER,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_requests_per_second: typing.Optional[float] = None,
+        request_burst: typing.Optional[int] = None,
+        name_cache: typing.Optional["NameCache"] = None,
+    ):
+        """
+        Args:
+            api_host: The API server address, e.g. `https://api.hirundo.io`.
+                Defaults to the `API_HOST` environment variable.
+            api_key: The API key to authenticate with. Defaults to the `API_KEY` environment variable.
+            read_timeout: The timeout in seconds for read requests
+            modify_timeout: The timeout in seconds for requests that modify server state
+            download_read_timeout: The read timeout in seconds for result downloads
+            retry: The `urllib3` retry policy of the HTTP transport.
+                Defaults to retrying rate-limited requests up to 9 times with exponential backoff.
+            hedging: If provided, idempotent reads are hedged using this policy
+            compress_requests_above: If provided, JSON request bodies of at least this many bytes
+                are sent gzip-compressed (with a `Content-Encoding: gzip` header).
+                Only enable this if the API server accepts compressed request bodies.
+            sse_ping_interval: The expected interval in seconds between the `ping` events of SSE streams.
+                Longer intervals are learned from the stream.
+            sse_stall_multiplier: SSE streams are reconnected (resuming from the last event)
+                when nothing arrived for this many ping intervals
+            max_workers: The maximum number of background tasks (e.g. :func:`QADataset.submit` calls)
+                running at once. The HTTP connection pool is sized to fit them.
+            max_requests_per_second: If provided, API requests from all threads using this client
+                are limited to this rate. Requests over the limit wait for their turn.
+            request_burst: The number of requests that can be sent at once before the rate limit applies.
+                Defaults to `max_requests_per_second` (rounded up).
+            name_cache: If provided, lookups by name are cached in it, see :class:`NameCache`
+        """
+        self.api_host = (api_host or _env.API_HOST).rstrip("/")
+        self.api_key = api_key if api_key is not None else _env.API_KEY
+        self.read_timeout = read_timeout
+        self.modify_timeout = modify_timeout
+        self.download_read_timeout = download_read_timeout
+        self.retry = retry
+        self.compress_requests_above = compress_requests_above
+        self.max_workers = max_workers
+        self._session = self._build_session()
+        self._session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        self._hedger = _Hedger(hedging) if hedging is not None else None
+        self.sse_ping_interval = sse_ping_interval
+        self.sse_stall_multiplier = sse_stall_multiplier
+        self._sse_ping_latencies = _LatencyTracker()
+        self._executor: typing.Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._rate_limiter = (
+            _RateLimiter(
+                max_requests_per_second,
+                request_burst or math.ceil(max_requests_per_second),
+            )
+            if max_requests_per_second is not None
+            else None
+        )
+        self.name_cache = name_cache
+        self._pid = os.getpid()
+        reset_after_fork(self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(api_host={self.api_host!r})"
+
+    def _build_session(self) -> Session:
+        return _build_retrying_session(
+            self.retry, pool_maxsize=max(DEFAULT_POOLSIZE, self.max_workers)
+        )
+
+    def _after_fork(self) -> None:
+        # ⬇️ The parent's pooled sockets are dropped rather than closed, as they are still in use by the parent
+        session = self._build_session()
+        session.headers.update(self._session.headers)
+        session.cookies.update(self._session.cookies)
+        self._session = session
+        if self._hedger is not None:
+            self._hedger = _Hedger(self._hedger.policy)
+        self._sse_ping_latencies = _LatencyTracker()
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        if self._rate_limiter is not None:
+            self._rate_limiter = _RateLimiter(
+                self._rate_limiter.rate, self._rate_limiter.burst
+            )
+        self._pid = os.getpid()
+
+    @property
+    def session(self) -> Session:
+        """
+        The pooled HTTP transport of the client
+        """
+        if self._pid != os.getpid():
+            # ⬆️ Forked without running the `os.register_at_fork` hooks, e.g. from a C extension
+            self._after_fork()
+        return self._session
+
+    def configure_hedging(self, policy: typing.Optional[HedgingPolicy]) -> None:
+        """
+        Enable hedged requests for idempotent reads (non-streaming `GET` requests) using the given policy.
+        Pass `None` to disable hedging.
+
+        Args:
+            policy: The hedging policy to use or `None` to disable hedging
+        """
+        self._hedger = _Hedger(policy) if policy is not None else None
+
+    def configure_name_cache(self, cache: typing.Optional["NameCache"]) -> None:
+        """
+        Cache lookups by name (e.g. :func:`QADataset.get_by_name`) in the given cache.
+        Pass `None` to disable caching.
+
+        Args:
+            cache: The cache to use or `None` to disable caching
+        """
+        self.name_cache = cache
+
+    def auth_headers(self) -> dict[str, str]:
+        if not self.api_key:
+            raise ValueError(
+                "API_KEY is not set. Please run `hirundo setup` to set the API key"
+            )
+        return {"Authorization": f"Bearer {self.api_key}"}
+
+    def headers(self) -> dict[str, str]:
+        return get_headers(self.auth_headers())
+
+    def url(self, path: str) -> str:
+        """
+        Get the full URL of an API path, e.g. `/dataset-qa/run/list`.
+        Absolute URLs are returned unchanged.
+        """
+        if path.startswith(("http://", "https://")):
+            return path
+        return f"{self.api_host}{path}"
+
+    def request(self, method: str, path: str, **kwargs) -> Response:
+        """
+        Send a request to the API server with this client's credentials.
+
+        Args:
+            method: The HTTP method
+            path: The API path (or an absolute URL)
+            kwargs: Extra arguments passed to `requests.Session.request`
+        """
+        if kwargs.get("headers") is None:
+            kwargs["headers"] = self.headers()
+        if self.compress_requests_above is not None and kwargs.get("json") is not None:
+            self._encode_json_body(kwargs, self.compress_requests_above)
+        url = self.url(path)
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+        if (
+            self._hedger is not None
+            and method.upper() == "GET"
+            and not kwargs.get("stream", False)
+        ):
+            # ⬇️ A hedged copy of the request is rate-limited like any other request
+            return self._hedger.request(
+                self.session,
+                "GET",
+                url,
+                before_hedge=self._rate_limiter.acquire
+                if self._rate_limiter is not None
+                else None,
+                **kwargs,
+            )
+        return self.session.request(method=method, url=url, **kwargs)
+
+    @staticmethod
+    def _encode_json_body(kwargs: dict[str, typing.Any], threshold: int) -> None:
+        """
+        Serialize the `json` request argument ourselves, so that large bodies can be gzip-compressed
+        """
+        body = json.dumps(
+            kwargs.pop("json"), separators=(",", ":"), allow_nan=False
+        ).encode()
+        headers = {**kwargs["headers"], "Content-Type": "application/json"}
+        if len(body) >= threshold:
+            body = gzip.compress(body, compresslevel=GZIP_COMPRESS_LEVEL)
+            headers["Content-Encoding"] = "gzip"
+        kwargs["data"] = body
+        kwargs["headers"] = headers
+
+    def get(self, path: str, **kwargs) -> Response:
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path: str, **kwargs) -> Response:
+        return self.request("POST", path, **kwargs)
+
+    def patch(self, path: str, **kwargs) -> Response:
+        return self.request("PATCH", path, **kwargs)
+
+    def put(self, path: str, **kwargs) -> Response:
+        return self.request("PUT", path, **kwargs)
+
+    def delete(self, path: str, **kwargs) -> Response:
+        return self.request("DELETE", path, **kwargs)
+
+    def sse_client(self) -> httpx.Client:
+        """
+        Create an `httpx` client for Server-Sent Events streams from this deployment
+        """
+        return httpx.Client(timeout=httpx.Timeout(None, connect=SSE_CONNECT_TIMEOUT))
+
+    def async_sse_client(self) -> httpx.AsyncClient:
+        """
+        Create an async `httpx` client for Server-Sent Events streams from this deployment
+        """
+        return httpx.AsyncClient(
+            timeout=httpx.Timeout(None, connect=SSE_CONNECT_TIMEOUT)
+        )
+
+    def sse_heartbeat(self, path: str) -> SSEHeartbeat:
+        """
+        Create the stall detector for an SSE stream, which records its ping-to-ping latencies
+        (see :func:`sse_ping_latency`)
+        """
+        key = _endpoint_key("GET", self.url(path))
+        return SSEHeartbeat(
+            ping_interval=self.sse_ping_interval,
+            stall_multiplier=self.sse_stall_multiplier,
+            on_ping_latency=lambda seconds: self._sse_ping_latencies.record(
+                key, seconds
+            ),
+        )
+
+    def sse_ping_latency(
+        self, path: str = "/dataset-qa/run/{id}", percentile: float = 50.0
+    ) -> typing.Optional[float]:
+        """
+        Get a percentile of the recent time in seconds between consecutive `ping` events
+        of the SSE streams from an API path. Latencies well above the server's ping interval
+        indicate a slow or congested connection.
+
+        Args:
+            path: The API path of the SSE streams. IDs in the path are grouped, e.g. `/dataset-qa/run/{id}`
+            percentile: The percentile to get, e.g. `50.0` for the median
+
+        Returns:
+            The latency or `None` if no consecutive pings were received yet
+        """
+        return self._sse_ping_latencies.percentile(
+            _endpoint_key("GET", self.url(path)), percentile
+        )
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """
+        The thread pool that runs the background tasks of this client, created on first use.
+        Its threads share the pooled HTTP transport of the client.
+        """
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="hirundo"
+                    )
+        return self._executor
+
+    def close(self) -> None:
+        with self._executor_lock:
+            if self._executor is not None:
+                # ⬇️ Queued tasks are cancelled, running tasks are left to finish
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+        self.session.close()
+
+    def __enter__(self) -> "HirundoClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+_DEFAULT_CLIENT: typing.Optional[HirundoClient] = None
+_DEFAULT_CLIENT_LOCK = threading.Lock()
+
+
+def _reset_default_client_lock() -> None:
+    global _DEFAULT_CLIENT_LOCK
+    _DEFAULT_CLIENT_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_default_client_lock)
+
+
+def get_default_client() -> HirundoClient:
+    """
+    Get the client used when no `client` argument is passed.
+    Unless replaced with :func:`set_default_client`, it is created on first use
+    from the `API_HOST` & `API_KEY` environment variables.
+    """
+    global _DEFAULT_CLIENT
+    if _DEFAULT_CLIENT is None:
+        with _DEFAULT_CLIENT_LOCK:
+            if _DEFAULT_CLIENT is None:
+                _DEFAULT_CLIENT = HirundoClient()
+    return _DEFAULT_CLIENT
+
+
+def set_default_client(client: typing.Optional[HirundoClient]) -> None:
+    """
+    Replace the client used when no `client` argument is passed.
+    Pass `None` to go back to a client configured from the environment variables.
+    """
+    global _DEFAULT_CLIENT
+    with _DEFAULT_CLIENT_LOCK:
+        _DEFAULT_CLIENT = client
+
+
+def resolve_client(client: typing.Optional[HirundoClient]) -> HirundoClient:
+    return client if client is not None else get_default_client()
+
+
+def configure_hedging(policy: typing.Optional[HedgingPolicy] = None) -> None:
+    """
+    Enable hedged requests for idempotent reads on the default client using the given policy.
+    Pass `None` to disable hedging.
+
+    Args:
+        policy: The hedging policy to use or `None` to disable hedging
+    """
+    get_default_client().configure_hedging(policy)
+
+
+def configure_name_cache(cache: typing.Optional["NameCache"] = None) -> None:
+    """
+    Cache lookups by name on the default client in the given cache.
+    Pass `None` to disable caching.
+
+    Args:
+        cache: The cache to use or `None` to disable caching
+    """
+    get_default_client().configure_name_cache(cache)
@@ -0,0 +1,266 @@
+import datetime
+import json
+import sys
+import typing
+from collections.abc import Generator, Iterable
+
+from pydantic import TypeAdapter
+
+from hirundo._dataframe import has_polars
+from hirundo._pagination import DEFAULT_PAGE_SIZE, iter_pages
+from hirundo.client import HirundoClient, resolve_client
+from hirundo.dataset_enum import LabelingType
+from hirundo.dataset_qa import DataQARunOut, QADatasetOut, RunStatus
+from hirundo.storage import ResponseStorageConfig
+
+if has_polars:
+    from hirundo._dataframe import pl
+
+_DATETIME = TypeAdapter(datetime.datetime)
+
+T = typing.TypeVar("T")
+
+
+class _Interner:
+    """
+    Shares one copy of equal nested objects (e.g. the storage config of many datasets) across records
+    """
+
+    def __init__(self):
+        self._values: dict[typing.Hashable, typing.Any] = {}
+
+    def get(self, key: typing.Hashable, make: typing.Callable[[], T]) -> T:
+        if key not in self._values:
+            self._values[key] = make()
+        return self._values[key]
+
+    def json(self, value: T) -> T:
+        # ⬇️ Plain JSON values (e.g. labeling info) are shared by their serialized form
+        if value is None:
+            return value
+        return self.get(("json", json.dumps(value, sort_keys=True)), lambda: value)
+
+
+class CompactRun:
+    """
+    A lightweight, read-only version of :class:`DataQARunOut` for holding large run listings in memory.
+    The run arguments are kept as shared plain JSON, call :func:`to_model` to get the full model.
+    """
+
+    __slots__ = (
+        "id",
+        "name",
+        "dataset_id",
+        "run_id",
+        "status",
+        "approved",
+        "created_at",
+        "_run_args",
+    )
+
+    def __init__(self, item: dict[str, typing.Any], interner: _Interner):
+        self.id: int = item["id"]
+        self.name: str = sys.intern(item["name"])
+        self.dataset_id: int = item["dataset_id"]
+        self.run_id: str = item["run_id"]
+        self.status = RunStatus(item["status"])
+        self.approved: bool = item["approved"]
+        self.created_at: datetime.datetime = _DATETIME.validate_python(
+            item["created_at"]
+        )
+        self._run_args: typing.Optional[dict] = interner.json(item.get("run_args"))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(run_id={self.run_id!r}, name={self.name!r}, status={self.status.value!r})"
+
+    def to_model(self) -> DataQARunOut:
+        return DataQARunOut.model_validate(
+            {
+                "id": self.id,
+                "name": self.name,
+                "dataset_id": self.dataset_id,
+                "run_id": self.run_id,
+                "status": self.status,
+                "approved": self.approved,
+                "created_at": self.created_at,
+                "run_args": self._run_args,
+            }
+        )
+
+
+class CompactDataset:
+    """
+    A lightweight, read-only version of :class:`QADatasetOut` for holding large dataset listings in memory.
+    Datasets using the same storage config share one :class:`ResponseStorageConfig`, and equal labeling info
+    & classes are shared as well, so they must not be modified. Call :func:`to_model` to get the full model,
+    with its own copies of them.
+    """
+
+    __slots__ = (
+        "id",
+        "name",
+        "labeling_type",
+        "storage_config",
+        "data_root_url",
+        "classes",
+        "_labeling_info",
+        "organization_id",
+        "creator_id",
+        "created_at",
+        "updated_at",
+    )
+
+    def __init__(self, item: dict[str, typing.Any], interner: _Interner):
+        storage_config = item["storage_config"]
+        self.id: int = item["id"]
+        self.name: str = item["name"]
+        self.labeling_type = LabelingType(item["labeling_type"])
+        self.storage_config: ResponseStorageConfig = interner.get(
+            ("storage-config", storage_config["id"]),
+            lambda: ResponseStorageConfig.model_validate(storage_config),
+        )
+        self.data_root_url: str = item["data_root_url"]
+        classes = item.get("classes")
+        self.classes: typing.Optional[tuple[str, ...]] = (
+            interner.get(("classes", *classes), lambda: tuple(classes))
+            if classes is not None
+            else None
+        )
+        self._labeling_info: typing.Union[dict, list] = interner.json(
+            item["labeling_info"]
+        )
+        self.organization_id: typing.Optional[int] = item.get("organization_id")
+        self.creator_id: typing.Optional[int] = item.get("creator_id")
+        self.created_at: datetime.datetime = _DATETIME.validate_python(
+            item["created_at"]
+        )
+        self.updated_at: datetime.datetime = _DATETIME.validate_python(
+            item["updated_at"]
+        )
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(id={self.id!r}, name={self.name!r})"
+
+    def to_model(self) -> QADatasetOut:
+        return QADatasetOut.model_validate(
+            {
+                "id": self.id,
+                "name": self.name,
+                "labeling_type": self.labeling_type,
+                # ⬇️ Copied, since pydantic keeps model instances & the storage config is shared
+                "storage_config": self.storage_config.model_copy(deep=True),
+                "data_root_url": self.data_root_url,
+                "classes": list(self.classes) if self.classes is not None else None,
+                "labeling_info": self._labeling_info,
+                "organization_id": self.organization_id,
+                "creator_id": self.creator_id,
+                "created_at": self.created_at,
+                "updated_at": self.updated_at,
+            }
+        )
+
+
+def iter_compact_runs(
+    organization_id: typing.Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    client: typing.Optional[HirundoClient] = None,
+) -> Generator[CompactRun, None, None]:
+    """
+    Lazily iterate over the runs like :func:`QADataset.iter_runs`, as :class:`CompactRun` records
+
+    Args:
+        organization_id: The ID of the organization to list the runs for.
+        page_size: The number of runs to fetch per request.
+        client: The client to use. Defaults to the default client.
+    """
+    interner = _Interner()
+    for item in iter_pages(
+        resolve_client(client),
+        "/dataset-qa/run/list",
+        dict,
+        params={"dataset_organization_id": organization_id},
+        page_size=page_size,
+    ):
+        yield CompactRun(item, interner)
+
+
+def iter_compact_datasets(
+    organization_id: typing.Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    client: typing.Optional[HirundoClient] = None,
+) -> Generator[CompactDataset, None, None]:
+    """
+    Lazily iterate over the datasets like :func:`QADataset.iter_datasets`, as :class:`CompactDataset` records
+
+    Args:
+        organization_id: The ID of the organization to list the datasets for.
+        page_size: The number of datasets to fetch per request.
+        client: The client to use. Defaults to the default client.
+    """
+    interner = _Interner()
+    for item in iter_pages(
+        resolve_client(client),
+        "/dataset-qa/dataset/",
+        dict,
+        params={"dataset_organization_id": organization_id},
+        page_size=page_size,
+    ):
+        yield CompactDataset(item, interner)
+
+
+def _require_polars() -> None:
+    if not has_polars:
+        raise ImportError(
+            "polars is required for listing tables, install it with `pip install hirundo[polars]`"
+        )
+
+
+def runs_table(runs: Iterable[CompactRun]) -> "pl.DataFrame":
+    """
+    A polars DataFrame of runs, with one row per run.
+    Dataset names & statuses are categorical columns, so each distinct value is stored once.
+    """
+    _require_polars()
+    runs = list(runs)
+    return pl.DataFrame(
+        {
+            "id": [run.id for run in runs],
+            "name": pl.Series([run.name for run in runs], dtype=pl.Categorical),
+            "dataset_id": [run.dataset_id for run in runs],
+            "run_id": [run.run_id for run in runs],
+            "status": pl.Series(
+                [run.status.value for run in runs], dtype=pl.Categorical
+            ),
+            "approved": [run.approved for run in runs],
+            "created_at": [run.created_at for run in runs],
+        }
+    )
+
+
+def datasets_table(datasets: Iterable[CompactDataset]) -> "pl.DataFrame":
+    """
+    A polars DataFrame of datasets, with one row per dataset.
+    Storage configs are referred to by ID & name, and the labeling type & storage config names are
+    categorical columns, so each distinct value is stored once.
+    """
+    _require_polars()
+    datasets = list(datasets)
+    return pl.DataFrame(
+        {
+            "id": [dataset.id for dataset in datasets],
+            "name": [dataset.name for dataset in datasets],
+            "labeling_type": pl.Series(
+                [dataset.labeling_type.value for dataset in datasets],
+                dtype=pl.Categorical,
+            ),
+            "storage_config_id": [dataset.storage_config.id for dataset in datasets],
+            "storage_config_name": pl.Series(
+                [dataset.storage_config.name for dataset in datasets],
+                dtype=pl.Categorical,
+            ),
+            "data_root_url": [dataset.data_root_url for dataset in datasets],
+            "organization_id": [dataset.organization_id for dataset in datasets],
+            "created_at": [dataset.created_at for dataset in datasets],
+            "updated_at": [dataset.updated_at for dataset in datasets],
+        }
+    )
@@ -1,29 +1,60 @@
+import asyncio
 import datetime
-import json
+import functools
+import re
+import threading
 import typing
-from collections.abc import AsyncGenerator, Generator
+from collections import Counter
+from collections.abc import AsyncGenerator, Generator, Iterable, Mapping
+from concurrent.futures import Future, as_completed
 from enum import Enum
 from typing import overload
 
-import httpx
-from pydantic import BaseModel, Field, model_validator
-from tqdm import tqdm
-from tqdm.contrib.logging import logging_redirect_tqdm
+from httpx_sse import ServerSentEvent
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
+from pydantic_core import from_json
 
 from hirundo._constraints import validate_labeling_info, validate_url
-from hirundo._env import API_HOST
-from hirundo._headers import get_headers
-from hirundo._http import raise_for_status_with_reason, requests
-from hirundo._iter_sse_retrying import aiter_sse_retrying, iter_sse_retrying
-from hirundo._timeouts import MODIFY_TIMEOUT, READ_TIMEOUT
+from hirundo._deadline import NO_DEADLINE, Deadline, abefore_deadline
+from hirundo._fingerprint import content_hash
+from hirundo._http import HTTPError, parse_response, raise_for_status_with_reason
+from hirundo._iter_sse_retrying import (
+    SSECancellation,
+    aiter_sse_retrying,
+    iter_sse_retrying,
+)
+from hirundo._pagination import DEFAULT_PAGE_SIZE, iter_pages, matches_filters
+from hirundo._sse_broadcast import SSEBroadcastRegistry
 from hirundo._urls import HirundoUrl
+from hirundo.bulk import (
+    DEFAULT_BULK_CONCURRENCY,
+    BulkReport,
+    create_deduplicated,
+    run_bulk,
+)
+from hirundo.client import HirundoClient, resolve_client
 from hirundo.dataset_enum import DatasetMetadataType, LabelingType
 from hirundo.dataset_qa_results import DatasetQAResults
+from hirundo.fingerprints import (
+    FingerprintStore,
+    create_unless_unchanged,
+    resource_key,
+)
 from hirundo.labeling import YOLO, LabelingInfo
 from hirundo.logger import get_logger
+from hirundo.name_cache import cached_get_by_name, invalidate_id, invalidate_name
+from hirundo.progress import (
+    NullProgressSink,
+    ProgressSink,
+    TqdmProgressSink,
+    debounce,
+)
 from hirundo.storage import ResponseStorageConfig, StorageConfig
 from hirundo.unzip import download_and_extract_zip
 
+if typing.TYPE_CHECKING:
+    from hirundo.run_checkpoints import RunCheckpointStore
+
 logger = get_logger(__name__)
 
 
@@ -35,8 +66,26 @@ class HirundoError(Exception):
     pass
 
 
+class RunTimeoutError(HirundoError, TimeoutError):
+    """
+    Raised when dataset QA runs did not finish within the given timeout
+    """
+
+    def __init__(self, message: str, run_ids: list[str]):
+        super().__init__(message)
+        self.run_ids = run_ids
+        """
+        The IDs of the runs that did not finish in time
+        """
+
+
 MAX_RETRIES = 200  # Max 200 retries for HTTP SSE connection
 
+_RUN_EVENT_STREAMS = SSEBroadcastRegistry()
+"""
+Shares a single SSE stream between concurrent `acheck_run_by_id` calls for the same run
+"""
+
 
 class RunStatus(Enum):
     PENDING = "PENDING"
@@ -70,6 +119,96 @@ STATUS_TO_PROGRESS_MAP = {
     RunStatus.REJECTED.value: 0.0,
 }
 
+FAILED_STATUSES = frozenset({RunStatus.FAILURE, RunStatus.REJECTED, RunStatus.REVOKED})
+
+PROGRESS_CACHE_SIZE = 256
+_PROGRESS_PATTERN = re.compile(r"([^:]*)(?::\s*(\d+(?:\.\d*)?)\s*% done)?")
+"""
+Matches progress messages such as `"Training model: 42.5% done"` (stage & percentage)
+or `"Training model"` (stage only)
+"""
+
+
+class RunEvent(BaseModel, frozen=True):
+    """
+    A progress or status update of a dataset QA run
+    """
+
+    state: typing.Optional[RunStatus] = None
+    """
+    The new status of the run, or `None` if this event only reports progress
+    """
+    stage: typing.Optional[str] = None
+    """
+    A description of the current stage of the run
+    """
+    percent: typing.Optional[float] = None
+    """
+    The progress of the run as a percentage, or `None` if the progress did not change
+    """
+    result_url: typing.Optional[str] = None
+    """
+    The URL of the results, once the run succeeded
+    """
+    error: typing.Optional[str] = None
+    """
+    The error reported by a failed, rejected or revoked run
+    """
+
+
+@functools.lru_cache(maxsize=PROGRESS_CACHE_SIZE)
+def _parse_progress(result: str) -> RunEvent:
+    # ⬆️ Progress messages are often repeated (e.g. the same percentage), so parsed events are reused.
+    # This is safe since `RunEvent` is immutable
+    stage, percent = _PROGRESS_PATTERN.match(result).groups()
+    return RunEvent(
+        stage=stage, percent=float(percent) if percent is not None else None
+    )
+
+
+def parse_run_event(data: typing.Union[str, bytes]) -> typing.Optional[RunEvent]:
+    """
+    Parse the data of a dataset QA run SSE event in a single pass.
+
+    Args:
+        data: The `data` field of the SSE event
+
+    Returns:
+        The parsed event, or `None` if the event is empty.
+        Events with a state this SDK does not know are returned without any run data.
+
+    Raises:
+        HirundoError: If the event reports an error instead of run data
+    """
+    payload = from_json(data)
+    if not payload:
+        return None
+    event = payload.get("data")
+    if event is None:
+        raise HirundoError(
+            payload.get("detail") or payload.get("reason") or "Unknown error"
+        )
+    state = event.get("state")
+    result = event.get("result")
+    if state is None:
+        if isinstance(result, dict):
+            result = result.get("result")
+        if not result or not isinstance(result, str):
+            return RunEvent()
+        return _parse_progress(result)
+    if state not in STATUS_TO_PROGRESS_MAP:
+        # ⬇️ States added on the server after this SDK version are skipped, like progress without a stage
+        logger.debug("Skipping unknown run state %s", state)
+        return RunEvent()
+    status = RunStatus(state)
+    return RunEvent(
+        state=status,
+        stage=STATUS_TO_TEXT_MAP[state],
+        percent=STATUS_TO_PROGRESS_MAP[state],
+        result_url=result if status == RunStatus.SUCCESS else None,
+        error=(str(result) if result else None) if status in FAILED_STATUSES else None,
+    )
+
 
 class ClassificationRunArgs(BaseModel):
     image_size: typing.Optional[tuple[int, int]] = (224, 224)
@@ -219,6 +358,9 @@ class QADataset(BaseModel):
 
     status: typing.Optional[RunStatus] = None
 
+    _submit_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    # ⬆️ Keeps concurrent `submit` calls from creating the same dataset twice
+
     @model_validator(mode="after")
     def validate_dataset(self):
         if self.domain not in DOMAIN_TO_SUPPORTED_LABELING_TYPES:
@@ -272,42 +414,52 @@ class QADataset(BaseModel):
         return self
 
     @staticmethod
-    def get_by_id(dataset_id: int) -> "QADataset":
+    def get_by_id(
+        dataset_id: int, client: typing.Optional[HirundoClient] = None
+    ) -> "QADataset":
         """
         Get a `QADataset` instance from the server by its ID
 
         Args:
             dataset_id: The ID of the `QADataset` instance to get
+            client: The client to use. Defaults to the default client.
         """
-        response = requests.get(
-            f"{API_HOST}/dataset-qa/dataset/{dataset_id}",
-            headers=get_headers(),
-            timeout=READ_TIMEOUT,
+        client = resolve_client(client)
+        response = client.get(
+            f"/dataset-qa/dataset/{dataset_id}",
+            timeout=client.read_timeout,
         )
         raise_for_status_with_reason(response)
-        dataset = response.json()
-        return QADataset(**dataset)
+        return parse_response(response, QADataset)
 
     @staticmethod
-    def get_by_name(name: str) -> "QADataset":
+    def get_by_name(
+        name: str, client: typing.Optional[HirundoClient] = None
+    ) -> "QADataset":
         """
-        Get a `QADataset` instance from the server by its name
+        Get a `QADataset` instance from the server by its name.
+        Cached if the client has a :class:`NameCache`.
 
         Args:
             name: The name of the `QADataset` instance to get
+            client: The client to use. Defaults to the default client.
         """
-        response = requests.get(
-            f"{API_HOST}/dataset-qa/dataset/by-name/{name}",
-            headers=get_headers(),
-            timeout=READ_TIMEOUT,
-        )
-        raise_for_status_with_reason(response)
-        dataset = response.json()
-        return QADataset(**dataset)
+        client = resolve_client(client)
+
+        def fetch() -> QADataset:
+            response = client.get(
+                f"/dataset-qa/dataset/by-name/{name}",
+                timeout=client.read_timeout,
+            )
+            raise_for_status_with_reason(response)
+            return parse_response(response, QADataset)
+
+        return cached_get_by_name(client, "dataset", name, None, QADataset, fetch)
 
     @staticmethod
     def list_datasets(
         organization_id: typing.Optional[int] = None,
+        client: typing.Optional[HirundoClient] = None,
     ) -> list["QADatasetOut"]:
         """
         Lists all the datasets created by user's default organization
@@ -315,25 +467,21 @@ class QADataset(BaseModel):
 
         Args:
             organization_id: The ID of the organization to list the datasets for.
+            client: The client to use. Defaults to the default client.
         """
-        response = requests.get(
-            f"{API_HOST}/dataset-qa/dataset/",
+        client = resolve_client(client)
+        response = client.get(
+            "/dataset-qa/dataset/",
             params={"dataset_organization_id": organization_id},
-            headers=get_headers(),
-            timeout=READ_TIMEOUT,
+            timeout=client.read_timeout,
         )
         raise_for_status_with_reason(response)
-        datasets = response.json()
-        return [
-            QADatasetOut(
-                **ds,
-            )
-            for ds in datasets
-        ]
+        return parse_response(response, list[QADatasetOut])
 
     @staticmethod
     def list_runs(
         organization_id: typing.Optional[int] = None,
+        client: typing.Optional[HirundoClient] = None,
     ) -> list["DataQARunOut"]:
         """
         Lists all the `QADataset` instances created by user's default organization
@@ -342,45 +490,149 @@ class QADataset(BaseModel):
 
         Args:
             organization_id: The ID of the organization to list the datasets for.
+            client: The client to use. Defaults to the default client.
         """
-        response = requests.get(
-            f"{API_HOST}/dataset-qa/run/list",
+        client = resolve_client(client)
+        response = client.get(
+            "/dataset-qa/run/list",
             params={"dataset_organization_id": organization_id},
-            headers=get_headers(),
-            timeout=READ_TIMEOUT,
+            timeout=client.read_timeout,
         )
         raise_for_status_with_reason(response)
-        runs = response.json()
-        return [
-            DataQARunOut(
-                **run,
-            )
-            for run in runs
-        ]
+        return parse_response(response, list[DataQARunOut])
+
+    @staticmethod
+    def iter_datasets(
+        organization_id: typing.Optional[int] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        name_prefix: typing.Optional[str] = None,
+        created_after: typing.Optional[datetime.datetime] = None,
+        created_before: typing.Optional[datetime.datetime] = None,
+        client: typing.Optional[HirundoClient] = None,
+    ) -> Generator["QADatasetOut", None, None]:
+        """
+        Lazily iterate over the datasets created by user's default organization
+        or the `organization_id` passed, fetching one page at a time
+
+        Args:
+            organization_id: The ID of the organization to list the datasets for.
+            page_size: The number of datasets to fetch per request.
+            name_prefix: If provided, only datasets whose name starts with this prefix are yielded.
+            created_after: If provided, only datasets created at or after this time are yielded.
+            created_before: If provided, only datasets created before this time are yielded.
+            client: The client to use. Defaults to the default client.
+        """
+        client = resolve_client(client)
+        for dataset in iter_pages(
+            client,
+            "/dataset-qa/dataset/",
+            QADatasetOut,
+            params={"dataset_organization_id": organization_id},
+            page_size=page_size,
+        ):
+            if matches_filters(dataset, name_prefix, created_after, created_before):
+                yield dataset
+
+    @staticmethod
+    def iter_runs(
+        organization_id: typing.Optional[int] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        status: typing.Union[RunStatus, typing.Iterable[RunStatus], None] = None,
+        name_prefix: typing.Optional[str] = None,
+        created_after: typing.Optional[datetime.datetime] = None,
+        created_before: typing.Optional[datetime.datetime] = None,
+        client: typing.Optional[HirundoClient] = None,
+    ) -> Generator["DataQARunOut", None, None]:
+        """
+        Lazily iterate over the runs created by user's default organization
+        or the `organization_id` passed, fetching one page at a time
+
+        Args:
+            organization_id: The ID of the organization to list the runs for.
+            page_size: The number of runs to fetch per request.
+            status: If provided, only runs with this status (or one of these statuses) are yielded.
+            name_prefix: If provided, only runs whose dataset name starts with this prefix are yielded.
+            created_after: If provided, only runs created at or after this time are yielded.
+            created_before: If provided, only runs created before this time are yielded.
+            client: The client to use. Defaults to the default client.
+        """
+        client = resolve_client(client)
+        statuses = (
+            None
+            if status is None
+            else {status}
+            if isinstance(status, RunStatus)
+            else set(status)
+        )
+        for run in iter_pages(
+            client,
+            "/dataset-qa/run/list",
+            DataQARunOut,
+            params={"dataset_organization_id": organization_id},
+            page_size=page_size,
+        ):
+            if (statuses is None or run.status in statuses) and matches_filters(
+                run, name_prefix, created_after, created_before
+            ):
+                yield run
 
     @staticmethod
-    def delete_by_id(dataset_id: int) -> None:
+    def delete_by_id(
+        dataset_id: int, client: typing.Optional[HirundoClient] = None
+    ) -> None:
         """
         Deletes a `QADataset` instance from the server by its ID
 
         Args:
             dataset_id: The ID of the `QADataset` instance to delete
+            client: The client to use. Defaults to the default client.
         """
-        response = requests.delete(
-            f"{API_HOST}/dataset-qa/dataset/{dataset_id}",
-            headers=get_headers(),
-            timeout=MODIFY_TIMEOUT,
+        client = resolve_client(client)
+        response = client.delete(
+            f"/dataset-qa/dataset/{dataset_id}",
+            timeout=client.modify_timeout,
         )
         raise_for_status_with_reason(response)
+        invalidate_id(client, "dataset", dataset_id)
         logger.info("Deleted dataset with ID: %s", dataset_id)
 
-    def delete(self, storage_config=True) -> None:
+    @staticmethod
+    def delete_many(
+        dataset_ids: Iterable[int],
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        client: typing.Optional[HirundoClient] = None,
+    ) -> BulkReport:
+        """
+        Deletes `QADataset` instances from the server by their IDs, at most `max_concurrency` at once.
+        A failure for one ID does not stop the others.
+
+        Args:
+            dataset_ids: The IDs of the `QADataset` instances to delete
+            max_concurrency: The maximum number of requests sent at once
+            client: The client to use. Defaults to the default client.
+                Its rate limit (if any) applies to all the requests.
+
+        Returns:
+            A report with the outcome for each ID
+        """
+        client = resolve_client(client)
+        return run_bulk(
+            "delete-datasets",
+            functools.partial(QADataset.delete_by_id, client=client),
+            dataset_ids,
+            max_concurrency,
+        )
+
+    def delete(
+        self, storage_config=True, client: typing.Optional[HirundoClient] = None
+    ) -> None:
         """
         Deletes the active `QADataset` instance from the server.
         It can only be used on a `QADataset` instance that has been created.
 
         Args:
             storage_config: If True, the `QADataset`'s `StorageConfig` will also be deleted
+            client: The client to use. Defaults to the default client.
 
         Note: If `storage_config` is not set to `False` then the `storage_config_id` must be set
         This can either be set manually or by creating the `StorageConfig` instance via the `QADataset`'s
@@ -389,15 +641,17 @@ class QADataset(BaseModel):
         if storage_config:
             if not self.storage_config_id:
                 raise ValueError("No storage config has been created")
-            StorageConfig.delete_by_id(self.storage_config_id)
+            StorageConfig.delete_by_id(self.storage_config_id, client=client)
         if not self.id:
             raise ValueError("No dataset has been created")
-        self.delete_by_id(self.id)
+        self.delete_by_id(self.id, client=client)
 
     def create(
         self,
         organization_id: typing.Optional[int] = None,
         replace_if_exists: bool = False,
+        client: typing.Optional[HirundoClient] = None,
+        fingerprints: typing.Optional[FingerprintStore] = None,
     ) -> int:
         """
         Create a `QADataset` instance on the server.
@@ -407,19 +661,16 @@ class QADataset(BaseModel):
             organization_id: The ID of the organization to create the dataset for.
             replace_if_exists: If True, the dataset will be replaced if it already exists
                 (this is determined by a dataset of the same name in the same organization).
+            client: The client to use. Defaults to the default client.
+            fingerprints: If provided, a replacement is skipped when neither the dataset (including its storage config)
+                nor the server's copy changed since it was last created, see :class:`FingerprintStore`.
 
         Returns:
             The ID of the created `QADataset` instance
         """
+        client = resolve_client(client)
         if self.storage_config is None and self.storage_config_id is None:
             raise ValueError("No dataset storage has been provided")
-        elif self.storage_config and self.storage_config_id is None:
-            if isinstance(self.storage_config, ResponseStorageConfig):
-                self.storage_config_id = self.storage_config.id
-            elif isinstance(self.storage_config, StorageConfig):
-                self.storage_config_id = self.storage_config.create(
-                    replace_if_exists=replace_if_exists,
-                )
         elif (
             self.storage_config is not None
             and self.storage_config_id is not None
@@ -431,30 +682,185 @@ class QADataset(BaseModel):
             raise ValueError(
                 "Both `storage_config` and `storage_config_id` have been provided. Storage config IDs do not match."
             )
+
+        def create() -> int:
+            if self.storage_config and self.storage_config_id is None:
+                if isinstance(self.storage_config, ResponseStorageConfig):
+                    self.storage_config_id = self.storage_config.id
+                elif isinstance(self.storage_config, StorageConfig):
+                    self.storage_config_id = self.storage_config.create(
+                        replace_if_exists=replace_if_exists,
+                        client=client,
+                        fingerprints=fingerprints,
+                    )
+            return self._post(organization_id, replace_if_exists, client)
+
+        dataset_id = self._create_unless_unchanged(
+            organization_id, replace_if_exists, client, fingerprints, create
+        )
+        if self.storage_config_id is None:
+            # ⬇️ The replacement was skipped, so the storage config was not resolved either
+            server_copy = QADataset.get_by_name(self.name, client=client)
+            self.storage_config_id = (
+                server_copy.storage_config.id
+                if isinstance(server_copy.storage_config, ResponseStorageConfig)
+                else server_copy.storage_config_id
+            )
+        return dataset_id
+
+    def _create_unless_unchanged(
+        self,
+        organization_id: typing.Optional[int],
+        replace_if_exists: bool,
+        client: HirundoClient,
+        fingerprints: typing.Optional[FingerprintStore],
+        create: typing.Callable[[], int],
+    ) -> int:
+        self.id = create_unless_unchanged(
+            fingerprints,
+            resource_key(client.api_host, "dataset", self.name, organization_id),
+            self.content_hash(),
+            functools.partial(QADataset.get_by_name, self.name, client=client),
+            create,
+            replace_if_exists,
+        )
+        return self.id
+
+    def content_hash(self) -> str:
+        """
+        A hash of the definition of the dataset & its storage config, ignoring the IDs set by the server
+        """
+        if isinstance(self.storage_config, StorageConfig):
+            storage = self.storage_config.content_hash()
+        elif isinstance(self.storage_config, ResponseStorageConfig):
+            storage = str(self.storage_config.id)
+        else:
+            storage = str(self.storage_config_id)
+        return content_hash(
+            self,
+            exclude={"id", "run_id", "status", "storage_config", "storage_config_id"},
+            extra=storage,
+        )
+
+    def _post(
+        self,
+        organization_id: typing.Optional[int],
+        replace_if_exists: bool,
+        client: HirundoClient,
+    ) -> int:
+        """
+        Create the `QADataset` on the server, once its `storage_config_id` is set
+        """
         model_dict = self.model_dump(mode="json")
         # ⬆️ Get dict of model fields from Pydantic model instance
-        dataset_response = requests.post(
-            f"{API_HOST}/dataset-qa/dataset/",
+        dataset_response = client.post(
+            "/dataset-qa/dataset/",
             json={
                 **{k: model_dict[k] for k in model_dict.keys() - {"storage_config"}},
                 "organization_id": organization_id,
                 "replace_if_exists": replace_if_exists,
             },
-            headers=get_headers(),
-            timeout=MODIFY_TIMEOUT,
+            timeout=client.modify_timeout,
         )
         raise_for_status_with_reason(dataset_response)
         self.id = dataset_response.json()["id"]
         if not self.id:
             raise HirundoError("An error ocurred while trying to create the dataset")
+        invalidate_name(client, "dataset", self.name)
         logger.info("Created dataset with ID: %s", self.id)
         return self.id
 
+    @staticmethod
+    def create_many(
+        datasets: Iterable["QADataset"],
+        organization_id: typing.Optional[int] = None,
+        replace_if_exists: bool = False,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        client: typing.Optional[HirundoClient] = None,
+        fingerprints: typing.Optional[FingerprintStore] = None,
+    ) -> dict[str, int]:
+        """
+        Create `QADataset` instances on the server, at most `max_concurrency` at once.
+        The storage configs & Git repositories of the datasets are created first,
+        and identical ones (by content) are only created once.
+        A failure for one dataset does not stop the others.
+
+        Args:
+            datasets: The datasets to create. Dataset names must be unique.
+            organization_id: The ID of the organization to create the datasets for.
+            replace_if_exists: If True, datasets, storage configs & Git repositories will be replaced
+                if they already exist (this is determined by the name in the same organization).
+            max_concurrency: The maximum number of requests sent at once
+            client: The client to use. Defaults to the default client.
+            fingerprints: If provided, unchanged replacements are skipped, see :class:`FingerprintStore`.
+
+        Returns:
+            The ID of each created dataset by its name.
+            Datasets that could not be created (or whose storage config could not be created)
+            are logged and left out.
+        """
+        client = resolve_client(client)
+        datasets = list(datasets)
+        duplicates = [
+            name
+            for name, count in Counter(dataset.name for dataset in datasets).items()
+            if count > 1
+        ]
+        if duplicates:
+            raise ValueError(
+                f"Dataset names must be unique, got duplicates: {duplicates}"
+            )
+        to_create = [
+            dataset
+            for dataset in datasets
+            if dataset.storage_config_id is None
+            and isinstance(dataset.storage_config, StorageConfig)
+        ]
+        storage_config_ids = StorageConfig.create_many(
+            [
+                typing.cast("StorageConfig", dataset.storage_config)
+                for dataset in to_create
+            ],
+            replace_if_exists,
+            max_concurrency,
+            client,
+            fingerprints,
+        )
+        for dataset, storage_config_id in zip(to_create, storage_config_ids):
+            dataset.storage_config_id = storage_config_id
+        for dataset in datasets:
+            if isinstance(dataset.storage_config, ResponseStorageConfig):
+                dataset.storage_config_id = dataset.storage_config.id
+        ready = [
+            dataset for dataset in datasets if dataset.storage_config_id is not None
+        ]
+        dataset_ids = create_deduplicated(
+            "create-datasets",
+            lambda dataset: dataset._create_unless_unchanged(
+                organization_id,
+                replace_if_exists,
+                client,
+                fingerprints,
+                functools.partial(
+                    dataset._post, organization_id, replace_if_exists, client
+                ),
+            ),
+            ready,
+            lambda dataset: dataset.name,
+            max_concurrency,
+        )
+        return {
+            dataset.name: dataset_id
+            for dataset, dataset_id in zip(ready, dataset_ids)
+            if dataset_id is not None
+        }
+
     @staticmethod
     def launch_qa_run(
         dataset_id: int,
         organization_id: typing.Optional[int] = None,
         run_args: typing.Optional[RunArgs] = None,
+        client: typing.Optional[HirundoClient] = None,
     ) -> str:
         """
         Run the dataset QA process on the server using the dataset with the given ID
@@ -462,20 +868,21 @@ class QADataset(BaseModel):
 
         Args:
             dataset_id: The ID of the dataset to run QA on.
+            client: The client to use. Defaults to the default client.
 
         Returns:
             ID of the run (`run_id`).
         """
+        client = resolve_client(client)
         run_info = {}
         if organization_id:
             run_info["organization_id"] = organization_id
         if run_args:
             run_info["run_args"] = run_args.model_dump(mode="json")
-        run_response = requests.post(
-            f"{API_HOST}/dataset-qa/run/{dataset_id}",
+        run_response = client.post(
+            f"/dataset-qa/run/{dataset_id}",
             json=run_info if len(run_info) > 0 else None,
-            headers=get_headers(),
-            timeout=MODIFY_TIMEOUT,
+            timeout=client.modify_timeout,
         )
         raise_for_status_with_reason(run_response)
         return run_response.json()["run_id"]
@@ -506,6 +913,7 @@ class QADataset(BaseModel):
         organization_id: typing.Optional[int] = None,
         replace_dataset_if_exists: bool = False,
         run_args: typing.Optional[RunArgs] = None,
+        client: typing.Optional[HirundoClient] = None,
     ) -> str:
         """
         If the dataset was not created on the server yet, it is created.
@@ -516,20 +924,25 @@ class QADataset(BaseModel):
             replace_dataset_if_exists: If True, the dataset will be replaced if it already exists
                 (this is determined by a dataset of the same name in the same organization).
             run_args: The run arguments to use for the QA run
+            client: The client to use. Defaults to the default client.
 
         Returns:
             An ID of the run (`run_id`) and stores that `run_id` on the instance
         """
         try:
             if not self.id:
-                self.id = self.create(replace_if_exists=replace_dataset_if_exists)
+                self.id = self.create(
+                    replace_if_exists=replace_dataset_if_exists, client=client
+                )
             if run_args is not None:
                 self._validate_run_args(run_args)
-            run_id = self.launch_qa_run(self.id, organization_id, run_args)
+            run_id = self.launch_qa_run(
+                self.id, organization_id, run_args, client=client
+            )
             self.run_id = run_id
             logger.info("Started the run with ID: %s", run_id)
             return run_id
-        except requests.HTTPError as error:
+        except HTTPError as error:
             try:
                 content = error.response.json()
                 logger.error(
@@ -555,16 +968,28 @@ class QADataset(BaseModel):
         self.run_id = None
 
     @staticmethod
-    def _check_run_by_id(run_id: str, retry=0) -> Generator[dict, None, None]:
+    def _check_run_by_id(
+        run_id: str,
+        retry=0,
+        client: typing.Optional[HirundoClient] = None,
+        checkpoints: typing.Optional["RunCheckpointStore"] = None,
+        deadline: Deadline = NO_DEADLINE,
+        cancellation: typing.Optional[SSECancellation] = None,
+    ) -> Generator[RunEvent, None, None]:
         if retry > MAX_RETRIES:
             raise HirundoError("Max retries reached")
+        client = resolve_client(client)
         last_event = None
-        with httpx.Client(timeout=httpx.Timeout(None, connect=5.0)) as client:
+        with client.sse_client() as sse_client:
             for sse in iter_sse_retrying(
-                client,
+                sse_client,
                 "GET",
-                f"{API_HOST}/dataset-qa/run/{run_id}",
-                headers=get_headers(),
+                client.url(f"/dataset-qa/run/{run_id}"),
+                headers=client.headers(),
+                heartbeat=client.sse_heartbeat(f"/dataset-qa/run/{run_id}"),
+                last_event_id=QADataset._resume_event_id(run_id, checkpoints),
+                deadline=deadline,
+                cancellation=cancellation,
             ):
                 if sse.event == "ping":
                     continue
@@ -575,50 +1000,164 @@ class QADataset(BaseModel):
                     sse.id,
                     sse.retry,
                 )
-                last_event = json.loads(sse.data)
-                if not last_event:
+                event = parse_run_event(sse.data)
+                if event is None:
                     continue
-                if "data" in last_event:
-                    data = last_event["data"]
-                else:
-                    if "detail" in last_event:
-                        raise HirundoError(last_event["detail"])
-                    elif "reason" in last_event:
-                        raise HirundoError(last_event["reason"])
-                    else:
-                        raise HirundoError("Unknown error")
-                yield data
-        if not last_event or last_event["data"]["state"] == RunStatus.PENDING.value:
-            QADataset._check_run_by_id(run_id, retry + 1)
+                if checkpoints is not None:
+                    checkpoints.record(run_id, sse.id, event)
+                last_event = event
+                yield event
+        if cancellation is not None and cancellation.cancelled:
+            return
+        if last_event is None or last_event.state == RunStatus.PENDING:
+            yield from QADataset._check_run_by_id(
+                run_id,
+                retry + 1,
+                client=client,
+                checkpoints=checkpoints,
+                deadline=deadline,
+                cancellation=cancellation,
+            )
+
+    @staticmethod
+    def _resume_event_id(
+        run_id: str, checkpoints: typing.Optional["RunCheckpointStore"]
+    ) -> str:
+        checkpoint = checkpoints.get(run_id) if checkpoints is not None else None
+        if checkpoint is None or checkpoint.last_event_id is None:
+            return ""
+        logger.debug("Resuming run %s after event %s", run_id, checkpoint.last_event_id)
+        return checkpoint.last_event_id
+
+    @staticmethod
+    def _download_results(
+        run_id: str,
+        result_url: str,
+        client: typing.Optional[HirundoClient],
+        checkpoints: typing.Optional["RunCheckpointStore"],
+        deadline: Deadline = NO_DEADLINE,
+    ) -> DatasetQAResults:
+        results = download_and_extract_zip(
+            run_id, result_url, client=client, deadline=deadline
+        )
+        if checkpoints is not None:
+            checkpoints.delete(run_id)
+        return results
 
     @staticmethod
-    def _handle_failure(iteration: dict):
-        if iteration["result"]:
-            raise HirundoError(f"QA run failed with error: {iteration['result']}")
+    def _download_checkpointed_results(
+        run_id: str,
+        client: typing.Optional[HirundoClient],
+        checkpoints: "RunCheckpointStore",
+        deadline: Deadline = NO_DEADLINE,
+    ) -> typing.Optional[DatasetQAResults]:
+        """
+        Download the results of a run that already succeeded according to its checkpoint.
+
+        Returns:
+            The results, or `None` if the run has not succeeded yet or the results URL expired
+        """
+        checkpoint = checkpoints.get(run_id)
+        if (
+            checkpoint is None
+            or checkpoint.state != RunStatus.SUCCESS
+            or not checkpoint.result_url
+        ):
+            return None
+        logger.info("Run %s already succeeded. Downloading results", run_id)
+        try:
+            return QADataset._download_results(
+                run_id, checkpoint.result_url, client, checkpoints, deadline
+            )
+        except HTTPError as error:
+            logger.warning(
+                "Failed to download the results of run %s (%s). Checking the run again",
+                run_id,
+                error,
+            )
+            # ⬇️ Results URLs are temporary, so watch the run from the start to get a new one
+            checkpoints.save(
+                checkpoint.model_copy(
+                    update={"last_event_id": None, "result_url": None}
+                )
+            )
+            return None
+
+    @staticmethod
+    def _handle_failure(event: RunEvent):
+        if event.error:
+            raise HirundoError(f"QA run failed with error: {event.error}")
         else:
             raise HirundoError("QA run failed with an unknown error in _handle_failure")
 
+    @staticmethod
+    def _cancel_after_timeout(
+        run_id: str, client: typing.Optional[HirundoClient]
+    ) -> None:
+        try:
+            QADataset.cancel_by_id(run_id, client=client)
+        except Exception as e:
+            logger.error("Failed to cancel run %s after timeout", run_id, exc_info=e)
+
+    @staticmethod
+    def _timed_out(
+        run_id: str,
+        timeout: typing.Optional[float],
+        cancel_on_timeout: bool,
+        client: typing.Optional[HirundoClient],
+    ) -> RunTimeoutError:
+        logger.warning("Run %s did not finish within %s seconds", run_id, timeout)
+        if cancel_on_timeout:
+            QADataset._cancel_after_timeout(run_id, client)
+        return RunTimeoutError(
+            f"QA run {run_id} did not finish within {timeout} seconds", [run_id]
+        )
+
     @staticmethod
     @overload
     def check_run_by_id(
-        run_id: str, stop_on_manual_approval: typing.Literal[True]
+        run_id: str,
+        stop_on_manual_approval: typing.Literal[True],
+        client: typing.Optional[HirundoClient] = None,
+        progress: typing.Optional[ProgressSink] = None,
+        checkpoints: typing.Optional["RunCheckpointStore"] = None,
+        timeout: typing.Optional[float] = None,
+        cancel_on_timeout: bool = False,
     ) -> typing.Optional[DatasetQAResults]: ...
 
     @staticmethod
     @overload
     def check_run_by_id(
-        run_id: str, stop_on_manual_approval: typing.Literal[False] = False
+        run_id: str,
+        stop_on_manual_approval: typing.Literal[False] = False,
+        client: typing.Optional[HirundoClient] = None,
+        progress: typing.Optional[ProgressSink] = None,
+        checkpoints: typing.Optional["RunCheckpointStore"] = None,
+        timeout: typing.Optional[float] = None,
+        cancel_on_timeout: bool = False,
     ) -> DatasetQAResults: ...
 
     @staticmethod
     @overload
     def check_run_by_id(
-        run_id: str, stop_on_manual_approval: bool
+        run_id: str,
+        stop_on_manual_approval: bool,
+        client: typing.Optional[HirundoClient] = None,
+        progress: typing.Optional[ProgressSink] = None,
+        checkpoints: typing.Optional["RunCheckpointStore"] = None,
+        timeout: typing.Optional[float] = None,
+        cancel_on_timeout: bool = False,
     ) -> typing.Optional[DatasetQAResults]: ...
 
     @staticmethod
     def check_run_by_id(
-        run_id: str, stop_on_manual_approval: bool = False
+        run_id: str,
+        stop_on_manual_approval: bool = False,
+        client: typing.Optional[HirundoClient] = None,
+        progress: typing.Optional[ProgressSink] = None,
+        checkpoints: typing.Optional["RunCheckpointStore"] = None,
+        timeout: typing.Optional[float] = None,
+        cancel_on_timeout: bool = False,
     ) -> typing.Optional[DatasetQAResults]:
         """
         Check the status of a run given its ID
@@ -626,103 +1165,270 @@ class QADataset(BaseModel):
         Args:
             run_id: The `run_id` produced by a `run_qa` call
             stop_on_manual_approval: If True, the function will return `None` if the run is awaiting manual approval
+            client: The client to use. Defaults to the default client.
+            progress: Where to report the progress of the run. Defaults to a `tqdm` progress bar.
+                Progress updates are debounced before they reach the sink.
+            checkpoints: If provided, the progress of the run is saved to this store, so that a restarted
+                process resumes watching the run from where it stopped.
+                If the run already succeeded, its results are downloaded right away.
+            timeout: If provided, the maximum number of seconds to wait for the run to finish,
+                including downloading its results
+            cancel_on_timeout: If True, the run is cancelled on the server when the timeout passes
 
         Returns:
             A DatasetQAResults object with the results of the QA run
 
         Raises:
             HirundoError: If the maximum number of retries is reached or if the run fails
+            RunTimeoutError: If the run did not finish within the timeout
         """
         logger.debug("Checking run with ID: %s", run_id)
-        with logging_redirect_tqdm():
-            t = tqdm(total=100.0)
-            for iteration in QADataset._check_run_by_id(run_id):
-                if iteration["state"] in STATUS_TO_PROGRESS_MAP:
-                    t.set_description(STATUS_TO_TEXT_MAP[iteration["state"]])
-                    t.n = STATUS_TO_PROGRESS_MAP[iteration["state"]]
-                    logger.debug("Setting progress to %s", t.n)
-                    t.refresh()
-                    if iteration["state"] in [
-                        RunStatus.FAILURE.value,
-                        RunStatus.REJECTED.value,
-                        RunStatus.REVOKED.value,
-                    ]:
-                        logger.error(
-                            "State is failure, rejected, or revoked: %s",
-                            iteration["state"],
-                        )
-                        QADataset._handle_failure(iteration)
-                    elif iteration["state"] == RunStatus.SUCCESS.value:
-                        t.close()
-                        zip_temporary_url = iteration["result"]
-                        logger.debug("QA run completed. Downloading results")
-
-                        return download_and_extract_zip(
-                            run_id,
-                            zip_temporary_url,
-                        )
-                    elif (
-                        iteration["state"] == RunStatus.AWAITING_MANUAL_APPROVAL.value
-                        and stop_on_manual_approval
-                    ):
-                        t.close()
-                        return None
-                elif iteration["state"] is None:
-                    if (
-                        iteration["result"]
-                        and isinstance(iteration["result"], dict)
-                        and iteration["result"]["result"]
-                        and isinstance(iteration["result"]["result"], str)
-                    ):
-                        result_info = iteration["result"]["result"].split(":")
-                        if len(result_info) > 1:
-                            stage = result_info[0]
-                            current_progress_percentage = float(
-                                result_info[1].removeprefix(" ").removesuffix("% done")
-                            )
-                        elif len(result_info) == 1:
-                            stage = result_info[0]
-                            current_progress_percentage = t.n  # Keep the same progress
-                        else:
-                            stage = "Unknown progress state"
-                            current_progress_percentage = t.n  # Keep the same progress
-                        desc = (
-                            "QA run completed. Uploading results"
-                            if current_progress_percentage == 100.0
-                            else stage
-                        )
-                        t.set_description(desc)
-                        t.n = current_progress_percentage
-                        logger.debug("Setting progress to %s", t.n)
-                        t.refresh()
+        deadline = Deadline(timeout)
+        try:
+            if checkpoints is not None and (
+                results := QADataset._download_checkpointed_results(
+                    run_id, client, checkpoints, deadline
+                )
+            ):
+                return results
+            sink = debounce(progress if progress is not None else TqdmProgressSink())
+            try:
+                event = QADataset._follow_run(
+                    run_id, stop_on_manual_approval, client, sink, checkpoints, deadline
+                )
+            finally:
+                sink.close()
+            if event is None:
+                return None
+            logger.debug("QA run completed. Downloading results")
+            return QADataset._download_results(
+                run_id, event.result_url, client, checkpoints, deadline
+            )
+        except TimeoutError as error:
+            if not deadline.expired:
+                raise
+            # ⬆️ The SSE connection and any partial download are closed by now
+            raise QADataset._timed_out(
+                run_id, timeout, cancel_on_timeout, client
+            ) from error
+
+    @staticmethod
+    def _follow_run(
+        run_id: str,
+        stop_on_manual_approval: bool,
+        client: typing.Optional[HirundoClient],
+        sink: ProgressSink,
+        checkpoints: typing.Optional["RunCheckpointStore"],
+        deadline: Deadline,
+    ) -> typing.Optional[RunEvent]:
+        """
+        Follow a run until it succeeds (returning the final event with the results URL)
+        or awaits manual approval with `stop_on_manual_approval` set (returning `None`)
+        """
+        for event in QADataset._check_run_by_id(
+            run_id, client=client, checkpoints=checkpoints, deadline=deadline
+        ):
+            if event.state is None:
+                if event.stage is not None:
+                    sink.on_progress(run_id, event)
+                continue
+            sink.on_state(run_id, event)
+            if event.state in FAILED_STATUSES:
+                logger.error(
+                    "State is failure, rejected, or revoked: %s",
+                    event.state.value,
+                )
+                QADataset._handle_failure(event)
+            elif event.state == RunStatus.SUCCESS:
+                sink.on_result(run_id, event)
+                return event
+            elif (
+                event.state == RunStatus.AWAITING_MANUAL_APPROVAL
+                and stop_on_manual_approval
+            ):
+                return None
         raise HirundoError("QA run failed with an unknown error in check_run_by_id")
 
     @overload
     def check_run(
-        self, stop_on_manual_approval: typing.Literal[True]
+        self,
+        stop_on_manual_approval: typing.Literal[True],
+        client: typing.Optional[HirundoClient] = None,
+        progress: typing.Optional[ProgressSink] = None,
+        checkpoints: typing.Optional["RunCheckpointStore"] = None,
+        timeout: typing.Optional[float] = None,
+        cancel_on_timeout: bool = False,
     ) -> typing.Optional[DatasetQAResults]: ...
 
     @overload
     def check_run(
-        self, stop_on_manual_approval: typing.Literal[False] = False
+        self,
+        stop_on_manual_approval: typing.Literal[False] = False,
+        client: typing.Optional[HirundoClient] = None,
+        progress: typing.Optional[ProgressSink] = None,
+        checkpoints: typing.Optional["RunCheckpointStore"] = None,
+        timeout: typing.Optional[float] = None,
+        cancel_on_timeout: bool = False,
     ) -> DatasetQAResults: ...
 
     def check_run(
-        self, stop_on_manual_approval: bool = False
+        self,
+        stop_on_manual_approval: bool = False,
+        client: typing.Optional[HirundoClient] = None,
+        progress: typing.Optional[ProgressSink] = None,
+        checkpoints: typing.Optional["RunCheckpointStore"] = None,
+        timeout: typing.Optional[float] = None,
+        cancel_on_timeout: bool = False,
     ) -> typing.Optional[DatasetQAResults]:
         """
         Check the status of the current active instance's run.
 
+        Args:
+            stop_on_manual_approval: If True, the function will return `None` if the run is awaiting manual approval
+            client: The client to use. Defaults to the default client.
+            progress: Where to report the progress of the run. Defaults to a `tqdm` progress bar.
+                Progress updates are debounced before they reach the sink.
+            checkpoints: If provided, the progress of the run is saved to this store, so that a restarted
+                process resumes watching the run from where it stopped.
+                If the run already succeeded, its results are downloaded right away.
+            timeout: If provided, the maximum number of seconds to wait for the run to finish,
+                including downloading its results
+            cancel_on_timeout: If True, the run is cancelled on the server when the timeout passes
+
         Returns:
             A pandas DataFrame with the results of the QA run
 
         """
         if not self.run_id:
             raise ValueError("No run has been started")
-        return self.check_run_by_id(self.run_id, stop_on_manual_approval)
+        return self.check_run_by_id(
+            self.run_id,
+            stop_on_manual_approval,
+            client=client,
+            progress=progress,
+            checkpoints=checkpoints,
+            timeout=timeout,
+            cancel_on_timeout=cancel_on_timeout,
+        )
+
+    def _run_and_check(
+        self,
+        organization_id: typing.Optional[int],
+        replace_dataset_if_exists: bool,
+        run_args: typing.Optional[RunArgs],
+        client: HirundoClient,
+        progress: ProgressSink,
+        checkpoints: typing.Optional["RunCheckpointStore"],
+        timeout: typing.Optional[float],
+        cancel_on_timeout: bool,
+    ) -> DatasetQAResults:
+        with self._submit_lock:
+            run_id = self.run_qa(
+                organization_id, replace_dataset_if_exists, run_args, client=client
+            )
+        return self.check_run_by_id(
+            run_id,
+            client=client,
+            progress=progress,
+            checkpoints=checkpoints,
+            timeout=timeout,
+            cancel_on_timeout=cancel_on_timeout,
+        )
+
+    def submit(
+        self,
+        organization_id: typing.Optional[int] = None,
+        replace_dataset_if_exists: bool = False,
+        run_args: typing.Optional[RunArgs] = None,
+        client: typing.Optional[HirundoClient] = None,
+        progress: typing.Optional[ProgressSink] = None,
+        checkpoints: typing.Optional["RunCheckpointStore"] = None,
+        timeout: typing.Optional[float] = None,
+        cancel_on_timeout: bool = False,
+    ) -> "Future[DatasetQAResults]":
+        """
+        Run the dataset QA process in the background: create the dataset if it was not created yet,
+        start the run, wait for it to finish and download its results.
+
+        The work is done by the thread pool of the client (see :attr:`HirundoClient.executor`),
+        so at most `max_workers` submissions of a client are in progress at once and the rest are queued.
+        Use :func:`concurrent.futures.as_completed` or :func:`QADataset.as_completed` to handle the results
+        of many submissions as they finish.
+
+        Args:
+            organization_id: The ID of the organization to run the QA for.
+            replace_dataset_if_exists: If True, the dataset will be replaced if it already exists
+                (this is determined by a dataset of the same name in the same organization).
+            run_args: The run arguments to use for the QA run
+            client: The client to use. Defaults to the default client.
+            progress: Where to report the progress of the run. Defaults to no progress reporting.
+            checkpoints: If provided, the progress of the run is saved to this store
+            timeout: If provided, the maximum number of seconds to wait for the run to finish once started
+            cancel_on_timeout: If True, the run is cancelled on the server when the timeout passes
+
+        Returns:
+            A future of the results of the QA run. Its exception is set if the run could not be started,
+            failed or timed out.
+        """
+        client = resolve_client(client)
+        return client.executor.submit(
+            self._run_and_check,
+            organization_id,
+            replace_dataset_if_exists,
+            run_args,
+            client,
+            progress if progress is not None else NullProgressSink(),
+            checkpoints,
+            timeout,
+            cancel_on_timeout,
+        )
 
     @staticmethod
-    async def acheck_run_by_id(run_id: str, retry=0) -> AsyncGenerator[dict, None]:
+    def submit_many(
+        datasets: Iterable["QADataset"], **kwargs
+    ) -> dict["Future[DatasetQAResults]", "QADataset"]:
+        """
+        Submit the dataset QA process of each of the given datasets, see :func:`QADataset.submit`
+
+        Args:
+            datasets: The datasets to run QA on
+            kwargs: Other arguments of :func:`QADataset.submit`, used for every dataset
+
+        Returns:
+            A mapping of each future to its dataset, to be passed to :func:`QADataset.as_completed`
+        """
+        return {dataset.submit(**kwargs): dataset for dataset in datasets}
+
+    @staticmethod
+    def as_completed(
+        submissions: Mapping["Future[DatasetQAResults]", "QADataset"],
+        timeout: typing.Optional[float] = None,
+    ) -> Generator[tuple["QADataset", "Future[DatasetQAResults]"], None, None]:
+        """
+        Iterate over submitted datasets as their runs finish (successfully or not)
+
+        Args:
+            submissions: A mapping of futures to their datasets, as returned by :func:`QADataset.submit_many`
+            timeout: The maximum number of seconds to wait for all submissions to finish
+
+        Yields:
+            Each dataset with its future, which is done
+
+        Raises:
+            concurrent.futures.TimeoutError: If not all submissions finished within the timeout
+        """
+        for future in as_completed(submissions, timeout=timeout):
+            yield submissions[future], future
+
+    @staticmethod
+    async def acheck_run_by_id(
+        run_id: str,
+        retry=0,
+        client: typing.Optional[HirundoClient] = None,
+        checkpoints: typing.Optional["RunCheckpointStore"] = None,
+        timeout: typing.Optional[float] = None,
+        cancel_on_timeout: bool = False,
+    ) -> AsyncGenerator[RunEvent, None]:
         """
         Async version of :func:`check_run_by_id`
 
@@ -733,42 +1439,127 @@ class QADataset(BaseModel):
         Args:
             run_id: The `run_id` produced by a `run_qa` call
             retry: A number used to track the number of retries to limit re-checks. *Do not* provide this value manually.
+            client: The client to use. Defaults to the default client.
+            checkpoints: If provided, the progress of the run is saved to this store, so that a restarted
+                process resumes watching the run from where it stopped
+            timeout: If provided, the maximum number of seconds to wait for the run to finish
+            cancel_on_timeout: If True, the run is cancelled on the server when the timeout passes
 
         Yields:
-            Each event will be a dict, where:
-            - `"state"` is PENDING, STARTED, RETRY, FAILURE or SUCCESS
-            - `"result"` is a string describing the progress as a percentage for a PENDING state, or the error for a FAILURE state or the results for a SUCCESS state
+            A :class:`RunEvent` for each status change or progress update of the run
+
+        Raises:
+            RunTimeoutError: If the run did not finish within the timeout
 
         """
+        if timeout is None:
+            async for event in QADataset._acheck_run_by_id(
+                run_id, retry, client, checkpoints
+            ):
+                yield event
+            return
+        deadline = Deadline(timeout)
+        async for event in QADataset._awith_timeout(
+            run_id,
+            QADataset._acheck_run_by_id(run_id, retry, client, checkpoints, deadline),
+            deadline,
+            cancel_on_timeout,
+            client,
+        ):
+            yield event
+
+    @staticmethod
+    async def _acheck_run_by_id(
+        run_id: str,
+        retry=0,
+        client: typing.Optional[HirundoClient] = None,
+        checkpoints: typing.Optional["RunCheckpointStore"] = None,
+        deadline: Deadline = NO_DEADLINE,
+    ) -> AsyncGenerator[RunEvent, None]:
         logger.debug("Checking run with ID: %s", run_id)
         if retry > MAX_RETRIES:
             raise HirundoError("Max retries reached")
+        client = resolve_client(client)
         last_event = None
-        async with httpx.AsyncClient(
-            timeout=httpx.Timeout(None, connect=5.0)
-        ) as client:
+        last_event_id = QADataset._resume_event_id(run_id, checkpoints)
+        # ⬇️ The stream is shared by every watcher of the run, so each applies its own deadline
+        async for sse in abefore_deadline(
+            _RUN_EVENT_STREAMS.subscribe(
+                (client, run_id),
+                lambda: QADataset._aiter_run_events(run_id, client, last_event_id),
+            ),
+            deadline,
+        ):
+            if sse.event == "ping":
+                continue
+            logger.debug(
+                "[ASYNC] Received event: %s with data: %s and ID: %s and retry: %s",
+                sse.event,
+                sse.data,
+                sse.id,
+                sse.retry,
+            )
+            event = parse_run_event(sse.data)
+            if event is None:
+                continue
+            if checkpoints is not None:
+                checkpoints.record(run_id, sse.id, event)
+            last_event = event
+            yield event
+        if last_event is None or last_event.state == RunStatus.PENDING:
+            async for data in QADataset._acheck_run_by_id(
+                run_id, retry + 1, client, checkpoints, deadline
+            ):
+                yield data
+
+    @staticmethod
+    async def _awith_timeout(
+        run_id: str,
+        events: AsyncGenerator[RunEvent, None],
+        deadline: Deadline,
+        cancel_on_timeout: bool,
+        client: typing.Optional[HirundoClient],
+    ) -> AsyncGenerator[RunEvent, None]:
+        try:
+            async for event in events:
+                yield event
+            return
+        except TimeoutError as error:
+            if not deadline.expired:
+                raise
+            timed_out = error
+        finally:
+            # ⬇️ Close the SSE stream before cancelling, as cancelling may take a while
+            await events.aclose()
+        raise await asyncio.to_thread(
+            QADataset._timed_out, run_id, deadline.timeout, cancel_on_timeout, client
+        ) from timed_out
+
+    @staticmethod
+    async def _aiter_run_events(
+        run_id: str,
+        client: HirundoClient,
+        last_event_id: str = "",
+    ) -> AsyncGenerator[ServerSentEvent, None]:
+        async with client.async_sse_client() as sse_client:
             async_iterator = await aiter_sse_retrying(
-                client,
+                sse_client,
                 "GET",
-                f"{API_HOST}/dataset-qa/run/{run_id}",
-                headers=get_headers(),
+                client.url(f"/dataset-qa/run/{run_id}"),
+                headers=client.headers(),
+                heartbeat=client.sse_heartbeat(f"/dataset-qa/run/{run_id}"),
+                last_event_id=last_event_id,
             )
             async for sse in async_iterator:
-                if sse.event == "ping":
-                    continue
-                logger.debug(
-                    "[ASYNC] Received event: %s with data: %s and ID: %s and retry: %s",
-                    sse.event,
-                    sse.data,
-                    sse.id,
-                    sse.retry,
-                )
-                last_event = json.loads(sse.data)
-                yield last_event["data"]
-        if not last_event or last_event["data"]["state"] == RunStatus.PENDING.value:
-            QADataset.acheck_run_by_id(run_id, retry + 1)
+                yield sse
 
-    async def acheck_run(self) -> AsyncGenerator[dict, None]:
+    async def acheck_run(
+        self,
+        client: typing.Optional[HirundoClient] = None,
+        checkpoints: typing.Optional["RunCheckpointStore"] = None,
+        timeout: typing.Optional[float] = None,
+        cancel_on_timeout: bool = False,
+    ) -> AsyncGenerator[RunEvent, None]:
         """
         Async version of :func:`check_run`
 
@@ -776,64 +1567,141 @@ class QADataset(BaseModel):
 
         This generator will produce values to show progress of the run.
 
+        Args:
+            client: The client to use. Defaults to the default client.
+            checkpoints: If provided, the progress of the run is saved to this store, so that a restarted
+                process resumes watching the run from where it stopped
+            timeout: If provided, the maximum number of seconds to wait for the run to finish
+            cancel_on_timeout: If True, the run is cancelled on the server when the timeout passes
+
         Yields:
-            Each event will be a dict, where:
-            - `"state"` is PENDING, STARTED, RETRY, FAILURE or SUCCESS
-            - `"result"` is a string describing the progress as a percentage for a PENDING state, or the error for a FAILURE state or the results for a SUCCESS state
+            A :class:`RunEvent` for each status change or progress update of the run
 
         """
         if not self.run_id:
             raise ValueError("No run has been started")
-        async for iteration in self.acheck_run_by_id(self.run_id):
-            yield iteration
+        async for event in self.acheck_run_by_id(
+            self.run_id,
+            client=client,
+            checkpoints=checkpoints,
+            timeout=timeout,
+            cancel_on_timeout=cancel_on_timeout,
+        ):
+            yield event
 
     @staticmethod
-    def cancel_by_id(run_id: str) -> None:
+    def cancel_by_id(
+        run_id: str, client: typing.Optional[HirundoClient] = None
+    ) -> None:
         """
         Cancel the dataset QA run for the given `run_id`.
 
         Args:
             run_id: The ID of the run to cancel
+            client: The client to use. Defaults to the default client.
         """
+        client = resolve_client(client)
         logger.info("Cancelling run with ID: %s", run_id)
-        response = requests.delete(
-            f"{API_HOST}/dataset-qa/run/{run_id}",
-            headers=get_headers(),
-            timeout=MODIFY_TIMEOUT,
+        response = client.delete(
+            f"/dataset-qa/run/{run_id}",
+            timeout=client.modify_timeout,
         )
         raise_for_status_with_reason(response)
 
-    def cancel(self) -> None:
+    @staticmethod
+    def cancel_runs(
+        run_ids: Iterable[str],
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        client: typing.Optional[HirundoClient] = None,
+    ) -> BulkReport:
+        """
+        Cancel the dataset QA runs with the given IDs, at most `max_concurrency` at once.
+        A failure for one ID does not stop the others.
+
+        Args:
+            run_ids: The IDs of the runs to cancel
+            max_concurrency: The maximum number of requests sent at once
+            client: The client to use. Defaults to the default client.
+                Its rate limit (if any) applies to all the requests.
+
+        Returns:
+            A report with the outcome for each ID
+        """
+        client = resolve_client(client)
+        return run_bulk(
+            "cancel-runs",
+            functools.partial(QADataset.cancel_by_id, client=client),
+            run_ids,
+            max_concurrency,
+        )
+
+    def cancel(self, client: typing.Optional[HirundoClient] = None) -> None:
         """
         Cancel the current active instance's run.
+
+        Args:
+            client: The client to use. Defaults to the default client.
         """
         if not self.run_id:
             raise ValueError("No run has been started")
-        self.cancel_by_id(self.run_id)
+        self.cancel_by_id(self.run_id, client=client)
 
     @staticmethod
-    def archive_run_by_id(run_id: str) -> None:
+    def archive_run_by_id(
+        run_id: str, client: typing.Optional[HirundoClient] = None
+    ) -> None:
         """
         Archive the dataset QA run for the given `run_id`.
 
         Args:
             run_id: The ID of the run to archive
+            client: The client to use. Defaults to the default client.
         """
+        client = resolve_client(client)
         logger.info("Archiving run with ID: %s", run_id)
-        response = requests.patch(
-            f"{API_HOST}/dataset-qa/run/archive/{run_id}",
-            headers=get_headers(),
-            timeout=MODIFY_TIMEOUT,
+        response = client.patch(
+            f"/dataset-qa/run/archive/{run_id}",
+            timeout=client.modify_timeout,
         )
         raise_for_status_with_reason(response)
 
-    def archive(self) -> None:
+    @staticmethod
+    def archive_runs(
+        run_ids: Iterable[str],
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        client: typing.Optional[HirundoClient] = None,
+    ) -> BulkReport:
+        """
+        Archive the dataset QA runs with the given IDs, at most `max_concurrency` at once.
+        A failure for one ID does not stop the others.
+
+        Args:
+            run_ids: The IDs of the runs to archive
+            max_concurrency: The maximum number of requests sent at once
+            client: The client to use. Defaults to the default client.
+                Its rate limit (if any) applies to all the requests.
+
+        Returns:
+            A report with the outcome for each ID
+        """
+        client = resolve_client(client)
+        return run_bulk(
+            "archive-runs",
+            functools.partial(QADataset.archive_run_by_id, client=client),
+            run_ids,
+            max_concurrency,
+        )
+
+    def archive(self, client: typing.Optional[HirundoClient] = None) -> None:
         """
         Archive the current active instance's run.
+
+        Args:
+            client: The client to use. Defaults to the default client.
         """
         if not self.run_id:
             raise ValueError("No run has been started")
-        self.archive_run_by_id(self.run_id)
+        self.archive_run_by_id(self.run_id, client=client)
 
 
 class QADatasetOut(BaseModel):
@@ -0,0 +1,203 @@
+import datetime
+import sqlite3
+import threading
+import typing
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from hirundo._fingerprint import content_hash
+from hirundo._fork import reset_after_fork
+from hirundo._http import HTTPError
+from hirundo.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_FINGERPRINTS_PATH = Path.home() / ".hirundo" / "fingerprints.sqlite3"
+SQLITE_TIMEOUT = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS fingerprints (
+    resource_key TEXT PRIMARY KEY,
+    resource_id INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    server_hash TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+)
+"""
+
+
+class Fingerprint(BaseModel):
+    resource_key: str
+    """
+    The server, type, organization & name of the resource
+    """
+    resource_id: int
+    content_hash: str
+    """
+    The hash of the definition the resource was last created from
+    """
+    server_hash: str
+    """
+    The hash of the resource as returned by the server after it was created,
+    to notice changes made by others (e.g. in the web interface)
+    """
+    updated_at: datetime.datetime
+
+
+class FingerprintStore:
+    """
+    A small local store of the definitions last written to the server, so that re-running
+    `create(replace_if_exists=True)` with an unchanged definition does not write to the server again.
+
+    Pass the store as `fingerprints` to :func:`QADataset.create`, :func:`StorageConfig.create`,
+    :func:`GitRepo.create` or their `create_many` versions. When a resource is replaced, its definition
+    is compared to the one it was last created from, and the server's copy (looked up by name)
+    to the one returned after that creation. If neither changed, the existing ID is returned without a write.
+
+    The store is a SQLite database, which can be shared by several threads & processes on the same machine.
+    """
+
+    def __init__(self, path: typing.Union[str, Path, None] = None):
+        """
+        Args:
+            path: The path of the SQLite database. Defaults to `~/.hirundo/fingerprints.sqlite3`
+        """
+        self.path = Path(path) if path is not None else DEFAULT_FINGERPRINTS_PATH
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = self._connect()
+        with self._lock, self._connection:
+            self._connection.execute(_SCHEMA)
+        reset_after_fork(self)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(
+            self.path, timeout=SQLITE_TIMEOUT, check_same_thread=False
+        )
+
+    def _after_fork(self) -> None:
+        # ⬇️ SQLite connections must not be used across a fork, so the child opens its own
+        self._lock = threading.Lock()
+        self._connection = self._connect()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(path={str(self.path)!r})"
+
+    def get(self, resource_key: str) -> typing.Optional[Fingerprint]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT * FROM fingerprints WHERE resource_key = ?", (resource_key,)
+            ).fetchone()
+        if row is None:
+            return None
+        key, resource_id, model_hash, server_hash, updated_at = row
+        return Fingerprint(
+            resource_key=key,
+            resource_id=resource_id,
+            content_hash=model_hash,
+            server_hash=server_hash,
+            updated_at=updated_at,
+        )
+
+    def save(self, fingerprint: Fingerprint) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO fingerprints VALUES (?, ?, ?, ?, ?)",
+                (
+                    fingerprint.resource_key,
+                    fingerprint.resource_id,
+                    fingerprint.content_hash,
+                    fingerprint.server_hash,
+                    fingerprint.updated_at.isoformat(),
+                ),
+            )
+
+    def delete(self, resource_key: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM fingerprints WHERE resource_key = ?", (resource_key,)
+            )
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+def resource_key(
+    api_host: str,
+    resource: str,
+    name: str,
+    organization_id: typing.Optional[int] = None,
+    type_: typing.Optional[str] = None,
+) -> str:
+    """
+    The key of a resource in a :class:`FingerprintStore`, e.g. `https://api.hirundo.io/storage-config/S3/my-bucket`
+    """
+    parts = [api_host, resource, str(organization_id or "default"), type_, name]
+    return "/".join(part for part in parts if part is not None)
+
+
+def _server_hash(
+    lookup: typing.Callable[[], BaseModel],
+) -> typing.Optional[str]:
+    try:
+        return content_hash(lookup())
+    except HTTPError as error:
+        logger.debug("Could not look up the server's copy: %s", error)
+        return None
+
+
+def create_unless_unchanged(
+    fingerprints: typing.Optional[FingerprintStore],
+    key: str,
+    model_hash: str,
+    lookup: typing.Callable[[], BaseModel],
+    create: typing.Callable[[], int],
+    replace_if_exists: bool,
+) -> int:
+    """
+    Create a resource, unless it is replaced with the same definition it was last created from
+    and the server's copy did not change since
+
+    Args:
+        fingerprints: The store of the definitions last written. If `None`, the resource is always created.
+        key: The key of the resource, see :func:`resource_key`
+        model_hash: The hash of the definition to create
+        lookup: Gets the server's copy of the resource by its name
+        create: Creates the resource & returns its ID
+        replace_if_exists: Whether the resource is created with `replace_if_exists`.
+            Only replacements can be skipped, other creations fail on the server if the resource exists.
+
+    Returns:
+        The ID of the resource
+    """
+    if fingerprints is None:
+        return create()
+    fingerprint = fingerprints.get(key)
+    if (
+        replace_if_exists
+        and fingerprint is not None
+        and fingerprint.content_hash == model_hash
+        and _server_hash(lookup) == fingerprint.server_hash
+    ):
+        logger.info(
+            "Skipped replacing %s, it did not change since it was created with ID %s",
+            key,
+            fingerprint.resource_id,
+        )
+        return fingerprint.resource_id
+    resource_id = create()
+    server_hash = _server_hash(lookup)
+    if server_hash is None:
+        fingerprints.delete(key)
+    else:
+        fingerprints.save(
+            Fingerprint(
+                resource_key=key,
+                resource_id=resource_id,
+                content_hash=model_hash,
+                server_hash=server_hash,
+                updated_at=datetime.datetime.now(datetime.timezone.utc),
+            )
+        )
+    return resource_id
@@ -1,17 +1,31 @@
 import datetime
+import functools
 import re
 import typing
+from collections.abc import Generator, Iterable, Sequence
 
 import pydantic
 from pydantic import BaseModel, field_validator
 from pydantic_core import Url
 
-from hirundo._env import API_HOST
-from hirundo._headers import get_headers
-from hirundo._http import raise_for_status_with_reason, requests
-from hirundo._timeouts import MODIFY_TIMEOUT, READ_TIMEOUT
+from hirundo._fingerprint import content_hash
+from hirundo._http import parse_response, raise_for_status_with_reason
+from hirundo._pagination import DEFAULT_PAGE_SIZE, iter_pages, matches_filters
 from hirundo._urls import RepoUrl
+from hirundo.bulk import (
+    DEFAULT_BULK_CONCURRENCY,
+    BulkReport,
+    create_deduplicated,
+    run_bulk,
+)
+from hirundo.client import HirundoClient, resolve_client
+from hirundo.fingerprints import (
+    FingerprintStore,
+    create_unless_unchanged,
+    resource_key,
+)
 from hirundo.logger import get_logger
+from hirundo.name_cache import cached_get_by_name, invalidate_id, invalidate_name
 
 logger = get_logger(__name__)
 
@@ -110,102 +124,232 @@ class GitRepo(BaseModel):
             repository_url = Url(repository_url)
         return repository_url
 
-    def create(self, replace_if_exists: bool = False) -> int:
+    def create(
+        self,
+        replace_if_exists: bool = False,
+        client: typing.Optional[HirundoClient] = None,
+        fingerprints: typing.Optional[FingerprintStore] = None,
+    ) -> int:
         """
         Create a Git repository in the Hirundo system.
 
         Args:
             replace_if_exists: If a Git repository with the same name already exists, replace it.
+            client: The client to use. Defaults to the default client.
+            fingerprints: If provided, a replacement is skipped when neither the Git repository
+                nor the server's copy changed since it was last created, see :class:`FingerprintStore`.
         """
-        git_repo = requests.post(
-            f"{API_HOST}/git-repo/",
+        client = resolve_client(client)
+        self.id = create_unless_unchanged(
+            fingerprints,
+            resource_key(client.api_host, "git-repo", self.name, self.organization_id),
+            self.content_hash(),
+            functools.partial(GitRepo.get_by_name, self.name, client=client),
+            functools.partial(self._post, replace_if_exists, client),
+            replace_if_exists,
+        )
+        return self.id
+
+    def _post(self, replace_if_exists: bool, client: HirundoClient) -> int:
+        git_repo = client.post(
+            "/git-repo/",
             json={
                 **self.model_dump(mode="json"),
                 "replace_if_exists": replace_if_exists,
             },
-            headers=get_headers(),
-            timeout=MODIFY_TIMEOUT,
+            timeout=client.modify_timeout,
         )
         raise_for_status_with_reason(git_repo)
         git_repo_id = git_repo.json()["id"]
         self.id = git_repo_id
+        invalidate_name(client, "git-repo", self.name)
         return git_repo_id
 
     @staticmethod
-    def get_by_id(git_repo_id: int) -> "GitRepoOut":
+    def create_many(
+        git_repos: Sequence["GitRepo"],
+        replace_if_exists: bool = False,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        client: typing.Optional[HirundoClient] = None,
+        fingerprints: typing.Optional[FingerprintStore] = None,
+    ) -> list[typing.Optional[int]]:
+        """
+        Create Git repositories in the Hirundo system, at most `max_concurrency` at once.
+        Identical Git repositories (by content) are only created once, and all of them get the created ID.
+
+        Args:
+            git_repos: The Git repositories to create
+            replace_if_exists: If a Git repository with the same name already exists, replace it.
+            max_concurrency: The maximum number of requests sent at once
+            client: The client to use. Defaults to the default client.
+            fingerprints: If provided, unchanged replacements are skipped, see :class:`FingerprintStore`.
+
+        Returns:
+            The ID of each Git repository in the given order, or `None` if it could not be created
+        """
+        client = resolve_client(client)
+        ids = create_deduplicated(
+            "create-git-repos",
+            functools.partial(
+                GitRepo.create,
+                replace_if_exists=replace_if_exists,
+                client=client,
+                fingerprints=fingerprints,
+            ),
+            git_repos,
+            GitRepo.content_hash,
+            max_concurrency,
+        )
+        for git_repo, git_repo_id in zip(git_repos, ids):
+            if git_repo_id is not None:
+                git_repo.id = git_repo_id
+        return ids
+
+    def content_hash(self) -> str:
+        """
+        A hash of the definition of the Git repository, ignoring its ID
+        """
+        return content_hash(self, exclude={"id"})
+
+    @staticmethod
+    def get_by_id(
+        git_repo_id: int, client: typing.Optional[HirundoClient] = None
+    ) -> "GitRepoOut":
         """
         Retrieves a `GitRepo` instance from the server by its ID
 
         Args:
             git_repo_id: The ID of the `GitRepo` to retrieve
+            client: The client to use. Defaults to the default client.
         """
-        git_repo = requests.get(
-            f"{API_HOST}/git-repo/{git_repo_id}",
-            headers=get_headers(),
-            timeout=READ_TIMEOUT,
+        client = resolve_client(client)
+        git_repo = client.get(
+            f"/git-repo/{git_repo_id}",
+            timeout=client.read_timeout,
         )
         raise_for_status_with_reason(git_repo)
-        return GitRepoOut(**git_repo.json())
+        return parse_response(git_repo, GitRepoOut)
 
     @staticmethod
     def get_by_name(
         name: str,
+        client: typing.Optional[HirundoClient] = None,
     ) -> "GitRepoOut":
         """
-        Retrieves a `GitRepo` instance from the server by its name
+        Retrieves a `GitRepo` instance from the server by its name.
+        Cached if the client has a :class:`NameCache`.
 
         Args:
             name: The name of the `GitRepo` to retrieve
+            client: The client to use. Defaults to the default client.
         """
-        git_repo = requests.get(
-            f"{API_HOST}/git-repo/by-name/{name}",
-            headers=get_headers(),
-            timeout=READ_TIMEOUT,
-        )
-        raise_for_status_with_reason(git_repo)
-        return GitRepoOut(**git_repo.json())
+        client = resolve_client(client)
+
+        def fetch() -> GitRepoOut:
+            git_repo = client.get(
+                f"/git-repo/by-name/{name}",
+                timeout=client.read_timeout,
+            )
+            raise_for_status_with_reason(git_repo)
+            return parse_response(git_repo, GitRepoOut)
+
+        return cached_get_by_name(client, "git-repo", name, None, GitRepoOut, fetch)
 
     @staticmethod
-    def list() -> list["GitRepoOut"]:
+    def list(client: typing.Optional[HirundoClient] = None) -> list["GitRepoOut"]:
         """
         List all Git repositories in the Hirundo system.
+
+        Args:
+            client: The client to use. Defaults to the default client.
         """
-        git_repos = requests.get(
-            f"{API_HOST}/git-repo/",
-            headers=get_headers(),
-            timeout=READ_TIMEOUT,
+        client = resolve_client(client)
+        git_repos = client.get(
+            "/git-repo/",
+            timeout=client.read_timeout,
         )
         raise_for_status_with_reason(git_repos)
-        git_repo_json = git_repos.json()
-        return [
-            GitRepoOut(
-                **git_repo,
-            )
-            for git_repo in git_repo_json
-        ]
+        return parse_response(git_repos, list[GitRepoOut])
+
+    @staticmethod
+    def iter_git_repos(
+        page_size: int = DEFAULT_PAGE_SIZE,
+        name_prefix: typing.Optional[str] = None,
+        created_after: typing.Optional[datetime.datetime] = None,
+        created_before: typing.Optional[datetime.datetime] = None,
+        client: typing.Optional[HirundoClient] = None,
+    ) -> Generator["GitRepoOut", None, None]:
+        """
+        Lazily iterate over the Git repositories in the Hirundo system, fetching one page at a time
+
+        Args:
+            page_size: The number of Git repositories to fetch per request.
+            name_prefix: If provided, only Git repositories whose name starts with this prefix are yielded.
+            created_after: If provided, only Git repositories created at or after this time are yielded.
+            created_before: If provided, only Git repositories created before this time are yielded.
+            client: The client to use. Defaults to the default client.
+        """
+        client = resolve_client(client)
+        for git_repo in iter_pages(
+            client, "/git-repo/", GitRepoOut, page_size=page_size
+        ):
+            if matches_filters(git_repo, name_prefix, created_after, created_before):
+                yield git_repo
 
     @staticmethod
-    def delete_by_id(git_repo_id: int):
+    def delete_by_id(git_repo_id: int, client: typing.Optional[HirundoClient] = None):
         """
         Delete a Git repository by its ID.
 
         Args:
             git_repo_id: The ID of the Git repository to delete
+            client: The client to use. Defaults to the default client.
         """
-        git_repo = requests.delete(
-            f"{API_HOST}/git-repo/{git_repo_id}",
-            headers=get_headers(),
-            timeout=MODIFY_TIMEOUT,
+        client = resolve_client(client)
+        git_repo = client.delete(
+            f"/git-repo/{git_repo_id}",
+            timeout=client.modify_timeout,
         )
         raise_for_status_with_reason(git_repo)
+        invalidate_id(client, "git-repo", git_repo_id)
 
-    def delete(self):
+    @staticmethod
+    def delete_many(
+        git_repo_ids: Iterable[int],
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        client: typing.Optional[HirundoClient] = None,
+    ) -> BulkReport:
+        """
+        Delete Git repositories by their IDs, at most `max_concurrency` at once.
+        A failure for one ID does not stop the others.
+
+        Args:
+            git_repo_ids: The IDs of the Git repositories to delete
+            max_concurrency: The maximum number of requests sent at once
+            client: The client to use. Defaults to the default client.
+                Its rate limit (if any) applies to all the requests.
+
+        Returns:
+            A report with the outcome for each ID
+        """
+        client = resolve_client(client)
+        return run_bulk(
+            "delete-git-repos",
+            functools.partial(GitRepo.delete_by_id, client=client),
+            git_repo_ids,
+            max_concurrency,
+        )
+
+    def delete(self, client: typing.Optional[HirundoClient] = None):
         """
         Delete the Git repository created by this instance.
+
+        Args:
+            client: The client to use. Defaults to the default client.
         """
         if not self.id:
             raise ValueError("No GitRepo has been created")
-        GitRepo.delete_by_id(self.id)
+        GitRepo.delete_by_id(self.id, client=client)
 
 
 class GitRepoOut(BaseModel):
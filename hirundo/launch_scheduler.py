@@ -0,0 +1,342 @@
+import heapq
+import itertools
+import threading
+import typing
+from collections import Counter, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from enum import IntEnum
+
+from hirundo._deadline import Deadline
+from hirundo.client import HirundoClient, resolve_client
+from hirundo.dataset_qa import HirundoError, QADataset, RunArgs, RunStatus
+from hirundo.logger import get_logger
+from hirundo.run_watcher import (
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
+    DEFAULT_POLL_BACKOFF,
+    TERMINAL_STATUSES,
+    RunStateChange,
+)
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_ACTIVE_RUNS = 4
+DEFAULT_LAUNCH_CONCURRENCY = 4
+
+
+class LaunchPriority(IntEnum):
+    """
+    Common launch priorities. Any integer can be used, higher priorities are launched first.
+    """
+
+    BACKFILL = -10
+    NORMAL = 0
+    URGENT = 10
+
+
+class _PendingLaunch:
+    def __init__(
+        self,
+        dataset_id: int,
+        organization_id: typing.Optional[int],
+        run_args: typing.Optional[RunArgs],
+        future: "Future[str]",
+    ):
+        self.dataset_id = dataset_id
+        self.organization_id = organization_id
+        self.run_args = run_args
+        self.future = future
+
+
+class LaunchScheduler:
+    """
+    Launch dataset QA runs through a client-side queue, instead of sending every launch to the server at once.
+
+    Launches wait in a priority queue per organization. At most `max_active_runs` runs of each organization
+    are active at once: a slot is taken when a run is launched and released when the run finishes,
+    as observed by polling the runs of each organization with active runs
+    (or passed to :func:`LaunchScheduler.observe`).
+    A run that no longer shows up in the organization's runs (e.g. it was archived or deleted) counts as finished.
+    So does a run awaiting manual approval, unless `release_awaiting_approval` is False,
+    since it stays idle until someone approves it.
+    Within an organization, higher priority launches go first and equal priorities go in scheduling order,
+    so urgent datasets do not queue behind bulk backfills.
+    Launches are sent from a small thread pool, so a slow launch does not hold up the other organizations.
+    """
+
+    def __init__(
+        self,
+        max_active_runs: int = DEFAULT_MAX_ACTIVE_RUNS,
+        watch_runs: bool = True,
+        launch_concurrency: int = DEFAULT_LAUNCH_CONCURRENCY,
+        release_awaiting_approval: bool = True,
+        min_poll_interval: float = DEFAULT_MIN_POLL_INTERVAL,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        client: typing.Optional[HirundoClient] = None,
+    ):
+        """
+        Args:
+            max_active_runs: The maximum number of active runs per organization
+            watch_runs: If True, the active runs are polled to release their slots when they finish.
+                If False, pass the state changes of the launched runs to :func:`LaunchScheduler.observe`
+                (e.g. from your own :class:`RunWatcher`) or release the slots with :func:`LaunchScheduler.release`.
+            launch_concurrency: The maximum number of launches sent at once
+            release_awaiting_approval: If True, the slot of a run is released once it awaits manual approval.
+                If False, the run keeps its slot until it finishes, so runs left awaiting approval
+                can use up all the slots of their organization.
+            min_poll_interval: The shortest interval in seconds between polls of the active runs
+            max_poll_interval: The longest interval in seconds between polls of the active runs.
+                The interval grows towards it while no active run finished.
+            client: The client to use. Defaults to the default client.
+        """
+        self.max_active_runs = max_active_runs
+        self.watch_runs = watch_runs
+        self.finished_statuses = (
+            TERMINAL_STATUSES | {RunStatus.AWAITING_MANUAL_APPROVAL}
+            if release_awaiting_approval
+            else TERMINAL_STATUSES
+        )
+        self.min_poll_interval = min_poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.client = resolve_client(client)
+        self._pending: defaultdict[
+            typing.Optional[int], list[tuple[int, int, _PendingLaunch]]
+        ] = defaultdict(list)
+        self._slots: Counter[typing.Optional[int]] = Counter()
+        # ⬆️ Slots taken per organization, by active runs & launches in progress
+        self._run_organizations: dict[str, typing.Optional[int]] = {}
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._launches = ThreadPoolExecutor(
+            launch_concurrency, thread_name_prefix="hirundo-launch"
+        )
+        self._dispatcher = threading.Thread(
+            target=self._dispatch, name="hirundo-launch-scheduler", daemon=True
+        )
+        self._dispatcher.start()
+        self._watcher: typing.Optional[threading.Thread] = None
+        if watch_runs:
+            self._watcher = threading.Thread(
+                target=self._watch, name="hirundo-launch-watcher", daemon=True
+            )
+            self._watcher.start()
+
+    def schedule(
+        self,
+        dataset_id: int,
+        organization_id: typing.Optional[int] = None,
+        run_args: typing.Optional[RunArgs] = None,
+        priority: int = LaunchPriority.NORMAL,
+    ) -> "Future[str]":
+        """
+        Queue a launch of the dataset QA process for the dataset with the given ID
+
+        Args:
+            dataset_id: The ID of the dataset to run QA on
+            organization_id: The ID of the organization to run the QA for
+            run_args: The run arguments to use for the QA run
+            priority: Higher priorities are launched first, see :class:`LaunchPriority`
+
+        Returns:
+            A future of the ID of the run, set once the run was launched
+        """
+        future: Future[str] = Future()
+        with self._condition:
+            if self._closed:
+                raise HirundoError("The launch scheduler is closed")
+            heapq.heappush(
+                self._pending[organization_id],
+                (
+                    -priority,
+                    next(self._sequence),
+                    _PendingLaunch(dataset_id, organization_id, run_args, future),
+                ),
+            )
+            self._condition.notify_all()
+        return future
+
+    def active_runs(self, organization_id: typing.Optional[int] = None) -> list[str]:
+        """
+        The IDs of the launched runs of the organization that did not finish yet
+        """
+        with self._condition:
+            return [
+                run_id
+                for run_id, run_organization_id in self._run_organizations.items()
+                if run_organization_id == organization_id
+            ]
+
+    def pending_launches(self, organization_id: typing.Optional[int] = None) -> int:
+        """
+        The number of launches of the organization still waiting for a slot
+        """
+        with self._condition:
+            return len(self._pending.get(organization_id, ()))
+
+    def observe(self, change: RunStateChange) -> None:
+        """
+        Release the slot of a run once a state change shows it finished (see `release_awaiting_approval`)
+
+        Args:
+            change: A state change of a run, e.g. from :func:`RunWatcher.watch`
+        """
+        if change.status in self.finished_statuses:
+            self.release(change.run_id)
+
+    def release(self, run_id: str) -> None:
+        """
+        Release the slot of a launched run, e.g. after it finished or was cancelled.
+        Releasing a run that is not active does nothing.
+        """
+        with self._condition:
+            if run_id not in self._run_organizations:
+                return
+            organization_id = self._run_organizations.pop(run_id)
+            self._slots[organization_id] -= 1
+            logger.debug("Released the slot of run %s", run_id)
+            self._condition.notify_all()
+
+    def _next_launch(self) -> typing.Optional[_PendingLaunch]:
+        """
+        Take the highest priority launch of an organization with a free slot.
+        Must be called with the condition held.
+        """
+        best: typing.Optional[tuple[int, int, _PendingLaunch]] = None
+        for organization_id, pending in self._pending.items():
+            if (
+                pending
+                and self._slots[organization_id] < self.max_active_runs
+                and (best is None or pending[0] < best)
+            ):
+                best = pending[0]
+        if best is None:
+            return None
+        launch = heapq.heappop(self._pending[best[2].organization_id])[2]
+        self._slots[launch.organization_id] += 1
+        return launch
+
+    def _dispatch(self) -> None:
+        while True:
+            with self._condition:
+                launch = self._next_launch()
+                while launch is None and not self._closed:
+                    self._condition.wait()
+                    launch = self._next_launch()
+                if launch is None:
+                    return
+            self._launches.submit(self._launch, launch)
+
+    def _launch(self, launch: _PendingLaunch) -> None:
+        if not launch.future.set_running_or_notify_cancel():
+            with self._condition:
+                self._slots[launch.organization_id] -= 1
+                self._condition.notify_all()
+            return
+        try:
+            run_id = QADataset.launch_qa_run(
+                launch.dataset_id,
+                launch.organization_id,
+                launch.run_args,
+                client=self.client,
+            )
+        except Exception as error:
+            with self._condition:
+                self._slots[launch.organization_id] -= 1
+                self._condition.notify_all()
+            launch.future.set_exception(error)
+            return
+        logger.info("Launched run %s for dataset %s", run_id, launch.dataset_id)
+        with self._condition:
+            self._run_organizations[run_id] = launch.organization_id
+            self._condition.notify_all()
+        launch.future.set_result(run_id)
+
+    def _wait_for_poll(self, interval: float) -> bool:
+        """
+        Wait until there are active runs and `interval` seconds passed, or the scheduler is closed
+
+        Returns:
+            Whether to poll, i.e. the scheduler is not closed
+        """
+        deadline = Deadline(interval)
+        with self._condition:
+            while not self._closed and (
+                not self._run_organizations or not deadline.expired
+            ):
+                self._condition.wait(
+                    deadline.remaining() if self._run_organizations else None
+                )
+            return not self._closed
+
+    def _release_finished(self, organization_id: typing.Optional[int]) -> bool:
+        """
+        List the runs of the organization once and release the slots of its active runs that finished
+        or are no longer listed
+
+        Returns:
+            Whether a slot was released
+        """
+        unseen = set(self.active_runs(organization_id))
+        released = False
+        for run in QADataset.iter_runs(
+            organization_id=organization_id, client=self.client
+        ):
+            if run.run_id not in unseen:
+                continue
+            unseen.discard(run.run_id)
+            if run.status in self.finished_statuses:
+                self.release(run.run_id)
+                released = True
+            if not unseen:
+                break
+        for run_id in unseen:
+            logger.info("Run %s is no longer listed. Releasing its slot", run_id)
+            self.release(run_id)
+        return released or bool(unseen)
+
+    def _watch(self) -> None:
+        interval = self.min_poll_interval
+        while self._wait_for_poll(interval):
+            with self._condition:
+                organization_ids = set(self._run_organizations.values())
+            released = False
+            for organization_id in organization_ids:
+                try:
+                    released = self._release_finished(organization_id) or released
+                except Exception as e:
+                    logger.error(
+                        "Failed to poll the runs of organization %s",
+                        organization_id,
+                        exc_info=e,
+                    )
+            interval = (
+                self.min_poll_interval
+                if released
+                else min(self.max_poll_interval, interval * DEFAULT_POLL_BACKOFF)
+            )
+
+    def close(self) -> None:
+        """
+        Stop launching & watching runs. Launches still waiting for a slot are cancelled,
+        while launches already being sent finish.
+        """
+        with self._condition:
+            self._closed = True
+            pending = [
+                launch for heap in self._pending.values() for _, _, launch in heap
+            ]
+            self._pending.clear()
+            self._condition.notify_all()
+        for launch in pending:
+            launch.future.cancel()
+        self._dispatcher.join()
+        self._launches.shutdown()
+        if self._watcher is not None:
+            self._watcher.join()
+
+    def __enter__(self) -> "LaunchScheduler":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
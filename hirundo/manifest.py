@@ -0,0 +1,545 @@
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from pathlib import Path
+
+import yaml
+from pydantic import BaseModel, model_validator
+
+from hirundo.bulk import DEFAULT_BULK_CONCURRENCY
+from hirundo.client import HirundoClient, resolve_client
+from hirundo.dataset_qa import QADataset, QADatasetOut
+from hirundo.fingerprints import FingerprintStore
+from hirundo.git import GitRepo, GitRepoOut
+from hirundo.logger import get_logger
+from hirundo.storage import ResponseStorageConfig, StorageConfig
+
+logger = get_logger(__name__)
+
+ModelT = typing.TypeVar("ModelT", GitRepo, StorageConfig, QADataset)
+
+_SERVER_SET_FIELDS = frozenset(
+    {
+        "id",
+        "repo",
+        "repo_id",
+        "organization_id",
+        "storage_config",
+        "storage_config_id",
+        "run_id",
+        "status",
+    }
+)
+# ⬆️ Fields compared separately (references) or set by the server
+
+
+class ChangeAction(str, Enum):
+    CREATE = "create"
+    """
+    The resource does not exist on the server
+    """
+    UPDATE = "update"
+    """
+    The resource exists on the server with different values, it is replaced
+    """
+    UNCHANGED = "unchanged"
+
+
+class ResourceChange(BaseModel):
+    """
+    The change :func:`Manifest.apply` makes to a single resource
+    """
+
+    key: str
+    """
+    Identifies the resource, e.g. `storage-config/S3/my-bucket`
+    """
+    resource: str
+    """
+    `git-repo`, `storage-config` or `dataset`
+    """
+    name: str
+    action: ChangeAction
+    changed_fields: list[str] = []
+    """
+    The fields whose values differ from the server's copy, e.g. `s3.region_name`.
+    Secrets are not returned by the server and can not be compared.
+    """
+    id: typing.Optional[int] = None
+    """
+    The ID of the resource on the server, if it exists or once it was created
+    """
+    depends_on: typing.Optional[str] = None
+    """
+    The key of the resource this resource refers to, e.g. the storage config of a dataset
+    """
+    linked_id: typing.Optional[int] = None
+    """
+    The ID of the resource the server's copy refers to, e.g. the ID of the storage config of a dataset
+    """
+    error: typing.Optional[str] = None
+    """
+    The error applying the change failed with, if it failed
+    """
+
+
+class ManifestPlan(BaseModel):
+    """
+    The changes needed to bring the server in line with a :class:`Manifest`, in dependency order
+    """
+
+    changes: list[ResourceChange] = []
+
+    @property
+    def pending(self) -> list[ResourceChange]:
+        """
+        The changes that create or replace a resource
+        """
+        return [
+            change for change in self.changes if change.action != ChangeAction.UNCHANGED
+        ]
+
+    @property
+    def failed(self) -> list[ResourceChange]:
+        return [change for change in self.changes if change.error is not None]
+
+
+def _git_repo_key(git_repo: typing.Union[GitRepo, GitRepoOut]) -> str:
+    return f"git-repo/{git_repo.name}"
+
+
+def _storage_config_key(
+    storage_config: typing.Union[StorageConfig, ResponseStorageConfig],
+) -> str:
+    storage_type = storage_config.type.value if storage_config.type else None
+    return f"storage-config/{storage_type}/{storage_config.name}"
+
+
+def _dataset_key(dataset: typing.Union[QADataset, QADatasetOut]) -> str:
+    return f"dataset/{dataset.name}"
+
+
+def _differences(
+    local: dict[str, typing.Any], server: dict[str, typing.Any], prefix: str = ""
+) -> list[str]:
+    """
+    The fields whose values differ, comparing only the fields both copies have.
+    `local` should only hold the fields the manifest sets, so that fields left at their defaults
+    (e.g. `classes`) don't differ from the values the server filled in.
+    """
+    changed = []
+    for field, value in local.items():
+        if field in _SERVER_SET_FIELDS or field not in server:
+            continue
+        if isinstance(value, dict) and isinstance(server[field], dict):
+            changed.extend(_differences(value, server[field], f"{prefix}{field}."))
+        elif value != server[field]:
+            changed.append(f"{prefix}{field}")
+    return changed
+
+
+def _change(
+    key: str,
+    resource: str,
+    local: typing.Union[GitRepo, StorageConfig, QADataset],
+    server: typing.Union[GitRepoOut, ResponseStorageConfig, QADatasetOut, None],
+) -> ResourceChange:
+    if server is None:
+        return ResourceChange(
+            key=key, resource=resource, name=local.name, action=ChangeAction.CREATE
+        )
+    changed_fields = _differences(
+        local.model_dump(mode="json", exclude_unset=True),
+        server.model_dump(mode="json"),
+    )
+    return ResourceChange(
+        key=key,
+        resource=resource,
+        name=local.name,
+        action=ChangeAction.UPDATE if changed_fields else ChangeAction.UNCHANGED,
+        changed_fields=changed_fields,
+        id=server.id,
+    )
+
+
+def _link(
+    change: ResourceChange,
+    ids: dict[str, int],
+    depends_on: typing.Optional[str],
+    local_id: typing.Optional[int],
+    linked_id: typing.Optional[int],
+) -> None:
+    """
+    Mark an otherwise unchanged resource as updated if its server copy refers to another resource
+    than it should, e.g. if the dataset's storage config is created or was replaced with a new ID
+    """
+    change.depends_on = depends_on
+    change.linked_id = linked_id
+    _relink(change, ids.get(depends_on) if depends_on else local_id)
+
+
+def _relink(change: ResourceChange, target_id: typing.Optional[int]) -> None:
+    if change.action != ChangeAction.UNCHANGED or change.linked_id == target_id:
+        return
+    change.action = ChangeAction.UPDATE
+    change.changed_fields.append(
+        "git.repo" if change.resource == "storage-config" else "storage_config"
+    )
+
+
+def _apply_level(
+    changes: list[ResourceChange],
+    apply_one: typing.Callable[[ResourceChange], int],
+    ids: dict[str, int],
+    failed: set[str],
+    max_concurrency: int,
+) -> None:
+    """
+    Apply the changes of one level of the dependency order in parallel,
+    skipping those whose dependency could not be created
+    """
+    pending = []
+    for change in changes:
+        if change.depends_on in failed:
+            change.error = f"Skipped because {change.depends_on} could not be created"
+            failed.add(change.key)
+            continue
+        if change.depends_on is not None:
+            _relink(change, ids.get(change.depends_on))
+        if change.action != ChangeAction.UNCHANGED:
+            pending.append(change)
+    if not pending:
+        return
+    with ThreadPoolExecutor(
+        max_workers=max_concurrency, thread_name_prefix="hirundo-manifest"
+    ) as executor:
+        futures = {change.key: executor.submit(apply_one, change) for change in pending}
+    for change in pending:
+        try:
+            change.id = futures[change.key].result()
+            ids[change.key] = change.id
+        except Exception as e:
+            logger.error("Failed to %s %s", change.action.value, change.key, exc_info=e)
+            change.error = str(e)
+            failed.add(change.key)
+
+
+def _unique(
+    models: typing.Iterable[ModelT], key: typing.Callable[[ModelT], str]
+) -> dict[str, ModelT]:
+    unique: dict[str, ModelT] = {}
+    for model in models:
+        model_key = key(model)
+        if model_key in unique and unique[model_key].model_dump(
+            exclude={"id"}
+        ) != model.model_dump(exclude={"id"}):
+            raise ValueError(
+                f"{model_key} is defined more than once with different values"
+            )
+        unique.setdefault(model_key, model)
+    return unique
+
+
+def _resolve(
+    value: typing.Any, definitions: dict[str, typing.Any], kind: str
+) -> typing.Any:
+    if not isinstance(value, str):
+        return value
+    if value not in definitions:
+        raise ValueError(f"Unknown {kind} {value!r}, define it under `{kind}s`")
+    return definitions[value]
+
+
+class Manifest(BaseModel):
+    """
+    Datasets to register, with the storage configs & Git repositories they use, e.g.:
+
+    .. code-block:: yaml
+
+        git_repos:
+          my-repo:
+            name: my-repo
+            repository_url: https://github.com/my-org/my-repo.git
+        storage_configs:
+          my-bucket:
+            name: my-bucket
+            type: S3
+            s3:
+              bucket_url: s3://my-bucket
+              region_name: us-east-1
+        datasets:
+          - name: my-dataset
+            labeling_type: SingleLabelClassification
+            storage_config: my-bucket
+            data_root_url: s3://my-bucket/images
+            labeling_info:
+              type: HirundoCSV
+              csv_url: s3://my-bucket/labels.csv
+
+    A dataset's `storage_config` (and a storage config's `git.repo`) can be defined inline
+    or refer to a definition by its key.
+    """
+
+    git_repos: dict[str, GitRepo] = {}
+    """
+    Git repositories that storage configs can refer to by key
+    """
+    storage_configs: dict[str, StorageConfig] = {}
+    """
+    Storage configs that datasets can refer to by key
+    """
+    datasets: list[QADataset] = []
+
+    @model_validator(mode="before")
+    @classmethod
+    def resolve_references(cls, data: typing.Any) -> typing.Any:
+        if not isinstance(data, dict):
+            return data
+        git_repos = data.get("git_repos") or {}
+        storage_configs = {
+            key: {
+                **storage_config,
+                "git": {
+                    **storage_config["git"],
+                    "repo": _resolve(
+                        storage_config["git"].get("repo"), git_repos, "git_repo"
+                    ),
+                },
+            }
+            if isinstance(storage_config, dict)
+            and isinstance(storage_config.get("git"), dict)
+            else storage_config
+            for key, storage_config in (data.get("storage_configs") or {}).items()
+        }
+        datasets = [
+            {
+                **dataset,
+                "storage_config": _resolve(
+                    dataset.get("storage_config"), storage_configs, "storage_config"
+                ),
+            }
+            if isinstance(dataset, dict)
+            else dataset
+            for dataset in data.get("datasets") or []
+        ]
+        return {
+            **data,
+            "git_repos": git_repos,
+            "storage_configs": storage_configs,
+            "datasets": datasets,
+        }
+
+    @classmethod
+    def from_yaml(cls, path: typing.Union[str, Path]) -> "Manifest":
+        """
+        Load a manifest from a YAML file
+        """
+        with open(path) as f:
+            return cls.model_validate(yaml.safe_load(f))
+
+    def register(
+        self,
+        organization_id: typing.Optional[int] = None,
+        replace_if_exists: bool = False,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        client: typing.Optional[HirundoClient] = None,
+        fingerprints: typing.Optional[FingerprintStore] = None,
+    ) -> dict[str, int]:
+        """
+        Create the datasets of the manifest, see :func:`QADataset.create_many`
+
+        Args:
+            organization_id: The ID of the organization to create the datasets for.
+            replace_if_exists: If True, existing datasets, storage configs & Git repositories
+                with the same names will be replaced.
+            max_concurrency: The maximum number of requests sent at once
+            client: The client to use. Defaults to the default client.
+            fingerprints: If provided, unchanged replacements are skipped, see :class:`FingerprintStore`.
+
+        Returns:
+            The ID of each created dataset by its name
+        """
+        return QADataset.create_many(
+            self.datasets,
+            organization_id,
+            replace_if_exists,
+            max_concurrency,
+            client,
+            fingerprints,
+        )
+
+    def _unique_storage_configs(self) -> dict[str, StorageConfig]:
+        storage_configs = list(self.storage_configs.values())
+        storage_configs.extend(
+            dataset.storage_config
+            for dataset in self.datasets
+            if isinstance(dataset.storage_config, StorageConfig)
+        )
+        return _unique(storage_configs, _storage_config_key)
+
+    def _unique_git_repos(self) -> dict[str, GitRepo]:
+        git_repos = list(self.git_repos.values())
+        git_repos.extend(
+            storage_config.git.repo
+            for storage_config in self._unique_storage_configs().values()
+            if storage_config.git and storage_config.git.repo
+        )
+        return _unique(git_repos, _git_repo_key)
+
+    def _list_server(
+        self, organization_id: typing.Optional[int], client: HirundoClient
+    ) -> dict[str, typing.Union[GitRepoOut, ResponseStorageConfig, QADatasetOut]]:
+        with ThreadPoolExecutor(
+            max_workers=3, thread_name_prefix="hirundo-manifest"
+        ) as executor:
+            git_repos = executor.submit(GitRepo.list, client=client)
+            storage_configs = executor.submit(
+                StorageConfig.list, organization_id, client=client
+            )
+            datasets = executor.submit(
+                QADataset.list_datasets, organization_id, client=client
+            )
+        return {
+            **{_git_repo_key(git_repo): git_repo for git_repo in git_repos.result()},
+            **{
+                _storage_config_key(storage_config): storage_config
+                for storage_config in storage_configs.result()
+            },
+            **{_dataset_key(dataset): dataset for dataset in datasets.result()},
+        }
+
+    def plan(
+        self,
+        organization_id: typing.Optional[int] = None,
+        client: typing.Optional[HirundoClient] = None,
+    ) -> ManifestPlan:
+        """
+        Compare the manifest to the datasets, storage configs & Git repositories on the server,
+        which are listed concurrently. Resources are matched by name (and type for storage configs)
+        and only the fields the server returns are compared, so changed secrets are not noticed.
+        Resources on the server that are not in the manifest are left alone.
+
+        Args:
+            organization_id: The ID of the organization the datasets & storage configs belong to.
+            client: The client to use. Defaults to the default client.
+
+        Returns:
+            The changes :func:`apply` would make, in dependency order
+        """
+        server = self._list_server(organization_id, resolve_client(client))
+        ids: dict[str, int] = {}
+        changes = []
+        for key, git_repo in self._unique_git_repos().items():
+            changes.append(_change(key, "git-repo", git_repo, server.get(key)))
+        ids.update((change.key, change.id) for change in changes if change.id)
+        for key, storage_config in self._unique_storage_configs().items():
+            change = _change(key, "storage-config", storage_config, server.get(key))
+            server_copy = typing.cast(
+                "typing.Optional[ResponseStorageConfig]", server.get(key)
+            )
+            if storage_config.git:
+                _link(
+                    change,
+                    ids,
+                    _git_repo_key(storage_config.git.repo)
+                    if storage_config.git.repo
+                    else None,
+                    storage_config.git.repo_id,
+                    server_copy.git.repo.id
+                    if server_copy and server_copy.git
+                    else None,
+                )
+            changes.append(change)
+        ids.update((change.key, change.id) for change in changes if change.id)
+        for dataset in self.datasets:
+            key = _dataset_key(dataset)
+            change = _change(key, "dataset", dataset, server.get(key))
+            server_copy = typing.cast("typing.Optional[QADatasetOut]", server.get(key))
+            _link(
+                change,
+                ids,
+                _storage_config_key(dataset.storage_config)
+                if isinstance(dataset.storage_config, StorageConfig)
+                else None,
+                dataset.storage_config.id
+                if dataset.storage_config
+                else dataset.storage_config_id,
+                server_copy.storage_config.id if server_copy else None,
+            )
+            changes.append(change)
+        return ManifestPlan(changes=changes)
+
+    def apply(
+        self,
+        organization_id: typing.Optional[int] = None,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        client: typing.Optional[HirundoClient] = None,
+        plan: typing.Optional[ManifestPlan] = None,
+    ) -> ManifestPlan:
+        """
+        Create the resources of the manifest that do not exist on the server and replace
+        those that changed, in dependency order: Git repositories, then storage configs, then datasets.
+        The changes of each level are made in parallel, at most `max_concurrency` at once.
+        A failure does not stop the other changes, but the resources that depend on it are skipped.
+
+        Args:
+            organization_id: The ID of the organization the datasets & storage configs belong to.
+            max_concurrency: The maximum number of requests sent at once
+            client: The client to use. Defaults to the default client.
+            plan: The plan to apply, see :func:`plan`. Defaults to a new plan.
+
+        Returns:
+            The plan, with the ID of each resource and the error of each failed change
+        """
+        client = resolve_client(client)
+        if plan is None:
+            plan = self.plan(organization_id, client)
+        git_repos = self._unique_git_repos()
+        storage_configs = self._unique_storage_configs()
+        datasets = {_dataset_key(dataset): dataset for dataset in self.datasets}
+        ids = {change.key: change.id for change in plan.changes if change.id}
+        failed: set[str] = set()
+
+        def apply_git_repo(change: ResourceChange) -> int:
+            return git_repos[change.key]._post(
+                change.action == ChangeAction.UPDATE, client
+            )
+
+        def apply_storage_config(change: ResourceChange) -> int:
+            storage_config = storage_configs[change.key]
+            if storage_config.git and change.depends_on:
+                storage_config.git.repo_id = ids[change.depends_on]
+            return storage_config._post(change.action == ChangeAction.UPDATE, client)
+
+        def apply_dataset(change: ResourceChange) -> int:
+            dataset = datasets[change.key]
+            if change.depends_on:
+                dataset.storage_config_id = ids[change.depends_on]
+            return dataset._post(
+                organization_id, change.action == ChangeAction.UPDATE, client
+            )
+
+        for resource, apply_one in (
+            ("git-repo", apply_git_repo),
+            ("storage-config", apply_storage_config),
+            ("dataset", apply_dataset),
+        ):
+            _apply_level(
+                [change for change in plan.changes if change.resource == resource],
+                apply_one,
+                ids,
+                failed,
+                max_concurrency,
+            )
+        for dataset in self.datasets:
+            if isinstance(dataset.storage_config, StorageConfig):
+                dataset.storage_config_id = ids.get(
+                    _storage_config_key(dataset.storage_config)
+                )
+        logger.info(
+            "Applied manifest: %s changed, %s unchanged, %s failed",
+            len(plan.pending) - len(plan.failed),
+            len(plan.changes) - len(plan.pending),
+            len(plan.failed),
+        )
+        return plan
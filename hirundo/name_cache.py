@@ -0,0 +1,266 @@
+import hashlib
+import sqlite3
+import threading
+import time
+import typing
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from hirundo._fork import reset_after_fork
+from hirundo.logger import get_logger
+
+if typing.TYPE_CHECKING:
+    from hirundo.client import HirundoClient
+
+logger = get_logger(__name__)
+
+DEFAULT_NAME_CACHE_TTL = 300.0
+SQLITE_TIMEOUT = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS name_cache (
+    key TEXT PRIMARY KEY,
+    scope TEXT NOT NULL,
+    resource_id INTEGER,
+    model TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS name_cache_resource_id ON name_cache (scope, resource_id);
+"""
+
+T = typing.TypeVar("T", bound=BaseModel)
+
+
+class NameCacheStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    """
+    Lookups that were not cached or whose entry expired
+    """
+    invalidations: int = 0
+    """
+    Entries removed because the resource was created, replaced or deleted with a client using the cache
+    """
+
+
+class _Entry(typing.NamedTuple):
+    scope: str
+    resource_id: typing.Optional[int]
+    model: str
+    expires_at: float
+
+
+class NameCache:
+    """
+    A cache of the resources looked up by name, so that code addressing datasets, storage configs
+    and Git repositories by name does not send a request for each lookup.
+
+    Enable it with :func:`HirundoClient.configure_name_cache` (or the `name_cache` argument of :class:`HirundoClient`).
+    :func:`QADataset.get_by_name`, :func:`StorageConfig.get_by_name` and :func:`GitRepo.get_by_name`
+    then return cached copies for `ttl` seconds. Entries are keyed by the API server, the API key
+    (and so its organization), the resource type, the storage type and the name.
+    Creating, replacing or deleting a resource with a client using the cache removes its entry.
+    Changes made elsewhere (e.g. in the web interface) are only noticed once the entry expires.
+
+    If a `path` is given, entries are also saved to a SQLite database, which can be shared
+    by several threads & processes on the same machine.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_NAME_CACHE_TTL,
+        path: typing.Union[str, Path, None] = None,
+    ):
+        """
+        Args:
+            ttl: The number of seconds an entry is used for
+            path: If provided, the path of a SQLite database to persist the entries to
+        """
+        if ttl <= 0:
+            raise ValueError("`ttl` must be positive")
+        self.ttl = ttl
+        self.path = Path(path) if path is not None else None
+        self._entries: dict[str, _Entry] = {}
+        self._stats = NameCacheStats()
+        self._lock = threading.Lock()
+        self._connection: typing.Optional[sqlite3.Connection] = None
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = self._connect()
+            with self._lock, self._connection:
+                self._connection.executescript(_SCHEMA)
+        reset_after_fork(self)
+
+    def _connect(self) -> typing.Optional[sqlite3.Connection]:
+        if self.path is None:
+            return None
+        return sqlite3.connect(
+            self.path, timeout=SQLITE_TIMEOUT, check_same_thread=False
+        )
+
+    def _after_fork(self) -> None:
+        # ⬇️ SQLite connections must not be used across a fork, so the child opens its own
+        self._lock = threading.Lock()
+        self._connection = self._connect()
+
+    def __repr__(self) -> str:
+        path = str(self.path) if self.path is not None else None
+        return f"{type(self).__name__}(ttl={self.ttl!r}, path={path!r})"
+
+    @property
+    def stats(self) -> NameCacheStats:
+        with self._lock:
+            return self._stats.model_copy()
+
+    def _load(self, key: str) -> typing.Optional[_Entry]:
+        entry = self._entries.get(key)
+        if entry is None and self._connection is not None:
+            row = self._connection.execute(
+                "SELECT scope, resource_id, model, expires_at FROM name_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+            entry = _Entry(*row) if row is not None else None
+        return entry
+
+    def get(self, key: str, model_type: type[T]) -> typing.Optional[T]:
+        """
+        Get a copy of the cached resource, unless it is not cached or expired
+
+        Args:
+            key: The key of the resource, see :func:`name_key`
+            model_type: The type of the resource
+        """
+        with self._lock:
+            entry = self._load(key)
+            if entry is None or entry.expires_at <= time.time():
+                self._stats.misses += 1
+                self._entries.pop(key, None)
+                return None
+            self._stats.hits += 1
+            self._entries[key] = entry
+        return model_type.model_validate_json(entry.model)
+
+    def put(
+        self,
+        key: str,
+        scope: str,
+        resource_id: typing.Optional[int],
+        model: BaseModel,
+    ) -> None:
+        entry = _Entry(
+            scope, resource_id, model.model_dump_json(), time.time() + self.ttl
+        )
+        with self._lock:
+            self._entries[key] = entry
+            if self._connection is not None:
+                with self._connection:
+                    self._connection.execute(
+                        "INSERT OR REPLACE INTO name_cache VALUES (?, ?, ?, ?, ?)",
+                        (key, *entry),
+                    )
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._stats.invalidations += 1
+            self._entries.pop(key, None)
+            if self._connection is not None:
+                with self._connection:
+                    self._connection.execute(
+                        "DELETE FROM name_cache WHERE key = ?", (key,)
+                    )
+
+    def invalidate_id(self, scope: str, resource_id: int) -> None:
+        """
+        Remove the entries of a resource by its ID, e.g. once it was deleted
+        """
+        with self._lock:
+            self._stats.invalidations += 1
+            for key in [
+                key
+                for key, entry in self._entries.items()
+                if entry.scope == scope and entry.resource_id == resource_id
+            ]:
+                del self._entries[key]
+            if self._connection is not None:
+                with self._connection:
+                    self._connection.execute(
+                        "DELETE FROM name_cache WHERE scope = ? AND resource_id = ?",
+                        (scope, resource_id),
+                    )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            if self._connection is not None:
+                with self._connection:
+                    self._connection.execute("DELETE FROM name_cache")
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+
+
+def name_scope(client: "HirundoClient", resource: str) -> str:
+    """
+    The API server, the account of the API key & the resource type, e.g. `https://api.hirundo.io/<key hash>/git-repo`
+    """
+    account = hashlib.sha256((client.api_key or "").encode()).hexdigest()[:16]
+    return f"{client.api_host}/{account}/{resource}"
+
+
+def name_key(
+    client: "HirundoClient",
+    resource: str,
+    name: str,
+    type_: typing.Optional[str] = None,
+) -> str:
+    """
+    The key of a resource in a :class:`NameCache`
+    """
+    parts = [name_scope(client, resource), type_, name]
+    return "/".join(part for part in parts if part is not None)
+
+
+def cached_get_by_name(
+    client: "HirundoClient",
+    resource: str,
+    name: str,
+    type_: typing.Optional[str],
+    model_type: type[T],
+    fetch: typing.Callable[[], T],
+) -> T:
+    """
+    Get a resource by name from the client's :class:`NameCache`, fetching & caching it on a miss
+    """
+    cache = client.name_cache
+    if cache is None:
+        return fetch()
+    key = name_key(client, resource, name, type_)
+    cached = cache.get(key, model_type)
+    if cached is not None:
+        logger.debug("Name cache hit for %s", key)
+        return cached
+    model = fetch()
+    cache.put(
+        key,
+        name_scope(client, resource),
+        typing.cast("typing.Optional[int]", getattr(model, "id", None)),
+        model,
+    )
+    return model
+
+
+def invalidate_name(
+    client: "HirundoClient",
+    resource: str,
+    name: str,
+    type_: typing.Optional[str] = None,
+) -> None:
+    if client.name_cache is not None:
+        client.name_cache.invalidate(name_key(client, resource, name, type_))
+
+
+def invalidate_id(client: "HirundoClient", resource: str, resource_id: int) -> None:
+    if client.name_cache is not None:
+        client.name_cache.invalidate_id(name_scope(client, resource), resource_id)
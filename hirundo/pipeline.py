@@ -0,0 +1,330 @@
+import functools
+import multiprocessing
+import threading
+import typing
+from collections.abc import Iterable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from enum import Enum
+from pathlib import Path
+
+from pydantic import BaseModel, InstanceOf
+
+from hirundo._deadline import Deadline
+from hirundo.client import HirundoClient, resolve_client
+from hirundo.dataset_qa import HirundoError, QADataset, RunArgs
+from hirundo.dataset_qa_results import DatasetQAResults
+from hirundo.logger import get_logger
+from hirundo.progress import NullProgressSink
+from hirundo.unzip import download_zip, extract_zip
+
+logger = get_logger(__name__)
+
+DEFAULT_CREATE_CONCURRENCY = 4
+DEFAULT_WATCH_CONCURRENCY = 32
+DEFAULT_DOWNLOAD_CONCURRENCY = 4
+
+
+def _parse_context() -> multiprocessing.context.BaseContext:
+    # ⬇️ Forking once polars started its thread pool (e.g. to build tables) can deadlock the child,
+    #    so parsing processes are forked from a clean server process where available
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context()
+
+
+class PipelineStage(str, Enum):
+    QUEUED = "QUEUED"
+    """
+    Not started yet
+    """
+    CREATE = "CREATE"
+    """
+    Creating the storage config & dataset (if needed) and launching the QA run
+    """
+    WATCH = "WATCH"
+    """
+    Waiting for the QA run to finish
+    """
+    DOWNLOAD = "DOWNLOAD"
+    """
+    Downloading the results zip file
+    """
+    PARSE = "PARSE"
+    """
+    Loading the results into DataFrames, in a separate process
+    """
+    DONE = "DONE"
+    FAILED = "FAILED"
+
+
+class PipelineItem(BaseModel):
+    """
+    The progress of a single dataset through a :class:`QAPipeline`
+    """
+
+    model_config = {"arbitrary_types_allowed": True}
+
+    dataset: InstanceOf[QADataset]
+    """
+    The dataset, as given. It is not validated again, since e.g. a created dataset has both
+    a `storage_config` and its `storage_config_id`.
+    """
+    stage: PipelineStage = PipelineStage.QUEUED
+    """
+    The stage the item is in (or waiting for), `DONE` or `FAILED`
+    """
+    run_id: typing.Optional[str] = None
+    zip_path: typing.Optional[Path] = None
+    results: typing.Optional[DatasetQAResults] = None
+    """
+    The results of the QA run, once the item is `DONE`
+    """
+    failed_stage: typing.Optional[PipelineStage] = None
+    """
+    The stage the item failed in, if it `FAILED`
+    """
+    error: typing.Optional[BaseException] = None
+    """
+    The error the item failed with, if it `FAILED`
+    """
+
+
+class QAPipeline:
+    """
+    Run dataset QA for many datasets at once, as a pipeline of stages with independent concurrency limits:
+
+    1. `CREATE`: create the storage configs & datasets (if needed) and launch the runs (API-bound)
+    2. `WATCH`: wait for the runs to finish (long-lived, mostly idle)
+    3. `DOWNLOAD`: download the results (bandwidth-bound)
+    4. `PARSE`: load the results into DataFrames in a process pool (CPU-bound)
+
+    Each item moves on to the next stage as soon as it leaves the previous one,
+    so e.g. results are parsed while other runs are still being launched.
+    An item that fails is marked as `FAILED` with its error, without stopping the other items.
+
+    Note: Where available, the parsing processes are started from a forkserver rather than forked,
+    since forking once polars started its thread pool can deadlock them. Like with `spawn`,
+    a script using the pipeline then needs an `if __name__ == "__main__":` guard,
+    or pass another `parse_context` (e.g. `multiprocessing.get_context("fork")`).
+    """
+
+    def __init__(
+        self,
+        create_concurrency: int = DEFAULT_CREATE_CONCURRENCY,
+        watch_concurrency: int = DEFAULT_WATCH_CONCURRENCY,
+        download_concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY,
+        parse_processes: typing.Optional[int] = None,
+        parse_context: typing.Optional[multiprocessing.context.BaseContext] = None,
+        organization_id: typing.Optional[int] = None,
+        replace_dataset_if_exists: bool = False,
+        run_args: typing.Optional[RunArgs] = None,
+        run_timeout: typing.Optional[float] = None,
+        cancel_on_timeout: bool = True,
+        on_progress: typing.Optional[typing.Callable[[PipelineItem], None]] = None,
+        client: typing.Optional[HirundoClient] = None,
+    ):
+        """
+        Args:
+            create_concurrency: The maximum number of datasets being created & launched at once
+            watch_concurrency: The maximum number of runs being watched at once
+            download_concurrency: The maximum number of results being downloaded at once
+            parse_processes: The number of processes parsing results. Defaults to the number of CPUs.
+            parse_context: The multiprocessing context to start the parsing processes with.
+                Defaults to `forkserver` where available, see the note above.
+            organization_id: The ID of the organization to run the QA for
+            replace_dataset_if_exists: If True, datasets will be replaced if they already exist
+            run_args: The run arguments to use for every QA run
+            run_timeout: If provided, the maximum number of seconds to wait for each run to finish.
+                A run that times out fails with a `RunTimeoutError`.
+            cancel_on_timeout: If True, a run that times out is cancelled on the server
+            on_progress: Called with the item whenever an item moves to another stage.
+                Called from the pipeline's threads, so it should be quick & thread-safe.
+            client: The client to use. Defaults to the default client.
+        """
+        self.create_concurrency = create_concurrency
+        self.watch_concurrency = watch_concurrency
+        self.download_concurrency = download_concurrency
+        self.parse_processes = parse_processes
+        self.parse_context = parse_context
+        self.organization_id = organization_id
+        self.replace_dataset_if_exists = replace_dataset_if_exists
+        self.run_args = run_args
+        self.run_timeout = run_timeout
+        self.cancel_on_timeout = cancel_on_timeout
+        self.on_progress = on_progress
+        self.client = resolve_client(client)
+        self._executors: dict[PipelineStage, Executor] = {}
+        self._unfinished = 0
+        self._finished = threading.Condition()
+
+    def _move(self, item: PipelineItem, stage: PipelineStage) -> None:
+        logger.debug("Dataset %s moved to %s", item.dataset.name, stage.value)
+        item.stage = stage
+        if self.on_progress is not None:
+            try:
+                self.on_progress(item)
+            except Exception as e:
+                logger.error("Pipeline progress callback failed", exc_info=e)
+        if stage in (PipelineStage.DONE, PipelineStage.FAILED):
+            with self._finished:
+                self._unfinished -= 1
+                self._finished.notify_all()
+
+    def _fail(
+        self, item: PipelineItem, stage: PipelineStage, error: BaseException
+    ) -> None:
+        logger.error(
+            "Dataset %s failed in the %s stage: %s",
+            item.dataset.name,
+            stage.value,
+            error,
+        )
+        item.failed_stage = stage
+        item.error = error
+        self._move(item, PipelineStage.FAILED)
+
+    def _submit(
+        self,
+        item: PipelineItem,
+        stage: PipelineStage,
+        function: typing.Callable[..., typing.Any],
+        *args: typing.Any,
+        then: typing.Callable[[PipelineItem, typing.Any], None],
+    ) -> None:
+        """
+        Move the item to `stage`, run `function(*args)` on the stage's executor
+        and pass its result to `then` (or fail the item if it raised)
+        """
+        self._move(item, stage)
+        try:
+            future = self._executors[stage].submit(function, *args)
+        except Exception as error:
+            self._fail(item, stage, error)
+            return
+        future.add_done_callback(
+            functools.partial(self._on_stage_done, item, stage, then)
+        )
+
+    def _on_stage_done(
+        self,
+        item: PipelineItem,
+        stage: PipelineStage,
+        then: typing.Callable[[PipelineItem, typing.Any], None],
+        future: Future,
+    ) -> None:
+        error = future.exception()
+        if error is not None:
+            self._fail(item, stage, error)
+            return
+        try:
+            then(item, future.result())
+        except Exception as error:
+            self._fail(item, stage, error)
+
+    def _create(self, item: PipelineItem) -> str:
+        return item.dataset.run_qa(
+            self.organization_id,
+            self.replace_dataset_if_exists,
+            self.run_args,
+            client=self.client,
+        )
+
+    def _watch(self, run_id: str) -> str:
+        deadline = Deadline(self.run_timeout)
+        try:
+            event = QADataset._follow_run(
+                run_id, False, self.client, NullProgressSink(), None, deadline
+            )
+        except TimeoutError as error:
+            if not deadline.expired:
+                raise
+            raise QADataset._timed_out(
+                run_id, self.run_timeout, self.cancel_on_timeout, self.client
+            ) from error
+        if event is None or event.result_url is None:
+            raise HirundoError(f"QA run {run_id} succeeded without results")
+        return event.result_url
+
+    def _start_watch(self, item: PipelineItem, run_id: str) -> None:
+        item.run_id = run_id
+        self._submit(
+            item, PipelineStage.WATCH, self._watch, run_id, then=self._start_download
+        )
+
+    def _start_download(self, item: PipelineItem, result_url: str) -> None:
+        self._submit(
+            item,
+            PipelineStage.DOWNLOAD,
+            download_zip,
+            item.run_id,
+            result_url,
+            self.client,
+            then=self._start_parse,
+        )
+
+    def _start_parse(self, item: PipelineItem, zip_path: Path) -> None:
+        item.zip_path = zip_path
+        self._submit(
+            item,
+            PipelineStage.PARSE,
+            extract_zip,
+            item.run_id,
+            zip_path,
+            then=self._done,
+        )
+
+    def _done(self, item: PipelineItem, results: DatasetQAResults) -> None:
+        item.results = results
+        self._move(item, PipelineStage.DONE)
+
+    def run(self, datasets: Iterable[QADataset]) -> list[PipelineItem]:
+        """
+        Run dataset QA for the given datasets and wait until every dataset is `DONE` or `FAILED`
+
+        Args:
+            datasets: The datasets to run QA on
+
+        Returns:
+            An item for each dataset, in the given order, with its results or the error it failed with
+        """
+        items = [PipelineItem(dataset=dataset) for dataset in datasets]
+        with (
+            ThreadPoolExecutor(
+                self.create_concurrency, thread_name_prefix="hirundo-create"
+            ) as creates,
+            ThreadPoolExecutor(
+                self.watch_concurrency, thread_name_prefix="hirundo-watch"
+            ) as watches,
+            ThreadPoolExecutor(
+                self.download_concurrency, thread_name_prefix="hirundo-download"
+            ) as downloads,
+            ProcessPoolExecutor(
+                self.parse_processes,
+                mp_context=self.parse_context or _parse_context(),
+            ) as parsing,
+        ):
+            self._executors = {
+                PipelineStage.CREATE: creates,
+                PipelineStage.WATCH: watches,
+                PipelineStage.DOWNLOAD: downloads,
+                PipelineStage.PARSE: parsing,
+            }
+            with self._finished:
+                self._unfinished += len(items)
+            for item in items:
+                self._submit(
+                    item,
+                    PipelineStage.CREATE,
+                    self._create,
+                    item,
+                    then=self._start_watch,
+                )
+            with self._finished:
+                self._finished.wait_for(lambda: self._unfinished == 0)
+        failed = sum(item.stage == PipelineStage.FAILED for item in items)
+        logger.info(
+            "Pipeline finished: %s datasets done, %s failed",
+            len(items) - failed,
+            failed,
+        )
+        return items
@@ -0,0 +1,261 @@
+import contextlib
+import logging
+import threading
+import time
+import typing
+
+from hirundo.logger import get_logger
+
+if typing.TYPE_CHECKING:
+    from hirundo.dataset_qa import RunEvent
+
+logger = get_logger(__name__)
+
+DEFAULT_DEBOUNCE_INTERVAL = 0.2
+UPLOADING_RESULTS_TEXT = "QA run completed. Uploading results"
+
+
+class ProgressSink:
+    """
+    Receives the progress of dataset QA runs, e.g. from :func:`QADataset.check_run_by_id`.
+
+    Subclass this and override the callbacks you need. All callbacks do nothing by default.
+    """
+
+    def on_state(self, run_id: str, event: "RunEvent") -> None:
+        """
+        Called when the status of a run changes, i.e. `event.state` is set
+        """
+
+    def on_progress(self, run_id: str, event: "RunEvent") -> None:
+        """
+        Called when a run reports progress, i.e. `event.stage` and possibly `event.percent` are set
+        """
+
+    def on_result(self, run_id: str, event: "RunEvent") -> None:
+        """
+        Called when a run succeeded, before its results are downloaded from `event.result_url`
+        """
+
+    def close(self) -> None:
+        """
+        Called once no more events will be reported. May be called more than once.
+        """
+
+
+class NullProgressSink(ProgressSink):
+    """
+    Ignores all progress. Use this in headless workers that do not need progress reporting.
+    """
+
+
+class LoggingProgressSink(ProgressSink):
+    """
+    Reports progress as log records
+    """
+
+    def __init__(
+        self,
+        sink_logger: typing.Optional[logging.Logger] = None,
+        level: int = logging.INFO,
+    ):
+        """
+        Args:
+            sink_logger: The logger to log to. Defaults to the `hirundo.progress` logger.
+            level: The level to log progress at
+        """
+        self.logger = sink_logger if sink_logger is not None else logger
+        self.level = level
+
+    def on_state(self, run_id: str, event: "RunEvent") -> None:
+        self.logger.log(self.level, "Run %s: %s", run_id, event.stage)
+
+    def on_progress(self, run_id: str, event: "RunEvent") -> None:
+        if event.percent is None:
+            self.logger.log(self.level, "Run %s: %s", run_id, event.stage)
+        else:
+            self.logger.log(
+                self.level, "Run %s: %s %.1f%%", run_id, event.stage, event.percent
+            )
+
+    def on_result(self, run_id: str, event: "RunEvent") -> None:
+        self.logger.log(self.level, "Run %s: results are ready", run_id)
+
+
+class TqdmProgressSink(ProgressSink):
+    """
+    Shows the progress of a run as a `tqdm` progress bar.
+    While the bar is shown, log records are redirected so they do not break the bar.
+    """
+
+    def __init__(self):
+        self._bar = None
+        self._exit_stack = contextlib.ExitStack()
+
+    def _get_bar(self):
+        if self._bar is None:
+            from tqdm import tqdm
+            from tqdm.contrib.logging import logging_redirect_tqdm
+
+            self._exit_stack.enter_context(logging_redirect_tqdm())
+            self._bar = tqdm(total=100.0)
+        return self._bar
+
+    def _update(self, description: typing.Optional[str], n: float) -> None:
+        bar = self._get_bar()
+        bar.set_description(description)
+        bar.n = n
+        logger.debug("Setting progress to %s", bar.n)
+        bar.refresh()
+
+    def on_state(self, run_id: str, event: "RunEvent") -> None:
+        self._update(event.stage, event.percent or 0.0)
+
+    def on_progress(self, run_id: str, event: "RunEvent") -> None:
+        n = event.percent if event.percent is not None else self._get_bar().n
+        self._update(UPLOADING_RESULTS_TEXT if n == 100.0 else event.stage, n)
+
+    def close(self) -> None:
+        if self._bar is not None:
+            self._bar.close()
+            self._bar = None
+        self._exit_stack.close()
+
+
+class RichProgressSink(ProgressSink):
+    """
+    Shows the progress of runs as `rich` progress bars, one per run
+    """
+
+    def __init__(self, console=None):
+        """
+        Args:
+            console: The `rich` console to render to. Defaults to the global console.
+        """
+        from rich.progress import Progress
+
+        self._progress = Progress(console=console, transient=False)
+        self._tasks: dict[str, typing.Any] = {}
+
+    def _update(
+        self, run_id: str, description: typing.Optional[str], n: typing.Optional[float]
+    ) -> None:
+        if run_id not in self._tasks:
+            if not self._tasks:
+                self._progress.start()
+            self._tasks[run_id] = self._progress.add_task(run_id, total=100.0)
+        self._progress.update(
+            self._tasks[run_id],
+            description=f"{run_id}: {description or ''}",
+            completed=n,
+        )
+
+    def on_state(self, run_id: str, event: "RunEvent") -> None:
+        self._update(run_id, event.stage, event.percent)
+
+    def on_progress(self, run_id: str, event: "RunEvent") -> None:
+        self._update(
+            run_id,
+            UPLOADING_RESULTS_TEXT if event.percent == 100.0 else event.stage,
+            event.percent,
+        )
+
+    def close(self) -> None:
+        if self._tasks:
+            self._progress.stop()
+            self._tasks.clear()
+
+
+class DebouncedProgressSink(ProgressSink):
+    """
+    Coalesces high-frequency progress updates before they reach another sink.
+
+    At most one progress update per run is forwarded every `min_interval` seconds.
+    The latest suppressed update is forwarded once the interval passed (from a timer thread,
+    so a long stage does not leave stale progress behind), or before any state change or result,
+    so the wrapped sink always sees the latest progress first.
+    State changes and results are never dropped.
+    """
+
+    def __init__(
+        self, sink: ProgressSink, min_interval: float = DEFAULT_DEBOUNCE_INTERVAL
+    ):
+        """
+        Args:
+            sink: The sink to forward the updates to
+            min_interval: The minimum interval in seconds between forwarded progress updates of a run
+        """
+        self.sink = sink
+        self.min_interval = min_interval
+        self._last_forwarded_at: dict[str, float] = {}
+        self._pending: dict[str, RunEvent] = {}
+        self._timers: dict[str, threading.Timer] = {}
+        self._lock = threading.Lock()
+        # ⬆️ Serializes the calls to the wrapped sink, which may come from the timer threads
+
+    def _forward_progress(self, run_id: str, event: "RunEvent") -> None:
+        self._last_forwarded_at[run_id] = time.monotonic()
+        self.sink.on_progress(run_id, event)
+
+    def _flush(self, run_id: str) -> None:
+        timer = self._timers.pop(run_id, None)
+        if timer is not None:
+            timer.cancel()
+        pending = self._pending.pop(run_id, None)
+        if pending is not None:
+            self._forward_progress(run_id, pending)
+
+    def _flush_trailing(self, run_id: str) -> None:
+        with self._lock:
+            if self._timers.get(run_id) is threading.current_thread():
+                self._flush(run_id)
+
+    def _schedule_flush(self, run_id: str, delay: float) -> None:
+        if run_id in self._timers:
+            return
+        timer = threading.Timer(delay, self._flush_trailing, (run_id,))
+        timer.daemon = True
+        self._timers[run_id] = timer
+        timer.start()
+
+    def on_state(self, run_id: str, event: "RunEvent") -> None:
+        with self._lock:
+            self._flush(run_id)
+            self.sink.on_state(run_id, event)
+
+    def on_progress(self, run_id: str, event: "RunEvent") -> None:
+        with self._lock:
+            last_forwarded_at = self._last_forwarded_at.get(run_id)
+            elapsed = (
+                time.monotonic() - last_forwarded_at
+                if last_forwarded_at is not None
+                else None
+            )
+            if elapsed is not None and elapsed < self.min_interval:
+                self._pending[run_id] = event
+                self._schedule_flush(run_id, self.min_interval - elapsed)
+                return
+            self._pending.pop(run_id, None)
+            self._forward_progress(run_id, event)
+
+    def on_result(self, run_id: str, event: "RunEvent") -> None:
+        with self._lock:
+            self._flush(run_id)
+            self.sink.on_result(run_id, event)
+
+    def close(self) -> None:
+        with self._lock:
+            for run_id in list(self._pending.keys() | self._timers.keys()):
+                self._flush(run_id)
+            self.sink.close()
+
+
+def debounce(
+    sink: ProgressSink, min_interval: float = DEFAULT_DEBOUNCE_INTERVAL
+) -> ProgressSink:
+    """
+    Wrap a sink with a :class:`DebouncedProgressSink`, unless it is debounced already or does nothing
+    """
+    if isinstance(sink, (DebouncedProgressSink, NullProgressSink)):
+        return sink
+    return DebouncedProgressSink(sink, min_interval)
@@ -0,0 +1,178 @@
+import datetime
+import sqlite3
+import threading
+import time
+import typing
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from hirundo._fork import reset_after_fork
+from hirundo.dataset_qa import RunEvent, RunStatus
+from hirundo.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_CHECKPOINTS_PATH = Path.home() / ".hirundo" / "run_checkpoints.sqlite3"
+DEFAULT_FLUSH_INTERVAL = 1.0
+SQLITE_TIMEOUT = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS run_checkpoints (
+    run_id TEXT PRIMARY KEY,
+    last_event_id TEXT,
+    state TEXT,
+    result_url TEXT,
+    updated_at TEXT NOT NULL
+)
+"""
+
+
+class RunCheckpoint(BaseModel):
+    run_id: str
+    last_event_id: typing.Optional[str] = None
+    """
+    The ID of the last SSE event received for the run, used to resume its stream
+    """
+    state: typing.Optional[RunStatus] = None
+    """
+    The last status reported for the run
+    """
+    result_url: typing.Optional[str] = None
+    """
+    The URL of the results, once the run succeeded
+    """
+    updated_at: datetime.datetime
+
+
+class RunCheckpointStore:
+    """
+    A small local store of the progress of watched dataset QA runs, so that a restarted process
+    can resume watching its runs from where it stopped.
+
+    Pass the store as `checkpoints` to :func:`QADataset.check_run_by_id`, :func:`QADataset.acheck_run_by_id`
+    or :class:`RunWatcher`. While watching, the last event ID, status and results URL of each run are saved.
+    A checkpoint is removed once the results of its run were downloaded.
+
+    The store is a SQLite database, which can be shared by several threads & processes on the same machine.
+    Forked child processes open their own connection to it.
+    Status changes are saved immediately, other events at most every `flush_interval` seconds per run.
+    """
+
+    def __init__(
+        self,
+        path: typing.Union[str, Path, None] = None,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ):
+        """
+        Args:
+            path: The path of the SQLite database. Defaults to `~/.hirundo/run_checkpoints.sqlite3`
+            flush_interval: The minimum interval in seconds between saves of progress-only events of a run
+        """
+        self.path = Path(path) if path is not None else DEFAULT_CHECKPOINTS_PATH
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._last_flushed_at: dict[str, float] = {}
+        self._connection = self._connect()
+        with self._lock, self._connection:
+            self._connection.execute(_SCHEMA)
+        reset_after_fork(self)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(
+            self.path, timeout=SQLITE_TIMEOUT, check_same_thread=False
+        )
+
+    def _after_fork(self) -> None:
+        # ⬇️ SQLite connections must not be used across a fork, so the child opens its own
+        self._lock = threading.Lock()
+        self._connection = self._connect()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(path={str(self.path)!r})"
+
+    @staticmethod
+    def _from_row(row: tuple) -> RunCheckpoint:
+        run_id, last_event_id, state, result_url, updated_at = row
+        return RunCheckpoint(
+            run_id=run_id,
+            last_event_id=last_event_id,
+            state=state,
+            result_url=result_url,
+            updated_at=updated_at,
+        )
+
+    def get(self, run_id: str) -> typing.Optional[RunCheckpoint]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT * FROM run_checkpoints WHERE run_id = ?", (run_id,)
+            ).fetchone()
+        return self._from_row(row) if row is not None else None
+
+    def list(self) -> list[RunCheckpoint]:
+        """
+        List the checkpoints of all tracked runs, i.e. runs whose results were not downloaded yet
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT * FROM run_checkpoints ORDER BY updated_at"
+            ).fetchall()
+        return [self._from_row(row) for row in rows]
+
+    def save(self, checkpoint: RunCheckpoint) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO run_checkpoints VALUES (?, ?, ?, ?, ?)",
+                (
+                    checkpoint.run_id,
+                    checkpoint.last_event_id,
+                    checkpoint.state.value if checkpoint.state is not None else None,
+                    checkpoint.result_url,
+                    checkpoint.updated_at.isoformat(),
+                ),
+            )
+
+    def record(
+        self, run_id: str, event_id: typing.Optional[str], event: RunEvent
+    ) -> None:
+        """
+        Record an event of a run. Progress-only events are saved at most every `flush_interval` seconds.
+
+        Args:
+            run_id: The ID of the run
+            event_id: The ID of the SSE event, if any
+            event: The event
+        """
+        now = time.monotonic()
+        last_flushed_at = self._last_flushed_at.get(run_id)
+        if (
+            event.state is None
+            and last_flushed_at is not None
+            and now - last_flushed_at < self.flush_interval
+        ):
+            return
+        self._last_flushed_at[run_id] = now
+        checkpoint = self.get(run_id) or RunCheckpoint(
+            run_id=run_id, updated_at=datetime.datetime.now(datetime.timezone.utc)
+        )
+        self.save(
+            checkpoint.model_copy(
+                update={
+                    "last_event_id": event_id or checkpoint.last_event_id,
+                    "state": event.state or checkpoint.state,
+                    "result_url": event.result_url or checkpoint.result_url,
+                    "updated_at": datetime.datetime.now(datetime.timezone.utc),
+                }
+            )
+        )
+
+    def delete(self, run_id: str) -> None:
+        self._last_flushed_at.pop(run_id, None)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM run_checkpoints WHERE run_id = ?", (run_id,)
+            )
+
+    def close(self) -> None:
+        self._connection.close()
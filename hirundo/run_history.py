@@ -0,0 +1,410 @@
+import datetime
+import sqlite3
+import threading
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from hirundo._fork import reset_after_fork
+from hirundo._pagination import DEFAULT_PAGE_SIZE, to_utc
+from hirundo.client import HirundoClient, resolve_client
+from hirundo.dataset_qa import DataQARunOut, QADataset, QADatasetOut, RunStatus
+from hirundo.logger import get_logger
+from hirundo.run_watcher import TERMINAL_STATUSES
+
+logger = get_logger(__name__)
+
+DEFAULT_RUN_HISTORY_PATH = Path.home() / ".hirundo" / "run_history.sqlite3"
+SQLITE_TIMEOUT = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS datasets (
+    scope TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (scope, id)
+);
+CREATE INDEX IF NOT EXISTS datasets_name ON datasets (scope, name);
+CREATE INDEX IF NOT EXISTS datasets_created_at ON datasets (scope, created_at);
+CREATE TABLE IF NOT EXISTS runs (
+    scope TEXT NOT NULL,
+    run_id TEXT NOT NULL,
+    dataset_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (scope, run_id)
+);
+CREATE INDEX IF NOT EXISTS runs_dataset_id ON runs (scope, dataset_id, created_at);
+CREATE INDEX IF NOT EXISTS runs_status ON runs (scope, status, created_at);
+CREATE INDEX IF NOT EXISTS runs_name ON runs (scope, name);
+CREATE INDEX IF NOT EXISTS runs_created_at ON runs (scope, created_at);
+CREATE TABLE IF NOT EXISTS watermarks (
+    scope TEXT NOT NULL,
+    resource TEXT NOT NULL,
+    watermark TEXT NOT NULL,
+    synced_at TEXT NOT NULL,
+    PRIMARY KEY (scope, resource)
+);
+"""
+
+
+class HistorySyncReport(BaseModel):
+    resource: str
+    """
+    `datasets` or `runs`
+    """
+    listed: int
+    """
+    The number of records listed by the server
+    """
+    written: int
+    """
+    The number of new or changed records written to the local index
+    """
+    deleted: int
+    """
+    The number of records removed from the local index because the server no longer lists them
+    """
+    watermark: typing.Optional[datetime.datetime]
+    """
+    The latest `created_at` (runs) or `updated_at` (datasets) seen
+    """
+
+
+def _to_text(value: datetime.datetime) -> str:
+    """
+    UTC ISO timestamps, so that they sort chronologically as text
+    """
+    return to_utc(value).isoformat()
+
+
+def _name_range(name_prefix: str) -> tuple[str, str]:
+    # ⬇️ A range (unlike `LIKE`) can use the name indexes
+    return name_prefix, name_prefix + "\U0010ffff"
+
+
+class RunHistory:
+    """
+    A local index of the datasets and dataset QA runs of an organization, to answer questions like
+    "which runs of dataset X succeeded last week" in milliseconds instead of listing all runs each time.
+
+    Call :func:`sync` to bring the index up to date. Only new or changed records are written:
+    runs created since the last sync (the `created_at` watermark), runs that had not finished yet
+    and datasets updated since the last sync (the `updated_at` watermark).
+    Records the server no longer lists (e.g. deleted datasets or archived runs) are removed.
+    Note: The server has no "changed since" filter, so a sync still pages through the listings.
+
+    The index is a SQLite database, which can be shared by several threads & processes on the same machine.
+    Several servers & organizations can share one database.
+    """
+
+    def __init__(
+        self,
+        path: typing.Union[str, Path, None] = None,
+        organization_id: typing.Optional[int] = None,
+        client: typing.Optional[HirundoClient] = None,
+    ):
+        """
+        Args:
+            path: The path of the SQLite database. Defaults to `~/.hirundo/run_history.sqlite3`
+            organization_id: The ID of the organization to index. Defaults to the user's default organization.
+            client: The client to sync with. Defaults to the default client.
+        """
+        self.path = Path(path) if path is not None else DEFAULT_RUN_HISTORY_PATH
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.organization_id = organization_id
+        self.client = resolve_client(client)
+        self.scope = f"{self.client.api_host}/{organization_id or 'default'}"
+        self._lock = threading.Lock()
+        self._connection = self._connect()
+        with self._lock, self._connection:
+            self._connection.executescript(_SCHEMA)
+        reset_after_fork(self)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(
+            self.path, timeout=SQLITE_TIMEOUT, check_same_thread=False
+        )
+
+    def _after_fork(self) -> None:
+        # ⬇️ SQLite connections must not be used across a fork, so the child opens its own
+        self._lock = threading.Lock()
+        self._connection = self._connect()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(path={str(self.path)!r}, scope={self.scope!r})"
+
+    def _watermark(self, resource: str) -> typing.Optional[datetime.datetime]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT watermark FROM watermarks WHERE scope = ? AND resource = ?",
+                (self.scope, resource),
+            ).fetchone()
+        return datetime.datetime.fromisoformat(row[0]) if row is not None else None
+
+    def _write(
+        self,
+        resource: str,
+        upsert: str,
+        delete: str,
+        rows: list[tuple],
+        stale_ids: set[typing.Any],
+        watermark: typing.Optional[datetime.datetime],
+    ) -> None:
+        with self._lock, self._connection:
+            self._connection.executemany(upsert, rows)
+            self._connection.executemany(
+                delete,
+                [(self.scope, id_) for id_ in stale_ids],
+            )
+            if watermark is not None:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO watermarks VALUES (?, ?, ?, ?)",
+                    (
+                        self.scope,
+                        resource,
+                        _to_text(watermark),
+                        _to_text(datetime.datetime.now(datetime.timezone.utc)),
+                    ),
+                )
+
+    def sync_runs(self, page_size: int = DEFAULT_PAGE_SIZE) -> HistorySyncReport:
+        """
+        Write the runs created since the last sync and those that had not finished yet to the index
+
+        Args:
+            page_size: The number of runs to fetch per request.
+        """
+        previous = self._watermark("runs")
+        with self._lock:
+            statuses = dict(
+                self._connection.execute(
+                    "SELECT run_id, status FROM runs WHERE scope = ?", (self.scope,)
+                ).fetchall()
+            )
+        indexed = set(statuses)
+        unfinished = {
+            run_id
+            for run_id, status in statuses.items()
+            if RunStatus(status) not in TERMINAL_STATUSES
+        }
+        watermark = previous
+        rows = []
+        listed = 0
+        for run in QADataset.iter_runs(
+            self.organization_id, page_size=page_size, client=self.client
+        ):
+            listed += 1
+            indexed.discard(run.run_id)
+            changed_at = to_utc(run.created_at)
+            if watermark is None or changed_at > watermark:
+                watermark = changed_at
+            if previous is None or changed_at >= previous or run.run_id in unfinished:
+                rows.append(
+                    (
+                        self.scope,
+                        run.run_id,
+                        run.dataset_id,
+                        run.name,
+                        run.status.value,
+                        _to_text(run.created_at),
+                        run.model_dump_json(),
+                    )
+                )
+        self._write(
+            "runs",
+            "INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?, ?)",
+            "DELETE FROM runs WHERE scope = ? AND run_id = ?",
+            rows,
+            indexed,
+            watermark,
+        )
+        return HistorySyncReport(
+            resource="runs",
+            listed=listed,
+            written=len(rows),
+            deleted=len(indexed),
+            watermark=watermark,
+        )
+
+    def sync_datasets(self, page_size: int = DEFAULT_PAGE_SIZE) -> HistorySyncReport:
+        """
+        Write the datasets created or updated since the last sync to the index
+
+        Args:
+            page_size: The number of datasets to fetch per request.
+        """
+        previous = self._watermark("datasets")
+        with self._lock:
+            indexed = {
+                row[0]
+                for row in self._connection.execute(
+                    "SELECT id FROM datasets WHERE scope = ?", (self.scope,)
+                ).fetchall()
+            }
+        watermark = previous
+        rows = []
+        listed = 0
+        for dataset in QADataset.iter_datasets(
+            self.organization_id, page_size=page_size, client=self.client
+        ):
+            listed += 1
+            indexed.discard(dataset.id)
+            changed_at = to_utc(dataset.updated_at)
+            if watermark is None or changed_at > watermark:
+                watermark = changed_at
+            if previous is None or changed_at >= previous:
+                rows.append(
+                    (
+                        self.scope,
+                        dataset.id,
+                        dataset.name,
+                        _to_text(dataset.created_at),
+                        _to_text(dataset.updated_at),
+                        dataset.model_dump_json(),
+                    )
+                )
+        self._write(
+            "datasets",
+            "INSERT OR REPLACE INTO datasets VALUES (?, ?, ?, ?, ?, ?)",
+            "DELETE FROM datasets WHERE scope = ? AND id = ?",
+            rows,
+            indexed,
+            watermark,
+        )
+        return HistorySyncReport(
+            resource="datasets",
+            listed=listed,
+            written=len(rows),
+            deleted=len(indexed),
+            watermark=watermark,
+        )
+
+    def sync(self, page_size: int = DEFAULT_PAGE_SIZE) -> list[HistorySyncReport]:
+        """
+        Sync the datasets and the runs concurrently, see :func:`sync_datasets` and :func:`sync_runs`
+        """
+        with ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="hirundo-run-history"
+        ) as executor:
+            datasets = executor.submit(self.sync_datasets, page_size)
+            runs = executor.submit(self.sync_runs, page_size)
+        reports = [datasets.result(), runs.result()]
+        for report in reports:
+            logger.info(
+                "Synced %s: %s listed, %s written, %s deleted",
+                report.resource,
+                report.listed,
+                report.written,
+                report.deleted,
+            )
+        return reports
+
+    def runs(
+        self,
+        dataset_id: typing.Optional[int] = None,
+        status: typing.Union[RunStatus, typing.Iterable[RunStatus], None] = None,
+        name_prefix: typing.Optional[str] = None,
+        created_after: typing.Optional[datetime.datetime] = None,
+        created_before: typing.Optional[datetime.datetime] = None,
+        limit: typing.Optional[int] = None,
+    ) -> list[DataQARunOut]:
+        """
+        Query the indexed runs, newest first, without sending requests
+
+        Args:
+            dataset_id: If provided, only runs of this dataset are returned.
+            status: If provided, only runs with this status (or one of these statuses) are returned.
+            name_prefix: If provided, only runs whose dataset name starts with this prefix are returned.
+            created_after: If provided, only runs created at or after this time are returned.
+            created_before: If provided, only runs created before this time are returned.
+            limit: The maximum number of runs to return.
+        """
+        conditions = ["scope = ?"]
+        params: list[typing.Any] = [self.scope]
+        if dataset_id is not None:
+            conditions.append("dataset_id = ?")
+            params.append(dataset_id)
+        if status is not None:
+            statuses = [status] if isinstance(status, RunStatus) else list(status)
+            conditions.append(f"status IN ({', '.join('?' * len(statuses))})")
+            params.extend(s.value for s in statuses)
+        return [
+            DataQARunOut.model_validate_json(data)
+            for data in self._query(
+                "runs",
+                conditions,
+                params,
+                name_prefix,
+                created_after,
+                created_before,
+                limit,
+            )
+        ]
+
+    def datasets(
+        self,
+        name_prefix: typing.Optional[str] = None,
+        created_after: typing.Optional[datetime.datetime] = None,
+        created_before: typing.Optional[datetime.datetime] = None,
+        limit: typing.Optional[int] = None,
+    ) -> list[QADatasetOut]:
+        """
+        Query the indexed datasets, newest first, without sending requests
+
+        Args:
+            name_prefix: If provided, only datasets whose name starts with this prefix are returned.
+            created_after: If provided, only datasets created at or after this time are returned.
+            created_before: If provided, only datasets created before this time are returned.
+            limit: The maximum number of datasets to return.
+        """
+        return [
+            QADatasetOut.model_validate_json(data)
+            for data in self._query(
+                "datasets",
+                ["scope = ?"],
+                [self.scope],
+                name_prefix,
+                created_after,
+                created_before,
+                limit,
+            )
+        ]
+
+    def _query(
+        self,
+        table: str,
+        conditions: list[str],
+        params: list[typing.Any],
+        name_prefix: typing.Optional[str],
+        created_after: typing.Optional[datetime.datetime],
+        created_before: typing.Optional[datetime.datetime],
+        limit: typing.Optional[int],
+    ) -> list[str]:
+        if name_prefix is not None:
+            conditions.append("name >= ? AND name < ?")
+            params.extend(_name_range(name_prefix))
+        if created_after is not None:
+            conditions.append("created_at >= ?")
+            params.append(_to_text(created_after))
+        if created_before is not None:
+            conditions.append("created_at < ?")
+            params.append(_to_text(created_before))
+        # ⬇️ Only fixed conditions are joined, the values are bound as parameters
+        query = f"SELECT data FROM {table} WHERE {' AND '.join(conditions)} ORDER BY created_at DESC"  # noqa: S608
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._connection.execute(query, params).fetchall()
+        return [row[0] for row in rows]
+
+    def close(self) -> None:
+        self._connection.close()
@@ -0,0 +1,421 @@
+import asyncio
+import datetime
+import queue
+import threading
+import time
+import typing
+from collections.abc import AsyncGenerator, Generator, Iterable
+from enum import Enum
+
+from pydantic import BaseModel
+
+from hirundo._deadline import NO_DEADLINE, Deadline
+from hirundo._iter_sse_retrying import SSECancellation
+from hirundo.client import HirundoClient, resolve_client
+from hirundo.dataset_qa import QADataset, RunEvent, RunStatus, RunTimeoutError
+from hirundo.logger import get_logger
+from hirundo.run_checkpoints import RunCheckpointStore
+
+logger = get_logger(__name__)
+
+DEFAULT_SSE_THRESHOLD = 10
+DEFAULT_MIN_POLL_INTERVAL = 2.0
+DEFAULT_MAX_POLL_INTERVAL = 60.0
+DEFAULT_POLL_BACKOFF = 1.5
+
+TERMINAL_STATUSES = frozenset(
+    {
+        RunStatus.SUCCESS,
+        RunStatus.FAILURE,
+        RunStatus.REVOKED,
+        RunStatus.REJECTED,
+    }
+)
+
+
+class WatchMode(str, Enum):
+    AUTO = "AUTO"
+    """
+    Use per-run SSE streams when watching at most `sse_threshold` runs and batched polling otherwise
+    """
+    SSE = "SSE"
+    """
+    Open one Server-Sent Events stream per run. Gives fine-grained progress, but keeps a connection per run open
+    """
+    POLL = "POLL"
+    """
+    Periodically list all runs with a single request and compare their statuses
+    """
+
+
+class RunStateChange(BaseModel):
+    """
+    Emitted by :class:`RunWatcher` whenever the status of a tracked run changes,
+    or when watching a run failed
+    """
+
+    model_config = {"arbitrary_types_allowed": True}
+
+    run_id: str
+    previous_status: typing.Optional[RunStatus]
+    """
+    The previously observed status or `None` if this is the first observation of the run
+    """
+    status: typing.Optional[RunStatus]
+    """
+    The observed status. If watching the run failed, the last observed status (or `None` if there was none)
+    """
+    event: typing.Optional[RunEvent] = None
+    """
+    The event that reported the status, with e.g. the results URL or the error.
+    Only available when watching with SSE.
+    """
+    error: typing.Optional[Exception] = None
+    """
+    The error watching the run failed with (e.g. its SSE stream could not be read).
+    The run is no longer watched after that, while the other runs still are.
+    """
+    observed_at: datetime.datetime
+
+
+class RunWatcher:
+    """
+    Watch the status of many dataset QA runs at once.
+
+    With few runs, one SSE stream is opened per run. With many runs, a single `list_runs` request
+    is sent at an adaptive interval instead: the interval resets to `min_poll_interval` whenever a status
+    changes and grows by `poll_backoff` (up to `max_poll_interval`) whenever nothing changed.
+    Either way, a :class:`RunStateChange` is emitted for every status change of every tracked run
+    until all tracked runs are finished or the timeout passes.
+    """
+
+    def __init__(
+        self,
+        run_ids: Iterable[str],
+        mode: WatchMode = WatchMode.AUTO,
+        sse_threshold: int = DEFAULT_SSE_THRESHOLD,
+        min_poll_interval: float = DEFAULT_MIN_POLL_INTERVAL,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        poll_backoff: float = DEFAULT_POLL_BACKOFF,
+        organization_id: typing.Optional[int] = None,
+        stop_on_manual_approval: bool = False,
+        client: typing.Optional[HirundoClient] = None,
+        checkpoints: typing.Optional[RunCheckpointStore] = None,
+        timeout: typing.Optional[float] = None,
+        cancel_on_timeout: bool = False,
+    ):
+        """
+        Args:
+            run_ids: The IDs of the runs to watch
+            mode: Whether to watch with per-run SSE streams, batched polling, or pick automatically
+            sse_threshold: In `AUTO` mode, the maximum number of runs to watch with SSE streams
+            min_poll_interval: The shortest interval in seconds between polls
+            max_poll_interval: The longest interval in seconds between polls
+            poll_backoff: The factor the poll interval grows by when no status changed
+            organization_id: The ID of the organization the runs belong to, used when polling
+            stop_on_manual_approval: If True, runs awaiting manual approval are considered finished
+            client: The client to use. Defaults to the default client.
+            checkpoints: If provided, the progress of each run is saved to this store,
+                so that a restarted process can resume watching with :func:`RunWatcher.resume`
+            timeout: If provided, the maximum number of seconds to watch for, starting when watching starts
+            cancel_on_timeout: If True, the runs that did not finish are cancelled on the server
+                when the timeout passes
+        """
+        self.run_ids = list(dict.fromkeys(run_ids))
+        self.mode = (
+            mode
+            if mode != WatchMode.AUTO
+            else WatchMode.SSE
+            if len(self.run_ids) <= sse_threshold
+            else WatchMode.POLL
+        )
+        self.min_poll_interval = min_poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.poll_backoff = poll_backoff
+        self.organization_id = organization_id
+        self.finished_statuses = (
+            TERMINAL_STATUSES | {RunStatus.AWAITING_MANUAL_APPROVAL}
+            if stop_on_manual_approval
+            else TERMINAL_STATUSES
+        )
+        self.client = resolve_client(client)
+        self.checkpoints = checkpoints
+        self.timeout = timeout
+        self.cancel_on_timeout = cancel_on_timeout
+        self._deadline = NO_DEADLINE
+        self.statuses: dict[str, typing.Optional[RunStatus]] = dict.fromkeys(
+            self.run_ids
+        )
+        """
+        The last observed status of each tracked run
+        """
+        self.errors: dict[str, Exception] = {}
+        """
+        The error of each run that could not be watched, see :attr:`RunStateChange.error`
+        """
+
+    @classmethod
+    def resume(cls, checkpoints: RunCheckpointStore, **kwargs) -> "RunWatcher":
+        """
+        Create a watcher for all runs tracked in a checkpoint store, e.g. after the process restarted.
+        Streams are resumed after the last saved event of each run.
+
+        Args:
+            checkpoints: The checkpoint store the previous watcher saved to
+            kwargs: Other arguments of :class:`RunWatcher`
+        """
+        return cls(
+            [checkpoint.run_id for checkpoint in checkpoints.list()],
+            checkpoints=checkpoints,
+            **kwargs,
+        )
+
+    def _unfinished(self) -> list[str]:
+        return [
+            run_id
+            for run_id, status in self.statuses.items()
+            if status not in self.finished_statuses and run_id not in self.errors
+        ]
+
+    @property
+    def finished(self) -> bool:
+        """
+        Whether every tracked run is finished (or could not be watched)
+        """
+        return not self._unfinished()
+
+    def _timed_out(self) -> RunTimeoutError:
+        unfinished = self._unfinished()
+        logger.warning(
+            "%s runs did not finish within %s seconds", len(unfinished), self.timeout
+        )
+        if self.cancel_on_timeout:
+            for run_id in unfinished:
+                QADataset._cancel_after_timeout(run_id, self.client)
+        return RunTimeoutError(
+            f"{len(unfinished)} QA runs did not finish within {self.timeout} seconds",
+            unfinished,
+        )
+
+    def _observe(
+        self, run_id: str, status: RunStatus, event: typing.Optional[RunEvent] = None
+    ) -> typing.Optional[RunStateChange]:
+        previous_status = self.statuses[run_id]
+        if status == previous_status:
+            return None
+        self.statuses[run_id] = status
+        return RunStateChange(
+            run_id=run_id,
+            previous_status=previous_status,
+            status=status,
+            event=event,
+            observed_at=datetime.datetime.now(datetime.timezone.utc),
+        )
+
+    def _failed(self, run_id: str, error: Exception) -> RunStateChange:
+        if isinstance(error, TimeoutError) and self._deadline.expired:
+            raise error
+        logger.warning("Stopped watching run %s: %s", run_id, error)
+        self.errors[run_id] = error
+        status = self.statuses[run_id]
+        return RunStateChange(
+            run_id=run_id,
+            previous_status=status,
+            status=status,
+            error=error,
+            observed_at=datetime.datetime.now(datetime.timezone.utc),
+        )
+
+    def _poll_once(self) -> list[RunStateChange]:
+        changes = []
+        for run in QADataset.iter_runs(
+            organization_id=self.organization_id, client=self.client
+        ):
+            if (
+                run.run_id in self.statuses
+                and run.run_id not in self.errors
+                and (change := self._observe(run.run_id, run.status))
+            ):
+                if self.checkpoints is not None:
+                    self.checkpoints.record(
+                        run.run_id, None, RunEvent(state=run.status)
+                    )
+                changes.append(change)
+        return changes
+
+    def _next_poll_interval(self, interval: float, changed: bool) -> float:
+        if changed:
+            return self.min_poll_interval
+        return min(self.max_poll_interval, interval * self.poll_backoff)
+
+    def _watch_poll(self) -> Generator[RunStateChange, None, None]:
+        interval = self.min_poll_interval
+        while True:
+            self._deadline.check()
+            changes = self._poll_once()
+            yield from changes
+            if self.finished:
+                return
+            interval = self._next_poll_interval(interval, bool(changes))
+            logger.debug("Polling run statuses again in %s seconds", interval)
+            time.sleep(self._deadline.clamp(interval))
+
+    def _stream_run(
+        self,
+        run_id: str,
+        events: "queue.Queue[tuple[str, typing.Any]]",
+        cancellation: SSECancellation,
+    ) -> None:
+        try:
+            for data in QADataset._check_run_by_id(
+                run_id,
+                client=self.client,
+                checkpoints=self.checkpoints,
+                deadline=self._deadline,
+                cancellation=cancellation,
+            ):
+                events.put((run_id, data))
+        except Exception as error:
+            events.put((run_id, error))
+        finally:
+            events.put((run_id, None))
+
+    def _watch_sse(self) -> Generator[RunStateChange, None, None]:
+        events: queue.Queue[tuple[str, typing.Any]] = queue.Queue()
+        cancellations = {run_id: SSECancellation() for run_id in self.run_ids}
+        for run_id, cancellation in cancellations.items():
+            threading.Thread(
+                target=self._stream_run,
+                args=(run_id, events, cancellation),
+                name=f"hirundo-watch-{run_id}",
+                daemon=True,
+            ).start()
+        open_streams = len(self.run_ids)
+        try:
+            while open_streams and not self.finished:
+                try:
+                    run_id, data = events.get(timeout=self._deadline.remaining())
+                except queue.Empty:
+                    self._deadline.check()
+                    continue
+                if data is None:
+                    open_streams -= 1
+                elif isinstance(data, Exception):
+                    yield self._failed(run_id, data)
+                elif data.state is not None and (
+                    change := self._observe(run_id, data.state, data)
+                ):
+                    yield change
+        finally:
+            # ⬇️ Close the streams that are still open, e.g. when the caller stopped iterating early
+            for cancellation in cancellations.values():
+                cancellation.cancel()
+        if not self.finished:
+            # ⬆️ Streams of some runs ended early, so fall back to polling for them
+            yield from self._watch_poll()
+
+    def watch(self) -> Generator[RunStateChange, None, None]:
+        """
+        Watch the tracked runs until all of them are finished.
+        If watching a run fails, a :class:`RunStateChange` with the error is yielded and the other runs
+        are still watched.
+
+        Yields:
+            A :class:`RunStateChange` for every status change of a tracked run
+
+        Raises:
+            RunTimeoutError: If the runs did not finish within the timeout
+        """
+        logger.debug("Watching %s runs with %s", len(self.run_ids), self.mode.value)
+        self._deadline = Deadline(self.timeout)
+        try:
+            if self.mode == WatchMode.SSE:
+                yield from self._watch_sse()
+            else:
+                yield from self._watch_poll()
+        except TimeoutError as error:
+            if not self._deadline.expired:
+                raise
+            raise self._timed_out() from error
+
+    async def _awatch_poll(self) -> AsyncGenerator[RunStateChange, None]:
+        interval = self.min_poll_interval
+        while True:
+            self._deadline.check()
+            changes = await asyncio.to_thread(self._poll_once)
+            for change in changes:
+                yield change
+            if self.finished:
+                return
+            interval = self._next_poll_interval(interval, bool(changes))
+            await asyncio.sleep(self._deadline.clamp(interval))
+
+    async def _astream_run(
+        self, run_id: str, events: "asyncio.Queue[tuple[str, typing.Any]]"
+    ) -> None:
+        try:
+            async for data in QADataset._acheck_run_by_id(
+                run_id,
+                client=self.client,
+                checkpoints=self.checkpoints,
+                deadline=self._deadline,
+            ):
+                await events.put((run_id, data))
+        except Exception as error:
+            await events.put((run_id, error))
+        finally:
+            await events.put((run_id, None))
+
+    async def _awatch_sse(self) -> AsyncGenerator[RunStateChange, None]:
+        events: asyncio.Queue[tuple[str, typing.Any]] = asyncio.Queue()
+        tasks = [
+            asyncio.create_task(self._astream_run(run_id, events))
+            for run_id in self.run_ids
+        ]
+        open_streams = len(tasks)
+        try:
+            while open_streams and not self.finished:
+                try:
+                    run_id, data = await asyncio.wait_for(
+                        events.get(), self._deadline.remaining()
+                    )
+                except asyncio.TimeoutError:
+                    self._deadline.check()
+                    continue
+                if data is None:
+                    open_streams -= 1
+                elif isinstance(data, Exception):
+                    yield self._failed(run_id, data)
+                elif data.state is not None and (
+                    change := self._observe(run_id, data.state, data)
+                ):
+                    yield change
+        finally:
+            for task in tasks:
+                task.cancel()
+        if not self.finished:
+            async for change in self._awatch_poll():
+                yield change
+
+    async def awatch(self) -> AsyncGenerator[RunStateChange, None]:
+        """
+        Async version of :func:`watch`
+
+        Yields:
+            A :class:`RunStateChange` for every status change of a tracked run
+
+        Raises:
+            RunTimeoutError: If the runs did not finish within the timeout
+        """
+        logger.debug("Watching %s runs with %s", len(self.run_ids), self.mode.value)
+        self._deadline = Deadline(self.timeout)
+        iterator = (
+            self._awatch_sse() if self.mode == WatchMode.SSE else self._awatch_poll()
+        )
+        try:
+            async for change in iterator:
+                yield change
+        except TimeoutError as error:
+            if not self._deadline.expired:
+                raise
+            raise await asyncio.to_thread(self._timed_out) from error
@@ -0,0 +1,299 @@
+import csv
+import os
+import typing
+from collections import defaultdict
+from collections.abc import Sequence
+from contextlib import ExitStack
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from hirundo._dataframe import has_pandas, has_polars
+from hirundo.client import HirundoClient, resolve_client
+from hirundo.dataset_qa import HirundoError, QADataset, RunArgs
+from hirundo.dataset_qa_results import DataFrameType, DatasetQAResults
+from hirundo.labeling import HirundoCSV
+from hirundo.logger import get_logger
+from hirundo.pipeline import PipelineItem, PipelineStage, QAPipeline
+
+if has_pandas:
+    from hirundo._dataframe import pd
+if has_polars:
+    from hirundo._dataframe import pl
+
+logger = get_logger(__name__)
+
+DEFAULT_LABEL_COLUMN = "class_name"
+DEFAULT_KEY_COLUMN = "image_path"
+SHARD_COLUMN = "shard"
+
+
+def split_manifest(
+    manifest_path: typing.Union[str, Path],
+    output_dir: typing.Union[str, Path],
+    shards: int,
+    label_column: str = DEFAULT_LABEL_COLUMN,
+    key_column: str = DEFAULT_KEY_COLUMN,
+) -> list[Path]:
+    """
+    Split a `HirundoCSV` metadata file into `shards` files, stratified by class.
+    The images of each class are dealt to the shards in turn, so every shard gets about the same
+    number of images & the same class balance. All the rows of an image (e.g. its bounding boxes)
+    go to the same shard, which is picked by the class of its first row.
+    The file is streamed, so only the shard of each image is kept in memory.
+
+    Args:
+        manifest_path: The path of the local CSV file to split
+        output_dir: The directory to write the shard files to, as `shard-<index>.csv`
+        shards: The number of shards
+        label_column: The column with the class name of each row
+        key_column: The column identifying the image (or audio file) of each row
+
+    Returns:
+        The paths of the shard files, by shard index
+    """
+    if shards < 1:
+        raise ValueError("`shards` must be at least 1")
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    paths = [output_dir / f"shard-{index}.csv" for index in range(shards)]
+    image_shards: dict[str, int] = {}
+    class_counts: defaultdict[str, int] = defaultdict(int)
+    class_offsets: dict[str, int] = {}
+    with ExitStack() as stack:
+        manifest = stack.enter_context(open(manifest_path, newline=""))
+        reader = csv.DictReader(manifest)
+        columns = reader.fieldnames or []
+        missing = {label_column, key_column} - set(columns)
+        if missing:
+            raise ValueError(f"The manifest has no {sorted(missing)} column(s)")
+        writers = [
+            csv.DictWriter(stack.enter_context(open(path, "w", newline="")), columns)
+            for path in paths
+        ]
+        for writer in writers:
+            writer.writeheader()
+        for row in reader:
+            key = row[key_column]
+            if key not in image_shards:
+                label = row[label_column]
+                # ⬇️ Each class starts at a different shard, so that small classes are spread out too
+                offset = class_offsets.setdefault(label, len(class_offsets))
+                image_shards[key] = (class_counts[label] + offset) % shards
+                class_counts[label] += 1
+            writers[image_shards[key]].writerow(row)
+    logger.info(
+        "Split %s images of %s classes into %s shards",
+        len(image_shards),
+        len(class_counts),
+        shards,
+    )
+    return paths
+
+
+def shard_datasets(dataset: QADataset, csv_urls: Sequence[str]) -> list[QADataset]:
+    """
+    Copies of `dataset` for each shard's metadata file, named `<name>-shard-<index>`.
+    The copies keep the dataset's storage config, so they can be created with one storage config.
+
+    Args:
+        dataset: The dataset to shard. Its `labeling_info` must be `HirundoCSV`.
+        csv_urls: The URL of each shard's metadata file on the dataset's storage
+    """
+    if not isinstance(dataset.labeling_info, HirundoCSV):
+        raise ValueError("Only datasets with `HirundoCSV` labeling info can be sharded")
+    return [
+        dataset.model_copy(
+            update={
+                "name": f"{dataset.name}-shard-{index}",
+                "labeling_info": HirundoCSV(csv_url=csv_url),
+                "id": None,
+                "run_id": None,
+                "status": None,
+            }
+        )
+        for index, csv_url in enumerate(csv_urls)
+    ]
+
+
+def _concat(frames: list[tuple[int, DataFrameType]]) -> DataFrameType:
+    frames = [(shard, frame) for shard, frame in frames if frame is not None]
+    if not frames:
+        return None
+    if has_polars:
+        return pl.concat(
+            [
+                frame.with_columns(pl.lit(shard, dtype=pl.Int32).alias(SHARD_COLUMN))
+                for shard, frame in frames
+            ],
+            how="diagonal_relaxed",
+        )
+    if has_pandas:
+        return pd.concat(
+            [frame.assign(**{SHARD_COLUMN: shard}) for shard, frame in frames],
+            ignore_index=True,
+        )
+    return None
+
+
+def merge_results(
+    results: Sequence[tuple[int, DatasetQAResults[DataFrameType]]],
+) -> DatasetQAResults[DataFrameType]:
+    """
+    Merge the results of sharded runs into one, with a `shard` column holding each row's shard index
+
+    Args:
+        results: The results of each shard, with its shard index
+
+    Returns:
+        The merged results. Its `cached_zip_path` is the directory of the shards' zip files.
+    """
+    if not results:
+        raise ValueError("There are no results to merge")
+    return DatasetQAResults[DataFrameType](
+        cached_zip_path=Path(
+            os.path.commonpath([result.cached_zip_path.parent for _, result in results])
+        ),
+        suspects=_concat([(shard, result.suspects) for shard, result in results]),
+        object_suspects=_concat(
+            [(shard, result.object_suspects) for shard, result in results]
+        ),
+        warnings_and_errors=_concat(
+            [(shard, result.warnings_and_errors) for shard, result in results]
+        ),
+    )
+
+
+class ShardedRun(BaseModel):
+    """
+    The outcome of a :func:`ShardedQA.run`
+    """
+
+    model_config = {"arbitrary_types_allowed": True}
+
+    items: list[PipelineItem]
+    """
+    The pipeline item of each shard, by shard index, with its dataset, run ID and results or error
+    """
+    results: typing.Optional[DatasetQAResults] = None
+    """
+    The merged results of the shards that finished, see :func:`merge_results`.
+    `None` if every shard failed.
+    """
+
+    @property
+    def failed(self) -> list[int]:
+        """
+        The indices of the shards that failed
+        """
+        return [
+            index
+            for index, item in enumerate(self.items)
+            if item.stage == PipelineStage.FAILED
+        ]
+
+
+class ShardedQA:
+    """
+    Run dataset QA over a large `HirundoCSV` dataset as several smaller runs, so that a run
+    takes less time and a failure only affects its own shard:
+
+    1. The metadata file is split into shards stratified by class, see :func:`split_manifest`
+    2. Each shard file is uploaded to the dataset's storage with the given `upload` function
+    3. A dataset is created for each shard, sharing the dataset's storage config
+    4. The runs are launched & watched concurrently with a :class:`QAPipeline`
+    5. The results are merged into one, with the shard of each row, see :func:`merge_results`
+
+    Shards that fail are reported in :attr:`ShardedRun.failed` and left out of the merged results,
+    so they can be retried on their own.
+    """
+
+    def __init__(
+        self,
+        shards: int,
+        upload: typing.Callable[[Path], str],
+        label_column: str = DEFAULT_LABEL_COLUMN,
+        key_column: str = DEFAULT_KEY_COLUMN,
+        organization_id: typing.Optional[int] = None,
+        replace_dataset_if_exists: bool = False,
+        run_args: typing.Optional[RunArgs] = None,
+        run_timeout: typing.Optional[float] = None,
+        on_progress: typing.Optional[typing.Callable[[PipelineItem], None]] = None,
+        client: typing.Optional[HirundoClient] = None,
+    ):
+        """
+        Args:
+            shards: The number of shards (and runs)
+            upload: Uploads a local shard file to the dataset's storage and returns its URL,
+                e.g. `s3://my-bucket/labels/shard-0.csv`
+            label_column: The metadata column with the class name of each row
+            key_column: The metadata column identifying the image (or audio file) of each row
+            organization_id: The ID of the organization to run the QA for
+            replace_dataset_if_exists: If True, shard datasets will be replaced if they already exist
+            run_args: The run arguments to use for every shard's run
+            run_timeout: If provided, the maximum number of seconds to wait for each run to finish
+            on_progress: Called with a shard's item whenever it moves to another stage, see :class:`QAPipeline`
+            client: The client to use. Defaults to the default client.
+        """
+        if shards < 1:
+            raise ValueError("`shards` must be at least 1")
+        self.shards = shards
+        self.upload = upload
+        self.label_column = label_column
+        self.key_column = key_column
+        self.organization_id = organization_id
+        self.replace_dataset_if_exists = replace_dataset_if_exists
+        self.run_args = run_args
+        self.run_timeout = run_timeout
+        self.on_progress = on_progress
+        self.client = resolve_client(client)
+
+    def run(
+        self,
+        dataset: QADataset,
+        manifest_path: typing.Union[str, Path],
+        work_dir: typing.Union[str, Path, None] = None,
+    ) -> ShardedRun:
+        """
+        Shard the dataset, run QA on every shard and merge the results
+
+        Args:
+            dataset: The dataset to run QA on. Its `labeling_info` must be `HirundoCSV`.
+            manifest_path: The path of a local copy of the dataset's metadata file
+            work_dir: The directory to write the shard files to.
+                Defaults to `~/.hirundo/shards/<dataset name>`.
+
+        Returns:
+            The item of each shard and the merged results
+        """
+        if work_dir is None:
+            work_dir = Path.home() / ".hirundo" / "shards" / dataset.name
+        paths = split_manifest(
+            manifest_path, work_dir, self.shards, self.label_column, self.key_column
+        )
+        datasets = shard_datasets(dataset, [self.upload(path) for path in paths])
+        # ⬇️ Created together so that the storage config is only created once
+        dataset_ids = QADataset.create_many(
+            datasets,
+            self.organization_id,
+            self.replace_dataset_if_exists,
+            client=self.client,
+        )
+        if not dataset_ids:
+            raise HirundoError(f"Unable to create the shards of dataset {dataset.name}")
+        items = QAPipeline(
+            organization_id=self.organization_id,
+            replace_dataset_if_exists=self.replace_dataset_if_exists,
+            run_args=self.run_args,
+            run_timeout=self.run_timeout,
+            on_progress=self.on_progress,
+            client=self.client,
+        ).run(datasets)
+        finished = [
+            (index, item.results)
+            for index, item in enumerate(items)
+            if item.results is not None
+        ]
+        return ShardedRun(
+            items=items, results=merge_results(finished) if finished else None
+        )
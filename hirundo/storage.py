@@ -1,18 +1,32 @@
+import functools
 import typing
+from collections.abc import Generator, Iterable, Sequence
 from pathlib import Path
 
 import pydantic
 from pydantic import BaseModel, model_validator
 from pydantic_core import Url
 
-from hirundo._env import API_HOST
-from hirundo._headers import get_headers
-from hirundo._http import raise_for_status_with_reason, requests
-from hirundo._timeouts import MODIFY_TIMEOUT, READ_TIMEOUT
+from hirundo._fingerprint import content_hash
+from hirundo._http import parse_response, raise_for_status_with_reason
+from hirundo._pagination import DEFAULT_PAGE_SIZE, iter_pages, matches_filters
 from hirundo._urls import S3BucketUrl, StorageConfigName
+from hirundo.bulk import (
+    DEFAULT_BULK_CONCURRENCY,
+    BulkReport,
+    create_deduplicated,
+    run_bulk,
+)
+from hirundo.client import HirundoClient, resolve_client
 from hirundo.dataset_enum import StorageTypes
+from hirundo.fingerprints import (
+    FingerprintStore,
+    create_unless_unchanged,
+    resource_key,
+)
 from hirundo.git import GitRepo, GitRepoOut
 from hirundo.logger import get_logger
+from hirundo.name_cache import cached_get_by_name, invalidate_id, invalidate_name
 
 logger = get_logger(__name__)
 
@@ -304,43 +318,152 @@ class StorageConfig(BaseModel):
     """
 
     @staticmethod
-    def get_by_id(storage_config_id: int) -> "ResponseStorageConfig":
+    def get_by_id(
+        storage_config_id: int, client: typing.Optional[HirundoClient] = None
+    ) -> "ResponseStorageConfig":
         """
         Retrieves a :code:`StorageConfig` instance from the server by its ID
 
         Args:
             storage_config_id: The ID of the :code:`StorageConfig` to retrieve
+            client: The client to use. Defaults to the default client.
         """
-        storage_config = requests.get(
-            f"{API_HOST}/storage-config/{storage_config_id}",
-            headers=get_headers(),
-            timeout=READ_TIMEOUT,
+        client = resolve_client(client)
+        storage_config = client.get(
+            f"/storage-config/{storage_config_id}",
+            timeout=client.read_timeout,
         )
         raise_for_status_with_reason(storage_config)
-        return ResponseStorageConfig(**storage_config.json())
+        return parse_response(storage_config, ResponseStorageConfig)
 
     @staticmethod
-    def get_by_name(name: str, storage_type: StorageTypes) -> "ResponseStorageConfig":
+    def get_by_name(
+        name: str,
+        storage_type: StorageTypes,
+        client: typing.Optional[HirundoClient] = None,
+    ) -> "ResponseStorageConfig":
         """
-        Retrieves a :code:`StorageConfig` instance from the server by its name
+        Retrieves a :code:`StorageConfig` instance from the server by its name.
+        Cached if the client has a :class:`NameCache`.
 
         Args:
             name: The name of the :code:`StorageConfig` to retrieve
             storage_type: The type of the :code:`StorageConfig` to retrieve
+            client: The client to use. Defaults to the default client.
 
             Note: The type is required because the name is not unique across different storage types
         """
-        storage_config = requests.get(
-            f"{API_HOST}/storage-config/by-name/{name}?storage_type={storage_type.value}",
-            headers=get_headers(),
-            timeout=READ_TIMEOUT,
+        client = resolve_client(client)
+
+        def fetch() -> ResponseStorageConfig:
+            storage_config = client.get(
+                f"/storage-config/by-name/{name}?storage_type={storage_type.value}",
+                timeout=client.read_timeout,
+            )
+            raise_for_status_with_reason(storage_config)
+            return parse_response(storage_config, ResponseStorageConfig)
+
+        return cached_get_by_name(
+            client,
+            "storage-config",
+            name,
+            storage_type.value,
+            ResponseStorageConfig,
+            fetch,
+        )
+
+    @staticmethod
+    def create_many(
+        storage_configs: Sequence["StorageConfig"],
+        replace_if_exists: bool = False,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        client: typing.Optional[HirundoClient] = None,
+        fingerprints: typing.Optional[FingerprintStore] = None,
+    ) -> list[typing.Optional[int]]:
+        """
+        Create :code:`StorageConfig` instances on the server, at most `max_concurrency` at once.
+        Identical :code:`StorageConfig`'s and Git repositories (by content) are only created once,
+        and all of them get the created ID.
+
+        Args:
+            storage_configs: The :code:`StorageConfig`'s to create
+            replace_if_exists: If a :code:`StorageConfig` with the same name and type already exists, replace it.
+            max_concurrency: The maximum number of requests sent at once
+            client: The client to use. Defaults to the default client.
+            fingerprints: If provided, unchanged replacements are skipped, see :class:`FingerprintStore`.
+
+        Returns:
+            The ID of each :code:`StorageConfig` in the given order, or `None` if it could not be created
+        """
+        client = resolve_client(client)
+        hashes = {
+            id(storage_config): storage_config.content_hash()
+            for storage_config in storage_configs
+        }
+        # ⬆️ Hashed before the Git repository IDs are set, which the hash ignores anyway
+        with_repos = [
+            storage_config
+            for storage_config in storage_configs
+            if storage_config.git and storage_config.git.repo
+        ]
+        repo_ids = GitRepo.create_many(
+            [
+                storage_config.git.repo
+                for storage_config in with_repos
+                if storage_config.git and storage_config.git.repo
+            ],
+            replace_if_exists,
+            max_concurrency,
+            client,
+            fingerprints,
+        )
+        failed_repos: set[int] = set()
+        for storage_config, repo_id in zip(with_repos, repo_ids):
+            if repo_id is None:
+                failed_repos.add(id(storage_config))
+            elif storage_config.git:
+                storage_config.git.repo_id = repo_id
+        ready = [
+            storage_config
+            for storage_config in storage_configs
+            if id(storage_config) not in failed_repos
+        ]
+        ids = dict(
+            zip(
+                map(id, ready),
+                create_deduplicated(
+                    "create-storage-configs",
+                    functools.partial(
+                        StorageConfig._create,
+                        replace_if_exists=replace_if_exists,
+                        client=client,
+                        fingerprints=fingerprints,
+                        create_repo=False,
+                    ),
+                    ready,
+                    lambda storage_config: hashes[id(storage_config)],
+                    max_concurrency,
+                ),
+            )
+        )
+        for storage_config in ready:
+            storage_config_id = ids[id(storage_config)]
+            if storage_config_id is not None:
+                storage_config.id = storage_config_id
+        return [ids.get(id(storage_config)) for storage_config in storage_configs]
+
+    def content_hash(self) -> str:
+        """
+        A hash of the definition of the :code:`StorageConfig`, ignoring the IDs set by the server
+        """
+        return content_hash(
+            self, exclude={"id": True, "git": {"repo_id": True, "repo": {"id"}}}
         )
-        raise_for_status_with_reason(storage_config)
-        return ResponseStorageConfig(**storage_config.json())
 
     @staticmethod
     def list(
         organization_id: typing.Optional[int] = None,
+        client: typing.Optional[HirundoClient] = None,
     ) -> list["ResponseStorageConfig"]:
         """
         Lists all the :code:`StorageConfig`'s created by user's default organization
@@ -349,61 +472,183 @@ class StorageConfig(BaseModel):
         Args:
             organization_id: The ID of the organization to list :code:`StorageConfig`'s for.
             If not provided, it will list :code:`StorageConfig`'s for the default organization.
+            client: The client to use. Defaults to the default client.
         """
-        storage_configs = requests.get(
-            f"{API_HOST}/storage-config/",
+        client = resolve_client(client)
+        storage_configs = client.get(
+            "/storage-config/",
             params={"storage_config_organization_id": organization_id},
-            headers=get_headers(),
-            timeout=READ_TIMEOUT,
+            timeout=client.read_timeout,
         )
         raise_for_status_with_reason(storage_configs)
-        return [ResponseStorageConfig(**si) for si in storage_configs.json()]
+        return parse_response(storage_configs, list[ResponseStorageConfig])
 
     @staticmethod
-    def delete_by_id(storage_config_id) -> None:
+    def iter_storage_configs(
+        organization_id: typing.Optional[int] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        name_prefix: typing.Optional[str] = None,
+        storage_type: typing.Optional[StorageTypes] = None,
+        client: typing.Optional[HirundoClient] = None,
+    ) -> Generator["ResponseStorageConfig", None, None]:
+        """
+        Lazily iterate over the :code:`StorageConfig`'s created by user's default organization,
+        fetching one page at a time
+
+        Args:
+            organization_id: The ID of the organization to list :code:`StorageConfig`'s for.
+            If not provided, it will list :code:`StorageConfig`'s for the default organization.
+            page_size: The number of :code:`StorageConfig`'s to fetch per request.
+            name_prefix: If provided, only :code:`StorageConfig`'s whose name starts with this prefix are yielded.
+            storage_type: If provided, only :code:`StorageConfig`'s of this type are yielded.
+            client: The client to use. Defaults to the default client.
+        """
+        client = resolve_client(client)
+        for storage_config in iter_pages(
+            client,
+            "/storage-config/",
+            ResponseStorageConfig,
+            params={"storage_config_organization_id": organization_id},
+            page_size=page_size,
+        ):
+            if (
+                storage_type is None or storage_config.type == storage_type
+            ) and matches_filters(storage_config, name_prefix):
+                yield storage_config
+
+    @staticmethod
+    def delete_by_id(
+        storage_config_id, client: typing.Optional[HirundoClient] = None
+    ) -> None:
         """
         Deletes a :code:`StorageConfig` instance from the server by its ID
 
         Args:
             storage_config_id: The ID of the :code:`StorageConfig` to delete
+            client: The client to use. Defaults to the default client.
         """
-        storage_config = requests.delete(
-            f"{API_HOST}/storage-config/{storage_config_id}",
-            headers=get_headers(),
-            timeout=MODIFY_TIMEOUT,
+        client = resolve_client(client)
+        storage_config = client.delete(
+            f"/storage-config/{storage_config_id}",
+            timeout=client.modify_timeout,
         )
         raise_for_status_with_reason(storage_config)
+        invalidate_id(client, "storage-config", storage_config_id)
         logger.info("Deleted storage config with ID: %s", storage_config_id)
 
-    def delete(self) -> None:
+    @staticmethod
+    def delete_many(
+        storage_config_ids: Iterable[int],
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        client: typing.Optional[HirundoClient] = None,
+    ) -> BulkReport:
+        """
+        Deletes :code:`StorageConfig` instances from the server by their IDs, at most `max_concurrency` at once.
+        A failure for one ID does not stop the others.
+
+        Args:
+            storage_config_ids: The IDs of the :code:`StorageConfig` instances to delete
+            max_concurrency: The maximum number of requests sent at once
+            client: The client to use. Defaults to the default client.
+                Its rate limit (if any) applies to all the requests.
+
+        Returns:
+            A report with the outcome for each ID
+        """
+        client = resolve_client(client)
+        return run_bulk(
+            "delete-storage-configs",
+            functools.partial(StorageConfig.delete_by_id, client=client),
+            storage_config_ids,
+            max_concurrency,
+        )
+
+    def delete(self, client: typing.Optional[HirundoClient] = None) -> None:
         """
         Deletes the :code:`StorageConfig` instance from the server
+
+        Args:
+            client: The client to use. Defaults to the default client.
         """
         if not self.id:
             raise ValueError("No StorageConfig has been created")
-        self.delete_by_id(self.id)
-
-    def create(self, replace_if_exists: bool = False) -> int:
+        self.delete_by_id(self.id, client=client)
+
+    def create(
+        self,
+        replace_if_exists: bool = False,
+        client: typing.Optional[HirundoClient] = None,
+        fingerprints: typing.Optional[FingerprintStore] = None,
+    ) -> int:
         """
         Create a :code:`StorageConfig` instance on the server
 
         Args:
             replace_if_exists: If a :code:`StorageConfig` with the same name and type already exists, replace it.
+            client: The client to use. Defaults to the default client.
+            fingerprints: If provided, a replacement is skipped when neither the :code:`StorageConfig`
+                nor the server's copy changed since it was last created, see :class:`FingerprintStore`.
+        """
+        client = resolve_client(client)
+        return self._create(replace_if_exists, client, fingerprints, create_repo=True)
+
+    def _create(
+        self,
+        replace_if_exists: bool,
+        client: HirundoClient,
+        fingerprints: typing.Optional[FingerprintStore],
+        create_repo: bool,
+    ) -> int:
+        def create() -> int:
+            if create_repo and self.git and self.git.repo:
+                self.git.repo_id = self.git.repo.create(
+                    replace_if_exists=replace_if_exists,
+                    client=client,
+                    fingerprints=fingerprints,
+                )
+            return self._post(replace_if_exists, client)
+
+        storage_type = typing.cast("StorageTypes", self.type)
+        # ⬆️ Set by `validate_storage_type`
+        self.id = create_unless_unchanged(
+            fingerprints,
+            resource_key(
+                client.api_host,
+                "storage-config",
+                self.name,
+                self.organization_id,
+                storage_type.value,
+            ),
+            self.content_hash(),
+            functools.partial(
+                StorageConfig.get_by_name, self.name, storage_type, client=client
+            ),
+            create,
+            replace_if_exists,
+        )
+        return self.id
+
+    def _post(self, replace_if_exists: bool, client: HirundoClient) -> int:
+        """
+        Create the :code:`StorageConfig` on the server, without creating its Git repository
         """
-        if self.git and self.git.repo:
-            self.git.repo_id = self.git.repo.create(replace_if_exists=replace_if_exists)
-        storage_config = requests.post(
-            f"{API_HOST}/storage-config/",
+        storage_config = client.post(
+            "/storage-config/",
             json={
                 **self.model_dump(mode="json"),
                 "replace_if_exists": replace_if_exists,
             },
-            headers=get_headers(),
-            timeout=MODIFY_TIMEOUT,
+            timeout=client.modify_timeout,
         )
         raise_for_status_with_reason(storage_config)
         storage_config_id = storage_config.json()["id"]
         self.id = storage_config_id
+        invalidate_name(
+            client,
+            "storage-config",
+            self.name,
+            self.type.value if self.type else None,
+        )
         logger.info("Created storage config with ID: %s", storage_config_id)
         return storage_config_id
 
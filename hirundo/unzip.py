@@ -1,9 +1,11 @@
 import typing
 import zipfile
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from pathlib import Path
 from typing import IO, cast
 
+import requests
+import urllib3
 from pydantic_core import Url
 
 from hirundo._dataframe import (
@@ -15,10 +17,8 @@ from hirundo._dataframe import (
     pl,
     string,
 )
-from hirundo._env import API_HOST
-from hirundo._headers import _get_auth_headers
-from hirundo._http import requests
-from hirundo._timeouts import DOWNLOAD_READ_TIMEOUT
+from hirundo._deadline import NO_DEADLINE, Deadline
+from hirundo.client import HirundoClient, resolve_client
 from hirundo.dataset_qa_results import (
     DataFrameType,
     DatasetQAResults,
@@ -26,6 +26,8 @@ from hirundo.dataset_qa_results import (
 from hirundo.logger import get_logger
 
 ZIP_FILE_CHUNK_SIZE = 50 * 1024 * 1024  # 50 MB
+DEADLINE_ZIP_FILE_CHUNK_SIZE = 1024 * 1024  # 1 MB
+# ⬆️ At most this much is read at once when there is a deadline, so it is checked often enough
 
 Dtype = typing.Union[type[int32], type[float32], type[string]]
 
@@ -115,8 +117,102 @@ def get_mislabel_suspect_filename(filenames: list[str]):
     return mislabel_suspect_filename
 
 
+def _iter_chunks(
+    response: requests.Response, client: HirundoClient, deadline: Deadline
+) -> Iterator[bytes]:
+    """
+    The chunks of a streamed download. With a deadline, each read returns whatever arrived so far
+    and waits no longer than the time left, so a slow trickle of data can't run past the deadline.
+    """
+    if deadline.expires_at is None:
+        yield from response.iter_content(chunk_size=ZIP_FILE_CHUNK_SIZE)
+        return
+    sock = getattr(response.raw.connection, "sock", None)
+    while True:
+        deadline.check()
+        if sock is not None:
+            sock.settimeout(deadline.clamp(client.download_read_timeout))
+        chunk = response.raw.read1(DEADLINE_ZIP_FILE_CHUNK_SIZE, decode_content=True)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _download_zip(
+    zip_url: str,
+    headers: dict[str, str],
+    zip_file_path: Path,
+    client: HirundoClient,
+    deadline: Deadline,
+) -> None:
+    try:
+        with client.session.get(
+            zip_url,
+            headers=headers,
+            timeout=deadline.clamp(client.download_read_timeout),
+            stream=True,
+        ) as r:
+            r.raise_for_status()
+            with open(zip_file_path, "wb") as f:
+                for chunk in _iter_chunks(r, client, deadline):
+                    f.write(chunk)
+    except BaseException as error:
+        # ⬇️ Do not leave a partial zip file in the cache
+        zip_file_path.unlink(missing_ok=True)
+        if isinstance(error, (requests.RequestException, urllib3.exceptions.HTTPError)):
+            # ⬇️ A read timeout clamped by the deadline means the deadline passed
+            deadline.check()
+        raise
+
+
+def download_zip(
+    run_id: str,
+    zip_url: str,
+    client: typing.Optional[HirundoClient] = None,
+    deadline: Deadline = NO_DEADLINE,
+) -> Path:
+    """
+    Download the results zip file of a run from the given URL to the local cache.
+
+    Args:
+        run_id: The ID of the dataset QA run.
+        zip_url: The URL of the zip file to download.
+        client: The client to use. Defaults to the default client.
+        deadline: The deadline for the download. Defaults to no deadline.
+
+    Returns:
+        The path of the downloaded zip file.
+
+    Raises:
+        TimeoutError: If the deadline passed before the download finished.
+    """
+    # Define the local file path
+    cache_dir = Path.home() / ".hirundo" / "cache"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    zip_file_path = cache_dir / f"{run_id}.zip"
+
+    client = resolve_client(client)
+    headers = {}
+    if Url(zip_url).scheme == "file":
+        zip_url = client.url(
+            "/dataset-qa/run/local-download" + zip_url.replace("file://", "")
+        )
+        headers = client.auth_headers()
+    # Stream the zip file download
+    _download_zip(zip_url, headers, zip_file_path, client, deadline)
+    logger.info(
+        "Successfully downloaded the result zip file for run ID %s to %s",
+        run_id,
+        zip_file_path,
+    )
+    return zip_file_path
+
+
 def download_and_extract_zip(
-    run_id: str, zip_url: str
+    run_id: str,
+    zip_url: str,
+    client: typing.Optional[HirundoClient] = None,
+    deadline: Deadline = NO_DEADLINE,
 ) -> DatasetQAResults[DataFrameType]:
     """
     Download and extract the zip file from the given URL.
@@ -129,99 +225,88 @@ def download_and_extract_zip(
     Args:
         run_id: The ID of the dataset QA run.
         zip_url: The URL of the zip file to download.
+        client: The client to use. Defaults to the default client.
+        deadline: The deadline for the download. Defaults to no deadline.
 
     Returns:
         The dataset QA results object.
+
+    Raises:
+        TimeoutError: If the deadline passed before the download finished.
     """
-    # Define the local file path
-    cache_dir = Path.home() / ".hirundo" / "cache"
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    zip_file_path = cache_dir / f"{run_id}.zip"
+    zip_file_path = download_zip(run_id, zip_url, client=client, deadline=deadline)
+    return extract_zip(run_id, zip_file_path)
 
-    headers = None
-    if Url(zip_url).scheme == "file":
-        zip_url = f"{API_HOST}/dataset-qa/run/local-download" + zip_url.replace(
-            "file://", ""
-        )
-        headers = _get_auth_headers()
-    # Stream the zip file download
-    with requests.get(
-        zip_url,
-        headers=headers,
-        timeout=DOWNLOAD_READ_TIMEOUT,
-        stream=True,
-    ) as r:
-        r.raise_for_status()
-        with open(zip_file_path, "wb") as f:
-            for chunk in r.iter_content(chunk_size=ZIP_FILE_CHUNK_SIZE):
-                f.write(chunk)
-        logger.info(
-            "Successfully downloaded the result zip file for run ID %s to %s",
-            run_id,
-            zip_file_path,
-        )
 
-        with zipfile.ZipFile(zip_file_path, "r") as z:
-            # Extract suspects file
-            suspects_df = None
-            object_suspects_df = None
-            warnings_and_errors_df = None
+def extract_zip(run_id: str, zip_file_path: Path) -> DatasetQAResults[DataFrameType]:
+    """
+    Extract the results of a run from its downloaded zip file.
+    Only uses the local file, so it can run in another process.
 
-            filenames = []
-            try:
-                filenames = [file.filename for file in z.filelist]
-            except Exception as e:
-                logger.error("Failed to get filenames from ZIP", exc_info=e)
+    Args:
+        run_id: The ID of the dataset QA run.
+        zip_file_path: The path of the downloaded zip file.
 
-            try:
-                mislabel_suspect_filename = get_mislabel_suspect_filename(filenames)
-                with z.open(mislabel_suspect_filename) as suspects_file:
-                    suspects_df = load_df(suspects_file)
-                logger.debug(
-                    "Successfully loaded mislabel suspects into DataFrame for run ID %s",
-                    run_id,
-                )
-            except Exception as e:
-                logger.error(
-                    "Failed to load mislabel suspects into DataFrame", exc_info=e
-                )
+    Returns:
+        The dataset QA results object.
+    """
+    with zipfile.ZipFile(zip_file_path, "r") as z:
+        # Extract suspects file
+        suspects_df = None
+        object_suspects_df = None
+        warnings_and_errors_df = None
 
-            object_mislabel_suspects_filename = "object_mislabel_suspects.csv"
-            if object_mislabel_suspects_filename in filenames:
-                try:
-                    with z.open(
-                        object_mislabel_suspects_filename
-                    ) as object_suspects_file:
-                        object_suspects_df = load_df(object_suspects_file)
-                    logger.debug(
-                        "Successfully loaded object mislabel suspects into DataFrame for run ID %s",
-                        run_id,
-                    )
-                except Exception as e:
-                    logger.error(
-                        "Failed to load object mislabel suspects into DataFrame",
-                        exc_info=e,
-                    )
+        filenames = []
+        try:
+            filenames = [file.filename for file in z.filelist]
+        except Exception as e:
+            logger.error("Failed to get filenames from ZIP", exc_info=e)
+
+        try:
+            mislabel_suspect_filename = get_mislabel_suspect_filename(filenames)
+            with z.open(mislabel_suspect_filename) as suspects_file:
+                suspects_df = load_df(suspects_file)
+            logger.debug(
+                "Successfully loaded mislabel suspects into DataFrame for run ID %s",
+                run_id,
+            )
+        except Exception as e:
+            logger.error("Failed to load mislabel suspects into DataFrame", exc_info=e)
 
+        object_mislabel_suspects_filename = "object_mislabel_suspects.csv"
+        if object_mislabel_suspects_filename in filenames:
             try:
-                # Extract warnings_and_errors file
-                with z.open("warnings_and_errors.csv") as warnings_file:
-                    warnings_and_errors_df = load_df(warnings_file)
+                with z.open(object_mislabel_suspects_filename) as object_suspects_file:
+                    object_suspects_df = load_df(object_suspects_file)
                 logger.debug(
-                    "Successfully loaded warnings and errors into DataFrame for run ID %s",
+                    "Successfully loaded object mislabel suspects into DataFrame for run ID %s",
                     run_id,
                 )
             except Exception as e:
                 logger.error(
-                    "Failed to load warnings and errors into DataFrame", exc_info=e
+                    "Failed to load object mislabel suspects into DataFrame",
+                    exc_info=e,
                 )
 
-            return DatasetQAResults[DataFrameType](
-                cached_zip_path=zip_file_path,
-                suspects=suspects_df,
-                object_suspects=object_suspects_df,
-                warnings_and_errors=warnings_and_errors_df,
+        try:
+            # Extract warnings_and_errors file
+            with z.open("warnings_and_errors.csv") as warnings_file:
+                warnings_and_errors_df = load_df(warnings_file)
+            logger.debug(
+                "Successfully loaded warnings and errors into DataFrame for run ID %s",
+                run_id,
             )
+        except Exception as e:
+            logger.error(
+                "Failed to load warnings and errors into DataFrame", exc_info=e
+            )
+
+        return DatasetQAResults[DataFrameType](
+            cached_zip_path=zip_file_path,
+            suspects=suspects_df,
+            object_suspects=object_suspects_df,
+            warnings_and_errors=warnings_and_errors_df,
+        )
 
 
 def load_from_zip(
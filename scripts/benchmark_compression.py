@@ -0,0 +1,140 @@
+"""
+Benchmark request & response body compression against a local stand-in for the API server.
+
+Measures the bytes sent over the wire and the latency of:
+- `QADataset.create` with a large `classes` list (with and without gzip-compressed request bodies)
+- `QADataset.list_runs` with a large response (with and without a compressed response)
+
+The stand-in server simulates a limited bandwidth link so that transfer sizes affect latency.
+
+Usage: `python scripts/benchmark_compression.py [--classes N] [--runs N] [--bandwidth-mbps N]`
+"""
+
+import argparse
+import gzip
+import json
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from hirundo import HirundoClient, HirundoCSV, LabelingType, QADataset
+
+REPEATS = 5
+
+
+class _Stats:
+    request_bytes = 0
+    response_bytes = 0
+
+
+def _make_server(run_list: bytes, bandwidth_bytes_per_second: float):
+    gzipped_run_list = gzip.compress(run_list)
+
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _send(self, body: bytes, content_encoding: str = "") -> None:
+            _Stats.response_bytes += len(body)
+            time.sleep(len(body) / bandwidth_bytes_per_second)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            if content_encoding:
+                self.send_header("Content-Encoding", content_encoding)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):  # noqa: N802
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            _Stats.request_bytes += len(body)
+            time.sleep(len(body) / bandwidth_bytes_per_second)
+            if self.headers.get("Content-Encoding") == "gzip":
+                body = gzip.decompress(body)
+            json.loads(body)
+            self._send(b'{"id": 1}')
+
+        def do_GET(self):  # noqa: N802
+            if "gzip" in self.headers.get("Accept-Encoding", ""):
+                self._send(gzipped_run_list, "gzip")
+            else:
+                self._send(run_list)
+
+        def log_message(self, format, *args):  # noqa: A002
+            pass
+
+    return ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+
+
+def _run_list(size: int) -> bytes:
+    return json.dumps(
+        [
+            {
+                "id": i,
+                "name": f"dataset-{i % 1000}",
+                "dataset_id": i % 1000,
+                "run_id": f"{i:032x}",
+                "status": "SUCCESS",
+                "approved": True,
+                "created_at": "2025-01-01T00:00:00Z",
+                "run_args": {"image_size": [224, 224], "upsample": False},
+            }
+            for i in range(size)
+        ]
+    ).encode()
+
+
+def _measure(fn) -> tuple[float, int, int]:
+    _Stats.request_bytes = _Stats.response_bytes = 0
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        fn()
+    seconds = (time.perf_counter() - start) / REPEATS
+    return (
+        seconds,
+        _Stats.request_bytes // REPEATS,
+        _Stats.response_bytes // REPEATS,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--classes", type=int, default=20_000)
+    parser.add_argument("--runs", type=int, default=20_000)
+    parser.add_argument("--bandwidth-mbps", type=float, default=100.0)
+    args = parser.parse_args()
+    logging.getLogger("hirundo.dataset_qa").setLevel(logging.WARNING)
+
+    server = _make_server(_run_list(args.runs), args.bandwidth_mbps * 1e6 / 8)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api_host = f"http://127.0.0.1:{server.server_address[1]}"
+
+    dataset = QADataset(
+        name="compression-benchmark",
+        labeling_type=LabelingType.SINGLE_LABEL_CLASSIFICATION,
+        storage_config_id=1,
+        data_root_url="s3://my-bucket/images",
+        labeling_info=HirundoCSV(csv_url="s3://my-bucket/metadata.csv"),
+        classes=[f"class-{i}" for i in range(args.classes)],
+    )
+    plain = HirundoClient(api_host=api_host, api_key="benchmark")
+    plain.session.headers["Accept-Encoding"] = "identity"
+    compressed = HirundoClient(
+        api_host=api_host, api_key="benchmark", compress_requests_above=1024
+    )
+    for label, client in (("uncompressed", plain), ("compressed", compressed)):
+        seconds, sent, _ = _measure(lambda c=client: dataset.create(client=c))
+        print(
+            f"create ({args.classes:,} classes), {label:<12}: "
+            f"{sent / 1e6:7.2f} MB sent, {seconds * 1000:8.1f} ms"
+        )
+        seconds, _, received = _measure(lambda c=client: QADataset.list_runs(client=c))
+        print(
+            f"list_runs ({args.runs:,} runs), {label:<12}: "
+            f"{received / 1e6:7.2f} MB received, {seconds * 1000:8.1f} ms"
+        )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
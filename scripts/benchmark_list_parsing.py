@@ -0,0 +1,103 @@
+"""
+Benchmark parsing of large list responses (`list_runs` / `list_datasets`).
+
+Compares the previous approach of `response.json()` followed by `Model(**item)` for every item
+with validating the raw response bytes through a cached `TypeAdapter`.
+
+Usage: `python scripts/benchmark_list_parsing.py [sizes...]` (defaults to 10k, 100k and 1M records)
+"""
+
+import gc
+import json
+import sys
+import time
+
+from hirundo._http import _get_type_adapter
+from hirundo.dataset_qa import DataQARunOut, QADatasetOut
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+
+
+def _run_record(i: int) -> dict:
+    return {
+        "id": i,
+        "name": f"dataset-{i % 1000}",
+        "dataset_id": i % 1000,
+        "run_id": f"{i:032x}",
+        "status": "SUCCESS",
+        "approved": True,
+        "created_at": "2025-01-01T00:00:00Z",
+        "run_args": {"image_size": [224, 224], "upsample": False},
+    }
+
+
+def _dataset_record(i: int) -> dict:
+    return {
+        "id": i,
+        "name": f"dataset-{i}",
+        "labeling_type": "SingleLabelClassification",
+        "storage_config": {
+            "id": i % 100,
+            "name": f"storage-{i % 100}",
+            "type": "S3",
+            "organization_name": "org",
+            "creator_name": "creator",
+            "s3": {
+                "endpoint_url": None,
+                "bucket_url": "s3://my-bucket",
+                "region_name": "us-east-1",
+                "access_key_id": None,
+            },
+            "gcp": None,
+            "git": None,
+        },
+        "data_root_url": "s3://my-bucket/images",
+        "classes": ["cat", "dog", "bird"],
+        "labeling_info": {
+            "type": "HirundoCSV",
+            "csv_url": "s3://my-bucket/metadata.csv",
+        },
+        "organization_id": 1,
+        "creator_id": 1,
+        "created_at": "2025-01-01T00:00:00Z",
+        "updated_at": "2025-01-01T00:00:00Z",
+    }
+
+
+def _parse_dicts(model: type, content: bytes) -> list:
+    return [model(**item) for item in json.loads(content)]
+
+
+def _parse_bytes(model: type, content: bytes) -> list:
+    return _get_type_adapter(list[model]).validate_json(content)
+
+
+def _time(parse, model: type, content: bytes) -> float:
+    gc.collect()
+    start = time.perf_counter()
+    parse(model, content)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    sizes = [int(size) for size in sys.argv[1:]] or DEFAULT_SIZES
+    for model, make_record in (
+        (DataQARunOut, _run_record),
+        (QADatasetOut, _dataset_record),
+    ):
+        for size in sizes:
+            content = json.dumps([make_record(i) for i in range(size)]).encode()
+            _get_type_adapter(list[model])  # Build the cached adapter up front
+            dict_seconds = _time(_parse_dicts, model, content)
+            bytes_seconds = _time(_parse_bytes, model, content)
+            print(
+                f"{model.__name__:<14} {size:>9,} records "
+                f"({len(content) / 1e6:8.1f} MB): "
+                f"json()+Model(**) {dict_seconds:7.2f}s | "
+                f"TypeAdapter.validate_json {bytes_seconds:7.2f}s | "
+                f"speedup x{dict_seconds / bytes_seconds:.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
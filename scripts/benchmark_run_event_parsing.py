@@ -0,0 +1,75 @@
+"""
+Benchmark parsing of dataset QA run SSE events.
+
+Compares the previous approach of decoding each event to a dict and working out the progress
+by splitting and stripping the result string with the single-pass `parse_run_event`.
+The recorded stream is mostly progress events reporting the percentage with two decimals
+(so each message is repeated as the run progresses), with a status change every 1,000 events.
+
+Usage: `python scripts/benchmark_run_event_parsing.py [events]` (defaults to 1M events)
+"""
+
+import gc
+import json
+import sys
+import time
+
+from hirundo.dataset_qa import parse_run_event
+
+DEFAULT_EVENTS = 1_000_000
+STATES = ("PENDING", "STARTED", "AWAITING MANUAL APPROVAL", "SUCCESS")
+
+
+def _recorded_stream(size: int) -> list[str]:
+    events = []
+    for i in range(size):
+        if i % 1000 == 0:
+            state = STATES[i // 1000 % len(STATES)]
+            result = "s3://bucket/results.zip" if state == "SUCCESS" else None
+            data = {"state": state, "result": result}
+        else:
+            percent = round(i / size * 100, 2)
+            data = {"state": None, "result": {"result": f"Training: {percent}% done"}}
+        events.append(json.dumps({"data": data}))
+    return events
+
+
+def _parse_legacy(events: list[str]) -> None:
+    for data in events:
+        iteration = json.loads(data)["data"]
+        if iteration["state"] is None:
+            result = iteration["result"]
+            if result and isinstance(result, dict) and isinstance(result["result"], str):
+                result_info = result["result"].split(":")
+                if len(result_info) > 1:
+                    float(result_info[1].removeprefix(" ").removesuffix("% done"))
+
+
+def _parse_run_events(events: list[str]) -> None:
+    for data in events:
+        parse_run_event(data)
+
+
+def _time(parse, events: list[str]) -> float:
+    gc.collect()
+    start = time.perf_counter()
+    parse(events)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_EVENTS
+    events = _recorded_stream(size)
+    legacy_seconds = _time(_parse_legacy, events)
+    parser_seconds = _time(_parse_run_events, events)
+    print(
+        f"{size:,} events: "
+        f"dict + split (no model) {legacy_seconds:6.2f}s "
+        f"({legacy_seconds / size * 1e6:5.2f}µs/event) | "
+        f"parse_run_event -> RunEvent {parser_seconds:6.2f}s "
+        f"({parser_seconds / size * 1e6:5.2f}µs/event)"
+    )
+
+
+if __name__ == "__main__":
+    main()
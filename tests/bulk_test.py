@@ -0,0 +1,70 @@
+import threading
+import time
+
+from hirundo import GitRepo, HirundoClient, QADataset, StorageConfig
+from tests.local_server import LocalServer, json_response, use_local_server
+
+MISSING_ID = "404"
+
+
+class _ConcurrencyTracker:
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def route(self, request):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.05)
+        with self.lock:
+            self.active -= 1
+        if request.path.endswith(f"/{MISSING_ID}"):
+            return json_response({"detail": "Not found"}, status=404)
+        return json_response({})
+
+
+def test_bulk_operations_report_each_id(monkeypatch):
+    tracker = _ConcurrencyTracker()
+    routes = {
+        ("DELETE", "/dataset-qa/dataset/"): tracker.route,
+        ("DELETE", "/dataset-qa/run/"): tracker.route,
+        ("PATCH", "/dataset-qa/run/archive/"): tracker.route,
+        ("DELETE", "/storage-config/"): tracker.route,
+        ("DELETE", "/git-repo/"): tracker.route,
+    }
+    with LocalServer(routes) as server:
+        use_local_server(monkeypatch, server)
+        report = QADataset.delete_many([1, 2, int(MISSING_ID), 3, 2], max_concurrency=2)
+        assert [result.id for result in report.results] == [1, 2, 404, 3]
+        assert report.succeeded == [1, 2, 3]
+        assert [(result.id, result.status_code) for result in report.failed] == [
+            (404, 404)
+        ]
+        assert tracker.max_active == 2
+
+        assert QADataset.archive_runs(["run-1", MISSING_ID]).succeeded == ["run-1"]
+        assert QADataset.cancel_runs(["run-1"]).succeeded == ["run-1"]
+        assert StorageConfig.delete_many([1, 2]).succeeded == [1, 2]
+        assert GitRepo.delete_many([]).results == []
+    paths = {(request.method, request.path) for request in server.requests}
+    assert ("PATCH", "/dataset-qa/run/archive/run-1") in paths
+    assert ("DELETE", "/dataset-qa/run/run-1") in paths
+    assert ("DELETE", "/storage-config/2") in paths
+
+
+def test_rate_limit_is_shared_by_all_threads():
+    routes = {("DELETE", "/git-repo/"): lambda _request: json_response({})}
+    with LocalServer(routes) as server:
+        client = HirundoClient(
+            api_host=server.url,
+            api_key="test-api-key",
+            max_requests_per_second=20,
+            request_burst=1,
+        )
+        started_at = time.monotonic()
+        report = GitRepo.delete_many(range(7), max_concurrency=7, client=client)
+        elapsed = time.monotonic() - started_at
+    assert len(report.succeeded) == 7
+    assert elapsed >= 6 / 20
@@ -0,0 +1,188 @@
+import datetime
+
+from hirundo.cleanup import Cleanup
+from hirundo.cli import app
+from tests.local_server import (
+    LocalServer,
+    dataset_out,
+    json_response,
+    storage_config_out,
+    use_local_server,
+)
+from typer.testing import CliRunner
+
+NOW = datetime.datetime.now(datetime.timezone.utc)
+OLD = (NOW - datetime.timedelta(days=30)).isoformat()
+RECENT = NOW.isoformat()
+FAILING_RUN_ID = "run-stuck"
+
+
+def _git_repo(i: int, name: str, updated_at: str) -> dict:
+    return {
+        "id": i,
+        "name": name,
+        "repository_url": f"https://github.com/hirundo-io/repo-{i}.git",
+        "created_at": updated_at,
+        "updated_at": updated_at,
+    }
+
+
+GIT_REPOS = [
+    _git_repo(1, "TEST-repo-1", OLD),
+    _git_repo(2, "TEST-orphan-old", OLD),
+    _git_repo(3, "TEST-orphan-recent", RECENT),
+]
+STORAGE_CONFIGS = [
+    storage_config_out(
+        1, "TEST-storage-1", git={"repo": GIT_REPOS[0], "branch": "main"}
+    ),
+    storage_config_out(2, "TEST-storage-shared"),
+    storage_config_out(5, "TEST-storage-5"),
+    storage_config_out(6, "TEST-storage-orphan"),
+]
+
+
+def _dataset(i: int, name: str, storage_config: dict) -> dict:
+    return dataset_out(i, name, storage_config, created_at=OLD, updated_at=OLD)
+
+
+DATASETS = [
+    _dataset(1, "TEST-dataset-1", STORAGE_CONFIGS[0]),
+    _dataset(2, "TEST-dataset-2", STORAGE_CONFIGS[1]),
+    _dataset(3, "PROD-dataset-3", STORAGE_CONFIGS[1]),
+    _dataset(4, "TEST-dataset-4-active", STORAGE_CONFIGS[1]),
+    _dataset(5, "TEST-dataset-5", STORAGE_CONFIGS[2]),
+    _dataset(6, "TEST-dataset-6-without-runs", STORAGE_CONFIGS[1]),
+]
+
+
+def _run(run_id: str, dataset_id: int, created_at: str) -> dict:
+    return {
+        "id": len(run_id),
+        "name": f"dataset-{dataset_id}",
+        "dataset_id": dataset_id,
+        "run_id": run_id,
+        "status": "SUCCESS",
+        "approved": True,
+        "created_at": created_at,
+        "run_args": None,
+    }
+
+
+RUNS = [
+    _run("run-a", 1, OLD),
+    _run("run-b", 1, OLD),
+    _run("run-c", 2, OLD),
+    _run("run-d", 4, RECENT),
+    _run(FAILING_RUN_ID, 5, OLD),
+]
+
+
+def _server() -> LocalServer:
+    def archive(request):
+        if request.path.endswith(FAILING_RUN_ID):
+            return json_response({"detail": "Run is still running"}, status=409)
+        return json_response({})
+
+    return LocalServer(
+        {
+            ("GET", "/dataset-qa/run/list"): lambda _: json_response(RUNS),
+            ("GET", "/dataset-qa/dataset/"): lambda _: json_response(DATASETS),
+            ("GET", "/storage-config/"): lambda _: json_response(STORAGE_CONFIGS),
+            ("GET", "/git-repo/"): lambda _: json_response(GIT_REPOS),
+            ("PATCH", "/dataset-qa/run/archive/"): archive,
+            ("DELETE", "/dataset-qa/dataset/"): lambda _: json_response({}),
+            ("DELETE", "/storage-config/"): lambda _: json_response({}),
+            ("DELETE", "/git-repo/"): lambda _: json_response({}),
+        }
+    )
+
+
+def test_cleanup_plan_respects_expiry_and_shared_resources(monkeypatch):
+    with _server() as server:
+        use_local_server(monkeypatch, server)
+        report = Cleanup(
+            name_prefix="TEST-", older_than=datetime.timedelta(days=7)
+        ).run(dry_run=True)
+    plan = report.plan
+    assert plan.run_ids == ["run-a", "run-b", "run-c", FAILING_RUN_ID]
+    assert plan.dataset_ids == [1, 2, 5]
+    assert plan.storage_config_ids == [1, 5]
+    assert plan.git_repo_ids == [1]
+    assert report.reports == []
+    assert {request.method for request in server.requests} == {"GET"}
+
+
+def test_cleanup_keeps_datasets_without_runs_unless_included(monkeypatch):
+    with _server() as server:
+        use_local_server(monkeypatch, server)
+        kept = Cleanup(name_prefix="TEST-").plan()
+        included = Cleanup(name_prefix="TEST-", include_without_runs=True).plan()
+    assert 6 not in kept.dataset_ids
+    assert 6 in included.dataset_ids
+
+
+def test_cleanup_only_deletes_orphans_when_included(monkeypatch):
+    with _server() as server:
+        use_local_server(monkeypatch, server)
+        default = Cleanup(name_prefix="TEST-").plan()
+        orphans = Cleanup(name_prefix="TEST-", include_orphans=True).plan()
+        expired_orphans = Cleanup(
+            name_prefix="TEST-",
+            older_than=datetime.timedelta(days=7),
+            include_orphans=True,
+        ).plan()
+    assert (default.storage_config_ids, default.git_repo_ids) == ([1, 5], [1])
+    assert (orphans.storage_config_ids, orphans.git_repo_ids) == ([1, 5, 6], [1, 2, 3])
+    assert (expired_orphans.storage_config_ids, expired_orphans.git_repo_ids) == (
+        [1, 5],
+        [1, 2],
+    )
+
+
+def test_cleanup_deletes_levels_in_dependency_order(monkeypatch):
+    with _server() as server:
+        use_local_server(monkeypatch, server)
+        report = Cleanup(
+            name_prefix="TEST-", older_than=datetime.timedelta(days=7)
+        ).run()
+    assert [level.operation for level in report.reports] == [
+        "archive-runs",
+        "delete-datasets",
+        "delete-storage-configs",
+        "delete-git-repos",
+    ]
+    assert [
+        (level.operation, result.id)
+        for level in report.reports
+        for result in level.failed
+    ] == [
+        ("archive-runs", FAILING_RUN_ID),
+        ("delete-datasets", 5),
+        ("delete-storage-configs", 5),
+    ]
+    deletes = [
+        (request.method, request.path)
+        for request in server.requests
+        if request.method != "GET"
+    ]
+    assert ("DELETE", "/dataset-qa/dataset/5") not in deletes
+    assert ("DELETE", "/storage-config/5") not in deletes
+    assert ("DELETE", "/storage-config/2") not in deletes
+    levels = [path.split("/")[1] for _, path in deletes]
+    assert levels == sorted(
+        levels,
+        key=["dataset-qa", "storage-config", "git-repo"].index,
+    )
+    archives = [path for method, path in deletes if method == "PATCH"]
+    assert deletes.index(("DELETE", "/dataset-qa/dataset/1")) >= len(archives)
+
+
+def test_cleanup_command_dry_run(monkeypatch):
+    with _server() as server:
+        use_local_server(monkeypatch, server)
+        result = CliRunner().invoke(
+            app, ["cleanup", "--name-prefix", "TEST-", "--dry-run"]
+        )
+    assert result.exit_code == 0, result.output
+    assert {request.method for request in server.requests} == {"GET"}
@@ -0,0 +1,36 @@
+from hirundo import GitRepo, HirundoClient
+from tests.local_server import LocalServer, json_response
+
+GIT_REPO = {
+    "id": 3,
+    "name": "repo",
+    "repository_url": "https://github.com/Hirundo-io/test-dataset.git",
+    "created_at": "2025-01-01T00:00:00Z",
+    "updated_at": "2025-01-01T00:00:00Z",
+}
+
+
+def test_clients_are_isolated():
+    routes = {("GET", "/git-repo/"): lambda _: json_response(GIT_REPO)}
+    with LocalServer(routes) as first_server, LocalServer(routes) as second_server:
+        first = HirundoClient(api_host=first_server.url, api_key="first-key")
+        second = HirundoClient(api_host=second_server.url + "/", api_key="second-key")
+        GitRepo.get_by_id(3, client=first)
+        GitRepo.get_by_id(3, client=second)
+    assert [r.headers["Authorization"] for r in first_server.requests] == [
+        "Bearer first-key"
+    ]
+    assert [r.headers["Authorization"] for r in second_server.requests] == [
+        "Bearer second-key"
+    ]
+    assert second_server.requests[0].path == "/git-repo/3"
+
+
+def test_client_requires_api_key():
+    client = HirundoClient(api_host="http://127.0.0.1:1", api_key="")
+    try:
+        client.headers()
+    except ValueError as error:
+        assert "API_KEY is not set" in str(error)
+    else:
+        raise AssertionError("Expected a ValueError")
@@ -0,0 +1,117 @@
+import tracemalloc
+
+import polars as pl
+from hirundo import QADataset
+from hirundo.compact import (
+    datasets_table,
+    iter_compact_datasets,
+    iter_compact_runs,
+    runs_table,
+)
+from hirundo.dataset_qa import DataQARunOut, QADatasetOut
+from tests.local_server import (
+    LocalServer,
+    dataset_out,
+    json_response,
+    storage_config_out,
+    use_local_server,
+)
+
+
+def _dataset(i: int) -> dict:
+    return dataset_out(
+        i,
+        storage_config=storage_config_out(
+            i % 2,
+            f"bucket-{i % 2}",
+            s3={"bucket_url": f"s3://bucket-{i % 2}", "region_name": "us-east-1"},
+        ),
+        data_root_url=f"s3://bucket-{i % 2}/data-{i}",
+        classes=["cat", "dog"],
+        updated_at="2025-01-02T00:00:00Z",
+    )
+
+
+def _run(i: int) -> dict:
+    return {
+        "id": i,
+        "name": f"dataset-{i % 3}",
+        "dataset_id": i % 3,
+        "run_id": f"run-{i}",
+        "status": "SUCCESS" if i % 2 else "FAILURE",
+        "approved": True,
+        "created_at": f"2025-01-{1 + i % 28:02d}T00:00:00Z",
+        "run_args": {"upsample": True} if i % 2 else None,
+    }
+
+
+DATASETS = [_dataset(i) for i in range(2000)]
+RUNS = [_run(i) for i in range(10)]
+
+
+def _server() -> LocalServer:
+    return LocalServer(
+        {
+            ("GET", "/dataset-qa/dataset/"): lambda _: json_response(DATASETS),
+            ("GET", "/dataset-qa/run/list"): lambda _: json_response(RUNS),
+        }
+    )
+
+
+def _allocated(make) -> tuple[int, object]:
+    tracemalloc.start()
+    try:
+        result = make()
+        return tracemalloc.get_traced_memory()[0], result
+    finally:
+        tracemalloc.stop()
+
+
+def test_compact_datasets_share_nested_objects(monkeypatch):
+    with _server() as server:
+        use_local_server(monkeypatch, server)
+        compact_size, datasets = _allocated(lambda: list(iter_compact_datasets()))
+        full_size, full = _allocated(lambda: list(QADataset.iter_datasets()))
+
+    assert datasets[0].storage_config is datasets[2].storage_config
+    assert datasets[0].storage_config is not datasets[1].storage_config
+    assert datasets[0].classes is datasets[1].classes
+    assert datasets[0].to_model() == QADatasetOut.model_validate(DATASETS[0])
+    assert datasets[0].to_model() == full[0]
+    assert compact_size < full_size / 2
+
+    table = datasets_table(datasets)
+    assert table.height == len(DATASETS)
+    assert table.schema["storage_config_name"] == pl.Categorical
+    assert table["storage_config_id"].unique().sort().to_list() == [0, 1]
+
+
+def test_materialized_datasets_do_not_share_nested_objects(monkeypatch):
+    with _server() as server:
+        use_local_server(monkeypatch, server)
+        datasets = list(iter_compact_datasets())
+
+    first, other = datasets[0].to_model(), datasets[2].to_model()
+    first.storage_config.name = "renamed"
+    assert other.storage_config.name == DATASETS[2]["storage_config"]["name"]
+    assert datasets[0].storage_config.name == DATASETS[0]["storage_config"]["name"]
+    assert first.labeling_info is not other.labeling_info
+
+
+def test_compact_runs_materialize_on_demand(monkeypatch):
+    with _server() as server:
+        use_local_server(monkeypatch, server)
+        runs = list(iter_compact_runs(page_size=4))
+
+    assert [run.run_id for run in runs] == [run["run_id"] for run in RUNS]
+    assert [run.to_model() for run in runs] == [
+        DataQARunOut.model_validate(run) for run in RUNS
+    ]
+    table = runs_table(runs)
+    assert table.filter(pl.col("status") == "SUCCESS")["run_id"].to_list() == [
+        "run-1",
+        "run-3",
+        "run-5",
+        "run-7",
+        "run-9",
+    ]
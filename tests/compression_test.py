@@ -0,0 +1,52 @@
+import gzip
+import json
+
+from hirundo import GitRepo, HirundoClient
+from tests.local_server import LocalServer, json_response
+
+GIT_REPO = {
+    "id": 3,
+    "name": "repo",
+    "repository_url": "https://github.com/Hirundo-io/test-dataset.git",
+    "created_at": "2025-01-01T00:00:00Z",
+    "updated_at": "2025-01-01T00:00:00Z",
+}
+
+
+def _create_route(request):
+    body = request.body
+    if request.headers.get("Content-Encoding") == "gzip":
+        body = gzip.decompress(body)
+    return json_response({"id": len(json.loads(body)["name"])})
+
+
+def test_large_request_bodies_are_gzipped():
+    with LocalServer({("POST", "/git-repo/"): _create_route}) as server:
+        client = HirundoClient(
+            api_host=server.url, api_key="test-api-key", compress_requests_above=256
+        )
+        repository_url = "https://github.com/Hirundo-io/test-dataset.git"
+        GitRepo(name="small", repository_url=repository_url).create(client=client)
+        large_id = GitRepo(name="x" * 1000, repository_url=repository_url).create(
+            client=client
+        )
+    small_request, large_request = server.requests
+    assert "Content-Encoding" not in small_request.headers
+    assert large_request.headers["Content-Encoding"] == "gzip"
+    assert large_request.headers["Content-Type"] == "application/json"
+    assert len(large_request.body) < 1000
+    assert large_id == 1000
+
+
+def test_compressed_responses_are_decoded():
+    def route(request):
+        status, headers, body = json_response([GIT_REPO] * 100)
+        if "gzip" in request.headers.get("Accept-Encoding", ""):
+            return status, {**headers, "Content-Encoding": "gzip"}, gzip.compress(body)
+        return status, headers, body
+
+    with LocalServer({("GET", "/git-repo/"): route}) as server:
+        client = HirundoClient(api_host=server.url, api_key="test-api-key")
+        git_repos = GitRepo.list(client=client)
+    assert len(git_repos) == 100
+    assert "gzip" in server.requests[0].headers["Accept-Encoding"]
@@ -10,6 +10,7 @@ from hirundo import (
     RunArgs,
     StorageConfig,
 )
+from hirundo.cleanup import Cleanup
 from hirundo.dataset_qa import RunStatus
 from hirundo.logger import get_logger
 
@@ -25,56 +26,13 @@ def get_unique_id():
 def cleanup_conflict_by_unique_id(unique_id: typing.Optional[str]):
     if not unique_id:
         return
-    runs = QADataset.list_runs()
-    conflicting_run_ids = [run.run_id for run in runs if unique_id in run.name]
-    datasets = QADataset.list_datasets()
-    conflicting_dataset_ids = [
-        dataset.id for dataset in datasets if unique_id in dataset.name
-    ]
-    conflicting_git_repo_ids = [
-        git_repo.id for git_repo in GitRepo.list() if unique_id in git_repo.name
-    ]
-    conflicting_storage_config_ids = [
-        storage_config.id
-        for storage_config in StorageConfig.list()
-        if unique_id in storage_config.name and storage_config.id is not None
-    ]
-    for conflicting_run_id in conflicting_run_ids:
-        try:
-            QADataset.archive_run_by_id(conflicting_run_id)
-        except Exception as e:
-            logger.warning(
-                "Failed to archive run with ID %s and exception %s",
-                conflicting_run_id,
-                e,
-            )
-    for conflicting_dataset_id in conflicting_dataset_ids:
-        try:
-            QADataset.delete_by_id(conflicting_dataset_id)
-        except Exception as e:
-            logger.warning(
-                "Failed to delete dataset with ID %s and exception %s",
-                conflicting_dataset_id,
-                e,
-            )
-    for conflicting_storage_config_id in conflicting_storage_config_ids:
-        try:
-            StorageConfig.delete_by_id(conflicting_storage_config_id)
-        except Exception as e:
-            logger.warning(
-                "Failed to delete storage config with ID %s and exception %s",
-                conflicting_storage_config_id,
-                e,
-            )
-    for conflicting_git_repo_id in conflicting_git_repo_ids:
-        try:
-            GitRepo.delete_by_id(conflicting_git_repo_id)
-        except Exception as e:
-            logger.warning(
-                "Failed to delete git repo with ID %s and exception %s",
-                conflicting_git_repo_id,
-                e,
-            )
+    report = Cleanup(
+        name_contains=unique_id, include_without_runs=True, include_orphans=True
+    ).run()
+    for result in report.failed:
+        logger.warning(
+            "Failed to clean up ID %s and exception %s", result.id, result.error
+        )
 
 
 @contextmanager
@@ -201,15 +159,16 @@ async def dataset_qa_async_test(
         logger.info("Async: Started dataset QA run with run ID %s", run_id)
         events_generator = test_dataset.acheck_run()
         logger.info("Async: Checking run progress")
-        last_event = {}
+        last_event = None
         async for last_event in events_generator:
             assert last_event is not None
             logger.info("Async: Run event %s", last_event)
-            if last_event["state"] == RunStatus.AWAITING_MANUAL_APPROVAL:
+            if last_event.state == RunStatus.AWAITING_MANUAL_APPROVAL:
                 # Currently we require manual approval
                 break
-        logger.info("Async: Results %s", last_event["result"])
-        return last_event["result"]
+        assert last_event is not None
+        logger.info("Async: Results %s", last_event.result_url)
+        return last_event.result_url
     else:
         test_dataset.create(replace_if_exists=True)
         logger.info("Async: Created dataset %s", test_dataset.name)
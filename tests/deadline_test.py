@@ -0,0 +1,188 @@
+import asyncio
+import json
+import time
+
+import pytest
+from hirundo import NullProgressSink, QADataset, RunTimeoutError, RunWatcher, WatchMode
+from hirundo._deadline import Deadline
+from hirundo._iter_sse_retrying import aiter_sse_retrying
+from hirundo.unzip import download_and_extract_zip
+from tests.local_server import LocalServer, json_response, use_local_server
+
+RUN_ID = "run-1"
+TIMEOUT = 0.5
+
+
+def _slow_run_route(_request):
+    def events():
+        yield f"event: message\nid: 1\ndata: {json.dumps({'data': {'state': 'STARTED'}})}\n\n".encode()
+        for _ in range(20):
+            time.sleep(0.1)
+            yield b"event: ping\ndata: \n\n"
+
+    return 200, {"Content-Type": "text/event-stream"}, events()
+
+
+def _slow_zip_route(_request):
+    def chunks():
+        for _ in range(20):
+            time.sleep(0.1)
+            yield b"\0" * 1024
+
+    return 200, {"Content-Type": "application/zip"}, chunks()
+
+
+def _trickling_zip_route(_request):
+    def chunks():
+        for _ in range(60):
+            time.sleep(0.05)
+            yield b"\0"
+
+    return 200, {"Content-Type": "application/zip"}, chunks()
+
+
+def _stalled_run_route(_request):
+    def events():
+        time.sleep(3)
+        yield b"event: ping\ndata: \n\n"
+
+    return 200, {"Content-Type": "text/event-stream"}, events()
+
+
+def _routes():
+    return {
+        ("GET", "/dataset-qa/run/"): _slow_run_route,
+        ("DELETE", "/dataset-qa/run/"): lambda _request: json_response({}),
+    }
+
+
+def _cancelled_run_ids(server: LocalServer) -> list[str]:
+    return [
+        request.path.rsplit("/", 1)[-1]
+        for request in server.requests
+        if request.method == "DELETE"
+    ]
+
+
+def test_check_run_by_id_times_out_and_cancels(monkeypatch):
+    with LocalServer(_routes()) as server:
+        use_local_server(monkeypatch, server)
+        started_at = time.monotonic()
+        with pytest.raises(RunTimeoutError) as error:
+            QADataset.check_run_by_id(
+                RUN_ID,
+                progress=NullProgressSink(),
+                timeout=TIMEOUT,
+                cancel_on_timeout=True,
+            )
+        assert time.monotonic() - started_at < TIMEOUT + 1
+        assert error.value.run_ids == [RUN_ID]
+        assert _cancelled_run_ids(server) == [RUN_ID]
+
+
+def test_check_run_by_id_times_out_without_cancelling(monkeypatch):
+    with LocalServer(_routes()) as server:
+        use_local_server(monkeypatch, server)
+        with pytest.raises(TimeoutError):
+            QADataset.check_run_by_id(
+                RUN_ID, progress=NullProgressSink(), timeout=TIMEOUT
+            )
+        assert _cancelled_run_ids(server) == []
+
+
+def test_partial_download_is_removed(monkeypatch, tmp_path):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    with LocalServer({("GET", "/results.zip"): _slow_zip_route}) as server:
+        client = use_local_server(monkeypatch, server)
+        with pytest.raises(TimeoutError):
+            download_and_extract_zip(
+                RUN_ID,
+                f"{server.url}/results.zip",
+                client=client,
+                deadline=Deadline(TIMEOUT),
+            )
+    assert not list((tmp_path / ".hirundo" / "cache").iterdir())
+
+
+def test_trickling_download_stops_at_the_deadline(monkeypatch, tmp_path):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    with LocalServer({("GET", "/results.zip"): _trickling_zip_route}) as server:
+        client = use_local_server(monkeypatch, server)
+        started_at = time.monotonic()
+        with pytest.raises(TimeoutError):
+            download_and_extract_zip(
+                RUN_ID,
+                f"{server.url}/results.zip",
+                client=client,
+                deadline=Deadline(TIMEOUT),
+            )
+        assert time.monotonic() - started_at < TIMEOUT + 1
+
+
+def test_async_reconnects_stop_at_the_deadline(monkeypatch):
+    async def read(client):
+        async with client.async_sse_client() as sse_client:
+            events = await aiter_sse_retrying(
+                sse_client,
+                "GET",
+                client.url(f"/dataset-qa/run/{RUN_ID}"),
+                headers=client.headers(),
+                deadline=Deadline(TIMEOUT),
+            )
+            return [sse async for sse in events]
+
+    with LocalServer({("GET", "/dataset-qa/run/"): _stalled_run_route}) as server:
+        client = use_local_server(monkeypatch, server)
+        started_at = time.monotonic()
+        with pytest.raises(TimeoutError):
+            asyncio.run(read(client))
+        assert time.monotonic() - started_at < TIMEOUT + 1
+
+
+def test_acheck_run_by_id_times_out_and_cancels(monkeypatch):
+    async def watch():
+        return [
+            event
+            async for event in QADataset.acheck_run_by_id(
+                RUN_ID, timeout=TIMEOUT, cancel_on_timeout=True
+            )
+        ]
+
+    with LocalServer(_routes()) as server:
+        use_local_server(monkeypatch, server)
+        with pytest.raises(RunTimeoutError):
+            asyncio.run(watch())
+        assert _cancelled_run_ids(server) == [RUN_ID]
+
+
+@pytest.mark.parametrize("mode", [WatchMode.SSE, WatchMode.POLL])
+def test_watcher_times_out_and_cancels_unfinished_runs(monkeypatch, mode):
+    routes = {
+        **_routes(),
+        ("GET", "/dataset-qa/run/list"): lambda _request: json_response([]),
+    }
+    with LocalServer(routes) as server:
+        use_local_server(monkeypatch, server)
+        watcher = RunWatcher(
+            ["run-0", "run-1"],
+            mode=mode,
+            min_poll_interval=0.1,
+            timeout=TIMEOUT,
+            cancel_on_timeout=True,
+        )
+        with pytest.raises(RunTimeoutError) as error:
+            list(watcher.watch())
+        assert sorted(error.value.run_ids) == ["run-0", "run-1"]
+        assert sorted(_cancelled_run_ids(server)) == ["run-0", "run-1"]
+
+
+def test_awatch_times_out(monkeypatch):
+    async def watch(watcher: RunWatcher):
+        return [change async for change in watcher.awatch()]
+
+    with LocalServer(_routes()) as server:
+        use_local_server(monkeypatch, server)
+        watcher = RunWatcher([RUN_ID], mode=WatchMode.SSE, timeout=TIMEOUT)
+        with pytest.raises(RunTimeoutError):
+            asyncio.run(watch(watcher))
+    assert watcher.statuses[RUN_ID] is not None
@@ -0,0 +1,118 @@
+import json
+
+import pytest
+from hirundo import QADataset, StorageConfig
+from hirundo.fingerprints import FingerprintStore
+from tests.local_server import LocalServer, json_response, use_local_server
+
+STORAGE_CONFIG_OUT = {
+    "id": 7,
+    "name": "bucket",
+    "type": "S3",
+    "organization_name": "org",
+    "creator_name": "creator",
+    "s3": {"bucket_url": "s3://my-bucket", "region_name": "us-east-1"},
+    "gcp": None,
+    "git": None,
+}
+
+
+def _storage_config(region_name: str = "us-east-1") -> StorageConfig:
+    return StorageConfig(
+        name="bucket",
+        type="S3",
+        s3={"bucket_url": "s3://my-bucket", "region_name": region_name},
+    )
+
+
+def _dataset(storage_config: StorageConfig) -> QADataset:
+    return QADataset(
+        name="dataset",
+        labeling_type="SingleLabelClassification",
+        storage_config=storage_config,
+        data_root_url="s3://my-bucket/images",
+        labeling_info={"type": "HirundoCSV", "csv_url": "s3://my-bucket/a.csv"},
+    )
+
+
+@pytest.fixture
+def server():
+    state = {"storage_config": dict(STORAGE_CONFIG_OUT), "dataset": None}
+
+    def create_dataset(request):
+        state["dataset"] = {**json.loads(request.body), "id": 3}
+        return json_response({"id": 3})
+
+    with LocalServer(
+        {
+            ("POST", "/storage-config/"): lambda _: json_response({"id": 7}),
+            ("GET", "/storage-config/by-name/"): lambda _: json_response(
+                state["storage_config"]
+            ),
+            ("POST", "/dataset-qa/dataset/"): create_dataset,
+            ("GET", "/dataset-qa/dataset/by-name/"): lambda _: json_response(
+                state["dataset"]
+            ),
+            ("DELETE", "/storage-config/"): lambda _: json_response({}),
+            ("DELETE", "/dataset-qa/dataset/"): lambda _: json_response({}),
+        }
+    ) as server:
+        server.state = state
+        yield server
+
+
+def _writes(server: LocalServer) -> list[str]:
+    return [request.path for request in server.requests if request.method == "POST"]
+
+
+def test_unchanged_replacement_is_skipped(monkeypatch, server, tmp_path):
+    use_local_server(monkeypatch, server)
+    fingerprints = FingerprintStore(tmp_path / "fingerprints.sqlite3")
+
+    for _ in range(3):
+        assert (
+            _dataset(_storage_config()).create(
+                replace_if_exists=True, fingerprints=fingerprints
+            )
+            == 3
+        )
+    assert _writes(server) == ["/storage-config/", "/dataset-qa/dataset/"]
+
+    assert (
+        _storage_config("eu-west-1").create(
+            replace_if_exists=True, fingerprints=fingerprints
+        )
+        == 7
+    )
+    assert _writes(server)[-1] == "/storage-config/"
+
+
+def test_skipped_dataset_can_be_deleted(monkeypatch, server, tmp_path):
+    use_local_server(monkeypatch, server)
+    fingerprints = FingerprintStore(tmp_path / "fingerprints.sqlite3")
+    _dataset(_storage_config()).create(
+        replace_if_exists=True, fingerprints=fingerprints
+    )
+
+    dataset = _dataset(_storage_config())
+    dataset.create(replace_if_exists=True, fingerprints=fingerprints)
+    assert _writes(server) == ["/storage-config/", "/dataset-qa/dataset/"]
+    assert (dataset.id, dataset.storage_config_id) == (3, 7)
+
+    dataset.delete()
+    assert [
+        request.path for request in server.requests if request.method == "DELETE"
+    ] == ["/storage-config/7", "/dataset-qa/dataset/3"]
+
+
+def test_server_side_changes_are_not_skipped(monkeypatch, server, tmp_path):
+    use_local_server(monkeypatch, server)
+    fingerprints = FingerprintStore(tmp_path / "fingerprints.sqlite3")
+
+    _storage_config().create(replace_if_exists=True, fingerprints=fingerprints)
+    server.state["storage_config"]["creator_name"] = "someone-else"
+    _storage_config().create(replace_if_exists=True, fingerprints=fingerprints)
+    _storage_config().create(fingerprints=fingerprints)
+    # ⬆️ Creations that do not replace are never skipped
+
+    assert _writes(server) == ["/storage-config/"] * 3
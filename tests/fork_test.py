@@ -0,0 +1,73 @@
+import multiprocessing
+import os
+
+import pytest
+from hirundo import HirundoClient, RunCheckpointStore, RunEvent
+from hirundo.dataset_qa import RunStatus
+from tests.local_server import LocalServer, json_response
+
+pytestmark = [
+    pytest.mark.skipif(
+        not hasattr(os, "register_at_fork"), reason="Processes cannot be forked"
+    ),
+    # ⬇️ Polars warns about forking once its thread pool started, which does not affect these tests
+    pytest.mark.filterwarnings("ignore::RuntimeWarning"),
+]
+
+
+def _in_forked_child(target, *args):
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+    process = context.Process(target=target, args=(results, *args))
+    process.start()
+    process.join(timeout=30)
+    assert process.exitcode == 0
+    return results.get(timeout=1)
+
+
+def _use_client(results, client: HirundoClient, parent_session_id: int):
+    response = client.get("/ping")
+    results.put(
+        (
+            id(client.session) != parent_session_id,
+            response.json(),
+            client.session.headers["X-Custom"],
+        )
+    )
+
+
+def test_forked_child_gets_its_own_connection_pool():
+    routes = {("GET", "/ping"): lambda _request: json_response({"pong": True})}
+    with LocalServer(routes) as server:
+        client = HirundoClient(api_host=server.url, api_key="test-api-key")
+        client.session.headers["X-Custom"] = "kept"
+        assert client.get("/ping").json() == {"pong": True}
+        # ⬆️ Leaves a pooled connection for the child to inherit
+        new_session, payload, header = _in_forked_child(
+            _use_client, client, id(client.session)
+        )
+    assert new_session
+    assert payload == {"pong": True}
+    assert header == "kept"
+
+
+def test_pid_change_rebuilds_the_session(monkeypatch):
+    client = HirundoClient(api_host="http://localhost", api_key="test-api-key")
+    session = client.session
+    executor = client.executor
+    monkeypatch.setattr(client, "_pid", -1)
+    assert client.session is not session
+    assert client.executor is not executor
+
+
+def _record_checkpoint(results, store: RunCheckpointStore):
+    store.record("child-run", "1", RunEvent(state=RunStatus.STARTED))
+    results.put(store.get("parent-run").last_event_id)
+
+
+def test_forked_child_reopens_checkpoint_store(tmp_path):
+    store = RunCheckpointStore(tmp_path / "checkpoints.sqlite3")
+    store.record("parent-run", "7", RunEvent(state=RunStatus.STARTED))
+    assert _in_forked_child(_record_checkpoint, store) == "7"
+    assert store.get("child-run").state == RunStatus.STARTED
+    store.close()
@@ -0,0 +1,110 @@
+import threading
+import time
+
+import pytest
+from hirundo import HedgingPolicy, HirundoClient
+from hirundo._http import _endpoint_key, _LatencyTracker, _RetryBudget
+from tests.local_server import LocalServer, json_response
+
+
+def _slow_first_route():
+    calls = []
+    lock = threading.Lock()
+
+    def route(_request):
+        with lock:
+            calls.append(time.monotonic())
+            call_number = len(calls)
+        if call_number == 1:
+            time.sleep(1.0)
+        return json_response({"call": call_number})
+
+    return route, calls
+
+
+def test_endpoint_key_groups_ids():
+    assert (
+        _endpoint_key("get", "https://api.hirundo.io/dataset-qa/dataset/12?x=1")
+        == "GET /dataset-qa/dataset/{id}"
+    )
+    assert (
+        _endpoint_key("GET", "http://host/dataset-qa/run/3f2b9c0e5d6a4b7c8d9e0f1a2b3c")
+        == "GET /dataset-qa/run/{id}"
+    )
+
+
+def test_latency_tracker_percentile():
+    tracker = _LatencyTracker()
+    for latency in range(1, 101):
+        tracker.record("GET /x", latency / 100)
+    assert tracker.percentile("GET /x", 95.0) == pytest.approx(0.95)
+    assert tracker.percentile("GET /x", 50.0, min_samples=200) is None
+    assert tracker.percentile("GET /y", 50.0) is None
+
+
+def test_retry_budget_caps_extra_load():
+    budget = _RetryBudget(ratio=0.5, burst=1.0)
+    assert budget.try_spend()
+    assert not budget.try_spend()
+    budget.deposit()
+    assert not budget.try_spend()
+    budget.deposit()
+    assert budget.try_spend()
+
+
+def test_hedged_request_returns_faster_response():
+    route, calls = _slow_first_route()
+    with LocalServer({("GET", "/slow"): route}) as server:
+        client = HirundoClient(
+            api_host=server.url,
+            api_key="test-api-key",
+            hedging=HedgingPolicy(initial_delay=0.1, min_delay=0.05),
+        )
+        start = time.monotonic()
+        response = client.get("/slow", timeout=5)
+        elapsed = time.monotonic() - start
+    assert response.json() == {"call": 2}
+    assert len(calls) == 2
+    assert elapsed < 0.9
+
+
+def test_hedging_respects_budget():
+    route, calls = _slow_first_route()
+    with LocalServer({("GET", "/slow"): route}) as server:
+        client = HirundoClient(
+            api_host=server.url,
+            api_key="test-api-key",
+            hedging=HedgingPolicy(initial_delay=0.1, min_delay=0.05, budget_burst=0.0),
+        )
+        response = client.get("/slow", timeout=5)
+    assert response.json() == {"call": 1}
+    assert len(calls) == 1
+
+
+def test_streaming_requests_are_not_hedged():
+    route, calls = _slow_first_route()
+    with LocalServer({("GET", "/slow"): route}) as server:
+        client = HirundoClient(
+            api_host=server.url,
+            api_key="test-api-key",
+            hedging=HedgingPolicy(initial_delay=0.1, min_delay=0.05),
+        )
+        with client.get("/slow", timeout=5, stream=True) as response:
+            assert response.json() == {"call": 1}
+    assert len(calls) == 1
+
+
+def test_hedged_requests_are_rate_limited():
+    route, calls = _slow_first_route()
+    with LocalServer({("GET", "/slow"): route}) as server:
+        client = HirundoClient(
+            api_host=server.url,
+            api_key="test-api-key",
+            hedging=HedgingPolicy(initial_delay=0.1, min_delay=0.05),
+            max_requests_per_second=2,
+            request_burst=1,
+        )
+        response = client.get("/slow", timeout=5)
+    assert response.json() == {"call": 2}
+    # ⬇️ The hedge waits for the rate limiter's next token instead of going out after 0.1s
+    assert calls[1] - calls[0] >= 0.4
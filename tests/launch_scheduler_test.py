@@ -0,0 +1,153 @@
+import datetime
+import threading
+import time
+
+from hirundo import LaunchPriority, LaunchScheduler, RunStateChange
+from hirundo.dataset_qa import RunStatus
+from tests.local_server import LocalServer, json_response, use_local_server
+
+
+def _launch_run(request):
+    return json_response({"run_id": f"run-{request.path.rsplit('/', 1)[-1]}"})
+
+
+def _runs_route(status: str, count: int = 3):
+    def route(_request):
+        return json_response(
+            [
+                {
+                    "id": i,
+                    "name": f"dataset-{i}",
+                    "dataset_id": i,
+                    "run_id": f"run-{i}",
+                    "status": status,
+                    "approved": status != "AWAITING MANUAL APPROVAL",
+                    "created_at": "2025-01-01T00:00:00Z",
+                    "run_args": None,
+                }
+                for i in range(1, count + 1)
+            ]
+        )
+
+    return route
+
+
+def _finished(run_id: str) -> RunStateChange:
+    return RunStateChange(
+        run_id=run_id,
+        previous_status=RunStatus.STARTED,
+        status=RunStatus.SUCCESS,
+        observed_at=datetime.datetime.now(datetime.timezone.utc),
+    )
+
+
+def test_urgent_launches_skip_the_queue_and_slots_are_per_organization(monkeypatch):
+    with LocalServer({("POST", "/dataset-qa/run/"): _launch_run}) as server:
+        use_local_server(monkeypatch, server)
+        with LaunchScheduler(max_active_runs=1, watch_runs=False) as scheduler:
+            first = scheduler.schedule(1, organization_id=7)
+            assert first.result(timeout=5) == "run-1"
+            backfills = [
+                scheduler.schedule(
+                    dataset_id, organization_id=7, priority=LaunchPriority.BACKFILL
+                )
+                for dataset_id in (2, 3)
+            ]
+            urgent = scheduler.schedule(
+                4, organization_id=7, priority=LaunchPriority.URGENT
+            )
+            other_organization = scheduler.schedule(5, organization_id=8)
+            assert other_organization.result(timeout=5) == "run-5"
+            assert scheduler.pending_launches(7) == 3
+            assert scheduler.active_runs(7) == ["run-1"]
+
+            scheduler.observe(_finished("run-1"))
+            assert urgent.result(timeout=5) == "run-4"
+            assert not any(future.done() for future in backfills)
+            scheduler.release("run-4")
+            assert backfills[0].result(timeout=5) == "run-2"
+        assert backfills[1].cancelled()
+    launched = [request.path for request in server.requests]
+    assert launched == [
+        "/dataset-qa/run/1",
+        "/dataset-qa/run/5",
+        "/dataset-qa/run/4",
+        "/dataset-qa/run/2",
+    ]
+
+
+def test_watched_runs_release_their_slots(monkeypatch):
+    routes = {
+        ("POST", "/dataset-qa/run/"): _launch_run,
+        ("GET", "/dataset-qa/run/list"): _runs_route("SUCCESS"),
+    }
+    with LocalServer(routes) as server:
+        use_local_server(monkeypatch, server)
+        with LaunchScheduler(max_active_runs=1, min_poll_interval=0.01) as scheduler:
+            futures = [scheduler.schedule(dataset_id) for dataset_id in range(1, 4)]
+            assert [future.result(timeout=10) for future in futures] == [
+                "run-1",
+                "run-2",
+                "run-3",
+            ]
+        assert scheduler._watcher is not None
+        assert not scheduler._watcher.is_alive()
+    assert all(
+        request.path == "/dataset-qa/run/list"
+        for request in server.requests
+        if request.method == "GET"
+    )
+
+
+def test_a_slow_launch_does_not_hold_up_other_organizations(monkeypatch):
+    unblock = threading.Event()
+
+    def launch_run(request):
+        if request.path.endswith("/1"):
+            unblock.wait(5)
+        return _launch_run(request)
+
+    with LocalServer({("POST", "/dataset-qa/run/"): launch_run}) as server:
+        use_local_server(monkeypatch, server)
+        with LaunchScheduler(watch_runs=False) as scheduler:
+            slow = scheduler.schedule(1, organization_id=7)
+            other_organization = scheduler.schedule(2, organization_id=8)
+            assert other_organization.result(timeout=5) == "run-2"
+            assert not slow.done()
+            unblock.set()
+            assert slow.result(timeout=5) == "run-1"
+
+
+def test_runs_missing_from_the_listing_release_their_slots(monkeypatch):
+    routes = {
+        ("POST", "/dataset-qa/run/"): _launch_run,
+        ("GET", "/dataset-qa/run/list"): _runs_route("SUCCESS", count=0),
+    }
+    with LocalServer(routes) as server:
+        use_local_server(monkeypatch, server)
+        with LaunchScheduler(max_active_runs=1, min_poll_interval=0.01) as scheduler:
+            futures = [scheduler.schedule(dataset_id) for dataset_id in (1, 2)]
+            assert [future.result(timeout=10) for future in futures] == [
+                "run-1",
+                "run-2",
+            ]
+
+
+def test_runs_awaiting_approval_release_their_slots_unless_configured(monkeypatch):
+    routes = {
+        ("POST", "/dataset-qa/run/"): _launch_run,
+        ("GET", "/dataset-qa/run/list"): _runs_route("AWAITING MANUAL APPROVAL"),
+    }
+    with LocalServer(routes) as server:
+        use_local_server(monkeypatch, server)
+        with LaunchScheduler(max_active_runs=1, min_poll_interval=0.01) as scheduler:
+            futures = [scheduler.schedule(dataset_id) for dataset_id in (1, 2)]
+            assert futures[1].result(timeout=10) == "run-2"
+        with LaunchScheduler(
+            max_active_runs=1, release_awaiting_approval=False, min_poll_interval=0.01
+        ) as scheduler:
+            futures = [scheduler.schedule(dataset_id) for dataset_id in (1, 2)]
+            assert futures[0].result(timeout=10) == "run-1"
+            time.sleep(0.2)
+            assert not futures[1].done()
+            assert scheduler.active_runs() == ["run-1"]
@@ -0,0 +1,191 @@
+import io
+import json
+import threading
+import typing
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import hirundo.client
+from hirundo import HirundoClient, HirundoCSV, LabelingType, QADataset
+
+
+class StubRequest(typing.NamedTuple):
+    method: str
+    path: str
+    query: dict[str, list[str]]
+    headers: dict[str, str]
+    body: bytes
+
+
+StubResponse = tuple[int, dict[str, str], typing.Union[bytes, typing.Iterable[bytes]]]
+Route = typing.Callable[[StubRequest], StubResponse]
+
+
+def json_response(payload: typing.Any, status: int = 200) -> StubResponse:
+    return status, {"Content-Type": "application/json"}, json.dumps(payload).encode()
+
+
+def zip_route(_request: StubRequest) -> StubResponse:
+    """
+    Serve a run's results zip with one suspect and no warnings or errors.
+    """
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as z:
+        z.writestr("suspects.csv", "image_path,suspect_level\na.png,0.5\n")
+        z.writestr("warnings_and_errors.csv", "image_path,status\n")
+    return 200, {"Content-Type": "application/zip"}, buffer.getvalue()
+
+
+def qa_dataset(name: str) -> QADataset:
+    """
+    Build a dataset to create on a local server, whose storage config already exists.
+    """
+    return QADataset(
+        name=name,
+        labeling_type=LabelingType.SINGLE_LABEL_CLASSIFICATION,
+        storage_config_id=1,
+        labeling_info=HirundoCSV(csv_url="s3://bucket/data/labels.csv"),
+        data_root_url="s3://bucket/data",
+    )
+
+
+_STORAGE_TYPES = {"s3": "S3", "gcp": "GCP", "git": "Git"}
+
+
+def storage_config_out(
+    i: int, name: typing.Optional[str] = None, **storage: typing.Any
+) -> dict:
+    """
+    Build a storage config as listed by the server.
+    The storage is given as a single `s3`, `gcp` or `git` keyword, an S3 bucket by default.
+    """
+    if not storage:
+        storage = {"s3": {"bucket_url": "s3://my-bucket", "region_name": "us-east-1"}}
+    [storage_type] = storage
+    return {
+        "id": i,
+        "name": name or f"storage-{i}",
+        "type": _STORAGE_TYPES[storage_type],
+        "organization_name": "org",
+        "creator_name": "creator",
+        "s3": None,
+        "gcp": None,
+        "git": None,
+        **storage,
+    }
+
+
+def dataset_out(
+    i: int,
+    name: typing.Optional[str] = None,
+    storage_config: typing.Optional[dict] = None,
+    data_root_url: str = "s3://my-bucket/data",
+    **fields: typing.Any,
+) -> dict:
+    """
+    Build a dataset as listed by the server, any other field can be overridden by keyword.
+    """
+    return {
+        "id": i,
+        "name": name or f"dataset-{i}",
+        "labeling_type": "SingleLabelClassification",
+        "storage_config": storage_config or storage_config_out(1, "bucket"),
+        "data_root_url": data_root_url,
+        "labeling_info": {"type": "HirundoCSV", "csv_url": f"{data_root_url}.csv"},
+        "organization_id": 1,
+        "creator_id": 1,
+        "created_at": "2025-01-01T00:00:00Z",
+        "updated_at": "2025-01-01T00:00:00Z",
+        **fields,
+    }
+
+
+class LocalServer:
+    """
+    A local stand-in for the Hirundo API server used by tests that do not need the real API.
+
+    Routes are matched by method and path prefix, the longest matching prefix wins.
+    A route may return an iterable of chunks instead of a body, to stream the response
+    (e.g. SSE) chunk by chunk until the connection is closed.
+    """
+
+    def __init__(self, routes: dict[tuple[str, str], Route]):
+        self.routes = routes
+        self.requests: list[StubRequest] = []
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _handle(self):
+                parsed = urlparse(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                request = StubRequest(
+                    method=self.command,
+                    path=parsed.path,
+                    query=parse_qs(parsed.query),
+                    headers=dict(self.headers.items()),
+                    body=self.rfile.read(length) if length else b"",
+                )
+                server.requests.append(request)
+                status, headers, body = server._dispatch(request)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                if isinstance(body, bytes):
+                    self.send_header("Content-Length", str(len(body)))
+                    chunks: typing.Iterable[bytes] = (body,)
+                else:
+                    self.send_header("Connection", "close")
+                    self.close_connection = True
+                    chunks = body
+                self.end_headers()
+                try:
+                    for chunk in chunks:
+                        self.wfile.write(chunk)
+                        self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+            do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = _handle  # noqa: N815
+
+            def log_message(self, format, *args):  # noqa: A002
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _dispatch(self, request: StubRequest) -> StubResponse:
+        candidates = [
+            (path, route)
+            for (method, path), route in self.routes.items()
+            if method == request.method and request.path.startswith(path)
+        ]
+        if not candidates:
+            return json_response({"detail": "Not found"}, status=404)
+        _, route = max(candidates, key=lambda candidate: len(candidate[0]))
+        return route(request)
+
+    def __enter__(self) -> "LocalServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+def use_local_server(monkeypatch, server: LocalServer) -> HirundoClient:
+    """
+    Make a client for the given local server (with a dummy API key) the default client.
+    """
+    client = HirundoClient(api_host=server.url, api_key="test-api-key")
+    monkeypatch.setattr(hirundo.client, "_DEFAULT_CLIENT", client)
+    return client
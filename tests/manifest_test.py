@@ -0,0 +1,303 @@
+import itertools
+import json
+import threading
+
+import pytest
+from hirundo import QADataset
+from hirundo.cli import app
+from hirundo.manifest import ChangeAction, Manifest
+from tests.local_server import (
+    LocalServer,
+    dataset_out,
+    json_response,
+    storage_config_out,
+    use_local_server,
+)
+from typer.testing import CliRunner
+
+MANIFEST = """
+git_repos:
+  labels-repo:
+    name: labels-repo
+    repository_url: https://github.com/hirundo-io/labels.git
+storage_configs:
+  bucket:
+    name: bucket
+    type: S3
+    s3:
+      bucket_url: s3://my-bucket
+      region_name: us-east-1
+  labels:
+    name: labels
+    type: Git
+    git:
+      repo: labels-repo
+      branch: main
+  labels-dev:
+    name: labels-dev
+    type: Git
+    git:
+      repo: labels-repo
+      branch: dev
+datasets:
+  - name: dataset-1
+    labeling_type: SingleLabelClassification
+    storage_config: bucket
+    data_root_url: s3://my-bucket/one
+    labeling_info:
+      type: HirundoCSV
+      csv_url: s3://my-bucket/one.csv
+  - name: dataset-2
+    labeling_type: SingleLabelClassification
+    storage_config:
+      name: bucket
+      type: S3
+      s3:
+        bucket_url: s3://my-bucket
+        region_name: us-east-1
+    data_root_url: s3://my-bucket/two
+    labeling_info:
+      type: HirundoCSV
+      csv_url: s3://my-bucket/two.csv
+  - name: dataset-3
+    labeling_type: SingleLabelClassification
+    storage_config: labels
+    data_root_url: https://github.com/hirundo-io/labels/images
+    labeling_info:
+      type: HirundoCSV
+      csv_url: https://github.com/hirundo-io/labels/labels.csv
+  - name: dataset-4
+    labeling_type: SingleLabelClassification
+    storage_config: labels-dev
+    data_root_url: https://github.com/hirundo-io/labels/images
+    labeling_info:
+      type: HirundoCSV
+      csv_url: https://github.com/hirundo-io/labels/labels.csv
+"""
+
+
+@pytest.fixture
+def server():
+    ids = itertools.count(1)
+    lock = threading.Lock()
+
+    def create(request):
+        if json.loads(request.body)["name"] == "dataset-4":
+            return json_response({"detail": "Invalid dataset"}, status=422)
+        with lock:
+            return json_response({"id": next(ids)})
+
+    with LocalServer(
+        {
+            ("POST", "/git-repo/"): create,
+            ("POST", "/storage-config/"): create,
+            ("POST", "/dataset-qa/dataset/"): create,
+        }
+    ) as server:
+        yield server
+
+
+def test_register_creates_shared_definitions_once(monkeypatch, server, tmp_path):
+    use_local_server(monkeypatch, server)
+    manifest_path = tmp_path / "manifest.yaml"
+    manifest_path.write_text(MANIFEST)
+    manifest = Manifest.from_yaml(manifest_path)
+
+    dataset_ids = manifest.register(max_concurrency=4)
+
+    posts = [(request.path, json.loads(request.body)) for request in server.requests]
+    assert [body["name"] for path, body in posts if path == "/git-repo/"] == [
+        "labels-repo"
+    ]
+    assert sorted(
+        body["name"] for path, body in posts if path == "/storage-config/"
+    ) == ["bucket", "labels", "labels-dev"]
+    git_storage_configs = [
+        body for path, body in posts if path == "/storage-config/" and body["git"]
+    ]
+    assert {body["git"]["repo_id"] for body in git_storage_configs} == {
+        manifest.datasets[2].storage_config.git.repo.id
+    }
+    assert sorted(dataset_ids) == ["dataset-1", "dataset-2", "dataset-3"]
+    assert (
+        manifest.datasets[0].storage_config_id == manifest.datasets[1].storage_config_id
+    )
+    dataset_bodies = {
+        body["name"]: body for path, body in posts if path == "/dataset-qa/dataset/"
+    }
+    assert dataset_bodies["dataset-1"]["storage_config_id"] == (
+        manifest.datasets[0].storage_config_id
+    )
+
+
+def test_create_many_rejects_duplicate_names(monkeypatch, server, tmp_path):
+    use_local_server(monkeypatch, server)
+    manifest_path = tmp_path / "manifest.yaml"
+    manifest_path.write_text(MANIFEST)
+    dataset = Manifest.from_yaml(manifest_path).datasets[0]
+    with pytest.raises(ValueError, match="unique"):
+        QADataset.create_many([dataset, dataset.model_copy()])
+    assert server.requests == []
+
+
+def test_unknown_reference_is_rejected():
+    with pytest.raises(ValueError, match="Unknown storage_config 'missing'"):
+        Manifest.model_validate(
+            {"datasets": [{"name": "dataset", "storage_config": "missing"}]}
+        )
+
+
+NOW = "2026-01-01T00:00:00+00:00"
+SERVER_GIT_REPO = {
+    "id": 7,
+    "name": "labels-repo",
+    "repository_url": "https://github.com/hirundo-io/labels.git",
+    "created_at": NOW,
+    "updated_at": NOW,
+}
+
+
+SERVER_STORAGE_CONFIGS = [
+    storage_config_out(
+        3, "bucket", s3={"bucket_url": "s3://my-bucket", "region_name": "us-west-2"}
+    ),
+    storage_config_out(4, "labels", git={"repo": SERVER_GIT_REPO, "branch": "main"}),
+]
+
+
+def _server_dataset(
+    i: int, name: str, storage_config: dict, data_root_url: str
+) -> dict:
+    return dataset_out(
+        i, name, storage_config, data_root_url, created_at=NOW, updated_at=NOW
+    )
+
+
+@pytest.fixture
+def apply_server():
+    ids = itertools.count(10)
+    lock = threading.Lock()
+
+    def create(request):
+        if json.loads(request.body)["name"] == "dataset-4":
+            return json_response({"detail": "Invalid dataset"}, status=422)
+        with lock:
+            return json_response({"id": next(ids)})
+
+    with LocalServer(
+        {
+            ("GET", "/git-repo/"): lambda _: json_response([SERVER_GIT_REPO]),
+            ("GET", "/storage-config/"): lambda _: json_response(
+                SERVER_STORAGE_CONFIGS
+            ),
+            ("GET", "/dataset-qa/dataset/"): lambda _: json_response(
+                [
+                    _server_dataset(
+                        1, "dataset-1", SERVER_STORAGE_CONFIGS[0], "s3://my-bucket/one"
+                    ),
+                    _server_dataset(
+                        3,
+                        "dataset-3",
+                        SERVER_STORAGE_CONFIGS[1],
+                        "https://github.com/hirundo-io/labels/images",
+                    ),
+                ]
+            ),
+            ("POST", "/git-repo/"): create,
+            ("POST", "/storage-config/"): create,
+            ("POST", "/dataset-qa/dataset/"): create,
+        }
+    ) as server:
+        yield server
+
+
+def _manifest(tmp_path) -> Manifest:
+    manifest_path = tmp_path / "manifest.yaml"
+    manifest_path.write_text(
+        MANIFEST.replace(
+            "https://github.com/hirundo-io/labels/labels.csv",
+            "https://github.com/hirundo-io/labels/images.csv",
+        )
+    )
+    return Manifest.from_yaml(manifest_path)
+
+
+def test_plan_diffs_against_server(monkeypatch, apply_server, tmp_path):
+    use_local_server(monkeypatch, apply_server)
+
+    plan = _manifest(tmp_path).plan()
+
+    assert [
+        (change.key, change.action, change.changed_fields) for change in plan.changes
+    ] == [
+        ("git-repo/labels-repo", ChangeAction.UNCHANGED, []),
+        ("storage-config/S3/bucket", ChangeAction.UPDATE, ["s3.region_name"]),
+        ("storage-config/Git/labels", ChangeAction.UNCHANGED, []),
+        ("storage-config/Git/labels-dev", ChangeAction.CREATE, []),
+        ("dataset/dataset-1", ChangeAction.UNCHANGED, []),
+        ("dataset/dataset-2", ChangeAction.CREATE, []),
+        ("dataset/dataset-3", ChangeAction.UNCHANGED, []),
+        ("dataset/dataset-4", ChangeAction.CREATE, []),
+    ]
+    assert {request.method for request in apply_server.requests} == {"GET"}
+
+
+def test_plan_ignores_fields_the_manifest_does_not_set(
+    monkeypatch, apply_server, tmp_path
+):
+    server_dataset = _server_dataset(
+        1, "dataset-1", SERVER_STORAGE_CONFIGS[0], "s3://my-bucket/one"
+    )
+    apply_server.routes[("GET", "/dataset-qa/dataset/")] = lambda _: json_response(
+        [{**server_dataset, "classes": ["cat", "dog"]}]
+    )
+    use_local_server(monkeypatch, apply_server)
+
+    plan = _manifest(tmp_path).plan()
+
+    change = next(change for change in plan.changes if change.name == "dataset-1")
+    assert (change.action, change.changed_fields) == (ChangeAction.UNCHANGED, [])
+
+
+def test_apply_follows_dependency_order(monkeypatch, apply_server, tmp_path):
+    use_local_server(monkeypatch, apply_server)
+
+    plan = _manifest(tmp_path).apply(max_concurrency=4)
+
+    posts = [
+        (request.path, json.loads(request.body))
+        for request in apply_server.requests
+        if request.method == "POST"
+    ]
+    levels = [path for path, _ in posts]
+    assert levels == sorted(
+        levels, key=["/storage-config/", "/dataset-qa/dataset/"].index
+    )
+    bodies = {body["name"]: body for _, body in posts}
+    assert sorted(bodies) == [
+        "bucket",
+        "dataset-1",
+        "dataset-2",
+        "dataset-4",
+        "labels-dev",
+    ]
+    assert bodies["bucket"]["replace_if_exists"] is True
+    assert bodies["labels-dev"]["git"]["repo_id"] == 7
+    # ⬇️ The replaced storage config got a new ID, so the dataset using it is replaced too
+    changes = {change.key: change for change in plan.changes}
+    assert changes["dataset/dataset-1"].action == ChangeAction.UPDATE
+    assert bodies["dataset-1"]["storage_config_id"] == (
+        changes["storage-config/S3/bucket"].id
+    )
+    assert [change.key for change in plan.failed] == ["dataset/dataset-4"]
+
+
+def test_plan_command_does_not_write(monkeypatch, apply_server, tmp_path):
+    use_local_server(monkeypatch, apply_server)
+    manifest_path = tmp_path / "manifest.yaml"
+    manifest_path.write_text(MANIFEST)
+
+    result = CliRunner().invoke(app, ["plan", "-f", str(manifest_path)])
+
+    assert result.exit_code == 0, result.output
+    assert {request.method for request in apply_server.requests} == {"GET"}
@@ -0,0 +1,92 @@
+import time
+
+from hirundo import GitRepo, NameCache, StorageConfig, StorageTypes
+from tests.local_server import LocalServer, json_response, use_local_server
+
+GIT_REPO = {
+    "id": 3,
+    "name": "labels-repo",
+    "repository_url": "https://github.com/hirundo-io/labels.git",
+    "created_at": "2025-01-01T00:00:00Z",
+    "updated_at": "2025-01-01T00:00:00Z",
+}
+
+
+def _storage_config(request) -> tuple:
+    storage_type = request.query["storage_type"][0]
+    return json_response(
+        {
+            "id": 1 if storage_type == "S3" else 2,
+            "name": "bucket",
+            "type": storage_type,
+            "organization_name": "org",
+            "creator_name": "creator",
+            "s3": {"bucket_url": "s3://my-bucket", "region_name": "us-east-1"}
+            if storage_type == "S3"
+            else None,
+            "gcp": {"bucket_name": "my-bucket", "project": "my-project"}
+            if storage_type == "GCP"
+            else None,
+            "git": None,
+        }
+    )
+
+
+def _server() -> LocalServer:
+    return LocalServer(
+        {
+            ("GET", "/git-repo/by-name/"): lambda _: json_response(GIT_REPO),
+            ("GET", "/storage-config/by-name/"): _storage_config,
+            ("POST", "/git-repo/"): lambda _: json_response({"id": 4}),
+            ("DELETE", "/storage-config/"): lambda _: json_response({}),
+        }
+    )
+
+
+def _lookups(server: LocalServer) -> int:
+    return sum(request.method == "GET" for request in server.requests)
+
+
+def test_lookups_are_cached_until_invalidated(monkeypatch):
+    with _server() as server:
+        client = use_local_server(monkeypatch, server)
+        cache = NameCache()
+        client.configure_name_cache(cache)
+
+        assert GitRepo.get_by_name("labels-repo").id == 3
+        assert GitRepo.get_by_name("labels-repo").id == 3
+        s3 = StorageConfig.get_by_name("bucket", StorageTypes.S3)
+        gcp = StorageConfig.get_by_name("bucket", StorageTypes.GCP)
+        assert (s3.id, gcp.id) == (1, 2)
+        assert StorageConfig.get_by_name("bucket", StorageTypes.S3).id == 1
+        assert _lookups(server) == 3
+
+        GitRepo(name="labels-repo", repository_url=GIT_REPO["repository_url"]).create(
+            replace_if_exists=True
+        )
+        StorageConfig.delete_by_id(1)
+        GitRepo.get_by_name("labels-repo")
+        StorageConfig.get_by_name("bucket", StorageTypes.S3)
+        StorageConfig.get_by_name("bucket", StorageTypes.GCP)
+        assert _lookups(server) == 5
+
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.invalidations) == (3, 5, 2)
+
+
+def test_entries_expire_and_persist(monkeypatch, tmp_path):
+    with _server() as server:
+        client = use_local_server(monkeypatch, server)
+        client.configure_name_cache(NameCache(ttl=60, path=tmp_path / "names.sqlite3"))
+        GitRepo.get_by_name("labels-repo")
+
+        # ⬇️ A new process (or cache) on the same machine reuses the saved entries
+        client.configure_name_cache(NameCache(ttl=60, path=tmp_path / "names.sqlite3"))
+        GitRepo.get_by_name("labels-repo")
+        assert _lookups(server) == 1
+
+        client.configure_name_cache(NameCache(ttl=0.05))
+        GitRepo.get_by_name("labels-repo")
+        time.sleep(0.1)
+        GitRepo.get_by_name("labels-repo")
+        assert _lookups(server) == 3
@@ -0,0 +1,146 @@
+import datetime
+
+from hirundo import GitRepo, QADataset, StorageConfig, StorageTypes
+from hirundo.cli import app
+from hirundo.dataset_qa import RunStatus
+from tests.local_server import (
+    LocalServer,
+    json_response,
+    storage_config_out,
+    use_local_server,
+)
+from typer.testing import CliRunner
+
+
+def _run(i: int) -> dict:
+    return {
+        "id": i,
+        "name": f"{'TEST-' if i % 2 else 'PROD-'}dataset-{i}",
+        "dataset_id": i,
+        "run_id": f"run-{i}",
+        "status": "SUCCESS" if i % 3 else "FAILURE",
+        "approved": True,
+        "created_at": f"2025-01-{1 + i % 28:02d}T00:00:00Z",
+        "run_args": None,
+    }
+
+
+def _paginated(items: list[dict]):
+    def route(request):
+        limit = int(request.query["limit"][0])
+        offset = int(request.query["offset"][0])
+        return json_response(items[offset : offset + limit])
+
+    return route
+
+
+RUNS = [_run(i) for i in range(25)]
+
+
+def test_iter_runs_pages_lazily(monkeypatch):
+    routes = {("GET", "/dataset-qa/run/list"): _paginated(RUNS)}
+    with LocalServer(routes) as server:
+        use_local_server(monkeypatch, server)
+        runs = QADataset.iter_runs(page_size=10)
+        first = next(runs)
+        assert first.id == 0
+        assert len(server.requests) == 1
+        remaining = list(runs)
+    assert [run.id for run in remaining] == list(range(1, 25))
+    assert [request.query["offset"] for request in server.requests] == [
+        ["0"],
+        ["10"],
+        ["20"],
+    ]
+
+
+def test_iter_runs_filters(monkeypatch):
+    routes = {("GET", "/dataset-qa/run/list"): _paginated(RUNS)}
+    with LocalServer(routes) as server:
+        use_local_server(monkeypatch, server)
+        runs = list(
+            QADataset.iter_runs(
+                page_size=7,
+                status=RunStatus.SUCCESS,
+                name_prefix="TEST-",
+                created_after=datetime.datetime(
+                    2025, 1, 10, tzinfo=datetime.timezone.utc
+                ),
+            )
+        )
+    expected = [
+        run["id"]
+        for run in RUNS
+        if run["status"] == "SUCCESS"
+        and run["name"].startswith("TEST-")
+        and run["created_at"] >= "2025-01-10"
+    ]
+    assert [run.id for run in runs] == expected
+
+
+def test_iter_runs_treats_naive_datetimes_as_utc(monkeypatch):
+    routes = {("GET", "/dataset-qa/run/list"): _paginated(RUNS)}
+    with LocalServer(routes) as server:
+        use_local_server(monkeypatch, server)
+        runs = list(
+            QADataset.iter_runs(
+                created_after=datetime.datetime(2025, 1, 10),
+                created_before=datetime.datetime(2025, 1, 12),
+            )
+        )
+    assert [run.id for run in runs] == [9, 10]
+
+
+def test_list_runs_rejects_unknown_status(monkeypatch):
+    routes = {("GET", "/dataset-qa/run/list"): _paginated(RUNS)}
+    with LocalServer(routes) as server:
+        use_local_server(monkeypatch, server)
+        result = CliRunner().invoke(app, ["list-runs", "--status", "DONE"])
+        assert result.exit_code == 2
+        assert "--status" in result.output
+        assert server.requests == []
+        result = CliRunner().invoke(
+            app, ["list-runs", "--status", "awaiting_manual_approval"]
+        )
+        assert result.exit_code == 0
+
+
+def test_iter_runs_when_server_ignores_pagination(monkeypatch):
+    routes = {("GET", "/dataset-qa/run/list"): lambda _: json_response(RUNS[:10])}
+    with LocalServer(routes) as server:
+        use_local_server(monkeypatch, server)
+        runs = list(QADataset.iter_runs(page_size=10))
+    assert [run.id for run in runs] == list(range(10))
+
+
+def test_iter_storage_configs_and_git_repos(monkeypatch):
+    storage_configs = [
+        storage_config_out(i, gcp={"bucket_name": "my-bucket", "project": "my-project"})
+        if i % 2
+        else storage_config_out(i)
+        for i in range(5)
+    ]
+    git_repos = [
+        {
+            "id": i,
+            "name": f"repo-{i}",
+            "repository_url": "https://github.com/Hirundo-io/test-dataset.git",
+            "created_at": "2025-01-01T00:00:00Z",
+            "updated_at": "2025-01-01T00:00:00Z",
+        }
+        for i in range(3)
+    ]
+    routes = {
+        ("GET", "/storage-config/"): _paginated(storage_configs),
+        ("GET", "/git-repo/"): _paginated(git_repos),
+    }
+    with LocalServer(routes) as server:
+        use_local_server(monkeypatch, server)
+        gcp_configs = list(
+            StorageConfig.iter_storage_configs(
+                page_size=2, storage_type=StorageTypes.GCP
+            )
+        )
+        repos = list(GitRepo.iter_git_repos(page_size=2, name_prefix="repo-2"))
+    assert [config.id for config in gcp_configs] == [1, 3]
+    assert [repo.id for repo in repos] == [2]
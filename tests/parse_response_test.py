@@ -0,0 +1,42 @@
+from hirundo import GitRepo, QADataset
+from hirundo.dataset_qa import DataQARunOut, RunStatus
+from tests.local_server import LocalServer, json_response, use_local_server
+
+RUN = {
+    "id": 1,
+    "name": "dataset-1",
+    "dataset_id": 1,
+    "run_id": "abc",
+    "status": "SUCCESS",
+    "approved": True,
+    "created_at": "2025-01-01T00:00:00Z",
+    "run_args": {"image_size": [224, 224], "upsample": False},
+}
+GIT_REPO = {
+    "id": 3,
+    "name": "repo",
+    "repository_url": "https://github.com/Hirundo-io/test-dataset.git",
+    "created_at": "2025-01-01T00:00:00Z",
+    "updated_at": "2025-01-01T00:00:00Z",
+}
+
+
+def test_list_runs_parses_from_bytes(monkeypatch):
+    routes = {("GET", "/dataset-qa/run/list"): lambda _: json_response([RUN, RUN])}
+    with LocalServer(routes) as server:
+        use_local_server(monkeypatch, server)
+        runs = QADataset.list_runs()
+    assert len(runs) == 2
+    assert isinstance(runs[0], DataQARunOut)
+    assert runs[0].status == RunStatus.SUCCESS
+    assert runs[0].run_args is not None
+    assert runs[0].run_args.image_size == (224, 224)
+
+
+def test_get_git_repo_parses_from_bytes(monkeypatch):
+    routes = {("GET", "/git-repo/"): lambda _: json_response(GIT_REPO)}
+    with LocalServer(routes) as server:
+        use_local_server(monkeypatch, server)
+        git_repo = GitRepo.get_by_id(3)
+    assert git_repo.id == 3
+    assert str(git_repo.repository_url).startswith("https://github.com/")
@@ -0,0 +1,156 @@
+import json
+import threading
+import time
+from collections import defaultdict
+
+import pytest
+from hirundo import (
+    HirundoCSV,
+    HirundoError,
+    LabelingType,
+    PipelineItem,
+    PipelineStage,
+    QADataset,
+    QAPipeline,
+    RunTimeoutError,
+    StorageConfig,
+    StorageS3,
+    StorageTypes,
+)
+from tests.local_server import (
+    LocalServer,
+    json_response,
+    qa_dataset,
+    use_local_server,
+    zip_route,
+)
+
+# ⬇️ Polars warns about forking the parsing processes once its thread pool started
+pytestmark = pytest.mark.filterwarnings("ignore::RuntimeWarning")
+
+FAILING_DATASET_ID = 2
+
+
+@pytest.fixture
+def server(monkeypatch, tmp_path):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    dataset_ids = iter(range(1, 100))
+    lock = threading.Lock()
+
+    def create_dataset(_request):
+        with lock:
+            return json_response({"id": next(dataset_ids)})
+
+    def launch_run(request):
+        return json_response({"run_id": f"run-{request.path.rsplit('/', 1)[-1]}"})
+
+    def run_events(request):
+        failed = request.path.endswith(f"run-{FAILING_DATASET_ID}")
+        data = {
+            "state": "FAILURE" if failed else "SUCCESS",
+            "result": "Out of memory" if failed else f"{server.url}/results.zip",
+        }
+        body = f"event: message\nid: 1\ndata: {json.dumps({'data': data})}\n\n"
+        return 200, {"Content-Type": "text/event-stream"}, body.encode()
+
+    routes = {
+        ("POST", "/storage-config/"): lambda _: json_response({"id": 7}),
+        ("POST", "/dataset-qa/dataset/"): create_dataset,
+        ("POST", "/dataset-qa/run/"): launch_run,
+        ("GET", "/dataset-qa/run/"): run_events,
+        ("GET", "/results.zip"): zip_route,
+    }
+    with LocalServer(routes) as server:
+        use_local_server(monkeypatch, server)
+        yield server
+
+
+def test_pipeline_collects_results_and_errors(server):
+    stages: defaultdict[str, list[PipelineStage]] = defaultdict(list)
+
+    def on_progress(item: PipelineItem) -> None:
+        stages[item.dataset.name].append(item.stage)
+
+    datasets = [qa_dataset(f"dataset-{i}") for i in range(4)]
+    items = QAPipeline(
+        create_concurrency=2, parse_processes=2, on_progress=on_progress
+    ).run(datasets)
+
+    assert [item.dataset for item in items] == datasets
+    failed = [item for item in items if item.stage == PipelineStage.FAILED]
+    assert len(failed) == 1
+    assert failed[0].failed_stage == PipelineStage.WATCH
+    assert isinstance(failed[0].error, HirundoError)
+    assert stages[failed[0].dataset.name] == [
+        PipelineStage.CREATE,
+        PipelineStage.WATCH,
+        PipelineStage.FAILED,
+    ]
+    for item in items:
+        if item is failed[0]:
+            continue
+        assert item.results is not None
+        assert item.results.suspects is not None
+        assert item.zip_path == item.results.cached_zip_path
+        assert stages[item.dataset.name] == [
+            PipelineStage.CREATE,
+            PipelineStage.WATCH,
+            PipelineStage.DOWNLOAD,
+            PipelineStage.PARSE,
+            PipelineStage.DONE,
+        ]
+
+
+def test_pipeline_accepts_created_datasets(server):
+    dataset = QADataset(
+        name="created",
+        labeling_type=LabelingType.SINGLE_LABEL_CLASSIFICATION,
+        storage_config=StorageConfig(
+            name="bucket",
+            type=StorageTypes.S3,
+            s3=StorageS3(bucket_url="s3://bucket", region_name="us-east-1"),
+        ),
+        labeling_info=HirundoCSV(csv_url="s3://bucket/data/labels.csv"),
+        data_root_url="s3://bucket/data",
+    )
+    dataset.create()
+    assert dataset.storage_config is not None
+    assert dataset.storage_config_id == 7
+
+    [item] = QAPipeline(parse_processes=1).run([dataset])
+
+    assert item.error is None
+    assert item.stage == PipelineStage.DONE
+    assert item.dataset is dataset
+
+
+def test_runs_that_time_out_are_cancelled(monkeypatch, tmp_path):
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    def slow_run_events(_request):
+        def events():
+            data = json.dumps({"data": {"state": "STARTED", "result": "10%"}})
+            yield f"event: message\nid: 1\ndata: {data}\n\n".encode()
+            for _ in range(20):
+                time.sleep(0.1)
+                yield b"event: ping\ndata: \n\n"
+
+        return 200, {"Content-Type": "text/event-stream"}, events()
+
+    routes = {
+        ("POST", "/dataset-qa/dataset/"): lambda _: json_response({"id": 1}),
+        ("POST", "/dataset-qa/run/"): lambda _: json_response({"run_id": "run-1"}),
+        ("GET", "/dataset-qa/run/"): slow_run_events,
+        ("DELETE", "/dataset-qa/run/"): lambda _: json_response({}),
+    }
+    with LocalServer(routes) as server:
+        use_local_server(monkeypatch, server)
+        [item] = QAPipeline(parse_processes=1, run_timeout=0.5).run(
+            [qa_dataset("slow")]
+        )
+
+    assert item.failed_stage == PipelineStage.WATCH
+    assert isinstance(item.error, RunTimeoutError)
+    assert [
+        request.path for request in server.requests if request.method == "DELETE"
+    ] == ["/dataset-qa/run/run-1"]
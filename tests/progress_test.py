@@ -0,0 +1,113 @@
+import json
+import logging
+import time
+
+import pytest
+from hirundo import (
+    DebouncedProgressSink,
+    HirundoError,
+    LoggingProgressSink,
+    ProgressSink,
+    QADataset,
+    RunEvent,
+)
+from hirundo.dataset_qa import RunStatus
+from tests.local_server import LocalServer, use_local_server
+
+
+class _RecordingSink(ProgressSink):
+    def __init__(self):
+        self.calls: list[tuple[str, RunEvent]] = []
+        self.closed = False
+
+    def on_state(self, run_id: str, event: RunEvent) -> None:
+        self.calls.append(("state", event))
+
+    def on_progress(self, run_id: str, event: RunEvent) -> None:
+        self.calls.append(("progress", event))
+
+    def on_result(self, run_id: str, event: RunEvent) -> None:
+        self.calls.append(("result", event))
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _progress(percent: float) -> RunEvent:
+    return RunEvent(stage="Training", percent=percent)
+
+
+def test_debounce_coalesces_progress_and_flushes_before_state():
+    recorded = _RecordingSink()
+    sink = DebouncedProgressSink(recorded, min_interval=60)
+    for percent in range(1, 11):
+        sink.on_progress("run", _progress(percent))
+    sink.on_state("run", RunEvent(state=RunStatus.SUCCESS, percent=100.0))
+    sink.close()
+    assert [(kind, event.percent) for kind, event in recorded.calls] == [
+        ("progress", 1),
+        ("progress", 10),
+        ("state", 100.0),
+    ]
+    assert recorded.closed
+
+
+def test_debounce_forwards_the_latest_progress_once_the_interval_passed():
+    recorded = _RecordingSink()
+    sink = DebouncedProgressSink(recorded, min_interval=0.1)
+    for percent in range(1, 4):
+        sink.on_progress("run", _progress(percent))
+    assert [event.percent for _, event in recorded.calls] == [1]
+    deadline = time.monotonic() + 2
+    while len(recorded.calls) < 2 and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert [event.percent for _, event in recorded.calls] == [1, 3]
+    sink.close()
+    assert len(recorded.calls) == 2
+
+
+def test_debounce_is_per_run():
+    recorded = _RecordingSink()
+    sink = DebouncedProgressSink(recorded, min_interval=60)
+    sink.on_progress("run-1", _progress(1))
+    sink.on_progress("run-2", _progress(2))
+    assert len(recorded.calls) == 2
+
+
+def test_logging_sink(caplog):
+    with caplog.at_level(logging.INFO, logger="hirundo.progress"):
+        sink = LoggingProgressSink()
+        sink.on_progress("run", _progress(42.5))
+        sink.on_result("run", RunEvent(state=RunStatus.SUCCESS))
+    assert "Run run: Training 42.5%" in caplog.text
+    assert "Run run: results are ready" in caplog.text
+
+
+def _failing_run_route(_request):
+    events = [
+        {"state": "STARTED", "result": None},
+        *(
+            {"state": None, "result": {"result": f"Training: {percent}% done"}}
+            for percent in range(100)
+        ),
+        {"state": "FAILURE", "result": "Out of memory"},
+    ]
+    body = "".join(
+        f"event: message\nid: {i}\ndata: {json.dumps({'data': event})}\n\n"
+        for i, event in enumerate(events)
+    ).encode()
+    return 200, {"Content-Type": "text/event-stream"}, body
+
+
+def test_check_run_by_id_reports_to_sink(monkeypatch):
+    recorded = _RecordingSink()
+    with LocalServer({("GET", "/dataset-qa/run/"): _failing_run_route}) as server:
+        use_local_server(monkeypatch, server)
+        with pytest.raises(HirundoError, match="Out of memory"):
+            QADataset.check_run_by_id("run", progress=recorded)
+    kinds = [kind for kind, _ in recorded.calls]
+    assert kinds[0] == "state"
+    assert kinds[-1] == "state"
+    assert 2 <= kinds.count("progress") < 100
+    assert recorded.calls[-2][1].percent == 99.0
+    assert recorded.closed
@@ -0,0 +1,125 @@
+import json
+
+import pytest
+from hirundo import (
+    HirundoError,
+    NullProgressSink,
+    QADataset,
+    RunCheckpointStore,
+    RunEvent,
+    RunWatcher,
+)
+from hirundo.dataset_qa import RunStatus
+from tests.local_server import LocalServer, use_local_server, zip_route
+
+RUN_ID = "run-1"
+
+
+def _sse_route(events: list[tuple[str, dict]]):
+    def route(_request):
+        body = "".join(
+            f"event: message\nid: {event_id}\ndata: {json.dumps({'data': event})}\n\n"
+            for event_id, event in events
+        ).encode()
+        return 200, {"Content-Type": "text/event-stream"}, body
+
+    return route
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    store = RunCheckpointStore(tmp_path / "checkpoints.sqlite3", flush_interval=60)
+    yield store
+    store.close()
+
+
+def test_record_saves_states_and_throttles_progress(store: RunCheckpointStore):
+    store.record(RUN_ID, "1", RunEvent(state=RunStatus.STARTED))
+    store.record(RUN_ID, "2", RunEvent(stage="Training", percent=10.0))
+    assert store.get(RUN_ID).last_event_id == "1"
+    store.record(RUN_ID, "3", RunEvent(state=RunStatus.SUCCESS, result_url="s3://x"))
+    checkpoint = store.get(RUN_ID)
+    assert (checkpoint.last_event_id, checkpoint.state, checkpoint.result_url) == (
+        "3",
+        RunStatus.SUCCESS,
+        "s3://x",
+    )
+    assert [checkpoint.run_id for checkpoint in store.list()] == [RUN_ID]
+    store.delete(RUN_ID)
+    assert store.get(RUN_ID) is None
+
+
+def test_checkpoints_survive_reopening(store: RunCheckpointStore):
+    store.record(RUN_ID, "7", RunEvent(state=RunStatus.STARTED))
+    reopened = RunCheckpointStore(store.path)
+    assert reopened.get(RUN_ID).last_event_id == "7"
+    reopened.close()
+
+
+def test_check_run_by_id_resumes_after_last_event(monkeypatch, store):
+    store.record(RUN_ID, "7", RunEvent(state=RunStatus.STARTED))
+    route = _sse_route([("8", {"state": "FAILURE", "result": "Out of memory"})])
+    with LocalServer({("GET", "/dataset-qa/run/"): route}) as server:
+        use_local_server(monkeypatch, server)
+        with pytest.raises(HirundoError, match="Out of memory"):
+            QADataset.check_run_by_id(
+                RUN_ID, checkpoints=store, progress=NullProgressSink()
+            )
+    assert server.requests[0].headers["Last-Event-ID"] == "7"
+    assert store.get(RUN_ID).state == RunStatus.FAILURE
+
+
+def test_succeeded_run_is_downloaded_without_watching(monkeypatch, store):
+    with LocalServer({("GET", "/results.zip"): zip_route}) as server:
+        use_local_server(monkeypatch, server)
+        store.record(
+            RUN_ID,
+            "9",
+            RunEvent(state=RunStatus.SUCCESS, result_url=f"{server.url}/results.zip"),
+        )
+        results = QADataset.check_run_by_id(RUN_ID, checkpoints=store)
+    assert [request.path for request in server.requests] == ["/results.zip"]
+    assert results.cached_zip_path.exists()
+    assert store.get(RUN_ID) is None
+
+
+def test_expired_results_url_watches_run_again(monkeypatch, store):
+    routes = {("GET", "/fresh.zip"): zip_route}
+    with LocalServer(routes) as server:
+        routes[("GET", "/dataset-qa/run/")] = _sse_route(
+            [("1", {"state": "SUCCESS", "result": f"{server.url}/fresh.zip"})]
+        )
+        use_local_server(monkeypatch, server)
+        store.record(
+            RUN_ID,
+            "9",
+            RunEvent(state=RunStatus.SUCCESS, result_url=f"{server.url}/expired.zip"),
+        )
+        QADataset.check_run_by_id(
+            RUN_ID, checkpoints=store, progress=NullProgressSink()
+        )
+    paths = [request.path for request in server.requests]
+    assert paths == ["/expired.zip", f"/dataset-qa/run/{RUN_ID}", "/fresh.zip"]
+    assert "Last-Event-ID" not in server.requests[1].headers
+    assert store.get(RUN_ID) is None
+
+
+def test_watcher_resumes_tracked_runs(monkeypatch, store):
+    store.record("run-0", "4", RunEvent(state=RunStatus.STARTED))
+    store.record("run-1", "5", RunEvent(state=RunStatus.STARTED))
+    route = _sse_route([("6", {"state": "SUCCESS", "result": "s3://results.zip"})])
+    with LocalServer({("GET", "/dataset-qa/run/"): route}) as server:
+        use_local_server(monkeypatch, server)
+        watcher = RunWatcher.resume(store)
+        changes = list(watcher.watch())
+    assert sorted(watcher.run_ids) == ["run-0", "run-1"]
+    assert {change.run_id: change.status for change in changes} == {
+        "run-0": RunStatus.SUCCESS,
+        "run-1": RunStatus.SUCCESS,
+    }
+    assert {request.headers["Last-Event-ID"] for request in server.requests} == {
+        "4",
+        "5",
+    }
+    assert store.get("run-0").result_url == "s3://results.zip"
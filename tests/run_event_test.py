@@ -0,0 +1,68 @@
+import json
+
+import pytest
+from hirundo import HirundoError, RunEvent
+from hirundo.dataset_qa import RunStatus, parse_run_event
+
+
+def _data(state, result) -> str:
+    return json.dumps({"data": {"state": state, "result": result}})
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        (
+            _data(None, {"result": "Training model: 42.5% done"}),
+            RunEvent(stage="Training model", percent=42.5),
+        ),
+        (
+            _data(None, {"result": "Preparing dataset"}),
+            RunEvent(stage="Preparing dataset"),
+        ),
+        (_data(None, None), RunEvent()),
+        (
+            _data("SUCCESS", "s3://bucket/results.zip"),
+            RunEvent(
+                state=RunStatus.SUCCESS,
+                stage="Dataset QA run completed successfully",
+                percent=100.0,
+                result_url="s3://bucket/results.zip",
+            ),
+        ),
+        (
+            _data("FAILURE", "Out of memory"),
+            RunEvent(
+                state=RunStatus.FAILURE,
+                stage="Dataset QA run failed",
+                percent=100.0,
+                error="Out of memory",
+            ),
+        ),
+        (
+            _data("PENDING", "0%"),
+            RunEvent(
+                state=RunStatus.PENDING,
+                stage="Dataset QA run queued and not yet started",
+                percent=0.0,
+            ),
+        ),
+        ("{}", None),
+        (_data("SOMETHING_NEW", "Migrating"), RunEvent()),
+    ],
+)
+def test_parse_run_event(data: str, expected):
+    assert parse_run_event(data) == expected
+
+
+@pytest.mark.parametrize(
+    ("payload", "message"),
+    [
+        ({"detail": "Run not found"}, "Run not found"),
+        ({"reason": "Forbidden"}, "Forbidden"),
+        ({"unexpected": True}, "Unknown error"),
+    ],
+)
+def test_parse_run_event_errors(payload: dict, message: str):
+    with pytest.raises(HirundoError, match=message):
+        parse_run_event(json.dumps(payload))
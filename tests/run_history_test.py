@@ -0,0 +1,90 @@
+import datetime
+
+from hirundo.dataset_qa import RunStatus
+from hirundo.run_history import RunHistory
+from tests.local_server import (
+    LocalServer,
+    dataset_out,
+    json_response,
+    use_local_server,
+)
+
+
+def _run(i: int, status: str = "SUCCESS") -> dict:
+    return {
+        "id": i,
+        "name": f"dataset-{i % 3}",
+        "dataset_id": i % 3,
+        "run_id": f"run-{i}",
+        "status": status,
+        "approved": True,
+        "created_at": f"2025-01-{1 + i:02d}T00:00:00Z",
+        "run_args": None,
+    }
+
+
+def _server(listing: dict[str, list[dict]]) -> LocalServer:
+    return LocalServer(
+        {
+            ("GET", "/dataset-qa/run/list"): lambda _: json_response(listing["runs"]),
+            ("GET", "/dataset-qa/dataset/"): lambda _: json_response(
+                listing["datasets"]
+            ),
+        }
+    )
+
+
+def test_sync_writes_only_new_and_unfinished_records(monkeypatch, tmp_path):
+    listing = {
+        "runs": [_run(i) for i in range(5)] + [_run(5, "STARTED")],
+        "datasets": [dataset_out(i) for i in range(3)],
+    }
+    with _server(listing) as server:
+        use_local_server(monkeypatch, server)
+        history = RunHistory(tmp_path / "history.sqlite3")
+        first = {report.resource: report for report in history.sync()}
+        assert (first["runs"].written, first["datasets"].written) == (6, 3)
+
+        listing["runs"] = [_run(i) for i in range(1, 6)] + [_run(6)]
+        listing["datasets"] = [
+            dataset_out(0),
+            dataset_out(1, updated_at="2025-02-01T00:00:00Z"),
+        ]
+        second = {report.resource: report for report in history.sync()}
+
+    # ⬇️ run-5 finished, run-6 is new & run-0 was archived
+    assert (second["runs"].listed, second["runs"].written) == (6, 2)
+    assert second["runs"].deleted == 1
+    assert (second["datasets"].written, second["datasets"].deleted) == (2, 1)
+    assert [run.run_id for run in history.runs(status=RunStatus.STARTED)] == []
+    assert [run.run_id for run in history.runs(dataset_id=0)] == ["run-6", "run-3"]
+    assert sorted(dataset.name for dataset in history.datasets()) == [
+        "dataset-0",
+        "dataset-1",
+    ]
+    history.close()
+
+
+def test_queries_use_indexes(monkeypatch, tmp_path):
+    listing = {"runs": [_run(i) for i in range(20)], "datasets": []}
+    with _server(listing) as server:
+        use_local_server(monkeypatch, server)
+        history = RunHistory(tmp_path / "history.sqlite3")
+        history.sync()
+        requests = len(server.requests)
+
+        runs = history.runs(
+            dataset_id=1,
+            status=[RunStatus.SUCCESS],
+            name_prefix="dataset-",
+            created_after=datetime.datetime(2025, 1, 5, tzinfo=datetime.timezone.utc),
+            limit=3,
+        )
+        assert len(server.requests) == requests
+    assert [run.run_id for run in runs] == ["run-19", "run-16", "run-13"]
+    plan = history._connection.execute(
+        "EXPLAIN QUERY PLAN SELECT data FROM runs WHERE scope = ? AND dataset_id = ?",
+        (history.scope, 1),
+    ).fetchall()
+    assert "runs_dataset_id" in str(plan)
+    history.close()
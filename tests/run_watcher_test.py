@@ -0,0 +1,180 @@
+import asyncio
+import json
+import threading
+import time
+
+from hirundo import HirundoError, RunWatcher, WatchMode
+from hirundo.dataset_qa import RunStatus
+from tests.local_server import LocalServer, json_response, use_local_server
+
+
+def _run(i: int, status: str) -> dict:
+    return {
+        "id": i,
+        "name": f"dataset-{i}",
+        "dataset_id": i,
+        "run_id": f"run-{i}",
+        "status": status,
+        "approved": True,
+        "created_at": "2025-01-01T00:00:00Z",
+        "run_args": None,
+    }
+
+
+def _status_sequence_route(snapshots: list[list[str]]):
+    """
+    Serve the run list snapshots in order, repeating the last one
+    """
+    calls = []
+
+    def route(_request):
+        calls.append(1)
+        statuses = snapshots[min(len(calls), len(snapshots)) - 1]
+        return json_response([_run(i, status) for i, status in enumerate(statuses)])
+
+    return route, calls
+
+
+def _sse_route(request):
+    run_id = request.path.rsplit("/", 1)[-1]
+    events = [
+        {"state": "PENDING", "result": "0%"},
+        {"state": "STARTED", "result": "50%"},
+        {"state": "SOMETHING_NEW", "result": "Migrating"},
+        {"state": None, "result": "75%"},
+        {"state": "SUCCESS", "result": f"s3://results/{run_id}.zip"},
+    ]
+    body = "".join(
+        f"event: message\nid: {event_id}\ndata: {json.dumps({'data': event})}\n\n"
+        for event_id, event in enumerate(events)
+    ).encode()
+    return 200, {"Content-Type": "text/event-stream"}, body
+
+
+def test_auto_mode_picks_polling_above_threshold():
+    assert RunWatcher(["a", "b"], sse_threshold=2).mode == WatchMode.SSE
+    assert RunWatcher(["a", "b", "c"], sse_threshold=2).mode == WatchMode.POLL
+    assert RunWatcher(["a"], mode=WatchMode.POLL).mode == WatchMode.POLL
+
+
+def test_poll_emits_each_state_change_once(monkeypatch):
+    route, calls = _status_sequence_route(
+        [
+            ["PENDING", "PENDING", "SUCCESS"],
+            ["STARTED", "PENDING", "SUCCESS"],
+            ["STARTED", "PENDING", "SUCCESS"],
+            ["SUCCESS", "FAILURE", "SUCCESS"],
+        ]
+    )
+    with LocalServer({("GET", "/dataset-qa/run/list"): route}) as server:
+        use_local_server(monkeypatch, server)
+        watcher = RunWatcher(
+            ["run-0", "run-1"],
+            mode=WatchMode.POLL,
+            min_poll_interval=0.01,
+            max_poll_interval=0.02,
+        )
+        changes = [
+            (change.run_id, change.previous_status, change.status)
+            for change in watcher.watch()
+        ]
+    assert changes == [
+        ("run-0", None, RunStatus.PENDING),
+        ("run-1", None, RunStatus.PENDING),
+        ("run-0", RunStatus.PENDING, RunStatus.STARTED),
+        ("run-0", RunStatus.STARTED, RunStatus.SUCCESS),
+        ("run-1", RunStatus.PENDING, RunStatus.FAILURE),
+    ]
+    assert len(calls) == 4
+
+
+def test_poll_interval_backs_off_until_a_change():
+    watcher = RunWatcher(
+        ["a"], min_poll_interval=1.0, max_poll_interval=3.0, poll_backoff=2.0
+    )
+    assert watcher._next_poll_interval(1.0, changed=False) == 2.0
+    assert watcher._next_poll_interval(2.0, changed=False) == 3.0
+    assert watcher._next_poll_interval(3.0, changed=True) == 1.0
+
+
+def test_sse_mode_streams_each_run(monkeypatch):
+    with LocalServer({("GET", "/dataset-qa/run/"): _sse_route}) as server:
+        use_local_server(monkeypatch, server)
+        changes = list(RunWatcher(["run-0", "run-1"], mode=WatchMode.SSE).watch())
+    for run_id in ("run-0", "run-1"):
+        statuses = [change.status for change in changes if change.run_id == run_id]
+        assert statuses == [RunStatus.PENDING, RunStatus.STARTED, RunStatus.SUCCESS]
+    assert {
+        change.event.result_url
+        for change in changes
+        if change.status == RunStatus.SUCCESS
+    } == {
+        "s3://results/run-0.zip",
+        "s3://results/run-1.zip",
+    }
+
+
+def test_awatch_sse(monkeypatch):
+    async def collect(watcher: RunWatcher):
+        return [change async for change in watcher.awatch()]
+
+    with LocalServer({("GET", "/dataset-qa/run/"): _sse_route}) as server:
+        use_local_server(monkeypatch, server)
+        changes = asyncio.run(collect(RunWatcher(["run-0"], mode=WatchMode.SSE)))
+    assert [change.status for change in changes] == [
+        RunStatus.PENDING,
+        RunStatus.STARTED,
+        RunStatus.SUCCESS,
+    ]
+
+
+def _failing_sse_route(request):
+    if request.path.endswith("run-1"):
+        body = f"event: message\nid: 0\ndata: {json.dumps({'detail': 'Not found'})}\n\n"
+        return 200, {"Content-Type": "text/event-stream"}, body.encode()
+    return _sse_route(request)
+
+
+def test_sse_error_of_one_run_does_not_stop_the_others(monkeypatch):
+    with LocalServer({("GET", "/dataset-qa/run/"): _failing_sse_route}) as server:
+        use_local_server(monkeypatch, server)
+        watcher = RunWatcher(["run-0", "run-1"], mode=WatchMode.SSE)
+        changes = list(watcher.watch())
+    failed = [change for change in changes if change.error is not None]
+    assert [(change.run_id, change.status) for change in failed] == [("run-1", None)]
+    assert isinstance(failed[0].error, HirundoError)
+    assert [change.status for change in changes if change.run_id == "run-0"] == [
+        RunStatus.PENDING,
+        RunStatus.STARTED,
+        RunStatus.SUCCESS,
+    ]
+    assert watcher.finished
+    assert set(watcher.errors) == {"run-1"}
+
+
+def _watch_threads() -> list[threading.Thread]:
+    return [
+        thread
+        for thread in threading.enumerate()
+        if thread.name.startswith("hirundo-watch-")
+    ]
+
+
+def test_stopping_early_closes_the_open_streams(monkeypatch):
+    def route(request):
+        def chunks():
+            data = {"state": "STARTED", "result": "10%"}
+            yield f"event: message\nid: 0\ndata: {json.dumps({'data': data})}\n\n".encode()
+            time.sleep(30)
+
+        return 200, {"Content-Type": "text/event-stream"}, chunks()
+
+    with LocalServer({("GET", "/dataset-qa/run/"): route}) as server:
+        use_local_server(monkeypatch, server)
+        changes = RunWatcher(["run-0", "run-1"], mode=WatchMode.SSE).watch()
+        assert next(changes).status == RunStatus.STARTED
+        changes.close()
+        deadline = time.monotonic() + 5
+        while _watch_threads() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert _watch_threads() == []
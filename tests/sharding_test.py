@@ -0,0 +1,168 @@
+import csv
+import io
+import json
+import threading
+import zipfile
+from collections import Counter
+
+import pytest
+from hirundo import (
+    HirundoCSV,
+    LabelingType,
+    QADataset,
+    ShardedQA,
+    StorageConfig,
+    StorageS3,
+    StorageTypes,
+)
+from hirundo.sharding import split_manifest
+from tests.local_server import LocalServer, json_response, use_local_server
+
+# ⬇️ Polars warns about forking the parsing processes once its thread pool started
+pytestmark = pytest.mark.filterwarnings("ignore::RuntimeWarning")
+
+FAILING_RUN_ID = "run-3"
+
+
+def _write_manifest(path, classes: dict[str, int]) -> None:
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["image_path", "class_name"])
+        for class_name, count in classes.items():
+            for i in range(count):
+                writer.writerow([f"{class_name}/{i}.png", class_name])
+
+
+def _read(path) -> list[dict[str, str]]:
+    with open(path, newline="") as file:
+        return list(csv.DictReader(file))
+
+
+def test_split_manifest_is_stratified_by_class(tmp_path):
+    manifest = tmp_path / "labels.csv"
+    _write_manifest(manifest, {"cat": 90, "dog": 30, "bird": 2})
+    with open(manifest, "a", newline="") as file:
+        # ⬇️ A second row of an image stays in the shard of its first row
+        csv.writer(file).writerow(["cat/0.png", "dog"])
+
+    paths = split_manifest(manifest, tmp_path / "shards", 3)
+
+    shards = [_read(path) for path in paths]
+    assert sum(len(rows) for rows in shards) == 123
+    for rows in shards:
+        counts = Counter(
+            row["class_name"]
+            for row in rows
+            if (row["image_path"], row["class_name"]) != ("cat/0.png", "dog")
+        )
+        assert counts["cat"] == 30
+        assert counts["dog"] == 10
+        assert counts["bird"] <= 1
+    assert [
+        index
+        for index, rows in enumerate(shards)
+        for row in rows
+        if row["image_path"] == "cat/0.png"
+    ] == [0, 0]
+
+
+def _zip(run_id: str) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as z:
+        z.writestr("suspects.csv", f"image_path,suspect_level\n{run_id}.png,0.5\n")
+        z.writestr("warnings_and_errors.csv", "image_path,status\n")
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def server(monkeypatch, tmp_path):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    dataset_ids = iter(range(1, 100))
+    lock = threading.Lock()
+
+    def create_dataset(_request):
+        with lock:
+            return json_response({"id": next(dataset_ids)})
+
+    def launch_run(request):
+        return json_response({"run_id": f"run-{request.path.rsplit('/', 1)[-1]}"})
+
+    def run_events(request):
+        run_id = request.path.rsplit("/", 1)[-1]
+        failed = run_id == FAILING_RUN_ID
+        data = {
+            "state": "FAILURE" if failed else "SUCCESS",
+            "result": "Out of memory" if failed else f"{server.url}/results/{run_id}",
+        }
+        body = f"event: message\nid: 1\ndata: {json.dumps({'data': data})}\n\n"
+        return 200, {"Content-Type": "text/event-stream"}, body.encode()
+
+    def results(request):
+        run_id = request.path.rsplit("/", 1)[-1]
+        return 200, {"Content-Type": "application/zip"}, _zip(run_id)
+
+    routes = {
+        ("POST", "/storage-config/"): lambda _: json_response({"id": 7}),
+        ("POST", "/dataset-qa/dataset/"): create_dataset,
+        ("POST", "/dataset-qa/run/"): launch_run,
+        ("GET", "/dataset-qa/run/"): run_events,
+        ("GET", "/results/"): results,
+    }
+    with LocalServer(routes) as server:
+        use_local_server(monkeypatch, server)
+        yield server
+
+
+def test_sharded_runs_share_a_storage_config_and_merge(server, tmp_path):
+    manifest = tmp_path / "labels.csv"
+    _write_manifest(manifest, {"cat": 8, "dog": 4})
+    dataset = QADataset(
+        name="big",
+        labeling_type=LabelingType.SINGLE_LABEL_CLASSIFICATION,
+        storage_config=StorageConfig(
+            name="bucket",
+            type=StorageTypes.S3,
+            s3=StorageS3(bucket_url="s3://bucket", region_name="us-east-1"),
+        ),
+        labeling_info=HirundoCSV(csv_url="s3://bucket/labels.csv"),
+        data_root_url="s3://bucket/images",
+    )
+    uploaded = []
+
+    def upload(path) -> str:
+        uploaded.append(path.name)
+        return f"s3://bucket/shards/{path.name}"
+
+    sharded = ShardedQA(4, upload).run(dataset, manifest, tmp_path / "shards")
+
+    assert uploaded == [f"shard-{index}.csv" for index in range(4)]
+    assert [
+        request.path
+        for request in server.requests
+        if request.path == "/storage-config/"
+    ] == ["/storage-config/"]
+    created = [
+        json.loads(request.body)
+        for request in server.requests
+        if request.method == "POST" and request.path == "/dataset-qa/dataset/"
+    ]
+    assert sorted(body["name"] for body in created) == [
+        f"big-shard-{index}" for index in range(4)
+    ]
+    assert {body["storage_config_id"] for body in created} == {7}
+    assert {body["labeling_info"]["csv_url"] for body in created} == {
+        f"s3://bucket/shards/shard-{index}.csv" for index in range(4)
+    }
+
+    assert all(item.dataset.storage_config is not None for item in sharded.items)
+    failed_shard = next(
+        index
+        for index, item in enumerate(sharded.items)
+        if item.run_id == FAILING_RUN_ID
+    )
+    assert sharded.failed == [failed_shard]
+    assert sharded.results is not None
+    suspects = sharded.results.suspects
+    assert sorted(suspects["shard"].to_list()) == sorted(set(range(4)) - {failed_shard})
+    for shard, image_path in zip(suspects["shard"], suspects["image_path"]):
+        assert image_path == f"{sharded.items[shard].run_id}.png"
@@ -0,0 +1,181 @@
+import asyncio
+import gc
+import json
+import time
+
+import pytest
+from hirundo import QADataset, RunTimeoutError
+from hirundo._sse_broadcast import SSEBroadcastRegistry
+from httpx_sse import ServerSentEvent
+from tests.local_server import LocalServer, use_local_server
+
+
+def _event(i: int) -> ServerSentEvent:
+    return ServerSentEvent(event="message", data=str(i), id=str(i))
+
+
+class _ControlledStream:
+    """
+    An upstream stream whose events are released by the test
+    """
+
+    def __init__(self):
+        self.opened = 0
+        self.closed = 0
+        self.events: asyncio.Queue = asyncio.Queue()
+
+    async def _stream(self):
+        self.opened += 1
+        try:
+            while (i := await self.events.get()) is not None:
+                yield _event(i)
+        finally:
+            self.closed += 1
+
+    def open(self):
+        return self._stream()
+
+
+async def _take(iterator, count: int) -> list[str]:
+    return [(await iterator.__anext__()).data for _ in range(count)]
+
+
+def test_late_subscriber_shares_stream_and_gets_replay():
+    async def scenario():
+        registry = SSEBroadcastRegistry(replay_size=2)
+        upstream = _ControlledStream()
+        first = registry.subscribe("run", upstream.open)
+        for i in range(3):
+            upstream.events.put_nowait(i)
+        assert await _take(first, 3) == ["0", "1", "2"]
+
+        second = registry.subscribe("run", upstream.open)
+        assert await _take(second, 2) == ["1", "2"]
+        upstream.events.put_nowait(3)
+        assert await _take(first, 1) == ["3"]
+        assert await _take(second, 1) == ["3"]
+        assert upstream.opened == 1
+
+        await first.aclose()
+        assert len(registry) == 1
+        await second.aclose()
+        await asyncio.sleep(0)
+        assert len(registry) == 0
+        assert upstream.closed == 1
+
+    asyncio.run(scenario())
+
+
+# ⬇️ The subscription left on the closed loop can only be finalized once it is garbage collected
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnraisableExceptionWarning")
+def test_streams_of_closed_loops_are_not_shared():
+    registry = SSEBroadcastRegistry()
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    stale = _ControlledStream()
+    abandoned = registry.subscribe("run", stale.open)
+    stale.events.put_nowait(0)
+    assert loop.run_until_complete(_take(abandoned, 1)) == ["0"]
+    loop.close()
+    asyncio.set_event_loop(None)
+    assert len(registry) == 1
+
+    async def scenario():
+        upstream = _ControlledStream()
+        subscriber = registry.subscribe("run", upstream.open)
+        upstream.events.put_nowait(1)
+        assert await _take(subscriber, 1) == ["1"]
+        assert upstream.opened == 1
+        assert len(registry) == 1
+        await subscriber.aclose()
+
+    asyncio.run(scenario())
+    assert len(registry) == 0
+    assert stale.opened == 1
+    del abandoned, stale
+    gc.collect()
+
+
+def test_stream_end_and_errors_reach_every_subscriber():
+    async def failing_stream():
+        yield _event(0)
+        raise RuntimeError("stream failed")
+
+    async def collect(iterator):
+        events = []
+        try:
+            async for sse in iterator:
+                events.append(sse.data)
+        except RuntimeError as error:
+            events.append(str(error))
+        return events
+
+    async def scenario():
+        registry = SSEBroadcastRegistry()
+        return await asyncio.gather(
+            collect(registry.subscribe("run", failing_stream)),
+            collect(registry.subscribe("run", failing_stream)),
+        )
+
+    assert asyncio.run(scenario()) == [["0", "stream failed"]] * 2
+
+
+def _slow_sse_route(_request):
+    time.sleep(0.3)
+    body = "".join(
+        f"event: message\nid: {i}\ndata: {json.dumps({'data': event})}\n\n"
+        for i, event in enumerate(
+            [
+                {"state": "STARTED", "result": "50%"},
+                {"state": "SUCCESS", "result": "s3://results/run.zip"},
+            ]
+        )
+    ).encode()
+    return 200, {"Content-Type": "text/event-stream"}, body
+
+
+def test_concurrent_acheck_run_by_id_opens_one_stream(monkeypatch):
+    async def collect():
+        return [data async for data in QADataset.acheck_run_by_id("run")]
+
+    async def scenario():
+        return await asyncio.gather(collect(), collect(), collect())
+
+    with LocalServer({("GET", "/dataset-qa/run/"): _slow_sse_route}) as server:
+        use_local_server(monkeypatch, server)
+        results = asyncio.run(scenario())
+    assert len(server.requests) == 1
+    assert all(
+        [event.state.value for event in result] == ["STARTED", "SUCCESS"]
+        for result in results
+    )
+
+
+def _endless_sse_route(_request):
+    def events():
+        data = json.dumps({"data": {"state": "STARTED", "result": "50%"}})
+        yield f"event: message\nid: 1\ndata: {data}\n\n".encode()
+        for _ in range(30):
+            time.sleep(0.1)
+            yield b"event: ping\ndata: \n\n"
+
+    return 200, {"Content-Type": "text/event-stream"}, events()
+
+
+def test_timed_subscribers_share_one_stream_with_their_own_deadlines(monkeypatch):
+    async def watch(timeout: float) -> float:
+        started_at = time.monotonic()
+        with pytest.raises(RunTimeoutError):
+            async for _ in QADataset.acheck_run_by_id("run", timeout=timeout):
+                pass
+        return time.monotonic() - started_at
+
+    async def scenario():
+        return await asyncio.gather(watch(0.3), watch(1.0))
+
+    with LocalServer({("GET", "/dataset-qa/run/"): _endless_sse_route}) as server:
+        use_local_server(monkeypatch, server)
+        short, long = asyncio.run(scenario())
+    assert len(server.requests) == 1
+    assert 0.3 <= short < 0.9
+    assert 1.0 <= long < 1.6
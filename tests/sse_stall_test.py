@@ -0,0 +1,168 @@
+import asyncio
+import json
+import time
+
+import pytest
+from hirundo import HirundoClient, QADataset
+from hirundo._deadline import Deadline
+from hirundo._iter_sse_retrying import (
+    SSEHeartbeat,
+    aiter_sse_retrying,
+    iter_sse_retrying,
+)
+from httpx_sse import ServerSentEvent
+from tests.local_server import LocalServer
+
+PING_INTERVAL = 0.1
+RUN_ID = "3f2b9c0e5d6a4b7c8d9e0f1a2b3c"
+
+
+def _sse(event: str, data: str, event_id: str = "") -> bytes:
+    return f"event: {event}\nid: {event_id}\ndata: {data}\n\n".encode()
+
+
+def _message(event_id: str, state: str) -> bytes:
+    return _sse("message", json.dumps({"data": {"state": state}}), event_id)
+
+
+def _stalling_route(request):
+    """
+    The first connection stalls after a few pings & an event, as with a half-open connection.
+    Reconnections resume after the `Last-Event-ID`.
+    """
+
+    def first_connection():
+        yield _sse("ping", "")
+        time.sleep(PING_INTERVAL)
+        yield _sse("ping", "")
+        yield _message("1", "STARTED")
+        time.sleep(2)
+
+    def resumed_connection():
+        assert request.headers["Last-Event-ID"] == "1"
+        yield _message("2", "SUCCESS")
+
+    body = (
+        resumed_connection()
+        if "Last-Event-ID" in request.headers
+        else first_connection()
+    )
+    return 200, {"Content-Type": "text/event-stream"}, body
+
+
+def _client(server: LocalServer) -> HirundoClient:
+    return HirundoClient(
+        api_host=server.url,
+        api_key="test-api-key",
+        sse_ping_interval=PING_INTERVAL,
+        sse_stall_multiplier=3.0,
+    )
+
+
+def test_heartbeat_learns_longer_ping_intervals():
+    latencies = []
+    heartbeat = SSEHeartbeat(
+        ping_interval=0.01, stall_multiplier=2.0, on_ping_latency=latencies.append
+    )
+    assert heartbeat.stall_timeout == pytest.approx(0.02)
+    ping = ServerSentEvent(event="ping")
+    heartbeat.observe(ping)
+    time.sleep(0.05)
+    heartbeat.observe(ping)
+    assert len(latencies) == 1
+    assert heartbeat.stall_timeout == pytest.approx(2 * latencies[0])
+    heartbeat.connected()
+    heartbeat.observe(ping)
+    assert len(latencies) == 1
+
+
+def test_stalled_stream_reconnects_from_last_event():
+    with LocalServer({("GET", "/dataset-qa/run/"): _stalling_route}) as server:
+        client = _client(server)
+        start = time.monotonic()
+        states = [
+            event.state.value
+            for event in QADataset._check_run_by_id(RUN_ID, client=client)
+        ]
+        elapsed = time.monotonic() - start
+    assert states == ["STARTED", "SUCCESS"]
+    assert len(server.requests) == 2
+    assert elapsed < 2
+    assert client.sse_ping_latency() == pytest.approx(PING_INTERVAL, abs=0.1)
+
+
+def test_stalled_async_stream_reconnects_from_last_event():
+    async def collect(client: HirundoClient):
+        return [
+            event.state.value
+            async for event in QADataset.acheck_run_by_id(RUN_ID, client=client)
+        ]
+
+    with LocalServer({("GET", "/dataset-qa/run/"): _stalling_route}) as server:
+        states = asyncio.run(collect(_client(server)))
+    assert states == ["STARTED", "SUCCESS"]
+    assert len(server.requests) == 2
+
+
+def _progressing_route(request):
+    """
+    Every connection sends the event after the `Last-Event-ID` and stalls, until the run succeeds
+    """
+    event_id = int(request.headers.get("Last-Event-ID", "0")) + 1
+
+    def stalling_connection():
+        yield _message(str(event_id), "STARTED")
+        time.sleep(2)
+
+    body = stalling_connection() if event_id < 6 else _message("6", "SUCCESS")
+    return 200, {"Content-Type": "text/event-stream"}, body
+
+
+def test_reconnect_attempts_reset_once_events_arrive(monkeypatch):
+    monkeypatch.setattr("hirundo._iter_sse_retrying.MAX_RECONNECTS", 3)
+    with LocalServer({("GET", "/dataset-qa/run/"): _progressing_route}) as server:
+        client = _client(server)
+        with client.sse_client() as sse_client:
+            event_ids = [
+                sse.id
+                for sse in iter_sse_retrying(
+                    sse_client,
+                    "GET",
+                    client.url(f"/dataset-qa/run/{RUN_ID}"),
+                    heartbeat=client.sse_heartbeat(f"/dataset-qa/run/{RUN_ID}"),
+                )
+            ]
+    assert event_ids == ["1", "2", "3", "4", "5", "6"]
+
+
+def _stalled_route(_request):
+    def stalled_connection():
+        time.sleep(2)
+        yield _sse("ping", "")
+
+    return 200, {"Content-Type": "text/event-stream"}, stalled_connection()
+
+
+def test_reconnect_backoff_is_limited_by_the_deadline(monkeypatch):
+    monkeypatch.setattr("hirundo._iter_sse_retrying.RECONNECT_WAIT_INITIAL", 10.0)
+    monkeypatch.setattr("hirundo._iter_sse_retrying.RECONNECT_WAIT_MAX", 10.0)
+
+    async def read(client: HirundoClient):
+        async with client.async_sse_client() as sse_client:
+            events = await aiter_sse_retrying(
+                sse_client,
+                "GET",
+                client.url(f"/dataset-qa/run/{RUN_ID}"),
+                headers={},
+                heartbeat=client.sse_heartbeat(f"/dataset-qa/run/{RUN_ID}"),
+                deadline=Deadline(1.0),
+            )
+            return [sse async for sse in events]
+
+    with LocalServer({("GET", "/dataset-qa/run/"): _stalled_route}) as server:
+        start = time.monotonic()
+        with pytest.raises(TimeoutError):
+            asyncio.run(read(_client(server)))
+        elapsed = time.monotonic() - start
+    assert elapsed < 2
+    assert len(server.requests) == 1
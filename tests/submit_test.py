@@ -0,0 +1,102 @@
+import itertools
+import json
+import threading
+import time
+
+import pytest
+from hirundo import HirundoClient, HirundoError, QADataset
+from tests.local_server import LocalServer, json_response, qa_dataset, zip_route
+
+
+class _Api:
+    """
+    Creates datasets & runs, and streams a final state for each run after a short delay
+    """
+
+    def __init__(self, final_state: str = "SUCCESS"):
+        self.final_state = final_state
+        self.dataset_ids = itertools.count(1)
+        self.active_runs = 0
+        self.max_active_runs = 0
+        self.lock = threading.Lock()
+        self.routes = {
+            ("POST", "/dataset-qa/dataset/"): self.create_dataset,
+            ("POST", "/dataset-qa/run/"): self.launch_run,
+            ("GET", "/dataset-qa/run/"): self.run_events,
+            ("GET", "/results.zip"): zip_route,
+        }
+        self.server = LocalServer(self.routes)
+
+    def create_dataset(self, _request):
+        return json_response({"id": next(self.dataset_ids)})
+
+    def launch_run(self, request):
+        return json_response({"run_id": f"run-{request.path.rsplit('/', 1)[-1]}"})
+
+    def run_events(self, _request):
+        with self.lock:
+            self.active_runs += 1
+            self.max_active_runs = max(self.max_active_runs, self.active_runs)
+        time.sleep(0.2)
+        with self.lock:
+            self.active_runs -= 1
+        result = (
+            f"{self.server.url}/results.zip"
+            if self.final_state == "SUCCESS"
+            else "Out of memory"
+        )
+        data = json.dumps({"data": {"state": self.final_state, "result": result}})
+        return (
+            200,
+            {"Content-Type": "text/event-stream"},
+            f"event: message\nid: 1\ndata: {data}\n\n".encode(),
+        )
+
+
+@pytest.fixture(autouse=True)
+def home(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+
+def _client(server: LocalServer, max_workers: int) -> HirundoClient:
+    return HirundoClient(
+        api_host=server.url, api_key="test-api-key", max_workers=max_workers
+    )
+
+
+def test_submit_many_runs_with_bounded_concurrency():
+    api = _Api()
+    with api.server, _client(api.server, max_workers=2) as client:
+        datasets = [qa_dataset(f"dataset-{i}") for i in range(5)]
+        submissions = QADataset.submit_many(datasets, client=client)
+        completed = list(QADataset.as_completed(submissions, timeout=30))
+    assert sorted(dataset.name for dataset, _ in completed) == sorted(
+        dataset.name for dataset in datasets
+    )
+    for dataset, future in completed:
+        assert future.result().cached_zip_path.name == f"{dataset.run_id}.zip"
+    assert api.max_active_runs == 2
+
+
+def test_concurrent_submissions_create_the_dataset_once():
+    api = _Api()
+    with api.server, _client(api.server, max_workers=4) as client:
+        dataset = qa_dataset("shared")
+        futures = [dataset.submit(client=client) for _ in range(4)]
+        for future in futures:
+            future.result(timeout=30)
+    creates = [
+        request
+        for request in api.server.requests
+        if request.path == "/dataset-qa/dataset/"
+    ]
+    assert len(creates) == 1
+    assert dataset.id == 1
+
+
+def test_failed_run_sets_the_future_exception():
+    api = _Api(final_state="FAILURE")
+    with api.server, _client(api.server, max_workers=1) as client:
+        future = qa_dataset("failing").submit(client=client)
+        with pytest.raises(HirundoError, match="Out of memory"):
+            future.result(timeout=30)